@@ -0,0 +1,203 @@
+"""End-to-end latency benchmark for every QueryRouter route, fully offline.
+
+Starts the local fake FRED server (`fake_fred.py`), replays the supported queries
+from `tests/evals/intent_cases.json` through `EvalCaseIntentParser`, and runs them
+through `NaturalLanguageQueryService.ask` plus response serialization. For each
+route it reports p50/p95/p99 latency, throughput and upstream FRED calls per
+query, broken down by endpoint.
+
+    python benchmarks/bench_routes.py --latency-ms 40 --jitter-ms 15 --concurrency 8 --iterations 3
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+from eval_parser import EvalCaseIntentParser, load_supported_cases
+from fake_fred import ENDPOINTS, FakeFREDCatalog, FakeFREDServer
+from fred_query.schemas.analysis import RoutedQueryStatus
+from fred_query.services.cross_section_service import CrossSectionService
+from fred_query.services.fred_client import FREDClient, build_fred_http_client
+from fred_query.services.natural_language_query_service import NaturalLanguageQueryService
+from fred_query.services.recession_index import RecessionIndex
+from fred_query.services.single_flight import SingleFlight
+
+# Eval families grouped by the QueryRouter route they exercise.
+ROUTE_FAMILIES = {
+    "single_series": ("single_series_basics", "single_series_transforms", "explicit_series_ids"),
+    "state_ranking": ("cross_section_rankings",),
+    "point_in_time": ("cross_section_point_in_time",),
+    "state_gdp": ("state_gdp_comparisons",),
+    "multi_series": ("multi_series_comparisons",),
+    "relationship": ("relationship_analysis",),
+}
+REVISION_QUERIES = {
+    "How has the unemployment rate been revised?": "UNRATE",
+    "Show first-release vs revised payrolls": "PAYEMS",
+    "How much has real GDP been revised?": "GDPC1",
+}
+
+
+@dataclass
+class RouteResult:
+    route: str
+    latencies: list[float] = field(default_factory=list)
+    failures: int = 0
+    wall_seconds: float = 0.0
+    upstream_calls: Counter[str] = field(default_factory=Counter)
+
+    def summary(self) -> dict[str, Any]:
+        latencies_ms = np.asarray(self.latencies) * 1000.0
+        count = len(self.latencies)
+        p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99]) if count else (0.0, 0.0, 0.0)
+        return {
+            "route": self.route,
+            "queries": count,
+            "failures": self.failures,
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "throughput_qps": round(count / self.wall_seconds, 2) if self.wall_seconds else 0.0,
+            "upstream_calls_per_query": round(sum(self.upstream_calls.values()) / count, 2) if count else 0.0,
+            "upstream_calls": {endpoint: self.upstream_calls.get(endpoint, 0) for endpoint in ENDPOINTS},
+        }
+
+
+def _route_queries(cases: list[dict[str, Any]]) -> dict[str, list[str]]:
+    queries: dict[str, list[str]] = defaultdict(list)
+    for route, families in ROUTE_FAMILIES.items():
+        queries[route] = [case["query"] for case in cases if case["family"] in families]
+    queries["vintage"] = list(REVISION_QUERIES)
+    return queries
+
+
+def run_route(
+    route: str,
+    queries: list[str],
+    *,
+    service: NaturalLanguageQueryService,
+    server: FakeFREDServer,
+    iterations: int,
+    concurrency: int,
+) -> RouteResult:
+    result = RouteResult(route=route)
+    workload = [query for _ in range(iterations) for query in queries]
+
+    def ask(query: str) -> tuple[float, bool]:
+        started = perf_counter()
+        try:
+            response = service.ask(query)
+            response.model_dump_json()
+            succeeded = response.status == RoutedQueryStatus.COMPLETED
+        except Exception:
+            succeeded = False
+        return perf_counter() - started, succeeded
+
+    calls_before = server.snapshot_calls()
+    started = perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for latency, succeeded in executor.map(ask, workload):
+            result.latencies.append(latency)
+            result.failures += 0 if succeeded else 1
+    result.wall_seconds = perf_counter() - started
+    result.upstream_calls = server.snapshot_calls() - calls_before
+    return result
+
+
+def _print_table(summaries: list[dict[str, Any]]) -> None:
+    header = (
+        f"{'route':<14} {'n':>5} {'fail':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'qps':>8} {'calls/q':>8}  "
+        "search/series/obs/vintage"
+    )
+    print(header)
+    print("-" * len(header))
+    for summary in summaries:
+        calls = "/".join(str(summary["upstream_calls"][endpoint]) for endpoint in ENDPOINTS)
+        print(
+            f"{summary['route']:<14} {summary['queries']:>5} {summary['failures']:>5} "
+            f"{summary['p50_ms']:>9.1f} {summary['p95_ms']:>9.1f} {summary['p99_ms']:>9.1f} "
+            f"{summary['throughput_qps']:>8.1f} {summary['upstream_calls_per_query']:>8.2f}  {calls}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="Fake FRED latency per request.")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="Uniform jitter around the latency.")
+    parser.add_argument("--iterations", type=int, default=2, help="Passes over each route's queries.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent queries in flight.")
+    parser.add_argument("--max-fred-concurrency", type=int, default=8, help="Cross-section fan-out width.")
+    parser.add_argument("--routes", nargs="*", help="Subset of routes to run.")
+    parser.add_argument("--recordings", help="JSON file of recorded FRED payloads for the fake server.")
+    parser.add_argument("--no-recession-index", action="store_true", help="Fetch USREC per query instead.")
+    parser.add_argument("--json", type=Path, help="Also write the summaries to this file.")
+    args = parser.parse_args()
+
+    cases = load_supported_cases()
+    intent_parser = EvalCaseIntentParser(cases)
+    for query, series_id in REVISION_QUERIES.items():
+        intent_parser.add_revision_query(query, series_id)
+    route_queries = _route_queries(cases)
+    selected_routes = args.routes or list(route_queries)
+
+    catalog = FakeFREDCatalog()
+    if args.recordings:
+        catalog.load_recordings(args.recordings)
+
+    with FakeFREDServer(catalog, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms) as server:
+        http_client = build_fred_http_client(
+            base_url=server.base_url,
+            timeout_seconds=30.0,
+            http2=False,
+            max_connections=max(20, args.concurrency * args.max_fred_concurrency),
+        )
+        fred_client = FREDClient(
+            api_key="benchmark",
+            base_url=server.base_url,
+            http_client=http_client,
+            single_flight=SingleFlight(),
+        )
+        recession_index = None
+        if not args.no_recession_index:
+            recession_index = RecessionIndex()
+            recession_index.refresh(fred_client)
+        service = NaturalLanguageQueryService(
+            parser=intent_parser,
+            fred_client=fred_client,
+            cross_section_service=CrossSectionService(fred_client, max_concurrency=args.max_fred_concurrency),
+            recession_index=recession_index,
+        )
+
+        summaries = []
+        for route in selected_routes:
+            result = run_route(
+                route,
+                route_queries[route],
+                service=service,
+                server=server,
+                iterations=args.iterations,
+                concurrency=args.concurrency,
+            )
+            summaries.append(result.summary())
+        http_client.close()
+
+    print(
+        f"fake FRED latency {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms, "
+        f"concurrency {args.concurrency}, {args.iterations} iteration(s)\n"
+    )
+    _print_table(summaries)
+    if args.json:
+        args.json.write_text(json.dumps(summaries, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Offline intent parser built from the labelled eval cases.
+
+`EvalCaseIntentParser` answers `parse` / `parse_with_context` with the intent that
+`tests/evals/intent_cases.json` expects for each supported query, so benchmarks
+exercise routing and execution without an OpenAI key or model latency.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date
+import json
+from pathlib import Path
+import re
+from typing import Any
+
+from fred_query.schemas.intent import (
+    CrossSectionScope,
+    Geography,
+    GeographyType,
+    QueryIntent,
+    TaskType,
+    TransformType,
+)
+from fred_query.services.resolver_service import STATE_NAME_TO_CODE
+
+_SERIES_ID_PATTERN = re.compile(r"\b[A-Z][A-Z0-9]{3,}\b")
+DEFAULT_CASES_PATH = Path(__file__).resolve().parents[1] / "tests" / "evals" / "intent_cases.json"
+
+
+def load_supported_cases(path: str | Path = DEFAULT_CASES_PATH) -> list[dict[str, Any]]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [
+        {**case, "family": family["family"]}
+        for family in payload["families"]
+        for case in family.get("cases", {}).get("supported", [])
+    ]
+
+
+def _geography(name: str) -> Geography:
+    code = STATE_NAME_TO_CODE.get(name.lower())
+    if code is None:
+        return Geography(name=name)
+    return Geography(name=name, geography_type=GeographyType.STATE, code=code)
+
+
+def intent_from_expectation(query: str, expect: dict[str, Any]) -> QueryIntent:
+    """Build the intent a correct parser would return for `query` from its eval expectations."""
+
+    fields: dict[str, Any] = {
+        "task_type": TaskType(expect["task_type"]),
+        "original_query": query,
+        "clarification_needed": bool(expect.get("clarification_needed", False)),
+    }
+    if "search_text_contains" in expect:
+        fields["search_text"] = expect["search_text_contains"]
+    if "search_texts_include" in expect:
+        fields["search_texts"] = list(expect["search_texts_include"])
+    if "series_id" in expect:
+        fields["series_id"] = expect["series_id"]
+    elif fields["task_type"] in (TaskType.MULTI_SERIES_COMPARISON, TaskType.RELATIONSHIP_ANALYSIS):
+        # Cases such as "FRED series UNRATE and CPIAUCSL" only label the count; take the IDs from the text.
+        series_ids = [token for token in _SERIES_ID_PATTERN.findall(query) if token != "FRED"]
+        if len(series_ids) >= 2 and "search_texts" not in fields:
+            fields["series_ids"] = series_ids
+    for name in ("start_date", "observation_date"):
+        if name in expect:
+            fields[name] = date.fromisoformat(expect[name])
+    if "transform" in expect:
+        fields["transform"] = TransformType(expect["transform"])
+    if "transform_window" in expect:
+        fields["transform_window"] = expect["transform_window"]
+    if "cross_section_scope" in expect:
+        fields["cross_section_scope"] = CrossSectionScope(expect["cross_section_scope"])
+    if "sort_descending" in expect:
+        fields["sort_descending"] = expect["sort_descending"]
+    if "rank_limit" in expect:
+        fields["rank_limit"] = expect["rank_limit"]
+    if "geographies_include" in expect:
+        fields["geographies"] = [_geography(name) for name in expect["geographies_include"]]
+    return QueryIntent(**fields)
+
+
+class EvalCaseIntentParser:
+    """Drop-in replacement for `OpenAIIntentParser` that replays eval expectations."""
+
+    def __init__(self, cases: Iterable[dict[str, Any]]) -> None:
+        self._intents = {case["query"]: intent_from_expectation(case["query"], case["expect"]) for case in cases}
+
+    def add_revision_query(self, query: str, series_id: str) -> None:
+        """Register a single-series query that asks for first-release vs revised values."""
+
+        self._intents[query] = QueryIntent(
+            task_type=TaskType.SINGLE_SERIES_LOOKUP,
+            original_query=query,
+            series_id=series_id,
+            needs_revision_analysis=True,
+        )
+
+    def parse(self, query: str) -> QueryIntent:
+        try:
+            return self._intents[query].model_copy(deep=True)
+        except KeyError as exc:
+            raise ValueError(f"No recorded intent for query {query!r}.") from exc
+
+    def parse_with_context(self, query: str, context: dict[str, object]) -> QueryIntent:
+        return self.parse(query)
@@ -0,0 +1,504 @@
+"""Local stand-in for the FRED REST API.
+
+Serves `series/search`, `series`, `series/observations` (including ALFRED's
+`vintage_dates`, `realtime_start`/`realtime_end` and `output_type` 1 and 4 modes)
+and `series/vintagedates` in FRED's JSON shapes over HTTP, with configurable latency and jitter. Payloads
+come from a recordings file when one is given (see `FakeFREDCatalog.load_recordings`)
+and are otherwise synthesized deterministically from a small catalog of common
+national series plus every state `{CODE}UR` / `{CODE}RGSP` series, so the same
+request always returns the same payload.
+
+Run it standalone and point the app at it:
+
+    python benchmarks/fake_fred.py --port 8765 --latency-ms 40 --jitter-ms 15
+    FRED_BASE_URL=http://127.0.0.1:8765/fred FRED_API_KEY=fake fred-query ask "..."
+"""
+
+from __future__ import annotations
+
+import argparse
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import random
+import re
+from threading import Lock, Thread
+import time
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+import zlib
+
+import numpy as np
+
+from fred_query.services.resolver_service import STATE_CODE_TO_NAME
+
+ENDPOINTS = ("series/search", "series", "series/observations", "series/vintagedates")
+_REALTIME_END = date(9999, 12, 31)
+_RECESSION_MONTHS = (
+    (date(1990, 8, 1), date(1991, 3, 1)),
+    (date(2001, 4, 1), date(2001, 11, 1)),
+    (date(2008, 1, 1), date(2009, 6, 1)),
+    (date(2020, 3, 1), date(2020, 4, 1)),
+)
+
+
+@dataclass(frozen=True)
+class FakeSeries:
+    series_id: str
+    title: str
+    units: str
+    frequency: str
+    seasonal_adjustment: str
+    popularity: int
+    level: float
+    volatility: float
+    keywords: str = ""
+    rate: bool = False
+    start: date = date(1990, 1, 1)
+
+
+_NATIONAL_SERIES = (
+    FakeSeries("UNRATE", "Unemployment Rate", "Percent", "M", "SA", 95, 5.5, 0.15, "jobless labor", rate=True),
+    FakeSeries("PAYEMS", "All Employees, Total Nonfarm", "Thous. of Persons", "M", "SA", 90, 110000, 0.002, "payroll payrolls employment jobs"),
+    FakeSeries("CPIAUCSL", "Consumer Price Index for All Urban Consumers: All Items in U.S. City Average", "Index 1982-1984=100", "M", "SA", 94, 130.0, 0.002, "cpi inflation prices"),
+    FakeSeries("CPILFESL", "Consumer Price Index for All Urban Consumers: All Items Less Food and Energy in U.S. City Average", "Index 1982-1984=100", "M", "SA", 80, 135.0, 0.0015, "core cpi inflation"),
+    FakeSeries("PCEPI", "Personal Consumption Expenditures: Chain-type Price Index", "Index 2017=100", "M", "SA", 78, 60.0, 0.0015, "pce inflation prices"),
+    FakeSeries("GDP", "Gross Domestic Product", "Bil. of $", "Q", "SAAR", 93, 6000.0, 0.01, "nominal gdp output economy"),
+    FakeSeries("GDPC1", "Real Gross Domestic Product", "Bil. of Chn. 2017 $", "Q", "SAAR", 92, 9000.0, 0.007, "real gdp output economy"),
+    FakeSeries("HOUST", "New Privately-Owned Housing Units Started: Total Units", "Thous. of Units", "M", "SAAR", 82, 1300.0, 0.05, "housing starts construction"),
+    FakeSeries("CSUSHPINSA", "S&P CoreLogic Case-Shiller U.S. National Home Price Index", "Index Jan 2000=100", "M", "NSA", 84, 80.0, 0.006, "housing home prices house"),
+    FakeSeries("INDPRO", "Industrial Production: Total Index", "Index 2017=100", "M", "SA", 83, 60.0, 0.006, "industrial production output manufacturing"),
+    FakeSeries("RSAFS", "Advance Retail Sales: Retail Trade and Food Services", "Mil. of $", "M", "SA", 81, 200000.0, 0.008, "retail sales consumer spending"),
+    FakeSeries("UMCSENT", "University of Michigan: Consumer Sentiment", "Index 1966:Q1=100", "M", "NSA", 79, 85.0, 0.04, "consumer sentiment confidence"),
+    FakeSeries("FEDFUNDS", "Federal Funds Effective Rate", "Percent", "M", "NSA", 91, 5.0, 0.12, "federal funds fed policy interest rate", rate=True),
+    FakeSeries("MORTGAGE30US", "30-Year Fixed Rate Mortgage Average in the United States", "Percent", "W", "NSA", 86, 8.0, 0.05, "mortgage rates housing", rate=True),
+    FakeSeries("DGS10", "Market Yield on U.S. Treasury Securities at 10-Year Constant Maturity", "Percent", "D", "NSA", 87, 6.0, 0.04, "10-year treasury yield bond interest rate", rate=True),
+    FakeSeries("DCOILBRENTEU", "Crude Oil Prices: Brent - Europe", "Dollars per Barrel", "D", "NSA", 77, 20.0, 0.02, "brent oil crude energy"),
+    FakeSeries("DCOILWTICO", "Crude Oil Prices: West Texas Intermediate (WTI) - Cushing, Oklahoma", "Dollars per Barrel", "D", "NSA", 80, 20.0, 0.02, "wti oil crude energy"),
+    FakeSeries("SP500", "S&P 500", "Index", "D", "NSA", 85, 350.0, 0.011, "stocks equities stock market"),
+    FakeSeries("M2SL", "M2", "Bil. of $", "M", "SA", 76, 3000.0, 0.004, "money supply"),
+    FakeSeries("CES0500000003", "Average Hourly Earnings of All Employees, Total Private", "Dollars per Hour", "M", "SA", 75, 20.0, 0.003, "wages earnings pay", start=date(2006, 3, 1)),
+    FakeSeries("ICSA", "Initial Claims", "Number", "W", "SA", 83, 300000.0, 0.03, "initial jobless claims unemployment insurance"),
+    FakeSeries("JTSJOL", "Job Openings: Total Nonfarm", "Level in Thousands", "M", "SA", 80, 5000.0, 0.02, "job openings jolts vacancies", start=date(2000, 12, 1)),
+    FakeSeries("TCU", "Capacity Utilization: Total Index", "Percent of Capacity", "M", "SA", 74, 78.0, 0.3, "capacity utilization industry", rate=True),
+    FakeSeries("NASDAQCOM", "NASDAQ Composite Index", "Index Feb 5, 1971=100", "D", "NSA", 78, 450.0, 0.014, "nasdaq stocks equities"),
+    FakeSeries("VIXCLS", "CBOE Volatility Index: VIX", "Index", "D", "NSA", 77, 18.0, 0.8, "vix volatility fear", rate=True),
+    FakeSeries("GASREGW", "US Regular All Formulations Gas Price", "Dollars per Gallon", "W", "NSA", 76, 1.2, 0.015, "gasoline gas prices fuel"),
+    FakeSeries("EXPGS", "Exports of Goods and Services", "Bil. of $", "Q", "SAAR", 72, 550.0, 0.015, "exports trade"),
+    FakeSeries("IMPGS", "Imports of Goods and Services", "Bil. of $", "Q", "SAAR", 72, 630.0, 0.015, "imports trade"),
+    FakeSeries("DTWEXBGS", "Nominal Broad U.S. Dollar Index", "Index Jan 2006=100", "D", "NSA", 73, 100.0, 0.003, "dollar index currency exchange", start=date(2006, 1, 2)),
+    FakeSeries("PI", "Personal Income", "Bil. of $", "M", "SAAR", 74, 4800.0, 0.004, "personal income"),
+    FakeSeries("PCE", "Personal Consumption Expenditures", "Bil. of $", "M", "SAAR", 79, 3800.0, 0.004, "consumer spending consumption"),
+    FakeSeries("USREC", "NBER based Recession Indicators for the United States from the Period following the Peak through the Trough", "+1 or 0", "M", "NSA", 70, 0.0, 0.0, "recession"),
+)
+_STATE_SERIES_PATTERN = re.compile(r"^([A-Z]{2})(UR|RGSP)$")
+_TOKEN_PATTERN = re.compile(r"[a-z0-9&]+")
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def _month_starts(start: date, end: date, step: int = 1) -> list[date]:
+    dates: list[date] = []
+    year, month = start.year, start.month
+    while date(year, month, 1) <= end:
+        dates.append(date(year, month, 1))
+        month += step
+        year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+    return dates
+
+
+def _observation_dates(series: FakeSeries, as_of: date) -> list[date]:
+    if series.frequency == "D":
+        return [
+            series.start + timedelta(days=offset)
+            for offset in range((as_of - series.start).days + 1)
+            if (series.start + timedelta(days=offset)).weekday() < 5
+        ]
+    if series.frequency == "W":
+        first_thursday = series.start + timedelta(days=(3 - series.start.weekday()) % 7)
+        return [first_thursday + timedelta(weeks=week) for week in range((as_of - first_thursday).days // 7 + 1)]
+    if series.frequency == "Q":
+        return _month_starts(series.start, as_of - timedelta(days=100), step=3)
+    if series.frequency == "A":
+        return [date(year, 1, 1) for year in range(series.start.year, as_of.year)]
+    return _month_starts(series.start, as_of - timedelta(days=35))
+
+
+def _format_value(value: float) -> str:
+    return f"{value:.3f}".rstrip("0").rstrip(".") or "0"
+
+
+def _period_start(value: date, frequency: str) -> date:
+    if frequency == "a":
+        return date(value.year, 1, 1)
+    if frequency == "q":
+        return date(value.year, 3 * ((value.month - 1) // 3) + 1, 1)
+    if frequency == "m":
+        return date(value.year, value.month, 1)
+    if frequency == "w":
+        return value - timedelta(days=value.weekday())
+    return value
+
+
+class FakeFREDCatalog:
+    """Deterministic FRED payloads keyed by series ID, optionally overridden by recordings."""
+
+    def __init__(self, *, as_of: date | None = None) -> None:
+        self.as_of = as_of or date.today()
+        self._series = {series.series_id: series for series in _NATIONAL_SERIES}
+        self._recordings: dict[str, dict[str, Any]] = {}
+        self._values: dict[str, tuple[list[date], np.ndarray]] = {}
+        self._lock = Lock()
+
+    def load_recordings(self, path: str | Path) -> None:
+        """Load recorded payloads from a JSON object keyed by `"<endpoint> <series_id or search_text>"`."""
+
+        self._recordings.update(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def lookup(self, series_id: str) -> FakeSeries | None:
+        series = self._series.get(series_id)
+        if series is not None:
+            return series
+        match = _STATE_SERIES_PATTERN.match(series_id)
+        if match is None or match.group(1) not in STATE_CODE_TO_NAME:
+            return None
+        state_name = STATE_CODE_TO_NAME[match.group(1)]
+        if match.group(2) == "UR":
+            return FakeSeries(
+                series_id, f"Unemployment Rate in {state_name}", "Percent", "M", "SA", 60, 5.5, 0.15,
+                f"{state_name} unemployment jobless", rate=True, start=date(1976, 1, 1),
+            )
+        return FakeSeries(
+            series_id, f"Real Gross Domestic Product: All Industry Total in {state_name}", "Mil. of Chn. 2017 $",
+            "A", "NSA", 55, 100000.0 + 10000.0 * (zlib.crc32(series_id.encode()) % 40), 0.02,
+            f"{state_name} real gdp output", start=date(1997, 1, 1),
+        )
+
+    def _history(self, series: FakeSeries) -> tuple[list[date], np.ndarray]:
+        with self._lock:
+            cached = self._values.get(series.series_id)
+            if cached is not None:
+                return cached
+            dates = _observation_dates(series, self.as_of)
+            if series.series_id == "USREC":
+                values = np.array(
+                    [float(any(start <= current <= end for start, end in _RECESSION_MONTHS)) for current in dates]
+                )
+            else:
+                rng = np.random.default_rng(zlib.crc32(series.series_id.encode()))
+                steps = rng.normal(0.0 if series.rate else 0.0005, series.volatility, len(dates))
+                if series.rate:
+                    # Mean-reverting around the catalog level so rates stay plausible.
+                    values = np.empty(len(dates))
+                    current = series.level
+                    for index, step in enumerate(steps.tolist()):
+                        current = series.level + 0.98 * (current - series.level) + step
+                        values[index] = current
+                    values = np.clip(values, 0.1, 25.0)
+                else:
+                    values = series.level * np.exp(np.cumsum(steps))
+                values = np.round(values, 3)
+            self._values[series.series_id] = (dates, values)
+            return dates, values
+
+    @staticmethod
+    def _metadata_item(series: FakeSeries) -> dict[str, Any]:
+        return {
+            "id": series.series_id,
+            "title": series.title,
+            "units": series.units,
+            "units_short": series.units,
+            "frequency_short": series.frequency,
+            "seasonal_adjustment_short": series.seasonal_adjustment,
+            "popularity": series.popularity,
+            "notes": f"Synthetic stand-in for {series.series_id}.",
+            "last_updated": "2024-01-05 07:45:00-06",
+        }
+
+    def _candidates(self) -> list[FakeSeries]:
+        candidates = list(self._series.values())
+        for code in STATE_CODE_TO_NAME:
+            candidates.extend(self.lookup(f"{code}{suffix}") for suffix in ("UR", "RGSP"))
+        return [series for series in candidates if series is not None]
+
+    def search(self, search_text: str, limit: int) -> dict[str, Any]:
+        recorded = self._recordings.get(f"series/search {search_text}")
+        if recorded is not None:
+            return recorded
+        query_tokens = _tokens(search_text)
+        scored = []
+        for series in self._candidates():
+            overlap = len(query_tokens & (_tokens(series.title) | _tokens(series.keywords) | {series.series_id.lower()}))
+            if overlap:
+                scored.append((overlap, series.popularity, series))
+        scored.sort(key=lambda item: (-item[0], -item[1], item[2].series_id))
+        return {"seriess": [self._metadata_item(series) for _, _, series in scored[:limit]]}
+
+    def metadata(self, series_id: str) -> dict[str, Any] | None:
+        recorded = self._recordings.get(f"series {series_id}")
+        if recorded is not None:
+            return recorded
+        series = self.lookup(series_id)
+        return None if series is None else {"seriess": [self._metadata_item(series)]}
+
+    def vintage_dates(
+        self,
+        series_id: str,
+        limit: int,
+        realtime_start: str | None = None,
+        sort_order: str | None = None,
+    ) -> dict[str, Any] | None:
+        recorded = self._recordings.get(f"series/vintagedates {series_id}")
+        if recorded is not None:
+            return recorded
+        series = self.lookup(series_id)
+        if series is None:
+            return None
+        vintages = self._vintages(series)
+        if realtime_start:
+            vintages = vintages[bisect_right(vintages, date.fromisoformat(realtime_start) - timedelta(days=1)) :]
+        if sort_order == "desc":
+            vintages = vintages[::-1]
+        return {"vintage_dates": [vintage.isoformat() for vintage in vintages[:limit]]}
+
+    def _vintages(self, series: FakeSeries) -> list[date]:
+        return [release + timedelta(days=4) for release in _month_starts(max(series.start, date(2000, 1, 1)), self.as_of)]
+
+    @staticmethod
+    def _realtime_periods(current: date, value: float, vintages: list[date]) -> list[tuple[date, date, float]]:
+        # Published with the first vintage more than 30 days later at a slightly different value,
+        # revised once more, then settled on the value plain requests return.
+        published = bisect_right(vintages, current + timedelta(days=30))
+        starts = vintages[published : published + 3] or [vintages[-1]] if vintages else []
+        periods = []
+        for index, start in enumerate(starts):
+            end = starts[index + 1] - timedelta(days=1) if index + 1 < len(starts) else _REALTIME_END
+            revised = value
+            if index + 1 < len(starts):
+                revised = round(value * (1.0 + 0.002 * (zlib.crc32(f"{current}{start}".encode()) % 7 - 3)), 3)
+            if periods and periods[-1][2] == revised:
+                start = periods.pop()[0]
+            periods.append((start, end, revised))
+        return periods
+
+    def observations(self, params: dict[str, str]) -> dict[str, Any] | None:
+        series_id = params.get("series_id", "")
+        recorded = self._recordings.get(f"series/observations {series_id}")
+        if recorded is not None:
+            return recorded
+        series = self.lookup(series_id)
+        if series is None:
+            return None
+
+        dates, values = self._history(series)
+        rows = list(zip(dates, values.tolist(), strict=True))
+        if "observation_start" in params:
+            start = date.fromisoformat(params["observation_start"])
+            rows = [row for row in rows if row[0] >= start]
+        if "observation_end" in params:
+            end = date.fromisoformat(params["observation_end"])
+            rows = [row for row in rows if row[0] <= end]
+        if "realtime_start" in params or "realtime_end" in params:
+            return self._realtime_observations(series, rows, params)
+        vintage = params.get("vintage_dates")
+        if vintage:
+            # Earlier vintages see fewer observations and slightly different (pre-revision) values.
+            vintage_date = date.fromisoformat(vintage.split(",")[-1])
+            vintages = self._vintages(series)
+            rows = [
+                (current, revised)
+                for current, value in rows
+                for start, end, revised in self._realtime_periods(current, value, vintages)
+                if start <= vintage_date <= end
+            ]
+        frequency = params.get("frequency", "").lower()
+        if frequency and frequency != series.frequency.lower():
+            grouped: dict[date, list[float]] = {}
+            for current, value in rows:
+                grouped.setdefault(_period_start(current, frequency), []).append(value)
+            method = params.get("aggregation_method", "avg")
+            rows = [
+                (period, values[-1] if method == "eop" else sum(values) if method == "sum" else sum(values) / len(values))
+                for period, values in grouped.items()
+            ]
+        if params.get("sort_order") == "desc":
+            rows.reverse()
+        if "limit" in params:
+            rows = rows[: int(params["limit"])]
+        return {
+            "count": len(rows),
+            "observations": [
+                {"date": current.isoformat(), "value": _format_value(value)}
+                for current, value in rows
+            ],
+        }
+
+    def _realtime_observations(
+        self, series: FakeSeries, rows: list[tuple[date, float]], params: dict[str, str]
+    ) -> dict[str, Any]:
+        realtime_start = date.fromisoformat(params.get("realtime_start", self.as_of.isoformat()))
+        realtime_end = date.fromisoformat(params.get("realtime_end", self.as_of.isoformat()))
+        initial_release_only = params.get("output_type") == "4"
+        vintages = self._vintages(series)
+        observations = []
+        for current, value in rows:
+            periods = self._realtime_periods(current, value, vintages)
+            for start, end, revised in periods[:1] if initial_release_only else periods:
+                if start > realtime_end or end < realtime_start:
+                    continue
+                observations.append(
+                    {
+                        "realtime_start": (start if initial_release_only else max(start, realtime_start)).isoformat(),
+                        "realtime_end": (end if initial_release_only else min(end, realtime_end)).isoformat(),
+                        "date": current.isoformat(),
+                        "value": _format_value(revised),
+                    }
+                )
+        count = len(observations)
+        offset = int(params.get("offset", 0))
+        observations = observations[offset : offset + int(params.get("limit", 100_000))]
+        return {"count": count, "offset": offset, "observations": observations}
+
+
+class FakeFREDServer:
+    """Threaded HTTP server answering FRED requests from a `FakeFREDCatalog`.
+
+    `latency_ms` is added to every response, plus a uniform random jitter of up to
+    `jitter_ms` either way. `calls` counts requests per endpoint.
+    """
+
+    def __init__(
+        self,
+        catalog: FakeFREDCatalog | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.catalog = catalog or FakeFREDCatalog()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.calls: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._lock = Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/fred"
+
+    def snapshot_calls(self) -> Counter[str]:
+        with self._lock:
+            return Counter(self.calls)
+
+    def _delay_seconds(self) -> float:
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000.0
+
+    def _respond(self, path: str, params: dict[str, str]) -> tuple[int, dict[str, Any]]:
+        endpoint = path.split("/fred/", 1)[-1].strip("/")
+        with self._lock:
+            self.calls[endpoint] += 1
+        time.sleep(self._delay_seconds())
+
+        if endpoint == "series/search":
+            payload = self.catalog.search(params.get("search_text", ""), int(params.get("limit", 10)))
+        elif endpoint == "series":
+            payload = self.catalog.metadata(params.get("series_id", ""))
+        elif endpoint == "series/observations":
+            payload = self.catalog.observations(params)
+        elif endpoint == "series/vintagedates":
+            payload = self.catalog.vintage_dates(
+                params.get("series_id", ""),
+                int(params.get("limit", 1000)),
+                params.get("realtime_start"),
+                params.get("sort_order"),
+            )
+        else:
+            return 404, {"error_code": 404, "error_message": f"Unknown endpoint {endpoint}."}
+        if payload is None:
+            return 400, {"error_code": 400, "error_message": "Bad Request.  The series does not exist."}
+        return 200, payload
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                parts = urlsplit(self.path)
+                params = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+                status, payload = server._respond(parts.path, params)
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                return
+
+        return Handler
+
+    def start(self) -> FakeFREDServer:
+        self._thread = Thread(target=self._httpd.serve_forever, name="fake-fred", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> FakeFREDServer:
+        return self.start()
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--recordings", help="JSON file of recorded payloads to serve before synthetic ones.")
+    args = parser.parse_args()
+
+    catalog = FakeFREDCatalog()
+    if args.recordings:
+        catalog.load_recordings(args.recordings)
+    server = FakeFREDServer(
+        catalog,
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+    )
+    print(f"Fake FRED listening on {server.base_url}")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,81 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import timedelta
+import json
 import logging
 from pathlib import Path
+from threading import Lock
 from typing import Any, TypeVar
 
 from fastapi import Body, Depends, FastAPI, Request, Response, status
 from fastapi.dependencies.utils import get_dependant, solve_dependencies
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+import httpx
 from pydantic import ValidationError
-
+from starlette.concurrency import run_in_threadpool
+
+from fred_query.cache import (
+    CachingFREDClient,
+    CatalogFREDClient,
+    FreshnessPolicy,
+    IntentParseCache,
+    ObservationStore,
+    SeriesCatalog,
+    VintageArchive,
+)
 from fred_query.errors import ConfigurationError, UpstreamServiceError
-from fred_query.api.models import ApiQueryResponse, ApiRoutedQueryResponse, AskRequest, StateGDPCompareRequest
+from fred_query.api.models import (
+    ApiQueryResponse,
+    ApiRoutedQueryResponse,
+    ApiStageTiming,
+    AskRequest,
+    StateGDPCompareRequest,
+)
 from fred_query.config import Settings, get_settings
 from fred_query.services import (
+    CrossSectionService,
     FREDClient,
+    FREDClientProtocol,
+    FastPathIntentParser,
+    FastPathStats,
     NaturalLanguageQueryService,
     OpenAIIntentParser,
     QuerySessionService,
+    QuerySessionStore,
+    ResolverService,
+    SingleSeriesLookupService,
+    SQLiteQuerySessionStore,
     StateGDPComparisonService,
 )
+from fred_query.services.fred_client import build_fred_http_client
+from fred_query.services.metrics import (
+    FAST_PATH_PARSES,
+    INTENT_CACHE_HIT_RATIO,
+    INTENT_CACHE_LOOKUPS,
+    QUERY_SESSION_BYTES,
+    QUERY_SESSIONS,
+    REGISTRY,
+    SINGLE_FLIGHT_CALLS,
+    SINGLE_FLIGHT_IN_FLIGHT,
+)
+from fred_query.services.progress import progress_listener
+from fred_query.services.recession_index import RecessionIndex
+from fred_query.services.vintage_analysis_service import VintageAnalysisService
+from fred_query.services.resolver_service import STATE_CODE_TO_NAME
+from fred_query.services.state_series_metadata import StateSeriesMetadataTable, bundled_state_series_metadata
+from fred_query.services.single_flight import SingleFlight
+from fred_query.services.stage_timing import StageTimings, stage
 
 STATIC_DIR = Path(__file__).parent / "static"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 LOGGER = logging.getLogger(__name__)
-QUERY_SESSION_SERVICE = QuerySessionService()
+_APP_STATE_LOCK = Lock()
 T = TypeVar("T")
 
 
@@ -34,49 +83,288 @@ def get_app_settings() -> Settings:
     return get_settings()
 
 
-def get_fred_client(settings: Settings = Depends(get_app_settings)) -> Iterator[FREDClient]:
-    client = _create_fred_client(settings)
+def _create_fred_http_client(settings: Settings) -> httpx.Client:
+    return build_fred_http_client(
+        base_url=settings.fred_base_url,
+        timeout_seconds=settings.http_timeout_seconds,
+        http2=settings.fred_http2,
+        max_connections=settings.fred_max_connections,
+        max_keepalive_connections=settings.fred_max_connections,
+    )
+
+
+def _state_value(app: FastAPI, name: str, factory: Callable[[], T]) -> T:
+    with _APP_STATE_LOCK:
+        value = getattr(app.state, name, None)
+        if value is None:
+            value = factory()
+            setattr(app.state, name, value)
+    return value
+
+
+def _app_state_value(request: Request, name: str, factory: Callable[[], T]) -> T:
+    return _state_value(request.app, name, factory)
+
+
+def get_fred_http_client(request: Request, settings: Settings = Depends(get_app_settings)) -> httpx.Client:
+    # One keep-alive pool per app so requests stop paying TCP+TLS setup on every FRED call.
+    return _app_state_value(request, "fred_http_client", lambda: _create_fred_http_client(settings))
+
+
+def get_fred_single_flight(request: Request) -> SingleFlight:
+    # Shared by every per-request FREDClient so identical concurrent calls hit FRED once.
+    return _app_state_value(request, "fred_single_flight", SingleFlight)
+
+
+def _create_background_fred_client(app: FastAPI, settings: Settings) -> FREDClient:
+    return _create_fred_client(
+        settings,
+        _state_value(app, "fred_http_client", lambda: _create_fred_http_client(settings)),
+        _state_value(app, "fred_single_flight", SingleFlight),
+    )
+
+
+def _start_recession_index(app: FastAPI, settings: Settings) -> None:
+    if settings.recession_index_refresh_hours <= 0 or not settings.fred_api_key:
+        return
+    index = RecessionIndex(refresh_interval=timedelta(hours=settings.recession_index_refresh_hours))
+    index.start(_create_background_fred_client(app, settings))
+    app.state.recession_index = index
+
+
+def get_recession_index(request: Request) -> RecessionIndex | None:
+    # Started by `_lifespan`, so requests never build or load it themselves.
+    return getattr(request.app.state, "recession_index", None)
+
+
+def _start_state_series_metadata(app: FastAPI, settings: Settings) -> None:
+    if settings.state_metadata_refresh_hours <= 0 or not settings.fred_api_key:
+        return
+    # The app's own table, so its refresh settings never reach other apps in the process.
+    table = StateSeriesMetadataTable(
+        bundled_state_series_metadata(STATE_CODE_TO_NAME),
+        refresh_interval=timedelta(hours=settings.state_metadata_refresh_hours),
+        max_concurrency=settings.fred_max_concurrency,
+    )
+    table.start(_create_background_fred_client(app, settings))
+    app.state.state_series_metadata = table
+
+
+def get_state_series_metadata(request: Request) -> StateSeriesMetadataTable | None:
+    # Started by `_lifespan`; without it resolvers use the bundled table.
+    return getattr(request.app.state, "state_series_metadata", None)
+
+
+def get_observation_store(request: Request, settings: Settings = Depends(get_app_settings)) -> ObservationStore | None:
+    if not settings.observation_cache_dir:
+        return None
+    return _app_state_value(
+        request,
+        "observation_store",
+        lambda: ObservationStore(settings.observation_cache_dir),
+    )
+
+
+def get_freshness_policy(request: Request, settings: Settings = Depends(get_app_settings)) -> FreshnessPolicy:
+    return _app_state_value(
+        request,
+        "freshness_policy",
+        lambda: FreshnessPolicy.from_release_calendar_path(settings.release_calendar_path),
+    )
+
+
+def get_series_catalog(request: Request, settings: Settings = Depends(get_app_settings)) -> SeriesCatalog | None:
+    if not settings.series_catalog_path:
+        return None
+    return _app_state_value(
+        request,
+        "series_catalog",
+        lambda: SeriesCatalog.load(settings.series_catalog_path),
+    )
+
+
+def get_vintage_archive(request: Request, settings: Settings = Depends(get_app_settings)) -> VintageArchive | None:
+    if not settings.vintage_archive_dir:
+        return None
+    return _app_state_value(
+        request,
+        "vintage_archive",
+        lambda: VintageArchive(settings.vintage_archive_dir),
+    )
+
+
+def get_fred_client(
+    settings: Settings = Depends(get_app_settings),
+    http_client: httpx.Client = Depends(get_fred_http_client),
+    single_flight: SingleFlight = Depends(get_fred_single_flight),
+    observation_store: ObservationStore | None = Depends(get_observation_store),
+    freshness_policy: FreshnessPolicy = Depends(get_freshness_policy),
+    series_catalog: SeriesCatalog | None = Depends(get_series_catalog),
+) -> Iterator[FREDClientProtocol]:
+    client: FREDClientProtocol = _create_fred_client(settings, http_client, single_flight)
+    if observation_store is not None:
+        client = CachingFREDClient(client, observation_store, freshness_policy=freshness_policy)
+    if series_catalog is not None:
+        client = CatalogFREDClient(client, series_catalog)
     try:
         yield client
     finally:
         client.close()
 
 
-def _create_fred_client(settings: Settings) -> FREDClient:
+def _create_fred_client(
+    settings: Settings,
+    http_client: httpx.Client | None = None,
+    single_flight: SingleFlight | None = None,
+) -> FREDClient:
     return FREDClient(
         api_key=settings.fred_api_key or "",
         base_url=settings.fred_base_url,
         timeout_seconds=settings.http_timeout_seconds,
+        http_client=http_client,
+        single_flight=single_flight,
     )
 
 
-def _create_natural_language_query_service(settings: Settings, fred_client: FREDClient) -> NaturalLanguageQueryService:
-    parser = OpenAIIntentParser(
+def _create_intent_parse_cache(settings: Settings) -> IntentParseCache | None:
+    if settings.intent_cache_size <= 0:
+        return None
+    return IntentParseCache(
+        max_entries=settings.intent_cache_size,
+        directory=settings.intent_cache_dir,
+        ttl=timedelta(hours=settings.intent_cache_ttl_hours),
+    )
+
+
+def get_intent_parse_cache(request: Request, settings: Settings = Depends(get_app_settings)) -> IntentParseCache | None:
+    if settings.intent_cache_size <= 0:
+        return None
+    return _app_state_value(request, "intent_parse_cache", lambda: _create_intent_parse_cache(settings))
+
+
+def get_fast_path_stats(request: Request) -> FastPathStats:
+    return _app_state_value(request, "fast_path_stats", FastPathStats)
+
+
+def _create_natural_language_query_service(
+    settings: Settings,
+    fred_client: FREDClientProtocol,
+    intent_cache: IntentParseCache | None = None,
+    fast_path_stats: FastPathStats | None = None,
+    recession_index: RecessionIndex | None = None,
+    vintage_archive: VintageArchive | None = None,
+    state_series_metadata: StateSeriesMetadataTable | None = None,
+) -> NaturalLanguageQueryService:
+    parser: OpenAIIntentParser | FastPathIntentParser = OpenAIIntentParser(
         api_key=settings.openai_api_key or "",
         model=settings.openai_model,
         reasoning_effort=settings.openai_reasoning_effort,
+        cache=intent_cache,
     )
+    if settings.fast_path_parser:
+        parser = FastPathIntentParser(parser, stats=fast_path_stats)
+    vintage_analysis_service = VintageAnalysisService(fred_client, vintage_archive=vintage_archive)
+    resolver_service = ResolverService(fred_client, state_series_metadata=state_series_metadata)
     return NaturalLanguageQueryService(
         parser=parser,
         fred_client=fred_client,
+        cross_section_service=CrossSectionService(
+            fred_client,
+            resolver_service=resolver_service,
+            max_concurrency=settings.fred_max_concurrency,
+        ),
+        single_series_service=SingleSeriesLookupService(
+            fred_client,
+            resolver_service=resolver_service,
+            vintage_analysis_service=vintage_analysis_service,
+            recession_index=recession_index,
+            vintage_deadline_seconds=settings.vintage_deadline_seconds,
+        ),
+        vintage_analysis_service=vintage_analysis_service,
+        recession_index=recession_index,
+        resolver_service=resolver_service,
     )
 
 
 def get_natural_language_query_service(
     settings: Settings = Depends(get_app_settings),
-    fred_client: FREDClient = Depends(get_fred_client),
+    fred_client: FREDClientProtocol = Depends(get_fred_client),
+    intent_cache: IntentParseCache | None = Depends(get_intent_parse_cache),
+    fast_path_stats: FastPathStats = Depends(get_fast_path_stats),
+    recession_index: RecessionIndex | None = Depends(get_recession_index),
+    state_series_metadata: StateSeriesMetadataTable | None = Depends(get_state_series_metadata),
+    vintage_archive: VintageArchive | None = Depends(get_vintage_archive),
 ) -> NaturalLanguageQueryService:
-    return _create_natural_language_query_service(settings, fred_client)
+    return _create_natural_language_query_service(
+        settings,
+        fred_client,
+        intent_cache,
+        fast_path_stats,
+        recession_index,
+        vintage_archive,
+        state_series_metadata,
+    )
 
 
 def get_state_gdp_comparison_service(
-    fred_client: FREDClient = Depends(get_fred_client),
+    fred_client: FREDClientProtocol = Depends(get_fred_client),
+    recession_index: RecessionIndex | None = Depends(get_recession_index),
+    state_series_metadata: StateSeriesMetadataTable | None = Depends(get_state_series_metadata),
 ) -> StateGDPComparisonService:
-    return StateGDPComparisonService(fred_client)
+    return StateGDPComparisonService(
+        fred_client,
+        resolver_service=ResolverService(fred_client, state_series_metadata=state_series_metadata),
+        recession_index=recession_index,
+    )
 
 
-def get_query_session_service() -> QuerySessionService:
-    return QUERY_SESSION_SERVICE
+def _create_query_session_service(settings: Settings) -> QuerySessionStore:
+    if settings.session_store_path:
+        return SQLiteQuerySessionStore(
+            settings.session_store_path,
+            idle_ttl=timedelta(minutes=settings.session_idle_ttl_minutes),
+            max_revisions=settings.session_max_revisions,
+        )
+    return QuerySessionService(
+        max_sessions=settings.session_max_count,
+        idle_ttl=timedelta(minutes=settings.session_idle_ttl_minutes),
+        max_revisions=settings.session_max_revisions,
+        full_revisions=settings.session_full_revisions,
+        memory_budget_bytes=int(settings.session_memory_budget_mb * 1024 * 1024),
+    )
+
+
+def get_query_session_service(
+    request: Request,
+    settings: Settings = Depends(get_app_settings),
+) -> QuerySessionStore:
+    return _app_state_value(request, "query_session_service", lambda: _create_query_session_service(settings))
+
+
+def _publish_component_metrics(
+    *,
+    intent_cache: IntentParseCache | None,
+    fast_path_stats: FastPathStats,
+    single_flight: SingleFlight,
+    query_session_service: QuerySessionStore,
+) -> None:
+    # These components keep their own counters; copy them into the registry at scrape time
+    # instead of adding a second increment to their hot paths.
+    if intent_cache is not None:
+        cache_stats = intent_cache.stats()
+        INTENT_CACHE_LOOKUPS.set_total(cache_stats.hits, outcome="hit")
+        INTENT_CACHE_LOOKUPS.set_total(cache_stats.misses, outcome="miss")
+        INTENT_CACHE_HIT_RATIO.set(cache_stats.hit_rate)
+    fast_path = fast_path_stats.to_dict()
+    for pattern, pattern_stats in fast_path["patterns"].items():
+        FAST_PATH_PARSES.set_total(pattern_stats["hits"], pattern=pattern)
+    FAST_PATH_PARSES.set_total(fast_path["fallback"]["count"], pattern="fallback")
+    flight_stats = single_flight.stats()
+    SINGLE_FLIGHT_CALLS.set_total(flight_stats.executed, outcome="executed")
+    SINGLE_FLIGHT_CALLS.set_total(flight_stats.coalesced, outcome="coalesced")
+    SINGLE_FLIGHT_IN_FLIGHT.set(flight_stats.in_flight)
+    QUERY_SESSIONS.set(query_session_service.session_count())
+    QUERY_SESSION_BYTES.set(query_session_service.estimated_bytes())
 
 
 def _validate_request_model(model_type: type[T], payload: Any) -> T:
@@ -123,11 +411,92 @@ async def _managed_dependency(
         yield solved.values[value_name]
 
 
+def _sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
+async def _answer_ask_request(
+    http_request: Request,
+    request: AskRequest,
+    query_session_service: QuerySessionStore,
+    timings: StageTimings,
+) -> ApiRoutedQueryResponse:
+    # Session stores may block on disk (SQLite reads, lock waits, commits), so they run in worker
+    # threads too; that also lets concurrent `store_turn` calls share a group commit.
+    with stage("session", timings=timings):
+        session = await run_in_threadpool(query_session_service.get_or_create, request.session_id)
+        session_context = await run_in_threadpool(
+            query_session_service.get_context,
+            session_id=session.session_id,
+            revision_id=request.base_revision_id,
+        )
+    async with _managed_dependency(
+        http_request,
+        _resolve_natural_language_query_service,
+        value_name="service",
+    ) as service:
+        # The service layer is synchronous; keep the event loop free for other in-flight requests.
+        # The worker thread inherits this context, so the service's stages land in `timings`.
+        with stage("service", timings=timings):
+            response = await run_in_threadpool(
+                service.ask,
+                request.query,
+                selected_series_id=request.selected_series_id,
+                selected_series_ids=request.selected_series_ids,
+                session_context=session_context,
+            )
+    with stage("session", timings=timings):
+        stored_session, revision = await run_in_threadpool(
+            query_session_service.store_turn,
+            session_id=session.session_id,
+            query=request.query,
+            response=response,
+        )
+    with stage("response", timings=timings):
+        api_response = ApiRoutedQueryResponse.from_routed_response(
+            response,
+            session_id=stored_session.session_id,
+            revision_id=revision.revision_id,
+        )
+    if request.include_timings:
+        api_response.timings = ApiStageTiming.from_stage_timings(timings)
+    return api_response
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Resolve settings the way requests do, so a dependency override also configures startup.
+    settings = app.dependency_overrides.get(get_app_settings, get_app_settings)()
+    _start_recession_index(app, settings)
+    _start_state_series_metadata(app, settings)
+    try:
+        yield
+    finally:
+        with _APP_STATE_LOCK:
+            recession_index = getattr(app.state, "recession_index", None)
+            app.state.recession_index = None
+            state_series_metadata = getattr(app.state, "state_series_metadata", None)
+            app.state.state_series_metadata = None
+            http_client = getattr(app.state, "fred_http_client", None)
+            app.state.fred_http_client = None
+            query_session_service = getattr(app.state, "query_session_service", None)
+            app.state.query_session_service = None
+        if query_session_service is not None:
+            query_session_service.close()
+        if recession_index is not None:
+            recession_index.stop()
+        if state_series_metadata is not None:
+            state_series_metadata.stop()
+        if http_client is not None:
+            http_client.close()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="FRED Query API",
         version="0.1.0",
         description="Natural-language FRED query backend with deterministic execution and plot-ready responses.",
+        lifespan=_lifespan,
     )
     app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
@@ -183,38 +552,111 @@ def create_app() -> FastAPI:
     def health() -> dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/api/cache/intent")
+    def intent_cache_stats(
+        intent_cache: IntentParseCache | None = Depends(get_intent_parse_cache),
+    ) -> dict[str, object]:
+        if intent_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **intent_cache.stats().to_dict()}
+
+    @app.get("/api/parser/fast-path")
+    def fast_path_stats(
+        stats: FastPathStats = Depends(get_fast_path_stats),
+        settings: Settings = Depends(get_app_settings),
+    ) -> dict[str, object]:
+        return {"enabled": settings.fast_path_parser, **stats.to_dict()}
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics(
+        intent_cache: IntentParseCache | None = Depends(get_intent_parse_cache),
+        fast_path_stats: FastPathStats = Depends(get_fast_path_stats),
+        single_flight: SingleFlight = Depends(get_fred_single_flight),
+        query_session_service: QuerySessionStore = Depends(get_query_session_service),
+    ) -> Response:
+        _publish_component_metrics(
+            intent_cache=intent_cache,
+            fast_path_stats=fast_path_stats,
+            single_flight=single_flight,
+            query_session_service=query_session_service,
+        )
+        return Response(content=REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
     @app.post("/api/ask", response_model=ApiRoutedQueryResponse)
     async def ask(
         http_request: Request,
+        http_response: Response,
         payload: dict[str, Any] = Body(...),
-        query_session_service: QuerySessionService = Depends(get_query_session_service),
+        query_session_service: QuerySessionStore = Depends(get_query_session_service),
     ) -> ApiRoutedQueryResponse:
         request = _validate_request_model(AskRequest, payload)
-        session = query_session_service.get_or_create(request.session_id)
-        session_context = query_session_service.get_context(
-            session_id=session.session_id,
-            revision_id=request.base_revision_id,
-        )
-        async with _managed_dependency(
-            http_request,
-            _resolve_natural_language_query_service,
-            value_name="service",
-        ) as service:
-            response = service.ask(
-                request.query,
-                selected_series_id=request.selected_series_id,
-                selected_series_ids=request.selected_series_ids,
-                session_context=session_context,
-            )
-        stored_session, revision = query_session_service.store_turn(
-            session_id=session.session_id,
-            query=request.query,
-            response=response,
-        )
-        return ApiRoutedQueryResponse.from_routed_response(
-            response,
-            session_id=stored_session.session_id,
-            revision_id=revision.revision_id,
+        timings = StageTimings()
+        api_response = await _answer_ask_request(http_request, request, query_session_service, timings)
+        http_response.headers["Server-Timing"] = timings.server_timing_header()
+        return api_response
+
+    @app.post("/api/ask/stream", response_class=StreamingResponse)
+    async def ask_stream(
+        http_request: Request,
+        payload: dict[str, Any] = Body(...),
+        query_session_service: QuerySessionStore = Depends(get_query_session_service),
+    ) -> StreamingResponse:
+        request = _validate_request_model(AskRequest, payload)
+        timings = StageTimings()
+
+        def error_event(exc: BaseException) -> str:
+            # The 200 status is already on the wire, so failures travel as an `error` event
+            # carrying the same code the JSON endpoint would have returned.
+            if isinstance(exc, ConfigurationError):
+                LOGGER.warning("Configuration error while serving request: %s", exc)
+                content = error_payload(code="service_configuration_error", message=str(exc))
+            elif isinstance(exc, UpstreamServiceError):
+                LOGGER.warning("Upstream service error from %s: %s", exc.service, exc)
+                content = error_payload(code=f"{exc.service}_error", message=str(exc))
+            elif isinstance(exc, (ValueError, RequestValidationError)):
+                LOGGER.info("Invalid request rejected: %s", exc)
+                content = error_payload(code="invalid_request", message=str(exc))
+            else:
+                LOGGER.exception("Unhandled request error", exc_info=exc)
+                content = error_payload(
+                    code="internal_server_error",
+                    message="The server hit an unexpected error while processing the request.",
+                )
+            return _sse_event("error", content)
+
+        async def events() -> AsyncIterator[str]:
+            loop = asyncio.get_running_loop()
+            queue: asyncio.Queue[tuple[str, dict[str, Any]] | None] = asyncio.Queue()
+
+            def publish(event: str, data: dict[str, Any]) -> None:
+                # Called from the service's worker threads.
+                loop.call_soon_threadsafe(queue.put_nowait, (event, data))
+
+            async def answer() -> ApiRoutedQueryResponse:
+                with progress_listener(publish):
+                    return await _answer_ask_request(http_request, request, query_session_service, timings)
+
+            task = asyncio.create_task(answer())
+            # Progress events are queued before the worker returns, so this marker always comes last.
+            task.add_done_callback(lambda _: queue.put_nowait(None))
+            while (item := await queue.get()) is not None:
+                event, data = item
+                if event == "chart":
+                    data = {"plotly_figure": data["chart"].to_plotly_dict()}
+                yield _sse_event(event, data)
+            try:
+                api_response = task.result()
+            except Exception as exc:
+                yield error_event(exc)
+                return
+            yield _sse_event("answer", api_response)
+            yield _sse_event("follow_ups", {"follow_up_suggestions": api_response.follow_up_suggestions})
+            yield _sse_event("done", {"session_id": api_response.session_id, "revision_id": api_response.revision_id})
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
     @app.post("/api/compare/state-gdp", response_model=ApiQueryResponse)
@@ -228,7 +670,8 @@ def create_app() -> FastAPI:
             _resolve_state_gdp_comparison_service,
             value_name="service",
         ) as service:
-            response = service.compare(
+            response = await run_in_threadpool(
+                service.compare,
                 state1=request.state1,
                 state2=request.state2,
                 start_date=request.start_date,
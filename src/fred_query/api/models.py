@@ -15,6 +15,7 @@ from fred_query.schemas.analysis import (
 )
 from fred_query.schemas.intent import QueryIntent
 from fred_query.schemas.resolved_series import SeriesSearchMatch
+from fred_query.services.stage_timing import StageTimings
 
 
 class AskRequest(BaseModel):
@@ -25,6 +26,7 @@ class AskRequest(BaseModel):
     base_revision_id: str | None = None
     selected_series_id: str | None = None
     selected_series_ids: list[str | None] = Field(default_factory=list)
+    include_timings: StrictBool = False
 
     @field_validator("query")
     @classmethod
@@ -119,6 +121,17 @@ class ApiQueryResponse(BaseModel):
         )
 
 
+class ApiStageTiming(BaseModel):
+    name: str
+    count: int
+    duration_ms: float
+    upstream_calls: int
+
+    @classmethod
+    def from_stage_timings(cls, timings: StageTimings) -> list["ApiStageTiming"]:
+        return [cls.model_validate(entry) for entry in timings.to_dict()]
+
+
 class ApiRoutedQueryResponse(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
@@ -132,6 +145,7 @@ class ApiRoutedQueryResponse(BaseModel):
     result: QueryResponse | None = None
     plotly_figure: dict[str, Any] | None = None
     follow_up_suggestions: list[FollowUpSuggestion] = Field(default_factory=list)
+    timings: list[ApiStageTiming] | None = None
 
     @classmethod
     def from_routed_response(
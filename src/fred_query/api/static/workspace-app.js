@@ -68,6 +68,7 @@ export function mountWorkspaceApp() {
     const resultRenderer = createResultRenderer(elements);
     let workspace = loadWorkspace();
     let isLoading = false;
+    let streamPreview = null;
     let selectedClarificationSeriesId = null;
 
     function setHidden(element, hidden) {
@@ -225,7 +226,7 @@ export function mountWorkspaceApp() {
 
     function syncStatus() {
         if (isLoading) {
-            updateStatus("working", "Processing query...");
+            updateStatus("working", streamPreview?.message || "Processing query...");
             return;
         }
         const activeRevision = getActiveRevision();
@@ -265,7 +266,21 @@ export function mountWorkspaceApp() {
             .join("");
     }
 
+    function renderStreamPreview() {
+        elements.activeResultTitle.textContent = streamPreview.title || truncateText(streamPreview.prompt, 56);
+        elements.activeResultMeta.textContent = "Preview | Finishing analysis...";
+        resultRenderer.clearClarificationPanel();
+        resultRenderer.renderUnsupportedPanel(null);
+        resultRenderer.renderChartPreview(streamPreview.figure);
+        setHidden(elements.workspaceContextBanner, true);
+        setHidden(elements.emptyStatePanel, true);
+    }
+
     function renderActiveRevision() {
+        if (streamPreview?.figure) {
+            renderStreamPreview();
+            return;
+        }
         const activeRevision = getActiveRevision();
         if (!activeRevision) {
             elements.activeResultTitle.textContent = "Result workspace";
@@ -307,7 +322,7 @@ export function mountWorkspaceApp() {
     }
 
     function renderApp() {
-        const hasWorkspace = workspace.revisions.length > 0;
+        const hasWorkspace = workspace.revisions.length > 0 || Boolean(streamPreview?.figure);
         const hasRevisionHistory = workspace.revisions.length > 1;
         const targetSlot = hasWorkspace ? elements.workspaceComposerSlot : elements.entryComposerSlot;
         if (elements.composerCard.parentElement !== targetSlot) {
@@ -378,11 +393,64 @@ export function mountWorkspaceApp() {
         };
     }
 
+    async function readServerSentEvents(response, onEvent) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = "";
+        for (;;) {
+            const { value, done } = await reader.read();
+            buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+            let boundary = buffer.indexOf("\n\n");
+            while (boundary !== -1) {
+                const block = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+                boundary = buffer.indexOf("\n\n");
+                let event = "message";
+                const data = [];
+                block.split("\n").forEach((line) => {
+                    if (line.startsWith("event: ")) {
+                        event = line.slice(7);
+                    } else if (line.startsWith("data: ")) {
+                        data.push(line.slice(6));
+                    }
+                });
+                if (data.length) {
+                    onEvent(event, JSON.parse(data.join("\n")));
+                }
+            }
+            if (done) {
+                return;
+            }
+        }
+    }
+
+    function applyStreamEvent(event, data) {
+        if (event === "intent") {
+            streamPreview.message = "Finding the right series...";
+        } else if (event === "resolved_series") {
+            const titles = (data.series || []).map((item) => item.title || item.series_id);
+            streamPreview.title = titles.length === 1 ? titles[0] : streamPreview.title;
+            streamPreview.message = titles.length ? `Fetching ${truncateText(titles.join(", "), 80)}...` : "Fetching data...";
+        } else if (event === "chart") {
+            streamPreview.figure = data.plotly_figure;
+            streamPreview.message = "Chart ready. Finishing analysis...";
+            renderApp();
+            return;
+        } else if (event === "answer") {
+            streamPreview.answer = data;
+        } else if (event === "follow_ups" && streamPreview.answer) {
+            streamPreview.answer.follow_up_suggestions = data.follow_up_suggestions || [];
+        } else if (event === "error") {
+            throw new Error(data?.error?.message || data?.detail || "The query request failed.");
+        }
+        syncStatus();
+    }
+
     async function submitQuery({ query, requestBaseRevisionId = null, parentRevisionId = null, selectedSeriesIds = [], replaceRevisionId = null }) {
         clearError();
         setLoading(true);
         try {
-            const response = await fetch("/api/ask", {
+            const response = await fetch("/api/ask/stream", {
                 method: "POST",
                 headers: { "Content-Type": "application/json" },
                 body: JSON.stringify({
@@ -393,10 +461,18 @@ export function mountWorkspaceApp() {
                     selected_series_ids: selectedSeriesIds,
                 }),
             });
-            const payload = await response.json();
             if (!response.ok) {
-                throw new Error(payload?.error?.message || payload?.detail || "The query request failed.");
+                const failure = await response.json().catch(() => null);
+                throw new Error(failure?.error?.message || failure?.detail || "The query request failed.");
+            }
+            // Intermediate events (resolved series, an early chart) render while the answer is still being built.
+            streamPreview = { prompt: query, title: "", message: "Processing query...", figure: null, answer: null };
+            await readServerSentEvents(response, applyStreamEvent);
+            const payload = streamPreview.answer;
+            if (!payload) {
+                throw new Error("The query stream ended before an answer arrived.");
             }
+            streamPreview = null;
 
             workspace.sessionId = payload.session_id || workspace.sessionId;
             const revision = buildRevision(query, payload, parentRevisionId);
@@ -418,6 +494,7 @@ export function mountWorkspaceApp() {
         } catch (error) {
             showError(error instanceof Error ? error.message : "Unexpected error.");
         } finally {
+            streamPreview = null;
             setLoading(false);
         }
     }
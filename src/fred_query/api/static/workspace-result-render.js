@@ -713,6 +713,16 @@ export function createResultRenderer(elements) {
         syncDetailGridVisibility();
     }
 
+    function renderChartPreview(figure) {
+        clearResultCanvas();
+        if (!figure) {
+            return;
+        }
+        setHidden(results, false);
+        setHidden(summaryGrid, true);
+        renderChart(figure, {}, { compact: false });
+    }
+
     function clearClarificationPanel() {
         clarificationQuestion.textContent = "";
         clarificationOptions.innerHTML = "";
@@ -785,6 +795,7 @@ export function createResultRenderer(elements) {
         clearResultCanvas,
         getClarificationButtons,
         getFollowUpButtons,
+        renderChartPreview,
         renderClarificationPanel,
         renderResultPayload,
         renderUnsupportedPanel,
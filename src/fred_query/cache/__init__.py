@@ -1 +1,31 @@
-"""Cache layer placeholder for future metadata and response caching."""
+"""Local caches that sit in front of the FRED API."""
+
+from fred_query.cache.caching_fred_client import CachingFREDClient
+from fred_query.cache.catalog_fred_client import CatalogFREDClient
+from fred_query.cache.freshness import FreshnessPolicy, ReleaseCalendar
+from fred_query.cache.intent_cache import IntentCacheStats, IntentParseCache
+from fred_query.cache.observation_store import (
+    CachedMetadata,
+    ObservationCacheKey,
+    ObservationSpan,
+    ObservationStore,
+)
+from fred_query.cache.series_catalog import CatalogHit, SeriesCatalog
+from fred_query.cache.vintage_archive import VintageArchive, VintageHistory
+
+__all__ = [
+    "CachedMetadata",
+    "CachingFREDClient",
+    "CatalogFREDClient",
+    "CatalogHit",
+    "FreshnessPolicy",
+    "IntentCacheStats",
+    "IntentParseCache",
+    "ObservationCacheKey",
+    "ObservationSpan",
+    "ObservationStore",
+    "ReleaseCalendar",
+    "SeriesCatalog",
+    "VintageArchive",
+    "VintageHistory",
+]
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import date, datetime, timedelta, timezone
+
+from fred_query.cache.freshness import FreshnessPolicy
+from fred_query.cache.observation_store import (
+    SERIES_START,
+    CachedMetadata,
+    ObservationCacheKey,
+    ObservationSpan,
+    ObservationStore,
+)
+from fred_query.errors import UpstreamServiceError
+from fred_query.schemas.observation_series import ObservationSeries
+from fred_query.schemas.resolved_series import SeriesMetadata, SeriesSearchMatch
+from fred_query.schemas.vintage_analysis import VintageObservation
+from fred_query.services.fred_client import OUTPUT_REALTIME_PERIODS, FREDClientProtocol
+from fred_query.services.metrics import METADATA_CACHE_LOOKUPS, OBSERVATION_CACHE_LOOKUPS
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class CachingFREDClient:
+    """FREDClient wrapper that answers metadata and observation ranges from an ObservationStore.
+
+    Range requests are served from the stored span when it covers them; otherwise
+    only the missing head and/or tail is fetched and merged into the span.
+    Aggregated requests (an explicit `frequency`) are refetched over the union
+    range instead of stitched, because FRED aggregates edge periods within the
+    requested window. `limit`-bounded requests always go upstream.
+
+    Entries carry an expiry from `FreshnessPolicy`. Fresh entries are served with
+    no upstream call; stale spans are revalidated against the series' FRED
+    `last_updated` stamp and only refetched when it has moved.
+    """
+
+    def __init__(
+        self,
+        fred_client: FREDClientProtocol,
+        store: ObservationStore,
+        *,
+        freshness_policy: FreshnessPolicy | None = None,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.fred_client = fred_client
+        self.store = store
+        self.freshness_policy = freshness_policy or FreshnessPolicy()
+        self._clock = clock
+
+    def close(self) -> None:
+        self.fred_client.close()
+
+    def search_series(
+        self,
+        search_text: str,
+        limit: int = 10,
+        *,
+        tag_names: str | None = None,
+        filter_variable: str | None = None,
+        filter_value: str | None = None,
+    ) -> list[SeriesSearchMatch]:
+        return self.fred_client.search_series(
+            search_text,
+            limit,
+            tag_names=tag_names,
+            filter_variable=filter_variable,
+            filter_value=filter_value,
+        )
+
+    def _refresh_metadata(self, series_id: str, now: datetime) -> SeriesMetadata:
+        metadata = self.fred_client.get_series_metadata(series_id)
+        self.store.put_metadata(
+            series_id,
+            CachedMetadata(metadata=metadata, expires_at=self.freshness_policy.expires_at(metadata, fetched_at=now)),
+        )
+        return metadata
+
+    def get_series_metadata(self, series_id: str) -> SeriesMetadata:
+        now = self._clock()
+        cached = self.store.get_metadata(series_id)
+        if cached is not None and cached.is_fresh(now):
+            METADATA_CACHE_LOOKUPS.inc(outcome="hit")
+            return cached.metadata
+        METADATA_CACHE_LOOKUPS.inc(outcome="miss")
+        return self._refresh_metadata(series_id, now)
+
+    def get_series_vintage_dates(
+        self,
+        series_id: str,
+        limit: int = 1000,
+        *,
+        realtime_start: date | None = None,
+        sort_order: str | None = None,
+    ) -> list[date]:
+        return self.fred_client.get_series_vintage_dates(
+            series_id, limit=limit, realtime_start=realtime_start, sort_order=sort_order
+        )
+
+    def get_series_observations_for_vintage_date(
+        self,
+        series_id: str,
+        vintage_date: date,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        *,
+        frequency: str | None = None,
+        aggregation_method: str | None = None,
+        limit: int | None = None,
+        sort_order: str | None = None,
+    ) -> ObservationSeries:
+        return self.fred_client.get_series_observations_for_vintage_date(
+            series_id,
+            vintage_date,
+            start_date,
+            end_date,
+            frequency=frequency,
+            aggregation_method=aggregation_method,
+            limit=limit,
+            sort_order=sort_order,
+        )
+
+    def get_series_realtime_observations(
+        self,
+        series_id: str,
+        realtime_start: date | None = None,
+        realtime_end: date | None = None,
+        *,
+        output_type: int = OUTPUT_REALTIME_PERIODS,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> list[VintageObservation]:
+        return self.fred_client.get_series_realtime_observations(
+            series_id,
+            realtime_start,
+            realtime_end,
+            output_type=output_type,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+    def _fetch_span(
+        self,
+        key: ObservationCacheKey,
+        *,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> ObservationSpan:
+        observations = ObservationSeries.coerce(
+            self.fred_client.get_series_observations(
+                key.series_id,
+                start_date=start_date,
+                end_date=end_date,
+                frequency=key.frequency,
+                aggregation_method=key.aggregation_method,
+            )
+        )
+        covered_start = start_date or SERIES_START
+        if end_date is not None and end_date < self._clock().date():
+            # A bounded fetch covers its whole window, so a later request past end_date fetches
+            # the tail; values FRED adds inside the window later surface through revalidation.
+            return ObservationSpan(covered_start=covered_start, covered_end=end_date, observations=observations)
+
+        # Unbounded (or reaching today): the tail stays open for observations published after the last one seen.
+        if observations:
+            covered_end = observations[-1].date
+        else:
+            covered_end = covered_start - timedelta(days=1) if covered_start > SERIES_START else covered_start
+        return ObservationSpan(
+            covered_start=covered_start,
+            covered_end=covered_end,
+            observations=observations,
+            tail_open=True,
+        )
+
+    def _stamp(
+        self,
+        span: ObservationSpan,
+        *,
+        series_id: str,
+        now: datetime,
+        metadata: SeriesMetadata | None = None,
+    ) -> ObservationSpan:
+        if metadata is None:
+            try:
+                metadata = self.get_series_metadata(series_id)
+            except UpstreamServiceError:
+                metadata = None
+        return replace(
+            span,
+            last_updated=metadata.last_updated if metadata is not None else None,
+            expires_at=self.freshness_policy.expires_at(metadata, fetched_at=now),
+        )
+
+    def _revalidate(self, key: ObservationCacheKey, span: ObservationSpan, now: datetime) -> ObservationSpan | None:
+        """Extend a stale span's expiry when FRED reports no update since it was fetched."""
+
+        metadata = self._refresh_metadata(key.series_id, now)
+        if metadata.last_updated is None or metadata.last_updated != span.last_updated:
+            return None
+        return self._stamp(span, series_id=key.series_id, now=now, metadata=metadata)
+
+    def _extend_span(
+        self,
+        key: ObservationCacheKey,
+        span: ObservationSpan,
+        *,
+        start_date: date,
+        end_date: date | None,
+    ) -> ObservationSpan:
+        if key.frequency:
+            union_start = min(start_date, span.covered_start)
+            return self._fetch_span(
+                key,
+                start_date=None if union_start == SERIES_START else union_start,
+                end_date=None if end_date is None or span.tail_open else max(end_date, span.covered_end),
+            )
+
+        if start_date < span.covered_start:
+            head = self._fetch_span(
+                key,
+                start_date=None if start_date == SERIES_START else start_date,
+                end_date=span.covered_start - timedelta(days=1),
+            )
+            span = span.merge(head)
+        if not span.tail_open and (end_date is None or end_date > span.covered_end):
+            tail = self._fetch_span(
+                key,
+                start_date=span.covered_end + timedelta(days=1),
+                end_date=end_date,
+            )
+            span = span.merge(tail)
+        return span
+
+    def _needs_extension(self, span: ObservationSpan, *, start_date: date, end_date: date | None) -> bool:
+        if start_date < span.covered_start:
+            return True
+        if span.tail_open:
+            # A fresh open tail already holds everything published so far.
+            return False
+        return end_date is None or end_date > span.covered_end
+
+    def get_series_observations(
+        self,
+        series_id: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        *,
+        frequency: str | None = None,
+        aggregation_method: str | None = None,
+        limit: int | None = None,
+        sort_order: str | None = None,
+    ) -> ObservationSeries:
+        if limit is not None:
+            OBSERVATION_CACHE_LOOKUPS.inc(outcome="bypass")
+            return self.fred_client.get_series_observations(
+                series_id,
+                start_date=start_date,
+                end_date=end_date,
+                frequency=frequency,
+                aggregation_method=aggregation_method,
+                limit=limit,
+                sort_order=sort_order,
+            )
+
+        key = ObservationCacheKey(series_id, frequency, aggregation_method)
+        requested_start = start_date or SERIES_START
+        with self.store.locked(key):
+            now = self._clock()
+            span = self.store.get(key)
+            fetch_start, fetch_end = start_date, end_date
+            changed = False
+            if span is not None and not span.is_fresh(now):
+                revalidated = self._revalidate(key, span, now)
+                if revalidated is None:
+                    # The series changed upstream; refetch everything the span held plus the request.
+                    union_start = min(requested_start, span.covered_start)
+                    fetch_start = None if union_start == SERIES_START else union_start
+                    fetch_end = None if end_date is None or span.tail_open else max(end_date, span.covered_end)
+                span = revalidated
+                changed = True
+
+            if span is None:
+                OBSERVATION_CACHE_LOOKUPS.inc(outcome="miss")
+                span = self._stamp(
+                    self._fetch_span(key, start_date=fetch_start, end_date=fetch_end),
+                    series_id=series_id,
+                    now=now,
+                )
+            elif self._needs_extension(span, start_date=requested_start, end_date=end_date):
+                OBSERVATION_CACHE_LOOKUPS.inc(outcome="extended")
+                span = self._stamp(
+                    self._extend_span(key, span, start_date=requested_start, end_date=end_date),
+                    series_id=series_id,
+                    now=now,
+                )
+            elif not changed:
+                OBSERVATION_CACHE_LOOKUPS.inc(outcome="hit")
+                return self._slice(span, start_date=start_date, end_date=end_date, sort_order=sort_order)
+            else:
+                OBSERVATION_CACHE_LOOKUPS.inc(outcome="revalidated")
+            self.store.put(key, span)
+
+        return self._slice(span, start_date=start_date, end_date=end_date, sort_order=sort_order)
+
+    @staticmethod
+    def _slice(
+        span: ObservationSpan,
+        *,
+        start_date: date | None,
+        end_date: date | None,
+        sort_order: str | None,
+    ) -> ObservationSeries:
+        observations = span.slice(start_date, end_date)
+        if sort_order == "desc":
+            return observations[::-1]
+        return observations
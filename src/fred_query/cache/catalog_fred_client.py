@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from datetime import date
+
+from fred_query.cache.series_catalog import SeriesCatalog, catalog_tokens
+from fred_query.schemas.observation_series import ObservationSeries
+from fred_query.schemas.resolved_series import SeriesMetadata, SeriesSearchMatch
+from fred_query.schemas.vintage_analysis import VintageObservation
+from fred_query.services.fred_client import OUTPUT_REALTIME_PERIODS, FREDClientProtocol
+from fred_query.services.metrics import SERIES_CATALOG_LOOKUPS
+
+
+class CatalogFREDClient:
+    """FREDClient wrapper that answers `search_series` from a local `SeriesCatalog`.
+
+    The catalog only holds what earlier searches returned, so its BM25 ranking alone
+    cannot stand in for FRED's. A search stays local when FRED already answered the
+    same text, or when the catalog was bulk-filled by `refresh-catalog` and at least
+    `limit` series match every query term. Otherwise it goes to FRED and the results
+    are recorded. Tag and filter searches always go upstream.
+    """
+
+    def __init__(self, fred_client: FREDClientProtocol, catalog: SeriesCatalog) -> None:
+        self.fred_client = fred_client
+        self.catalog = catalog
+
+    def close(self) -> None:
+        self.fred_client.close()
+
+    def search_series(
+        self,
+        search_text: str,
+        limit: int = 10,
+        *,
+        tag_names: str | None = None,
+        filter_variable: str | None = None,
+        filter_value: str | None = None,
+    ) -> list[SeriesSearchMatch]:
+        plain = tag_names is None and filter_variable is None and filter_value is None
+        if plain:
+            local = self._search_locally(search_text, limit)
+            if local is not None:
+                SERIES_CATALOG_LOOKUPS.inc(outcome="hit")
+                return local
+            SERIES_CATALOG_LOOKUPS.inc(outcome="fallback")
+        else:
+            SERIES_CATALOG_LOOKUPS.inc(outcome="bypass")
+
+        matches = self.fred_client.search_series(
+            search_text,
+            limit,
+            tag_names=tag_names,
+            filter_variable=filter_variable,
+            filter_value=filter_value,
+        )
+        if plain:
+            self.catalog.record_search(search_text, matches, limit=limit)
+        else:
+            self.catalog.upsert(matches)
+        return matches
+
+    def _search_locally(self, search_text: str, limit: int) -> list[SeriesSearchMatch] | None:
+        recorded = self.catalog.recorded_search(search_text, limit)
+        if recorded is not None:
+            return recorded
+        if not self.catalog.bulk_filled:
+            return None
+        term_count = len(set(catalog_tokens(search_text)))
+        hits = self.catalog.search(search_text, limit=limit)
+        if term_count == 0 or len(hits) < limit or any(hit.matched_terms < term_count for hit in hits):
+            return None
+        return [hit.series for hit in hits]
+
+    def get_series_metadata(self, series_id: str) -> SeriesMetadata:
+        return self.fred_client.get_series_metadata(series_id)
+
+    def get_series_observations(
+        self,
+        series_id: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        *,
+        frequency: str | None = None,
+        aggregation_method: str | None = None,
+        limit: int | None = None,
+        sort_order: str | None = None,
+    ) -> ObservationSeries:
+        return self.fred_client.get_series_observations(
+            series_id,
+            start_date,
+            end_date,
+            frequency=frequency,
+            aggregation_method=aggregation_method,
+            limit=limit,
+            sort_order=sort_order,
+        )
+
+    def get_series_vintage_dates(
+        self,
+        series_id: str,
+        limit: int = 1000,
+        *,
+        realtime_start: date | None = None,
+        sort_order: str | None = None,
+    ) -> list[date]:
+        return self.fred_client.get_series_vintage_dates(
+            series_id, limit=limit, realtime_start=realtime_start, sort_order=sort_order
+        )
+
+    def get_series_observations_for_vintage_date(
+        self,
+        series_id: str,
+        vintage_date: date,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        *,
+        frequency: str | None = None,
+        aggregation_method: str | None = None,
+        limit: int | None = None,
+        sort_order: str | None = None,
+    ) -> ObservationSeries:
+        return self.fred_client.get_series_observations_for_vintage_date(
+            series_id,
+            vintage_date,
+            start_date,
+            end_date,
+            frequency=frequency,
+            aggregation_method=aggregation_method,
+            limit=limit,
+            sort_order=sort_order,
+        )
+
+    def get_series_realtime_observations(
+        self,
+        series_id: str,
+        realtime_start: date | None = None,
+        realtime_end: date | None = None,
+        *,
+        output_type: int = OUTPUT_REALTIME_PERIODS,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> list[VintageObservation]:
+        return self.fred_client.get_series_realtime_observations(
+            series_id,
+            realtime_start,
+            realtime_end,
+            output_type=output_type,
+            start_date=start_date,
+            end_date=end_date,
+        )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta, timezone
+from fnmatch import fnmatchcase
+import json
+from pathlib import Path
+
+from fred_query.schemas.resolved_series import SeriesMetadata
+from fred_query.services.transform.planning import TransformPlanningService
+
+
+class ReleaseCalendar:
+    """Known upcoming release dates, keyed by series ID or fnmatch pattern (e.g. `*RGSP`).
+
+    The JSON file format is `{"UNRATE": ["2024-08-02", ...], "*RGSP": [...]}`.
+    """
+
+    def __init__(self, releases: dict[str, list[date]] | None = None) -> None:
+        self._releases = {pattern.upper(): sorted(dates) for pattern, dates in (releases or {}).items()}
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> ReleaseCalendar:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            {pattern: [date.fromisoformat(value) for value in values] for pattern, values in payload.items()}
+        )
+
+    def _dates_for(self, series_id: str) -> list[date] | None:
+        normalized = series_id.upper()
+        if normalized in self._releases:
+            return self._releases[normalized]
+        for pattern, dates in self._releases.items():
+            if fnmatchcase(normalized, pattern):
+                return dates
+        return None
+
+    def next_release_after(self, series_id: str, moment: datetime) -> datetime | None:
+        dates = self._dates_for(series_id)
+        if not dates:
+            return None
+        index = bisect_right(dates, moment.date())
+        if index >= len(dates):
+            return None
+        return datetime.combine(dates[index], time.min, tzinfo=timezone.utc)
+
+
+class FreshnessPolicy:
+    """Decide how long a cached FRED response can be served without asking upstream.
+
+    An entry stays fresh until the next expected update: the next release-calendar
+    date when one is known, otherwise `last_updated` plus the series' native
+    update interval. The result is clamped to a per-frequency maximum so
+    unscheduled revisions are picked up, and overdue series are retried after
+    `overdue_retry`.
+    """
+
+    _MAX_TTL_BY_PERIODS_PER_YEAR = {
+        252: timedelta(days=1),
+        52: timedelta(days=2),
+        26: timedelta(days=2),
+        12: timedelta(days=3),
+    }
+    _DEFAULT_MAX_TTL = timedelta(days=7)
+
+    def __init__(
+        self,
+        *,
+        release_calendar: ReleaseCalendar | None = None,
+        overdue_retry: timedelta = timedelta(hours=1),
+    ) -> None:
+        self.release_calendar = release_calendar
+        self.overdue_retry = overdue_retry
+
+    @classmethod
+    def from_release_calendar_path(cls, path: str | Path | None) -> FreshnessPolicy:
+        return cls(release_calendar=ReleaseCalendar.from_file(path) if path else None)
+
+    @staticmethod
+    def _periods_per_year(frequency: str | None) -> int:
+        return TransformPlanningService.periods_per_year_for_frequency(frequency)
+
+    @classmethod
+    def max_ttl(cls, frequency: str | None) -> timedelta:
+        return cls._MAX_TTL_BY_PERIODS_PER_YEAR.get(cls._periods_per_year(frequency), cls._DEFAULT_MAX_TTL)
+
+    @classmethod
+    def next_expected_update(cls, frequency: str | None, last_updated: datetime) -> datetime:
+        periods_per_year = cls._periods_per_year(frequency)
+        if periods_per_year >= 252:
+            candidate = last_updated + timedelta(days=1)
+            while candidate.weekday() >= 5:
+                candidate += timedelta(days=1)
+            return candidate
+        return last_updated + timedelta(days=365 / periods_per_year)
+
+    def expires_at(self, metadata: SeriesMetadata | None, *, fetched_at: datetime) -> datetime:
+        frequency = metadata.frequency if metadata is not None else None
+        ceiling = fetched_at + self.max_ttl(frequency)
+        if metadata is None:
+            return fetched_at + self.overdue_retry
+
+        expected = None
+        if self.release_calendar is not None:
+            expected = self.release_calendar.next_release_after(metadata.series_id, fetched_at)
+        if expected is None and metadata.last_updated is not None:
+            expected = self.next_expected_update(frequency, metadata.last_updated)
+        if expected is None:
+            return ceiling
+        if expected <= fetched_at:
+            return fetched_at + self.overdue_retry
+        return min(expected, ceiling)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+from threading import Lock, get_ident
+from typing import Any
+
+from pydantic import ValidationError
+
+from fred_query.schemas.intent import QueryIntent
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def normalize_query_text(query: str) -> str:
+    """Collapse case, whitespace and trailing punctuation so trivially different phrasings share a key."""
+
+    return re.sub(r"\s+", " ", query).strip().rstrip("?.!").strip().casefold()
+
+
+@dataclass(frozen=True)
+class IntentCacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": self.size,
+            "max_entries": self.max_entries,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class IntentParseCache:
+    """LRU cache of parsed QueryIntent objects, optionally persisted as one JSON file per key.
+
+    Keys cover everything that can change the parser output: the normalized query,
+    the model and reasoning effort, the parser instructions, any follow-up context
+    and the current UTC date, since relative ranges ("the past 5 years") are parsed
+    into absolute dates. Entries also expire `ttl` after they were stored, in memory
+    and on disk. Cached intents are copied on the way in and out because downstream
+    services mutate them.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        directory: str | Path | None = None,
+        ttl: timedelta = timedelta(hours=24),
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[QueryIntent, datetime]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def key_for(
+        self,
+        query: str,
+        *,
+        model: str,
+        reasoning_effort: str | None,
+        instructions: str,
+        context: dict[str, object] | None = None,
+    ) -> str:
+        material = {
+            "query": normalize_query_text(query),
+            "model": model,
+            "reasoning_effort": (reasoning_effort or "").lower(),
+            "instructions": hashlib.sha256(instructions.encode("utf-8")).hexdigest(),
+            "context": context,
+            "as_of": self._clock().date().isoformat(),
+        }
+        serialized = json.dumps(material, default=str, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> tuple[QueryIntent, datetime] | None:
+        path = self._path_for(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            return QueryIntent.model_validate(payload["intent"]), datetime.fromisoformat(payload["stored_at"])
+        except (OSError, ValueError, KeyError, TypeError, ValidationError):
+            return None
+
+    def _write(self, key: str, intent: QueryIntent, stored_at: datetime) -> None:
+        path = self._path_for(key)
+        if path is None:
+            return
+        payload = {"stored_at": stored_at.isoformat(), "intent": intent.model_dump(mode="json")}
+        temporary_path = path.with_suffix(f".{os.getpid()}.{get_ident()}.tmp")
+        temporary_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(temporary_path, path)
+
+    def _forget(self, key: str) -> None:
+        self._entries.pop(key, None)
+        path = self._path_for(key)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, intent: QueryIntent, stored_at: datetime) -> None:
+        self._entries[key] = (intent, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> QueryIntent | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            else:
+                entry = self._read(key)
+                if entry is not None:
+                    self._remember(key, *entry)
+            if entry is not None and self._clock() - entry[1] >= self.ttl:
+                self._forget(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry[0].model_copy(deep=True)
+
+    def put(self, key: str, intent: QueryIntent) -> None:
+        stored = intent.model_copy(deep=True)
+        stored_at = self._clock()
+        with self._lock:
+            self._remember(key, stored, stored_at)
+            self._write(key, stored, stored_at)
+
+    def stats(self) -> IntentCacheStats:
+        with self._lock:
+            return IntentCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+        if self.directory is not None:
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
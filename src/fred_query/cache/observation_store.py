@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime
+import json
+import os
+from pathlib import Path
+import re
+from threading import Lock, get_ident
+from typing import Any, TypeVar
+
+import numpy as np
+
+from fred_query.schemas.observation_series import ObservationSeries
+from fred_query.schemas.resolved_series import SeriesMetadata
+
+
+SERIES_START = date.min
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+@dataclass(frozen=True)
+class ObservationCacheKey:
+    series_id: str
+    frequency: str | None = None
+    aggregation_method: str | None = None
+
+    def file_stem(self) -> str:
+        parts = [self.series_id, self.frequency or "native", self.aggregation_method or "default"]
+        return "__".join(re.sub(r"[^A-Za-z0-9_.-]", "_", part) for part in parts)
+
+
+@dataclass(frozen=True)
+class ObservationSpan:
+    """A contiguous, fully-known date range of observations for one cache key.
+
+    Every observation dated within [covered_start, covered_end] is present in
+    `observations`, which is sorted by date. `tail_open` marks spans whose end is
+    the latest observation seen rather than a settled bound; such a tail is
+    current for as long as the span is fresh.
+    """
+
+    covered_start: date
+    covered_end: date
+    observations: ObservationSeries = field(default_factory=ObservationSeries)
+    tail_open: bool = False
+    last_updated: datetime | None = None
+    expires_at: datetime | None = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "observations", ObservationSeries.coerce(self.observations))
+
+    def is_fresh(self, moment: datetime) -> bool:
+        return self.expires_at is not None and moment < self.expires_at
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        return self.covered_start <= start_date and end_date <= self.covered_end
+
+    def slice(self, start_date: date | None, end_date: date | None) -> ObservationSeries:
+        return self.observations.between(start_date, end_date)
+
+    def merge(self, other: ObservationSpan) -> ObservationSpan:
+        """Union two overlapping or adjacent spans, preferring `other` for duplicate dates.
+
+        Freshness fields are kept from `self`; callers restamp the merged span.
+        """
+
+        kept = ~np.isin(self.observations.dates, other.observations.dates)
+        dates = np.concatenate((self.observations.dates[kept], other.observations.dates))
+        values = np.concatenate((self.observations.values[kept], other.observations.values))
+        order = np.argsort(dates, kind="stable")
+        return ObservationSpan(
+            covered_start=min(self.covered_start, other.covered_start),
+            covered_end=max(self.covered_end, other.covered_end),
+            observations=ObservationSeries(dates[order], values[order]),
+            tail_open=other.tail_open if other.covered_end >= self.covered_end else self.tail_open,
+            last_updated=self.last_updated,
+            expires_at=self.expires_at,
+        )
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "covered_start": self.covered_start.isoformat(),
+            "covered_end": self.covered_end.isoformat(),
+            "tail_open": self.tail_open,
+            "last_updated": _isoformat(self.last_updated),
+            "expires_at": _isoformat(self.expires_at),
+            "observations": [
+                [raw_date, value]
+                for raw_date, value in zip(
+                    self.observations.dates.astype(str).tolist(),
+                    self.observations.values.tolist(),
+                    strict=True,
+                )
+            ],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> ObservationSpan:
+        rows = payload.get("observations", [])
+        return cls(
+            covered_start=date.fromisoformat(payload["covered_start"]),
+            covered_end=date.fromisoformat(payload["covered_end"]),
+            observations=ObservationSeries(
+                [raw_date for raw_date, _ in rows],
+                [float(raw_value) for _, raw_value in rows],
+            ),
+            tail_open=bool(payload.get("tail_open", False)),
+            last_updated=_parse_datetime(payload.get("last_updated")),
+            expires_at=_parse_datetime(payload.get("expires_at")),
+        )
+
+
+@dataclass(frozen=True)
+class CachedMetadata:
+    metadata: SeriesMetadata
+    expires_at: datetime
+
+    def is_fresh(self, moment: datetime) -> bool:
+        return moment < self.expires_at
+
+    def to_payload(self) -> dict[str, Any]:
+        return {"metadata": self.metadata.model_dump(mode="json"), "expires_at": self.expires_at.isoformat()}
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> CachedMetadata:
+        return cls(
+            metadata=SeriesMetadata.model_validate(payload["metadata"]),
+            expires_at=datetime.fromisoformat(payload["expires_at"]),
+        )
+
+
+class ObservationStore:
+    """Observation spans keyed by (series_id, frequency, aggregation_method), plus series metadata.
+
+    When `directory` is set, every entry is persisted as one JSON file per key, so it
+    survives process restarts. The files are the store of record; memory holds only
+    the `max_entries` most recently used spans (and as many metadata entries) in front of them.
+    """
+
+    def __init__(self, directory: str | Path | None = None, *, max_entries: int = 256) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            (self.directory / "metadata").mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._spans: OrderedDict[ObservationCacheKey, ObservationSpan | None] = OrderedDict()
+        self._metadata: OrderedDict[str, CachedMetadata | None] = OrderedDict()
+        self._guard = Lock()
+        self._key_locks: dict[ObservationCacheKey, Lock] = {}
+
+    @contextmanager
+    def locked(self, key: ObservationCacheKey) -> Iterator[None]:
+        """Serialize read-fetch-write cycles for one key without blocking other keys."""
+
+        with self._guard:
+            key_lock = self._key_locks.setdefault(key, Lock())
+        with key_lock:
+            yield
+
+    def _path_for(self, key: ObservationCacheKey) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / f"{key.file_stem()}.json"
+
+    def _metadata_path_for(self, series_id: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / "metadata" / f"{ObservationCacheKey(series_id).file_stem()}.json"
+
+    @staticmethod
+    def _read_payload(path: Path | None) -> dict[str, Any] | None:
+        if path is None or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_payload(path: Path | None, payload: dict[str, Any]) -> None:
+        if path is None:
+            return
+        temporary_path = path.with_suffix(f".{os.getpid()}.{get_ident()}.tmp")
+        temporary_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(temporary_path, path)
+
+    def _recall(self, entries: OrderedDict[K, V], key: K) -> tuple[bool, V | None]:
+        with self._guard:
+            if key not in entries:
+                return False, None
+            entries.move_to_end(key)
+            return True, entries[key]
+
+    def _remember(self, entries: OrderedDict[K, V], key: K, value: V) -> None:
+        with self._guard:
+            entries[key] = value
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def get(self, key: ObservationCacheKey) -> ObservationSpan | None:
+        found, span = self._recall(self._spans, key)
+        if found:
+            return span
+
+        span = None
+        payload = self._read_payload(self._path_for(key))
+        if payload is not None:
+            try:
+                span = ObservationSpan.from_payload(payload)
+            except (ValueError, KeyError, TypeError):
+                span = None
+        self._remember(self._spans, key, span)
+        return span
+
+    def put(self, key: ObservationCacheKey, span: ObservationSpan) -> None:
+        self._remember(self._spans, key, span)
+        self._write_payload(self._path_for(key), span.to_payload())
+
+    def get_metadata(self, series_id: str) -> CachedMetadata | None:
+        found, cached = self._recall(self._metadata, series_id)
+        if found:
+            return cached
+
+        cached = None
+        payload = self._read_payload(self._metadata_path_for(series_id))
+        if payload is not None:
+            try:
+                cached = CachedMetadata.from_payload(payload)
+            except (ValueError, KeyError, TypeError):
+                cached = None
+        self._remember(self._metadata, series_id, cached)
+        return cached
+
+    def put_metadata(self, series_id: str, cached: CachedMetadata) -> None:
+        self._remember(self._metadata, series_id, cached)
+        self._write_payload(self._metadata_path_for(series_id), cached.to_payload())
+
+    def clear(self) -> None:
+        with self._guard:
+            self._spans.clear()
+            self._metadata.clear()
+        if self.directory is not None:
+            for path in [*self.directory.glob("*.json"), *self.directory.glob("metadata/*.json")]:
+                path.unlink(missing_ok=True)
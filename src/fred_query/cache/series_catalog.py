@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import heapq
+import json
+import math
+import os
+from pathlib import Path
+import re
+from threading import Lock, get_ident
+from typing import Any
+
+from pydantic import ValidationError
+
+from fred_query.schemas.resolved_series import SeriesSearchMatch
+from fred_query.services.fred_client import FREDClientProtocol
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({"a", "an", "and", "at", "by", "for", "from", "in", "of", "on", "the", "to", "with"})
+
+# Per-field term weights: an id or title hit says far more about a series than a word in its notes.
+_FIELD_WEIGHTS = (
+    ("series_id", 3.0),
+    ("title", 2.0),
+    ("units", 1.0),
+    ("frequency", 1.0),
+    ("seasonal_adjustment", 1.0),
+    ("notes", 0.25),
+)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def catalog_tokens(text: str | None) -> list[str]:
+    """Lowercase word tokens without stopwords, with a plural 's' stripped ("rates" -> "rate")."""
+
+    tokens: list[str] = []
+    for token in _TOKEN_PATTERN.findall((text or "").casefold()):
+        if token in _STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def search_key(text: str | None) -> str:
+    """The normalized form under which a search text's FRED results are recorded."""
+
+    return " ".join(catalog_tokens(text))
+
+
+@dataclass(frozen=True)
+class RecordedSearch:
+    """The series FRED returned for one search text, best first, when asked for up to `limit`."""
+
+    series_ids: tuple[str, ...]
+    limit: int
+    bulk: bool = False
+    recorded_at: datetime | None = None
+
+    def answers(self, limit: int) -> bool:
+        # A shorter list than was asked for means FRED had nothing more to give.
+        return limit <= self.limit or len(self.series_ids) < self.limit
+
+
+@dataclass(frozen=True)
+class CatalogHit:
+    series: SeriesSearchMatch
+    score: float
+    matched_terms: int
+
+
+class SeriesCatalog:
+    """In-process FRED series catalog with an inverted index and BM25 scoring.
+
+    Documents are `SeriesSearchMatch` records; fields are weighted by `_FIELD_WEIGHTS`
+    and FRED popularity (0-100) adds up to `popularity_weight` to the text score.
+    `upsert` replaces a series' postings in place, so the catalog can be refreshed
+    incrementally from FRED search results. `record_search` also remembers which
+    series FRED returned for a search text (at most `max_searches`, oldest dropped
+    first); searches recorded by `refresh` mark the catalog as bulk-filled, and any
+    other recorded search is trusted for `search_ttl`.
+    Snapshots are JSON lines, one series or recorded search each.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[SeriesSearchMatch] = (),
+        *,
+        k1: float = 1.2,
+        b: float = 0.75,
+        popularity_weight: float = 1.0,
+        max_searches: int = 10_000,
+        search_ttl: timedelta = timedelta(hours=24),
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.k1 = k1
+        self.b = b
+        self.popularity_weight = popularity_weight
+        self._entries: dict[str, SeriesSearchMatch] = {}
+        self._doc_terms: dict[str, dict[str, float]] = {}
+        self._doc_lengths: dict[str, float] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        self._total_length = 0.0
+        # BM25 length norms per series; rebuilt on the first search after an upsert changes the average.
+        self._norms: dict[str, float] | None = None
+        self.max_searches = max(1, max_searches)
+        self._searches: dict[str, RecordedSearch] = {}
+        self._bulk_searches = 0
+        self.search_ttl = search_ttl
+        self._clock = clock
+        self._lock = Lock()
+        self.upsert(entries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, series_id: str) -> SeriesSearchMatch | None:
+        with self._lock:
+            entry = self._entries.get(series_id.upper())
+        return entry.model_copy() if entry is not None else None
+
+    @staticmethod
+    def _document_terms(entry: SeriesSearchMatch) -> dict[str, float]:
+        terms: dict[str, float] = {}
+        for field_name, weight in _FIELD_WEIGHTS:
+            for token in catalog_tokens(getattr(entry, field_name)):
+                terms[token] = terms.get(token, 0.0) + weight
+        return terms
+
+    def _remove_unlocked(self, series_id: str) -> None:
+        if self._entries.pop(series_id, None) is None:
+            return
+        for token in self._doc_terms.pop(series_id):
+            postings = self._postings[token]
+            del postings[series_id]
+            if not postings:
+                del self._postings[token]
+        self._total_length -= self._doc_lengths.pop(series_id)
+        self._norms = None
+
+    def upsert(self, entries: Iterable[SeriesSearchMatch]) -> int:
+        """Add or replace series by id; returns how many were written."""
+
+        prepared = [(entry, self._document_terms(entry)) for entry in entries]
+        with self._lock:
+            for entry, terms in prepared:
+                series_id = entry.series_id.upper()
+                self._remove_unlocked(series_id)
+                self._entries[series_id] = entry
+                self._doc_terms[series_id] = terms
+                length = sum(terms.values())
+                self._doc_lengths[series_id] = length
+                self._total_length += length
+                for token, weight in terms.items():
+                    self._postings.setdefault(token, {})[series_id] = weight
+            if prepared:
+                self._norms = None
+        return len(prepared)
+
+    def remove(self, series_id: str) -> None:
+        with self._lock:
+            self._remove_unlocked(series_id.upper())
+
+    @property
+    def bulk_filled(self) -> bool:
+        return self._bulk_searches > 0
+
+    def record_search(
+        self,
+        text: str,
+        entries: Iterable[SeriesSearchMatch],
+        *,
+        limit: int,
+        bulk: bool = False,
+    ) -> int:
+        """Upsert FRED's results for `text` and remember them as its answer; returns series written."""
+
+        entries = list(entries)
+        written = self.upsert(entries)
+        key = search_key(text)
+        if not key:
+            return written
+        record = RecordedSearch(tuple(entry.series_id.upper() for entry in entries), limit, bulk, self._clock())
+        with self._lock:
+            self._record_unlocked(key, record)
+        return written
+
+    def _forget_unlocked(self, key: str) -> None:
+        record = self._searches.pop(key, None)
+        if record is not None and record.bulk:
+            self._bulk_searches -= 1
+
+    def _record_unlocked(self, key: str, record: RecordedSearch) -> None:
+        previous = self._searches.get(key)
+        if previous is not None and previous.bulk and not record.bulk and previous.limit >= record.limit:
+            record = previous
+        self._forget_unlocked(key)
+        self._searches[key] = record
+        if record.bulk:
+            self._bulk_searches += 1
+        while len(self._searches) > self.max_searches:
+            self._forget_unlocked(next(iter(self._searches)))
+
+    def _expired(self, record: RecordedSearch) -> bool:
+        # Bulk records live until the next refresh; a runtime answer (or one of unknown age) goes stale.
+        if record.bulk:
+            return False
+        return record.recorded_at is None or self._clock() - record.recorded_at >= self.search_ttl
+
+    def recorded_search(self, text: str, limit: int = 10) -> list[SeriesSearchMatch] | None:
+        """FRED's recorded answer for `text` when it is still current and covers `limit` results, else None."""
+
+        key = search_key(text)
+        with self._lock:
+            record = self._searches.get(key)
+            if record is not None and self._expired(record):
+                self._forget_unlocked(key)
+                return None
+            if record is None or not record.answers(limit):
+                return None
+            entries = [self._entries.get(series_id) for series_id in record.series_ids[:limit]]
+        if any(entry is None for entry in entries):
+            return None
+        return [entry.model_copy() for entry in entries]
+
+    def search(self, text: str, limit: int = 10) -> list[CatalogHit]:
+        terms = list(dict.fromkeys(catalog_tokens(text)))
+        if not terms or limit < 1:
+            return []
+
+        scores: dict[str, float] = {}
+        matched: dict[str, int] = {}
+        k1 = self.k1
+        with self._lock:
+            document_count = len(self._entries)
+            if not document_count:
+                return []
+            norms = self._norms
+            if norms is None:
+                average_length = self._total_length / document_count
+                norms = self._norms = {
+                    series_id: k1 * (1.0 - self.b + self.b * length / average_length)
+                    for series_id, length in self._doc_lengths.items()
+                }
+            # Rarest terms first. Once they have produced enough candidates, a much more common
+            # term only rescores those candidates instead of walking its whole posting list.
+            postings_by_term = sorted(
+                (postings for postings in map(self._postings.get, terms) if postings),
+                key=len,
+            )
+            for postings in postings_by_term:
+                idf = math.log(1.0 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5)) * (k1 + 1.0)
+                if len(scores) >= limit and len(postings) > 4 * len(scores):
+                    items = [(series_id, postings[series_id]) for series_id in scores if series_id in postings]
+                else:
+                    items = postings.items()
+                for series_id, frequency in items:
+                    scores[series_id] = scores.get(series_id, 0.0) + idf * frequency / (frequency + norms[series_id])
+                    matched[series_id] = matched.get(series_id, 0) + 1
+            best = heapq.nlargest(
+                limit,
+                scores,
+                key=lambda series_id: (
+                    matched[series_id],
+                    scores[series_id] + self.popularity_weight * (self._entries[series_id].popularity or 0) / 100.0,
+                ),
+            )
+            entries = [self._entries[series_id] for series_id in best]
+        return [
+            CatalogHit(
+                series=entry.model_copy(),
+                score=scores[series_id] + self.popularity_weight * (entry.popularity or 0) / 100.0,
+                matched_terms=matched[series_id],
+            )
+            for series_id, entry in zip(best, entries)
+        ]
+
+    def refresh(self, fred_client: FREDClientProtocol, search_texts: Iterable[str], *, limit: int = 1000) -> int:
+        """Bulk-fetch FRED search results for each text into the catalog; returns series written."""
+
+        return sum(
+            self.record_search(text, fred_client.search_series(text, limit=limit), limit=limit, bulk=True)
+            for text in search_texts
+        )
+
+    @classmethod
+    def load(cls, path: str | Path, **kwargs: Any) -> SeriesCatalog:
+        """Load a JSON-lines snapshot, skipping unreadable lines; a missing file gives an empty catalog."""
+
+        catalog = cls(**kwargs)
+        snapshot_path = Path(path)
+        if not snapshot_path.exists():
+            return catalog
+        entries: list[SeriesSearchMatch] = []
+        searches: dict[str, RecordedSearch] = {}
+        with snapshot_path.open(encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    if line.lstrip().startswith('{"search"'):
+                        payload = json.loads(line)
+                        searches[payload["search"]] = RecordedSearch(
+                            tuple(payload["series_ids"]),
+                            int(payload["limit"]),
+                            bool(payload.get("bulk", False)),
+                            datetime.fromisoformat(payload["recorded_at"]) if payload.get("recorded_at") else None,
+                        )
+                    else:
+                        entries.append(SeriesSearchMatch.model_validate_json(line))
+                except (ValueError, ValidationError, KeyError, TypeError):
+                    continue
+        catalog.upsert(entries)
+        with catalog._lock:
+            for key, record in searches.items():
+                catalog._record_unlocked(key, record)
+        return catalog
+
+    def save(self, path: str | Path) -> None:
+        snapshot_path = Path(path)
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda entry: entry.series_id)
+            searches = list(self._searches.items())
+        temporary_path = snapshot_path.with_suffix(f".{os.getpid()}.{get_ident()}.tmp")
+        temporary_path.write_text(
+            "".join(entry.model_dump_json(exclude_none=True) + "\n" for entry in entries)
+            + "".join(
+                json.dumps(
+                    {
+                        "search": key,
+                        "limit": record.limit,
+                        "bulk": record.bulk,
+                        "recorded_at": record.recorded_at.isoformat() if record.recorded_at else None,
+                        "series_ids": list(record.series_ids),
+                    }
+                )
+                + "\n"
+                for key, record in searches
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temporary_path, snapshot_path)
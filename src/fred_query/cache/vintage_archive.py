@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta, timezone
+import json
+import os
+from pathlib import Path
+from threading import Lock, get_ident
+from typing import Any
+
+from fred_query.cache.observation_store import ObservationCacheKey
+from fred_query.schemas.vintage_analysis import VintageObservation, VintageSeriesData
+from fred_query.services.fred_client import FREDClientProtocol
+from fred_query.services.metrics import VINTAGE_ARCHIVE_SYNCS
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _merge_periods(
+    stored: list[VintageObservation],
+    fetched: list[VintageObservation],
+    since: date,
+) -> list[VintageObservation]:
+    """Append real-time periods fetched from `since` onward to the stored ones.
+
+    ALFRED clips fetched periods to start at `since`; a value that was already current
+    then keeps its stored start. Stored periods still open at `since` with no fetched
+    continuation (the observation was revised or dropped) are closed the day before.
+    """
+
+    merged = [row for row in stored if row.realtime_end is not None and row.realtime_end < since]
+    open_rows = {
+        (row.date, row.value): row
+        for row in stored
+        if row.vintage_date < since and (row.realtime_end is None or row.realtime_end >= since)
+    }
+    for row in fetched:
+        previous = open_rows.pop((row.date, row.value), None) if row.vintage_date == since else None
+        merged.append(row if previous is None else row.model_copy(update={"vintage_date": previous.vintage_date}))
+    merged.extend(
+        row.model_copy(update={"realtime_end": since - timedelta(days=1)}) for row in open_rows.values()
+    )
+    merged.sort(key=lambda row: (row.date, row.vintage_date))
+    return merged
+
+
+@dataclass(frozen=True)
+class VintageHistory:
+    """Every stored real-time period of one series, through vintage `synced_through`."""
+
+    series_id: str
+    observations: list[VintageObservation] = field(default_factory=list)
+    vintage_dates: list[date] = field(default_factory=list)
+    synced_through: date | None = None
+    checked_at: datetime | None = None
+    data: VintageSeriesData = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Built once per history so the revision matrix is shared by every request that reads it.
+        object.__setattr__(
+            self,
+            "data",
+            VintageSeriesData.from_realtime_periods(self.series_id, self.series_id, self.observations),
+        )
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "series_id": self.series_id,
+            "synced_through": self.synced_through.isoformat() if self.synced_through else None,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+            "vintage_dates": [vintage_date.isoformat() for vintage_date in self.vintage_dates],
+            "observations": [
+                [
+                    row.date.isoformat(),
+                    row.value,
+                    row.vintage_date.isoformat(),
+                    row.realtime_end.isoformat() if row.realtime_end else None,
+                ]
+                for row in self.observations
+            ],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> VintageHistory:
+        return cls(
+            series_id=payload["series_id"],
+            observations=[
+                VintageObservation.model_construct(
+                    date=date.fromisoformat(raw_date),
+                    value=float(value),
+                    vintage_date=date.fromisoformat(raw_start),
+                    realtime_end=date.fromisoformat(raw_end) if raw_end else None,
+                )
+                for raw_date, value, raw_start, raw_end in payload.get("observations", [])
+            ],
+            vintage_dates=[date.fromisoformat(value) for value in payload.get("vintage_dates", [])],
+            synced_through=date.fromisoformat(payload["synced_through"]) if payload.get("synced_through") else None,
+            checked_at=datetime.fromisoformat(payload["checked_at"]) if payload.get("checked_at") else None,
+        )
+
+
+class VintageArchive:
+    """Per-series ALFRED revision history that only ever downloads new vintages.
+
+    Published vintages never change, so `history` keeps each series' real-time
+    periods and, at most once per `check_interval`, asks FRED for vintage dates
+    after `synced_through`, `page_size` at a time. Only when there are some does it
+    fetch the periods from that point on and merge them in. With `directory` set,
+    each series is persisted as one JSON file; those files are the store of record
+    and memory keeps only the `max_histories` most recently used histories.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        *,
+        check_interval: timedelta = timedelta(hours=1),
+        page_size: int = 10_000,
+        max_histories: int = 32,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.check_interval = check_interval
+        self.page_size = max(1, page_size)
+        self.max_histories = max(1, max_histories)
+        self._clock = clock
+        self._histories: OrderedDict[str, VintageHistory | None] = OrderedDict()
+        self._guard = Lock()
+        self._series_locks: dict[str, Lock] = {}
+
+    @contextmanager
+    def locked(self, series_id: str) -> Iterator[None]:
+        with self._guard:
+            series_lock = self._series_locks.setdefault(series_id, Lock())
+        with series_lock:
+            yield
+
+    def _path_for(self, series_id: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / f"{ObservationCacheKey(series_id).file_stem()}.json"
+
+    def _remember(self, series_id: str, history: VintageHistory | None) -> None:
+        with self._guard:
+            self._histories[series_id] = history
+            self._histories.move_to_end(series_id)
+            while len(self._histories) > self.max_histories:
+                self._histories.popitem(last=False)
+
+    def get(self, series_id: str) -> VintageHistory | None:
+        """The stored history, without contacting FRED."""
+
+        with self._guard:
+            if series_id in self._histories:
+                self._histories.move_to_end(series_id)
+                return self._histories[series_id]
+
+        history = None
+        path = self._path_for(series_id)
+        if path is not None and path.exists():
+            try:
+                history = VintageHistory.from_payload(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError, KeyError, TypeError):
+                history = None
+        self._remember(series_id, history)
+        return history
+
+    def put(self, history: VintageHistory) -> None:
+        self._remember(history.series_id, history)
+        path = self._path_for(history.series_id)
+        if path is None:
+            return
+        temporary_path = path.with_suffix(f".{os.getpid()}.{get_ident()}.tmp")
+        temporary_path.write_text(json.dumps(history.to_payload()), encoding="utf-8")
+        os.replace(temporary_path, path)
+
+    def _vintage_dates_since(self, fred_client: FREDClientProtocol, series_id: str, since: date | None) -> list[date]:
+        # FRED returns vintage dates oldest first and cuts each response at `limit`; a full page
+        # means there may be more, so continue the day after its last date.
+        vintage_dates: list[date] = []
+        while True:
+            page = fred_client.get_series_vintage_dates(series_id, limit=self.page_size, realtime_start=since)
+            vintage_dates.extend(page)
+            if len(page) < self.page_size:
+                return vintage_dates
+            since = page[-1] + timedelta(days=1)
+
+    def history(self, fred_client: FREDClientProtocol, series_id: str) -> VintageHistory:
+        """The stored history, first extended with any vintages published since the last check."""
+
+        with self.locked(series_id):
+            stored = self.get(series_id)
+            now = self._clock()
+            if stored is not None and stored.checked_at is not None and now - stored.checked_at < self.check_interval:
+                VINTAGE_ARCHIVE_SYNCS.inc(outcome="fresh")
+                return stored
+
+            since = stored.synced_through + timedelta(days=1) if stored and stored.synced_through else None
+            new_dates = self._vintage_dates_since(fred_client, series_id, since)
+            if stored is not None and not new_dates:
+                VINTAGE_ARCHIVE_SYNCS.inc(outcome="unchanged")
+                history = replace(stored, checked_at=now)
+            else:
+                VINTAGE_ARCHIVE_SYNCS.inc(outcome="appended" if stored is not None else "created")
+                fetched = (
+                    fred_client.get_series_realtime_observations(series_id, realtime_start=since) if new_dates else []
+                )
+                history = VintageHistory(
+                    series_id=series_id,
+                    observations=(
+                        _merge_periods(stored.observations, fetched, since)
+                        if stored is not None and since is not None
+                        else fetched
+                    ),
+                    vintage_dates=sorted({*(stored.vintage_dates if stored else ()), *new_dates}),
+                    synced_through=max(new_dates, default=stored.synced_through if stored else None),
+                    checked_at=now,
+                )
+            self.put(history)
+            return history
+
+    def clear(self) -> None:
+        # Wait out in-flight syncs so none of them writes its history back after the files are gone.
+        with self._guard:
+            series_ids = sorted(self._series_locks)
+        with ExitStack() as stack:
+            for series_id in series_ids:
+                stack.enter_context(self.locked(series_id))
+            with self._guard:
+                self._histories.clear()
+            if self.directory is not None:
+                for path in self.directory.glob("*.json"):
+                    path.unlink(missing_ok=True)
@@ -1,15 +1,34 @@
 from __future__ import annotations
 
 import argparse
-from datetime import date
+from datetime import date, timedelta
 import json
 from pathlib import Path
 import sys
 from typing import Callable
 
+from fred_query.cache import (
+    CachingFREDClient,
+    CatalogFREDClient,
+    FreshnessPolicy,
+    IntentParseCache,
+    ObservationStore,
+    SeriesCatalog,
+    VintageArchive,
+)
 from fred_query.config import get_settings
 from fred_query.schemas.analysis import QueryResponse, RoutedQueryResponse, RoutedQueryStatus
-from fred_query.services import FREDClient, NaturalLanguageQueryService, OpenAIIntentParser, StateGDPComparisonService
+from fred_query.services import (
+    CrossSectionService,
+    FREDClient,
+    FREDClientProtocol,
+    FastPathIntentParser,
+    NaturalLanguageQueryService,
+    OpenAIIntentParser,
+    StateGDPComparisonService,
+)
+from fred_query.services.stage_timing import StageTimings, stage
+from fred_query.services.vintage_analysis_service import VintageAnalysisService
 
 
 def _parse_date(value: str) -> date:
@@ -40,6 +59,28 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Optional path to write the generated chart spec JSON when the query completes successfully.",
     )
+    ask_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings and upstream FRED call counts to stderr.",
+    )
+
+    catalog_parser = subparsers.add_parser(
+        "refresh-catalog",
+        help="Fetch FRED search results into the local series catalog snapshot.",
+    )
+    catalog_parser.add_argument("search_texts", nargs="+", help="FRED search texts to bulk-fetch, e.g. 'unemployment rate'.")
+    catalog_parser.add_argument(
+        "--catalog",
+        type=Path,
+        help="Snapshot to refresh. Defaults to FRED_SERIES_CATALOG_PATH.",
+    )
+    catalog_parser.add_argument(
+        "--limit",
+        type=int,
+        default=1000,
+        help="Maximum series fetched per search text (FRED allows up to 1000).",
+    )
 
     compare_parser = subparsers.add_parser(
         "compare-state-gdp",
@@ -66,6 +107,11 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Optional path to write the generated chart spec JSON.",
     )
+    compare_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings and upstream FRED call counts to stderr.",
+    )
     return parser
 
 
@@ -102,12 +148,19 @@ def _render_routed_text_response(response: RoutedQueryResponse) -> str:
     return "\n".join(lines)
 
 
+def _render_stage_timings(timings: StageTimings) -> str:
+    lines = [f"{'stage':<12} {'calls':>6} {'ms':>10} {'upstream':>9}"]
+    for entry in timings.stages():
+        lines.append(f"{entry.name:<12} {entry.count:>6} {entry.duration_ms:>10.1f} {entry.upstream_calls:>9}")
+    return "\n".join(lines)
+
+
 def _write_chart_spec(response: QueryResponse, destination: Path) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
     destination.write_text(json.dumps(response.chart.to_plotly_dict(), indent=2), encoding="utf-8")
 
 
-def _build_fred_client() -> FREDClient:
+def _build_upstream_fred_client() -> FREDClient:
     settings = get_settings()
     return FREDClient(
         api_key=settings.fred_api_key or "",
@@ -116,10 +169,45 @@ def _build_fred_client() -> FREDClient:
     )
 
 
+def _build_fred_client() -> FREDClientProtocol:
+    settings = get_settings()
+    client: FREDClientProtocol = _build_upstream_fred_client()
+    if settings.observation_cache_dir:
+        client = CachingFREDClient(
+            client,
+            ObservationStore(settings.observation_cache_dir),
+            freshness_policy=FreshnessPolicy.from_release_calendar_path(settings.release_calendar_path),
+        )
+    if settings.series_catalog_path:
+        client = CatalogFREDClient(client, SeriesCatalog.load(settings.series_catalog_path))
+    return client
+
+
+def _build_intent_parser() -> OpenAIIntentParser | FastPathIntentParser:
+    settings = get_settings()
+    parser = OpenAIIntentParser(
+        api_key=settings.openai_api_key or "",
+        model=settings.openai_model,
+        reasoning_effort=settings.openai_reasoning_effort,
+        cache=(
+            IntentParseCache(
+                max_entries=settings.intent_cache_size,
+                directory=settings.intent_cache_dir,
+                ttl=timedelta(hours=settings.intent_cache_ttl_hours),
+            )
+            if settings.intent_cache_size > 0
+            else None
+        ),
+    )
+    if settings.fast_path_parser:
+        return FastPathIntentParser(parser)
+    return parser
+
+
 def run_compare_state_gdp(
     args: argparse.Namespace,
     *,
-    client_factory: Callable[[], FREDClient] | None = None,
+    client_factory: Callable[[], FREDClientProtocol] | None = None,
 ) -> QueryResponse:
     factory = client_factory or _build_fred_client
     client = factory()
@@ -139,32 +227,68 @@ def run_compare_state_gdp(
 def run_natural_language_query(
     args: argparse.Namespace,
     *,
-    client_factory: Callable[[], FREDClient] | None = None,
-    parser_factory: Callable[[], OpenAIIntentParser] | None = None,
+    client_factory: Callable[[], FREDClientProtocol] | None = None,
+    parser_factory: Callable[[], OpenAIIntentParser | FastPathIntentParser] | None = None,
 ) -> RoutedQueryResponse:
     settings = get_settings()
     client = (client_factory or _build_fred_client)()
-    parser = (parser_factory or (lambda: OpenAIIntentParser(
-        api_key=settings.openai_api_key or "",
-        model=settings.openai_model,
-        reasoning_effort=settings.openai_reasoning_effort,
-    )))()
+    parser = (parser_factory or _build_intent_parser)()
     try:
         service = NaturalLanguageQueryService(
             parser=parser,
             fred_client=client,
+            cross_section_service=CrossSectionService(
+                client,
+                max_concurrency=settings.fred_max_concurrency,
+            ),
+            vintage_analysis_service=VintageAnalysisService(
+                client,
+                vintage_archive=VintageArchive(settings.vintage_archive_dir) if settings.vintage_archive_dir else None,
+            ),
         )
         return service.ask(args.query)
     finally:
         client.close()
 
 
+def run_refresh_catalog(
+    args: argparse.Namespace,
+    *,
+    client_factory: Callable[[], FREDClientProtocol] | None = None,
+) -> tuple[Path, int, int]:
+    catalog_path = args.catalog or get_settings().series_catalog_path
+    if not catalog_path:
+        raise ValueError("Pass --catalog or set FRED_SERIES_CATALOG_PATH.")
+    catalog = SeriesCatalog.load(catalog_path)
+    client = (client_factory or _build_upstream_fred_client)()
+    try:
+        written = catalog.refresh(client, args.search_texts, limit=args.limit)
+    finally:
+        client.close()
+    catalog.save(catalog_path)
+    return Path(catalog_path), written, len(catalog)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    if args.command == "refresh-catalog":
+        try:
+            catalog_path, written, size = run_refresh_catalog(args)
+        except Exception as exc:
+            print(f"Error: catalog refresh failed: {exc}", file=sys.stderr)
+            return 1
+        print(f"Fetched {written} series into {catalog_path} ({size} series total).")
+        return 0
+
+    timings = StageTimings() if args.profile else None
+
     if args.command == "compare-state-gdp":
-        response = run_compare_state_gdp(args)
+        with stage("total", timings=timings):
+            response = run_compare_state_gdp(args)
+        if timings is not None:
+            print(_render_stage_timings(timings), file=sys.stderr)
 
         if args.chart_spec_out:
             _write_chart_spec(response, args.chart_spec_out)
@@ -177,10 +301,13 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.command == "ask":
         try:
-            response = run_natural_language_query(args)
+            with stage("total", timings=timings):
+                response = run_natural_language_query(args)
         except Exception as exc:
             print(f"Error: natural-language parsing failed: {exc}", file=sys.stderr)
             return 1
+        if timings is not None:
+            print(_render_stage_timings(timings), file=sys.stderr)
 
         if args.chart_spec_out and response.query_response is not None:
             _write_chart_spec(response.query_response, args.chart_spec_out)
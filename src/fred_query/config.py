@@ -15,6 +15,26 @@ _ENV_KEY_MAP = {
     "OPENAI_REASONING_EFFORT": "openai_reasoning_effort",
     "FRED_BASE_URL": "fred_base_url",
     "HTTP_TIMEOUT_SECONDS": "http_timeout_seconds",
+    "FRED_HTTP2": "fred_http2",
+    "FRED_MAX_CONNECTIONS": "fred_max_connections",
+    "FRED_MAX_CONCURRENCY": "fred_max_concurrency",
+    "FRED_OBSERVATION_CACHE_DIR": "observation_cache_dir",
+    "FRED_RELEASE_CALENDAR_PATH": "release_calendar_path",
+    "FRED_SERIES_CATALOG_PATH": "series_catalog_path",
+    "FRED_VINTAGE_ARCHIVE_DIR": "vintage_archive_dir",
+    "VINTAGE_DEADLINE_SECONDS": "vintage_deadline_seconds",
+    "INTENT_CACHE_SIZE": "intent_cache_size",
+    "FAST_PATH_PARSER": "fast_path_parser",
+    "INTENT_CACHE_DIR": "intent_cache_dir",
+    "INTENT_CACHE_TTL_HOURS": "intent_cache_ttl_hours",
+    "RECESSION_INDEX_REFRESH_HOURS": "recession_index_refresh_hours",
+    "STATE_METADATA_REFRESH_HOURS": "state_metadata_refresh_hours",
+    "SESSION_MAX_COUNT": "session_max_count",
+    "SESSION_IDLE_TTL_MINUTES": "session_idle_ttl_minutes",
+    "SESSION_MAX_REVISIONS": "session_max_revisions",
+    "SESSION_FULL_REVISIONS": "session_full_revisions",
+    "SESSION_MEMORY_BUDGET_MB": "session_memory_budget_mb",
+    "SESSION_STORE_PATH": "session_store_path",
 }
 
 
@@ -29,6 +49,26 @@ class Settings(BaseModel):
     openai_reasoning_effort: str = "low"
     fred_base_url: str = "https://api.stlouisfed.org/fred"
     http_timeout_seconds: float = 20.0
+    fred_http2: bool = True
+    fred_max_connections: int = 20
+    fred_max_concurrency: int = 8
+    observation_cache_dir: str | None = None
+    release_calendar_path: str | None = None
+    series_catalog_path: str | None = None
+    vintage_archive_dir: str | None = None
+    vintage_deadline_seconds: float = 5.0
+    intent_cache_size: int = 256
+    fast_path_parser: bool = True
+    intent_cache_dir: str | None = None
+    intent_cache_ttl_hours: float = 24.0
+    recession_index_refresh_hours: float = 12.0
+    state_metadata_refresh_hours: float = 24.0
+    session_max_count: int = 1000
+    session_idle_ttl_minutes: float = 720.0
+    session_max_revisions: int = 50
+    session_full_revisions: int = 5
+    session_memory_budget_mb: float = 256.0
+    session_store_path: str | None = None
 
 
 def _strip_env_value(raw_value: str) -> str:
@@ -27,6 +27,7 @@ from fred_query.schemas.intent import (
     TimeScopeKind,
     TransformType,
 )
+from fred_query.schemas.observation_series import ObservationSeries
 from fred_query.schemas.resolved_series import (
     ClarificationBadge,
     ClarificationOption,
@@ -51,6 +52,7 @@ __all__ = [
     "HistoricalSeriesContext",
     "LineStyle",
     "ObservationPoint",
+    "ObservationSeries",
     "ExecutionOperation",
     "ExecutionPlan",
     "ExecutionPlanType",
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from datetime import date
 from enum import Enum
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
 from fred_query.schemas.chart import ChartSpec
 from fred_query.schemas.intent import QueryIntent
@@ -17,6 +18,15 @@ class ObservationPoint(BaseModel):
     value: float
 
 
+def _materialize_observations(value: Any) -> Any:
+    # ObservationSeries columns become ObservationPoint models only at the response-model boundary.
+    to_points = getattr(value, "to_points", None)
+    return to_points() if callable(to_points) else value
+
+
+ObservationList = Annotated[list[ObservationPoint], BeforeValidator(_materialize_observations)]
+
+
 class DerivedMetric(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
@@ -80,8 +90,8 @@ class SeriesAnalysis(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
     series: ResolvedSeries
-    observations: list[ObservationPoint] = Field(default_factory=list)
-    transformed_observations: list[ObservationPoint] | None = None
+    observations: ObservationList = Field(default_factory=list)
+    transformed_observations: ObservationList | None = None
     historical_context: HistoricalSeriesContext | None = None
     analysis_basis: str | None = None
     analysis_units: str | None = None
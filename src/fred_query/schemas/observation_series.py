@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import date
+from typing import Any, TypeAlias, overload
+
+import numpy as np
+
+from fred_query.schemas.analysis import ObservationPoint
+
+
+class ObservationSeries(Sequence[ObservationPoint]):
+    """Observations stored as parallel `datetime64[D]` date and `float64` value arrays.
+
+    Fetch, transform, statistics and relationship code pass these columns around
+    instead of lists of pydantic models. Indexing or iterating still yields
+    `ObservationPoint` objects, built on demand, so code that reads single points
+    keeps working; whole lists are only materialized by `to_points()` when a
+    response model is built.
+    """
+
+    __slots__ = ("dates", "values")
+
+    def __init__(self, dates: Any = (), values: Any = ()) -> None:
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.values = np.asarray(values, dtype=np.float64)
+        if self.dates.shape != self.values.shape or self.dates.ndim != 1:
+            raise ValueError("ObservationSeries requires one-dimensional date and value arrays of equal length.")
+
+    @classmethod
+    def from_points(cls, points: Iterable[ObservationPoint]) -> ObservationSeries:
+        point_list = list(points)
+        return cls(
+            np.array([point.date for point in point_list], dtype="datetime64[D]"),
+            np.fromiter((point.value for point in point_list), dtype=np.float64, count=len(point_list)),
+        )
+
+    @classmethod
+    def from_fred_observations(cls, items: Iterable[Mapping[str, Any]]) -> ObservationSeries:
+        """Build a series straight from FRED's JSON rows, dropping missing (".") values."""
+
+        rows = [(item["date"], item.get("value", ".")) for item in items]
+        rows = [(raw_date, raw_value) for raw_date, raw_value in rows if raw_value != "."]
+        return cls(
+            np.array([raw_date for raw_date, _ in rows], dtype="datetime64[D]"),
+            np.array([raw_value for _, raw_value in rows], dtype=np.float64),
+        )
+
+    @classmethod
+    def coerce(cls, observations: ObservationInput) -> ObservationSeries:
+        if isinstance(observations, ObservationSeries):
+            return observations
+        return cls.from_points(observations)
+
+    def __len__(self) -> int:
+        return int(self.dates.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> ObservationPoint: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ObservationSeries: ...
+
+    def __getitem__(self, index: int | slice) -> ObservationPoint | ObservationSeries:
+        if isinstance(index, slice):
+            return ObservationSeries(self.dates[index], self.values[index])
+        return ObservationPoint.model_construct(
+            date=self.dates[index].item(),
+            value=float(self.values[index]),
+        )
+
+    def __iter__(self) -> Iterator[ObservationPoint]:
+        for current_date, value in zip(self.python_dates(), self.values.tolist(), strict=True):
+            yield ObservationPoint.model_construct(date=current_date, value=value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ObservationSeries):
+            return np.array_equal(self.dates, other.dates) and np.array_equal(self.values, other.values)
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return self.to_points() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "ObservationSeries([])"
+        return f"ObservationSeries({len(self)} points, {self.dates[0]}..{self.dates[-1]})"
+
+    def python_dates(self) -> list[date]:
+        return self.dates.astype(object).tolist()
+
+    def to_points(self) -> list[ObservationPoint]:
+        return list(self)
+
+    def with_values(self, values: Any) -> ObservationSeries:
+        return ObservationSeries(self.dates, values)
+
+    def between(self, start_date: date | None = None, end_date: date | None = None) -> ObservationSeries:
+        """Slice an ascending series to [start_date, end_date] with binary search."""
+
+        lower = 0 if start_date is None else int(np.searchsorted(self.dates, np.datetime64(start_date, "D"), "left"))
+        upper = (
+            len(self)
+            if end_date is None
+            else int(np.searchsorted(self.dates, np.datetime64(end_date, "D"), "right"))
+        )
+        return self[lower:upper]
+
+
+ObservationInput: TypeAlias = ObservationSeries | Sequence[ObservationPoint]
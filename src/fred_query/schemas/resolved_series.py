@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -45,6 +47,7 @@ class SeriesMetadata(BaseModel):
     frequency: str
     seasonal_adjustment: str | None = None
     notes: str | None = None
+    last_updated: datetime | None = None
     source_url: str
 
 
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import date
+from typing import Any
+
+import numpy as np
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NAT = np.iinfo(np.int64).min
+
+
+def _as_days(values: Any) -> np.ndarray:
+    # Python dates (or None) go through ordinals; numpy's object-to-datetime64 path is ~20x slower.
+    if isinstance(values, np.ndarray):
+        return values.astype("datetime64[D]", copy=False)
+    return np.fromiter(
+        (_NAT if value is None else value.toordinal() - _EPOCH_ORDINAL for value in values),
+        dtype=np.int64,
+    ).view("datetime64[D]")
+
+
+class RevisionMatrix:
+    """Observation date x vintage date values, stored as compressed sparse rows.
+
+    Entries are sorted by observation date, then vintage date; row `i` spans
+    `offsets[i]:offsets[i + 1]` of the entry arrays. First-release value, latest
+    value and revision count are precomputed per row, so with the date -> row
+    index every lookup is O(1) and a revision history is one slice.
+    """
+
+    __slots__ = (
+        "observation_dates",
+        "vintage_dates",
+        "offsets",
+        "vintage_index",
+        "values",
+        "realtime_ends",
+        "first_values",
+        "latest_values",
+        "revision_counts",
+        "_rows",
+    )
+
+    def __init__(self, observation_dates: Any, vintage_dates: Any, values: Any, realtime_ends: Any = None) -> None:
+        """Build from parallel per-entry arrays in any order; `realtime_ends` may hold None/NaT."""
+
+        entry_dates = _as_days(observation_dates)
+        entry_vintages = _as_days(vintage_dates)
+        entry_values = np.asarray(values, dtype=np.float64)
+        entry_ends = (
+            np.full(entry_dates.shape, np.datetime64("NaT"), dtype="datetime64[D]")
+            if realtime_ends is None
+            else _as_days(realtime_ends)
+        )
+        if not entry_dates.shape == entry_vintages.shape == entry_values.shape == entry_ends.shape:
+            raise ValueError("RevisionMatrix requires equal-length date, vintage and value arrays.")
+
+        order = np.lexsort((entry_vintages, entry_dates))
+        entry_dates = entry_dates[order]
+        self.observation_dates, row_starts = np.unique(entry_dates, return_index=True)
+        self.vintage_dates, vintage_index = np.unique(entry_vintages[order], return_inverse=True)
+        self.offsets = np.append(row_starts, entry_dates.shape[0]).astype(np.int64)
+        self.vintage_index = vintage_index.astype(np.int32)
+        self.values = entry_values[order]
+        self.realtime_ends = entry_ends[order]
+
+        self.first_values = self.values[self.offsets[:-1]]
+        self.latest_values = self.values[self.offsets[1:] - 1]
+        self.revision_counts = np.diff(self.offsets)
+        self._rows = {current: row for row, current in enumerate(self.observation_dates.astype(object).tolist())}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return (
+            f"RevisionMatrix({len(self)} observation dates x {self.vintage_dates.shape[0]} vintages, "
+            f"{self.values.shape[0]} values)"
+        )
+
+    def row(self, obs_date: date) -> int | None:
+        return self._rows.get(obs_date)
+
+    def first_release_value(self, obs_date: date) -> float | None:
+        row = self._rows.get(obs_date)
+        return None if row is None else float(self.first_values[row])
+
+    def latest_value(self, obs_date: date) -> float | None:
+        row = self._rows.get(obs_date)
+        return None if row is None else float(self.latest_values[row])
+
+    def revision_count(self, obs_date: date) -> int:
+        row = self._rows.get(obs_date)
+        return 0 if row is None else int(self.revision_counts[row])
+
+    def revisions(self, obs_date: date) -> Iterator[tuple[date, float, date | None]]:
+        """Yield `(vintage_date, value, realtime_end)` for one observation date, oldest vintage first."""
+
+        row = self._rows.get(obs_date)
+        if row is None:
+            return
+        lower, upper = int(self.offsets[row]), int(self.offsets[row + 1])
+        vintages = self.vintage_dates[self.vintage_index[lower:upper]].astype(object).tolist()
+        ends = self.realtime_ends[lower:upper].astype(object).tolist()
+        yield from zip(vintages, self.values[lower:upper].tolist(), ends, strict=True)
@@ -3,9 +3,10 @@ from __future__ import annotations
 from datetime import date
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from fred_query.schemas.analysis import ObservationPoint
+from fred_query.schemas.revision_matrix import RevisionMatrix
 
 
 class VintageObservation(BaseModel):
@@ -15,6 +16,7 @@ class VintageObservation(BaseModel):
     date: date
     value: float
     vintage_date: date
+    realtime_end: Optional[date] = None  # Last day this value was current, for ALFRED real-time periods
 
 
 class VintageSeriesData(BaseModel):
@@ -25,42 +27,56 @@ class VintageSeriesData(BaseModel):
     title: str
     vintage_observations: List[VintageObservation] = []
     vintage_dates: List[date] = []
+    _revision_matrix: Optional[RevisionMatrix] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_realtime_periods(
+        cls,
+        series_id: str,
+        title: str,
+        observations: List[VintageObservation],
+    ) -> "VintageSeriesData":
+        """Build from ALFRED real-time period rows, where each row's vintage is the start of its period"""
+        return cls.model_construct(
+            series_id=series_id,
+            title=title,
+            vintage_observations=observations,
+            vintage_dates=sorted({obs.vintage_date for obs in observations}),
+        )
+
+    @property
+    def revision_matrix(self) -> RevisionMatrix:
+        """Sparse observation date x vintage date index over `vintage_observations`, built on first use"""
+        if self._revision_matrix is None:
+            observations = self.vintage_observations
+            self._revision_matrix = RevisionMatrix(
+                [obs.date for obs in observations],
+                [obs.vintage_date for obs in observations],
+                [obs.value for obs in observations],
+                [obs.realtime_end for obs in observations],
+            )
+        return self._revision_matrix
 
     def get_first_release_value(self, obs_date: date) -> Optional[float]:
         """Get the first-release value for a specific observation date"""
-        # Find the earliest vintage date that contains this observation
-        relevant_vintages = [
-            obs.vintage_date for obs in self.vintage_observations
-            if obs.date == obs_date
-        ]
-
-        if not relevant_vintages:
-            return None
-
-        first_vintage_with_obs = min(relevant_vintages)
-
-        # Find the observation from that vintage date
-        for obs in self.vintage_observations:
-            if obs.date == obs_date and obs.vintage_date == first_vintage_with_obs:
-                return obs.value
-        return None
+        return self.revision_matrix.first_release_value(obs_date)
 
     def get_latest_revision_value(self, obs_date: date) -> Optional[float]:
         """Get the latest revision value for a specific observation date"""
-        latest_vintage = max(self.vintage_dates) if self.vintage_dates else None
-        if not latest_vintage:
-            return None
+        return self.revision_matrix.latest_value(obs_date)
 
-        for obs in reversed(self.vintage_observations):
-            if obs.date == obs_date and obs.vintage_date == latest_vintage:
-                return obs.value
-        return None
+    def get_revision_count(self, obs_date: date) -> int:
+        """Get the number of vintages holding a value for a specific observation date"""
+        return self.revision_matrix.revision_count(obs_date)
 
     def get_revision_history(self, obs_date: date) -> List[VintageObservation]:
         """Get all revisions for a specific observation date, ordered by vintage date"""
-        revisions = [obs for obs in self.vintage_observations if obs.date == obs_date]
-        revisions.sort(key=lambda x: x.vintage_date)
-        return revisions
+        return [
+            VintageObservation.model_construct(
+                date=obs_date, value=value, vintage_date=vintage_date, realtime_end=realtime_end
+            )
+            for vintage_date, value, realtime_end in self.revision_matrix.revisions(obs_date)
+        ]
 
 
 class VintageComparison(BaseModel):
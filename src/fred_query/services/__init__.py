@@ -11,6 +11,9 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     "ExecutionPlanner": ("fred_query.services.execution_planner", "ExecutionPlanner"),
     "FREDAPIError": ("fred_query.services.fred_client", "FREDAPIError"),
     "FREDClient": ("fred_query.services.fred_client", "FREDClient"),
+    "FREDClientProtocol": ("fred_query.services.fred_client", "FREDClientProtocol"),
+    "FastPathIntentParser": ("fred_query.services.fast_path_parser_service", "FastPathIntentParser"),
+    "FastPathStats": ("fred_query.services.fast_path_parser_service", "FastPathStats"),
     "FollowUpIntentMerger": ("fred_query.services.follow_up_intent_merger", "FollowUpIntentMerger"),
     "IntentService": ("fred_query.services.intent_service", "IntentService"),
     "NaturalLanguageQueryService": (
@@ -21,8 +24,11 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     "QueryRouter": ("fred_query.services.query_router", "QueryRouter"),
     "QuerySession": ("fred_query.services.query_session_service", "QuerySession"),
     "QuerySessionService": ("fred_query.services.query_session_service", "QuerySessionService"),
+    "QuerySessionStore": ("fred_query.services.query_session_service", "QuerySessionStore"),
     "RelationshipAnalysisService": ("fred_query.services.relationship_service", "RelationshipAnalysisService"),
     "ResolverService": ("fred_query.services.resolver_service", "ResolverService"),
+    "SQLiteQuerySessionStore": ("fred_query.services.sqlite_session_store", "SQLiteQuerySessionStore"),
+    "SingleFlight": ("fred_query.services.single_flight", "SingleFlight"),
     "SingleSeriesLookupService": ("fred_query.services.single_series_service", "SingleSeriesLookupService"),
     "StateGDPComparisonService": ("fred_query.services.comparison_service", "StateGDPComparisonService"),
     "TransformService": ("fred_query.services.transform_service", "TransformService"),
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
-import re
-
 from fred_query.schemas.intent import QueryIntent, TaskType
 from fred_query.schemas.resolved_series import ClarificationBadge, ClarificationOption, SeriesSearchMatch
-from fred_query.services.fred_client import FREDClient
+from fred_query.services.fred_client import FREDClientProtocol
 from fred_query.services.series_match_scorer import (
     CandidateFeatures as _ClarificationCandidateFeatures,
     MatchScoreContext as _ClarificationContext,
     build_match_score_context,
     candidate_is_seasonally_adjusted,
+    candidate_profile,
     candidate_text,
     extract_candidate_features,
     extract_candidate_features_from_text,
@@ -32,7 +31,7 @@ class ClarificationResolver:
         "SA": "Semiannual",
         "A": "Annual",
     }
-    def __init__(self, fred_client: FREDClient) -> None:
+    def __init__(self, fred_client: FREDClientProtocol) -> None:
         self.fred_client = fred_client
 
     @classmethod
@@ -77,7 +76,7 @@ class ClarificationResolver:
 
     @classmethod
     def _candidate_title_key(cls, candidate: SeriesSearchMatch) -> str:
-        title_key = re.sub(r"\s+", " ", candidate.title.strip().lower())
+        title_key = candidate_profile(candidate).normalized_title
         features = cls._extract_candidate_features(candidate)
         seasonality = cls._candidate_is_seasonally_adjusted(candidate)
         semantic_parts = [
@@ -5,8 +5,9 @@ from datetime import date
 from fred_query.schemas.analysis import AnalysisResult, DerivedMetric, QueryResponse, SeriesAnalysis
 from fred_query.services.answer_service import AnswerService
 from fred_query.services.chart_service import ChartService
-from fred_query.services.fred_client import FREDClient
+from fred_query.services.fred_client import FREDClientProtocol
 from fred_query.services.intent_service import IntentService
+from fred_query.services.recession_index import RecessionIndex
 from fred_query.services.resolver_service import ResolverService
 from fred_query.services.transform_service import TransformService
 
@@ -16,13 +17,14 @@ class StateGDPComparisonService:
 
     def __init__(
         self,
-        fred_client: FREDClient,
+        fred_client: FREDClientProtocol,
         *,
         intent_service: IntentService | None = None,
         resolver_service: ResolverService | None = None,
         transform_service: TransformService | None = None,
         chart_service: ChartService | None = None,
         answer_service: AnswerService | None = None,
+        recession_index: RecessionIndex | None = None,
     ) -> None:
         self.fred_client = fred_client
         self.intent_service = intent_service or IntentService()
@@ -32,6 +34,7 @@ class StateGDPComparisonService:
         self.series_statistics_service = self.transform_service.series_statistics_service
         self.chart_service = chart_service or ChartService()
         self.answer_service = answer_service or AnswerService()
+        self.recession_index = recession_index
 
     def compare(
         self,
@@ -96,16 +99,20 @@ class StateGDPComparisonService:
                 )
             )
 
-        recession_periods = []
-        try:
-            recession_observations = self.fred_client.get_series_observations(
-                "USREC",
-                start_date=coverage_start,
-                end_date=coverage_end,
-            )
-            recession_periods = self.series_statistics_service.derive_recession_periods(recession_observations)
-        except Exception as exc:  # pragma: no cover
-            warnings.append(f"Unable to load recession shading series: {exc}")
+        recession_periods = (
+            self.recession_index.overlapping(coverage_start, coverage_end) if self.recession_index is not None else None
+        )
+        if recession_periods is None:
+            recession_periods = []
+            try:
+                recession_observations = self.fred_client.get_series_observations(
+                    "USREC",
+                    start_date=coverage_start,
+                    end_date=coverage_end,
+                )
+                recession_periods = self.series_statistics_service.derive_recession_periods(recession_observations)
+            except Exception as exc:  # pragma: no cover
+                warnings.append(f"Unable to load recession shading series: {exc}")
 
         derived_metrics = []
         first, second = series_results
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from typing import TypeVar
 
 from fred_query.schemas.analysis import (
     AnalysisResult,
@@ -15,25 +18,47 @@ from fred_query.schemas.resolved_series import ResolvedSeries
 from fred_query.services.answer_service import AnswerService
 from fred_query.services.cross_section_intent_service import CrossSectionIntentService
 from fred_query.services.chart_service import ChartService
-from fred_query.services.fred_client import FREDClient
+from fred_query.services.fred_client import FREDClientProtocol
 from fred_query.services.resolver_service import ResolverService, STATE_CODE_TO_NAME
+from fred_query.services.stage_timing import bind_stage_context
+
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class CrossSectionService:
     """Deterministic point-in-time and ranked cross-section analysis."""
 
+    DEFAULT_MAX_CONCURRENCY = 8
+
     def __init__(
         self,
-        fred_client: FREDClient,
+        fred_client: FREDClientProtocol,
         *,
         resolver_service: ResolverService | None = None,
         chart_service: ChartService | None = None,
         answer_service: AnswerService | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         self.fred_client = fred_client
         self.resolver_service = resolver_service or ResolverService(fred_client)
         self.chart_service = chart_service or ChartService()
         self.answer_service = answer_service or AnswerService()
+        self.max_concurrency = max(1, max_concurrency)
+
+    def _map_concurrently(self, func: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Apply `func` to each item with bounded concurrency, preserving input order.
+
+        The first exception (in input order) is re-raised, matching a serial loop.
+        """
+
+        item_list = list(items)
+        worker_count = min(self.max_concurrency, len(item_list))
+        if worker_count <= 1:
+            return [func(item) for item in item_list]
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="cross-section") as executor:
+            return list(executor.map(bind_stage_context(func), item_list))
 
     @staticmethod
     def _indicator_text(intent: QueryIntent) -> str:
@@ -110,14 +135,14 @@ class CrossSectionService:
 
     def _resolve_series(self, intent: QueryIntent, scope: CrossSectionScope, indicator_text: str) -> list[ResolvedSeries]:
         if scope == CrossSectionScope.STATES:
-            return [
-                self.resolver_service.resolve_state_indicator_series(
+            return self._map_concurrently(
+                lambda state_name: self.resolver_service.resolve_state_indicator_series(
                     state_name,
                     indicator_hint=indicator_text,
                     search_text=intent.search_text,
-                )
-                for state_name in STATE_CODE_TO_NAME.values()
-            ]
+                ),
+                STATE_CODE_TO_NAME.values(),
+            )
         if scope == CrossSectionScope.PROVIDED_GEOGRAPHIES:
             return self._resolve_geography_series(intent, indicator_text)
         return [self._resolve_single_series(intent, indicator_text)]
@@ -144,28 +169,56 @@ class CrossSectionService:
         )
         return observations[0]
 
+    def _fetch_snapshot_points(
+        self,
+        resolved_series: list[ResolvedSeries],
+        *,
+        observation_date: date | None,
+        frequency: str | None,
+    ) -> list[ObservationPoint | ValueError]:
+        def fetch(series: ResolvedSeries) -> ObservationPoint | ValueError:
+            try:
+                return self._fetch_snapshot_point(
+                    series,
+                    observation_date=observation_date,
+                    frequency=frequency,
+                )
+            except ValueError as exc:
+                return exc
+
+        return self._map_concurrently(fetch, resolved_series)
+
     def _resolve_snapshot_date(
         self,
         resolved_series: list[ResolvedSeries],
         *,
         observation_date: date | None,
         frequency: str | None,
-    ) -> tuple[date | None, str]:
+    ) -> tuple[date | None, str, dict[str, ObservationPoint]]:
+        """Pick the shared snapshot date and return each series' latest point on or before it.
+
+        Series whose latest point already sits on the aligned date do not need a second fetch.
+        """
+
         if observation_date is not None or len(resolved_series) <= 1:
-            return observation_date, self._snapshot_basis(observation_date)
+            return observation_date, self._snapshot_basis(observation_date), {}
 
-        latest_points: list[ObservationPoint] = []
-        for resolved in resolved_series:
-            latest_points.append(
-                self._fetch_snapshot_point(
-                    resolved,
-                    observation_date=None,
-                    frequency=frequency,
-                )
+        latest_points = {
+            series.series_id: outcome
+            for series, outcome in zip(
+                resolved_series,
+                self._fetch_snapshot_points(resolved_series, observation_date=None, frequency=frequency),
             )
+            if isinstance(outcome, ObservationPoint)
+        }
+        if not latest_points:
+            return None, self._snapshot_basis(None), {}
 
-        aligned_date = min(point.date for point in latest_points)
-        return aligned_date, self._aligned_snapshot_basis(aligned_date)
+        aligned_date = min(point.date for point in latest_points.values())
+        aligned_points = {
+            series_id: point for series_id, point in latest_points.items() if point.date == aligned_date
+        }
+        return aligned_date, self._aligned_snapshot_basis(aligned_date), aligned_points
 
     @staticmethod
     def _sort_results(
@@ -203,7 +256,7 @@ class CrossSectionService:
         if scope == CrossSectionScope.SINGLE_SERIES and resolved_series:
             response_intent.series_id = resolved_series[0].series_id
             response_intent.search_text = response_intent.search_text or indicator_text
-        observation_date, snapshot_basis = self._resolve_snapshot_date(
+        observation_date, snapshot_basis, snapshot_points = self._resolve_snapshot_date(
             resolved_series,
             observation_date=requested_observation_date,
             frequency=response_intent.frequency,
@@ -212,17 +265,23 @@ class CrossSectionService:
         series_results: list[SeriesAnalysis] = []
         warnings: list[str] = []
 
-        for resolved in resolved_series:
-            try:
-                point = self._fetch_snapshot_point(
-                    resolved,
+        pending_series = [resolved for resolved in resolved_series if resolved.series_id not in snapshot_points]
+        fetched_points = dict(
+            zip(
+                (resolved.series_id for resolved in pending_series),
+                self._fetch_snapshot_points(
+                    pending_series,
                     observation_date=observation_date,
                     frequency=response_intent.frequency,
-                )
-            except ValueError as exc:
+                ),
+            )
+        )
+        for resolved in resolved_series:
+            point = snapshot_points.get(resolved.series_id) or fetched_points[resolved.series_id]
+            if isinstance(point, ValueError):
                 if scope == CrossSectionScope.SINGLE_SERIES:
-                    raise
-                warnings.append(str(exc))
+                    raise point
+                warnings.append(str(point))
                 continue
 
             series_results.append(
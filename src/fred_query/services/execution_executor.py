@@ -6,6 +6,7 @@ from fred_query.services.comparison_service import StateGDPComparisonService
 from fred_query.services.cross_section_service import CrossSectionService
 from fred_query.services.relationship_service import RelationshipAnalysisService
 from fred_query.services.single_series_service import SingleSeriesLookupService
+from fred_query.services.stage_timing import timed_stage
 
 
 class ExecutionExecutor:
@@ -24,6 +25,7 @@ class ExecutionExecutor:
         self.single_series_service = single_series_service
         self.relationship_service = relationship_service
 
+    @timed_stage("execute")
     def execute(self, plan: ExecutionPlan) -> QueryResponse:
         if len(plan.steps) != 1:
             raise ValueError("The phase-one executor only supports single-step execution plans.")
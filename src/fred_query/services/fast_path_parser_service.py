@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import calendar
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+import re
+from threading import Lock
+from time import perf_counter
+
+from fred_query.schemas.intent import (
+    ComparisonMode,
+    CrossSectionScope,
+    Geography,
+    GeographyType,
+    QueryIntent,
+    TaskType,
+    TransformType,
+)
+from fred_query.services.cross_section_intent_service import CrossSectionIntentService
+from fred_query.services.openai_parser_service import OpenAIIntentParser
+from fred_query.services.resolver_service import (
+    STATE_CODE_TO_NAME,
+    STATE_NAME_TO_CODE,
+    STATE_SERIES_METADATA,
+    STATE_SERIES_PATTERNS,
+)
+
+
+_DATE = r"\d{4}(?:-\d{2}(?:-\d{2})?)?"
+_WINDOW = r"(?:(?P<window>\d+)[- ]?(?:month|mo|day|week|quarter|year|period)s?\s+)?"
+_TRANSFORM_SUFFIX = r"(?:\s+(?:percent\s+)?(?:change|growth))?(?:\s+(?:in|of|for))?"
+
+# Mirrors the transform rules in PARSER_INSTRUCTIONS; rolling variants come first so "rolling" is not left behind.
+_TRANSFORM_PATTERNS: tuple[tuple[TransformType, re.Pattern[str]], ...] = tuple(
+    (transform, re.compile(rf"\b(?:the\s+)?{_WINDOW}(?:{phrase}){_TRANSFORM_SUFFIX}\b", re.IGNORECASE))
+    for transform, phrase in (
+        (TransformType.ROLLING_STDDEV, r"rolling\s+(?:standard\s+deviation|std\s*dev|std)"),
+        (TransformType.ROLLING_AVERAGE, r"(?:rolling|moving)\s+(?:average|avg|mean)"),
+        (TransformType.ROLLING_VOLATILITY, r"(?:rolling\s+)?volatility"),
+        (TransformType.YEAR_OVER_YEAR_PERCENT_CHANGE, r"yoy|y/y|year[- ]over[- ]year"),
+        (
+            TransformType.PERIOD_OVER_PERIOD_PERCENT_CHANGE,
+            r"mom|m/m|qoq|q/q|(?:month|quarter|period)[- ]over[- ](?:month|quarter|period)",
+        ),
+        (TransformType.NORMALIZED_INDEX, r"normalized|indexed|rebased"),
+    )
+)
+_DATE_RANGE_PATTERNS = (
+    re.compile(rf"\b(?:from|between)\s+(?P<start>{_DATE})\s+(?:to|and|through|until)\s+(?P<end>{_DATE})\b", re.IGNORECASE),
+    re.compile(rf"\b(?:since|from|starting(?:\s+in)?|after)\s+(?P<start>{_DATE})\b", re.IGNORECASE),
+)
+_LEADING_FILLER = re.compile(
+    r"^(?:please\s+)?(?:(?:show|plot|chart|graph|display|get|give|pull|fetch)(?:\s+me)?|what(?:'s|\s+is|\s+was))\s+(?:the\s+)?",
+    re.IGNORECASE,
+)
+_TRAILING_FILLER = re.compile(r"\s+(?:please|data|chart)$", re.IGNORECASE)
+_REFERENTIAL_TOKENS = {"again", "also", "instead", "it", "now", "same", "that", "them", "then", "those"}
+_SERIES_ID = re.compile(r"^(?:fred\s+)?(?:series\s+)?(?P<series_id>[A-Z0-9_]+)(?:\s+series)?$")
+# Widely used FRED IDs with no digit; other all-letter words (UNEMPLOYMENT, NASDAQ) are shouted words, not IDs.
+_KNOWN_SERIES_IDS = frozenset(
+    {
+        "CPIAUCNS",
+        "CPIAUCSL",
+        "CPILFESL",
+        "DCOILBRENTEU",
+        "DCOILWTICO",
+        "DEXUSEU",
+        "FEDFUNDS",
+        "HOUST",
+        "ICSA",
+        "INDPRO",
+        "NASDAQCOM",
+        "PAYEMS",
+        "PCEPI",
+        "PCEPILFE",
+        "RSAFS",
+        "UMCSENT",
+        "UNRATE",
+        "UNRATENSA",
+        "VIXCLS",
+    }
+)
+_STATE_SUBJECT = "|".join(sorted((re.escape(subject) for subject in STATE_SERIES_PATTERNS), key=len, reverse=True))
+_STATE = "|".join(
+    sorted(
+        [re.escape(name) for name in STATE_NAME_TO_CODE] + [code.lower() for code in STATE_CODE_TO_NAME],
+        key=len,
+        reverse=True,
+    )
+)
+_RANK_PATTERNS = (
+    re.compile(
+        rf"^(?:rank\s+|list\s+)?(?:the\s+)?(?P<direction>top|bottom)\s+(?P<count>\d+|[a-z]+)\s+(?:us\s+)?states\s+by\s+(?:the\s+)?(?P<subject>{_STATE_SUBJECT})$"
+    ),
+    re.compile(rf"^rank\s+(?:all\s+)?(?:the\s+)?(?:us\s+)?states\s+by\s+(?:the\s+)?(?P<subject>{_STATE_SUBJECT})$"),
+    re.compile(
+        rf"^which\s+(?:us\s+)?states?\s+(?:has|have)\s+the\s+(?P<direction>highest|lowest)\s+(?P<subject>{_STATE_SUBJECT})$"
+    ),
+)
+_STATE_GDP_PATTERNS = (
+    re.compile(rf"^compare\s+(?P<first>{_STATE})\s+(?:and|vs\.?|versus|with|to)\s+(?P<second>{_STATE})\s+(?:real\s+)?gdp$"),
+    re.compile(
+        rf"^compare\s+(?:the\s+)?(?:real\s+)?gdp\s+(?:of|for|in|between)\s+(?P<first>{_STATE})\s+(?:and|vs\.?|versus)\s+(?P<second>{_STATE})$"
+    ),
+    re.compile(rf"^(?P<first>{_STATE})\s+(?:vs\.?|versus)\s+(?P<second>{_STATE})\s+(?:real\s+)?gdp$"),
+)
+
+
+@dataclass(frozen=True)
+class _Extracted:
+    text: str
+    transform: TransformType = TransformType.LEVEL
+    transform_window: int | None = None
+    start_date: date | None = None
+    end_date: date | None = None
+
+
+def _parse_start(raw_value: str) -> date:
+    parts = [int(part) for part in raw_value.split("-")]
+    return date(parts[0], parts[1] if len(parts) > 1 else 1, parts[2] if len(parts) > 2 else 1)
+
+
+def _parse_end(raw_value: str) -> date:
+    parts = [int(part) for part in raw_value.split("-")]
+    if len(parts) == 3:
+        return date(*parts)
+    month = parts[1] if len(parts) > 1 else 12
+    return date(parts[0], month, calendar.monthrange(parts[0], month)[1])
+
+
+class FastPathStats:
+    """Thread-safe hit counts and parse latency per fast-path pattern, plus LLM fallbacks."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._hits: dict[str, int] = {}
+        self._seconds: dict[str, float] = {}
+        self._fallbacks = 0
+        self._fallback_seconds = 0.0
+
+    def record_hit(self, pattern: str, seconds: float) -> None:
+        with self._lock:
+            self._hits[pattern] = self._hits.get(pattern, 0) + 1
+            self._seconds[pattern] = self._seconds.get(pattern, 0.0) + seconds
+
+    def record_fallback(self, seconds: float) -> None:
+        with self._lock:
+            self._fallbacks += 1
+            self._fallback_seconds += seconds
+
+    def to_dict(self) -> dict[str, object]:
+        with self._lock:
+            total = sum(self._hits.values()) + self._fallbacks
+            return {
+                "total": total,
+                "fast_path_hit_rate": round(sum(self._hits.values()) / total, 4) if total else 0.0,
+                "patterns": {
+                    pattern: {
+                        "hits": hits,
+                        "hit_rate": round(hits / total, 4),
+                        "avg_latency_ms": round(self._seconds[pattern] / hits * 1000, 3),
+                    }
+                    for pattern, hits in sorted(self._hits.items())
+                },
+                "fallback": {
+                    "count": self._fallbacks,
+                    "avg_latency_ms": (
+                        round(self._fallback_seconds / self._fallbacks * 1000, 3) if self._fallbacks else 0.0
+                    ),
+                },
+            }
+
+
+class FastPathIntentParser:
+    """Parse common, unambiguous query shapes locally and defer everything else to the LLM parser.
+
+    A pattern only fires when it accounts for the whole query, so partial matches
+    never replace the LLM's reading of the request.
+    """
+
+    def __init__(self, fallback: OpenAIIntentParser, *, stats: FastPathStats | None = None) -> None:
+        self.fallback = fallback
+        self.stats = stats or FastPathStats()
+        self._patterns: tuple[tuple[str, Callable[[_Extracted, str], QueryIntent | None]], ...] = (
+            ("series_id", self._parse_series_id),
+            ("state_ranking", self._parse_state_ranking),
+            ("state_gdp_comparison", self._parse_state_gdp_comparison),
+        )
+
+    def parse(self, query: str) -> QueryIntent:
+        return self._parse(query, context=None)
+
+    def parse_with_context(self, query: str, context: dict[str, object]) -> QueryIntent:
+        return self._parse(query, context=context)
+
+    def _parse(self, query: str, *, context: dict[str, object] | None) -> QueryIntent:
+        started = perf_counter()
+        if context is None or not self._is_referential(query):
+            matched = self.try_parse(query)
+            if matched is not None:
+                pattern, intent = matched
+                self.stats.record_hit(pattern, perf_counter() - started)
+                return intent
+
+        if context is None:
+            intent = self.fallback.parse(query)
+        else:
+            intent = self.fallback.parse_with_context(query, context)
+        self.stats.record_fallback(perf_counter() - started)
+        return intent
+
+    @staticmethod
+    def _is_referential(query: str) -> bool:
+        return bool(set(re.findall(r"[a-z]+", query.lower())) & _REFERENTIAL_TOKENS)
+
+    def try_parse(self, query: str) -> tuple[str, QueryIntent] | None:
+        extracted = self._extract(query)
+        if extracted is None:
+            return None
+        for pattern, parse_pattern in self._patterns:
+            intent = parse_pattern(extracted, query)
+            if intent is not None:
+                intent.original_query = query
+                intent.parser_notes.append(f"Parsed locally by the '{pattern}' fast-path pattern.")
+                CrossSectionIntentService.promote_task_type(intent, query=query)
+                if intent.task_type == TaskType.CROSS_SECTION:
+                    CrossSectionIntentService.apply_defaults(intent, query=query)
+                return pattern, intent.refresh_query_plan()
+        return None
+
+    @staticmethod
+    def _extract(query: str) -> _Extracted | None:
+        text = re.sub(r"\s+", " ", query).strip().rstrip("?.!").strip()
+
+        transform = TransformType.LEVEL
+        transform_window = None
+        for candidate, pattern in _TRANSFORM_PATTERNS:
+            match = pattern.search(text)
+            if match is None:
+                continue
+            if transform != TransformType.LEVEL:
+                return None
+            transform = candidate
+            if match.group("window"):
+                transform_window = int(match.group("window"))
+            text = f"{text[:match.start()]} {text[match.end():]}"
+
+        start_date = end_date = None
+        for pattern in _DATE_RANGE_PATTERNS:
+            match = pattern.search(text)
+            if match is None:
+                continue
+            groups = match.groupdict()
+            try:
+                start_date = _parse_start(groups["start"])
+                end_date = _parse_end(groups["end"]) if groups.get("end") else None
+            except ValueError:
+                return None
+            text = f"{text[:match.start()]} {text[match.end():]}"
+            break
+
+        text = re.sub(r"\s+", " ", text).strip()
+        text = _TRAILING_FILLER.sub("", _LEADING_FILLER.sub("", text)).strip()
+        if not text or (transform_window is not None and not 2 <= transform_window <= 1000):
+            return None
+        return _Extracted(
+            text=text,
+            transform=transform,
+            transform_window=transform_window,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+    @staticmethod
+    def _parse_series_id(extracted: _Extracted, query: str) -> QueryIntent | None:
+        match = _SERIES_ID.match(extracted.text)
+        if match is None:
+            return None
+        series_id = match.group("series_id")
+        # All-caps words (GDP, CPI, UNEMPLOYMENT) are usually acronyms or emphasis, so without a
+        # digit only known IDs skip the LLM; a wrong guess would fail the metadata lookup.
+        if not re.search(r"[A-Z]", series_id):
+            return None
+        if (
+            not re.search(r"\d", series_id)
+            and series_id not in _KNOWN_SERIES_IDS
+            and STATE_SERIES_METADATA.get(series_id) is None
+        ):
+            return None
+        return QueryIntent(
+            task_type=TaskType.SINGLE_SERIES_LOOKUP,
+            series_id=series_id,
+            start_date=extracted.start_date,
+            end_date=extracted.end_date,
+            transform=extracted.transform,
+            transform_window=extracted.transform_window,
+            normalization=extracted.transform == TransformType.NORMALIZED_INDEX,
+        )
+
+    @staticmethod
+    def _parse_state_ranking(extracted: _Extracted, query: str) -> QueryIntent | None:
+        if extracted.start_date is not None or extracted.transform != TransformType.LEVEL:
+            return None
+        text = extracted.text.lower()
+        for pattern in _RANK_PATTERNS:
+            match = pattern.match(text)
+            if match is None:
+                continue
+            groups = match.groupdict()
+            subject = groups["subject"]
+            intent = QueryIntent(
+                task_type=TaskType.CROSS_SECTION,
+                indicators=[subject],
+                search_text=subject,
+                comparison_mode=ComparisonMode.CROSS_SECTION,
+                cross_section_scope=CrossSectionScope.STATES,
+                sort_descending=groups.get("direction") not in ("bottom", "lowest"),
+            )
+            if groups.get("count"):
+                rank_limit = CrossSectionIntentService.explicit_rank_limit(intent, query=query)
+                if rank_limit is None or not 1 <= rank_limit <= 100:
+                    return None
+                intent.rank_limit = rank_limit
+            return intent
+        return None
+
+    @staticmethod
+    def _parse_state_gdp_comparison(extracted: _Extracted, query: str) -> QueryIntent | None:
+        text = extracted.text.lower()
+        for pattern in _STATE_GDP_PATTERNS:
+            match = pattern.match(text)
+            if match is None:
+                continue
+            codes = [STATE_NAME_TO_CODE.get(match.group(name), match.group(name).upper()) for name in ("first", "second")]
+            if codes[0] == codes[1]:
+                return None
+            return QueryIntent(
+                task_type=TaskType.STATE_GDP_COMPARISON,
+                indicators=["real_gdp"],
+                geographies=[
+                    Geography(name=STATE_CODE_TO_NAME[code], geography_type=GeographyType.STATE, code=code)
+                    for code in codes
+                ],
+                comparison_mode=ComparisonMode.STATE_VS_STATE,
+                start_date=extracted.start_date,
+                end_date=extracted.end_date,
+                transform=extracted.transform,
+                transform_window=extracted.transform_window,
+                normalization=extracted.transform == TransformType.NORMALIZED_INDEX,
+            )
+        return None
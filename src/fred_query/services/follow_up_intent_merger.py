@@ -5,6 +5,7 @@ from dataclasses import dataclass
 
 from fred_query.schemas.analysis import RoutedQueryStatus
 from fred_query.schemas.intent import ComparisonMode, QueryIntent, TaskType, TransformType
+from fred_query.services.fast_path_parser_service import FastPathIntentParser
 from fred_query.services.openai_parser_service import OpenAIIntentParser
 from fred_query.services.query_session_service import QuerySession
 
@@ -52,7 +53,7 @@ class FollowUpIntentMerger:
     _ASCENDING_TERMS = ("bottom", "least", "lowest", "smallest")
     _DESCENDING_TERMS = ("highest", "largest", "most", "top")
 
-    def __init__(self, parser: OpenAIIntentParser) -> None:
+    def __init__(self, parser: OpenAIIntentParser | FastPathIntentParser) -> None:
         self.parser = parser
 
     @staticmethod
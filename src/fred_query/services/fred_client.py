@@ -1,13 +1,30 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import Any
+from datetime import date, datetime
+from importlib.util import find_spec
+from time import perf_counter
+from typing import Any, Protocol
 
 import httpx
 
 from fred_query.errors import ConfigurationError, UpstreamServiceError
-from fred_query.schemas.analysis import ObservationPoint
+from fred_query.schemas.observation_series import ObservationSeries
 from fred_query.schemas.resolved_series import SeriesMetadata, SeriesSearchMatch
+from fred_query.schemas.vintage_analysis import VintageObservation
+from fred_query.services.metrics import FRED_REQUEST_RETRIES, FRED_REQUEST_SECONDS, FRED_REQUESTS
+from fred_query.services.single_flight import SingleFlight
+from fred_query.services.stage_timing import record_upstream_call
+
+
+DEFAULT_FRED_BASE_URL = "https://api.stlouisfed.org/fred"
+# ALFRED's real-time bounds; a period ending on REALTIME_END is still current.
+REALTIME_START = date(1776, 7, 4)
+REALTIME_END = date(9999, 12, 31)
+# `output_type` values: one row per value per real-time period, or each observation's first release only.
+OUTPUT_REALTIME_PERIODS = 1
+OUTPUT_INITIAL_RELEASE = 4
+# The most observations FRED returns per request; longer real-time histories are paged with `offset`.
+REALTIME_PAGE_SIZE = 100_000
 
 
 class FREDAPIError(UpstreamServiceError):
@@ -17,16 +34,319 @@ class FREDAPIError(UpstreamServiceError):
         super().__init__("fred", message)
 
 
+def http2_available() -> bool:
+    """Return whether the optional `h2` package needed for HTTP/2 is installed."""
+
+    return find_spec("h2") is not None
+
+
+def _client_options(
+    *,
+    base_url: str,
+    timeout_seconds: float,
+    http2: bool,
+    max_connections: int,
+    max_keepalive_connections: int,
+) -> dict[str, Any]:
+    return {
+        "base_url": base_url.rstrip("/"),
+        "timeout": timeout_seconds,
+        "http2": http2 and http2_available(),
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+    }
+
+
+def build_fred_http_client(
+    *,
+    base_url: str = DEFAULT_FRED_BASE_URL,
+    timeout_seconds: float = 20.0,
+    http2: bool = True,
+    max_connections: int = 20,
+    max_keepalive_connections: int = 20,
+) -> httpx.Client:
+    """Build a pooled keep-alive client that can be shared across FREDClient instances."""
+
+    return httpx.Client(
+        **_client_options(
+            base_url=base_url,
+            timeout_seconds=timeout_seconds,
+            http2=http2,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+    )
+
+
+def _source_url(series_id: str) -> str:
+    return f"https://fred.stlouisfed.org/series/{series_id}"
+
+
+def _search_params(
+    search_text: str,
+    limit: int,
+    *,
+    tag_names: str | None,
+    filter_variable: str | None,
+    filter_value: str | None,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {"search_text": search_text, "limit": limit}
+    if tag_names:
+        params["tag_names"] = tag_names
+    if filter_variable and filter_value:
+        params["filter_variable"] = filter_variable
+        params["filter_value"] = filter_value
+    return params
+
+
+def _observation_params(
+    series_id: str,
+    *,
+    start_date: date | None,
+    end_date: date | None,
+    frequency: str | None,
+    aggregation_method: str | None,
+    limit: int | None,
+    sort_order: str | None,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {"series_id": series_id}
+    if start_date is not None:
+        params["observation_start"] = start_date.isoformat()
+    if end_date is not None:
+        params["observation_end"] = end_date.isoformat()
+    if frequency:
+        params["frequency"] = frequency
+    if aggregation_method:
+        params["aggregation_method"] = aggregation_method
+    if limit is not None:
+        params["limit"] = limit
+    if sort_order:
+        params["sort_order"] = sort_order
+    return params
+
+
+def _vintage_date_params(
+    series_id: str,
+    limit: int,
+    realtime_start: date | None,
+    sort_order: str | None,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {"series_id": series_id, "limit": limit}
+    if realtime_start is not None:
+        params["realtime_start"] = realtime_start.isoformat()
+    if sort_order:
+        params["sort_order"] = sort_order
+    return params
+
+
+def _realtime_params(
+    series_id: str,
+    *,
+    realtime_start: date | None,
+    realtime_end: date | None,
+    output_type: int,
+    start_date: date | None,
+    end_date: date | None,
+    page_size: int,
+) -> dict[str, Any]:
+    if output_type not in (OUTPUT_REALTIME_PERIODS, OUTPUT_INITIAL_RELEASE):
+        raise ValueError(f"Unsupported FRED output_type {output_type}; use 1 (real-time periods) or 4 (initial release).")
+    params = _observation_params(
+        series_id,
+        start_date=start_date,
+        end_date=end_date,
+        frequency=None,
+        aggregation_method=None,
+        limit=page_size,
+        sort_order=None,
+    )
+    params["realtime_start"] = (realtime_start or REALTIME_START).isoformat()
+    params["realtime_end"] = (realtime_end or REALTIME_END).isoformat()
+    params["output_type"] = output_type
+    return params
+
+
+def _parse_search_matches(payload: dict[str, Any]) -> list[SeriesSearchMatch]:
+    matches = []
+    for item in payload.get("seriess", []):
+        series_id = item["id"]
+        matches.append(
+            SeriesSearchMatch(
+                series_id=series_id,
+                title=item["title"],
+                units=item.get("units_short") or item.get("units"),
+                frequency=item.get("frequency_short") or item.get("frequency"),
+                seasonal_adjustment=item.get("seasonal_adjustment_short") or item.get("seasonal_adjustment"),
+                notes=item.get("notes"),
+                popularity=item.get("popularity"),
+                source_url=_source_url(series_id),
+            )
+        )
+    return matches
+
+
+def _parse_last_updated(raw_value: str | None) -> datetime | None:
+    # FRED reports e.g. "2024-07-05 07:47:02-05"; the bare hour offset needs minutes to parse.
+    if not raw_value:
+        return None
+    value = raw_value.strip()
+    if len(value) >= 3 and value[-3] in "+-" and value[-2:].isdigit():
+        value = f"{value}:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_series_metadata(series_id: str, payload: dict[str, Any]) -> SeriesMetadata:
+    items = payload.get("seriess", [])
+    if not items:
+        raise FREDAPIError(f"No metadata found for series {series_id}.")
+
+    item = items[0]
+    return SeriesMetadata(
+        series_id=series_id,
+        title=item["title"],
+        units=item.get("units_short") or item.get("units") or "Unknown",
+        frequency=item.get("frequency_short") or item.get("frequency") or "Unknown",
+        seasonal_adjustment=item.get("seasonal_adjustment_short") or item.get("seasonal_adjustment"),
+        notes=item.get("notes"),
+        last_updated=_parse_last_updated(item.get("last_updated")),
+        source_url=_source_url(series_id),
+    )
+
+
+def _parse_observations(payload: dict[str, Any]) -> ObservationSeries:
+    return ObservationSeries.from_fred_observations(payload.get("observations", []))
+
+
+def _parse_realtime_observations(payload: dict[str, Any]) -> list[VintageObservation]:
+    return [
+        VintageObservation.model_construct(
+            date=date.fromisoformat(item["date"]),
+            value=float(item["value"]),
+            vintage_date=date.fromisoformat(item["realtime_start"]),
+            realtime_end=date.fromisoformat(item["realtime_end"]),
+        )
+        for item in payload.get("observations", [])
+        if item.get("value", ".") != "."
+    ]
+
+
+def _next_realtime_offset(payload: dict[str, Any], offset: int, page_size: int) -> int | None:
+    # Count raw rows, missing values included: a full page means FRED cut the response short.
+    rows = len(payload.get("observations", []))
+    return offset + rows if rows >= page_size else None
+
+
+def _parse_vintage_dates(payload: dict[str, Any]) -> list[date]:
+    return [date.fromisoformat(value) for value in payload.get("vintage_dates", [])]
+
+
+def _flight_key(endpoint: str, params: dict[str, Any]) -> tuple[str, tuple[tuple[str, str], ...]]:
+    return endpoint, tuple(sorted((name, str(value)) for name, value in params.items()))
+
+
+def _record_fred_request(endpoint: str, status: str, seconds: float) -> None:
+    FRED_REQUESTS.inc(endpoint=endpoint, status=status)
+    FRED_REQUEST_SECONDS.observe(seconds, endpoint=endpoint)
+
+
+def _payload_from_response(response: httpx.Response) -> dict[str, Any]:
+    response.raise_for_status()
+    payload = response.json()
+    if isinstance(payload, dict) and payload.get("error_code"):
+        message = payload.get("error_message", "FRED returned an API error.")
+        raise FREDAPIError(message)
+    return payload
+
+
+class FREDClientProtocol(Protocol):
+    """The FRED surface the services use.
+
+    `FREDClient` talks to FRED; `CachingFREDClient` and `CatalogFREDClient` wrap any
+    implementation and answer some calls locally.
+    """
+
+    def close(self) -> None: ...
+
+    def search_series(
+        self,
+        search_text: str,
+        limit: int = 10,
+        *,
+        tag_names: str | None = None,
+        filter_variable: str | None = None,
+        filter_value: str | None = None,
+    ) -> list[SeriesSearchMatch]: ...
+
+    def get_series_metadata(self, series_id: str) -> SeriesMetadata: ...
+
+    def get_series_observations(
+        self,
+        series_id: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        *,
+        frequency: str | None = None,
+        aggregation_method: str | None = None,
+        limit: int | None = None,
+        sort_order: str | None = None,
+    ) -> ObservationSeries: ...
+
+    def get_series_vintage_dates(
+        self,
+        series_id: str,
+        limit: int = 1000,
+        *,
+        realtime_start: date | None = None,
+        sort_order: str | None = None,
+    ) -> list[date]: ...
+
+    def get_series_observations_for_vintage_date(
+        self,
+        series_id: str,
+        vintage_date: date,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        *,
+        frequency: str | None = None,
+        aggregation_method: str | None = None,
+        limit: int | None = None,
+        sort_order: str | None = None,
+    ) -> ObservationSeries: ...
+
+    def get_series_realtime_observations(
+        self,
+        series_id: str,
+        realtime_start: date | None = None,
+        realtime_end: date | None = None,
+        *,
+        output_type: int = OUTPUT_REALTIME_PERIODS,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> list[VintageObservation]: ...
+
+
 class FREDClient:
-    """Thin, explicit client for the FRED REST API."""
+    """Thin, explicit client for the FRED REST API.
+
+    Identical concurrent requests share one upstream call through `single_flight`.
+    Pass one `SingleFlight` to every client built on a shared HTTP pool so the
+    coalescing spans requests, not just one client's worker threads.
+    """
 
     def __init__(
         self,
         api_key: str,
-        base_url: str = "https://api.stlouisfed.org/fred",
+        base_url: str = DEFAULT_FRED_BASE_URL,
         timeout_seconds: float = 20.0,
         max_retries: int = 1,
         http_client: httpx.Client | None = None,
+        single_flight: SingleFlight | None = None,
+        realtime_page_size: int = REALTIME_PAGE_SIZE,
     ) -> None:
         if not api_key:
             raise ConfigurationError("A FRED API key is required.")
@@ -36,35 +356,49 @@ class FREDClient:
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
         self._owns_client = http_client is None
-        self._client = http_client or httpx.Client(base_url=self.base_url, timeout=self.timeout_seconds)
+        self._client = http_client or build_fred_http_client(
+            base_url=self.base_url,
+            timeout_seconds=self.timeout_seconds,
+        )
+        self.single_flight = single_flight or SingleFlight()
+        self.realtime_page_size = realtime_page_size
 
     def close(self) -> None:
         if self._owns_client:
             self._client.close()
 
     def _request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        return self.single_flight.do(
+            (self.base_url, self.api_key, *_flight_key(endpoint, params)),
+            lambda: self._fetch(endpoint, params),
+        )
+
+    def _fetch(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
         query = {"api_key": self.api_key, "file_type": "json", **params}
         last_error: Exception | None = None
 
         for attempt in range(self.max_retries + 1):
+            if attempt:
+                FRED_REQUEST_RETRIES.inc(endpoint=endpoint)
+            record_upstream_call()
+            started = perf_counter()
+            status = "error"
             try:
                 response = self._client.get(endpoint, params=query)
-                response.raise_for_status()
-                payload = response.json()
-                if isinstance(payload, dict) and payload.get("error_code"):
-                    message = payload.get("error_message", "FRED returned an API error.")
-                    raise FREDAPIError(message)
-                return payload
+                status = str(response.status_code)
+                return _payload_from_response(response)
             except (httpx.HTTPError, ValueError) as exc:
                 last_error = exc
                 if attempt >= self.max_retries:
                     break
+            finally:
+                _record_fred_request(endpoint, status, perf_counter() - started)
 
         raise FREDAPIError(f"FRED request failed for {endpoint}: {last_error}") from last_error
 
     @staticmethod
     def _source_url(series_id: str) -> str:
-        return f"https://fred.stlouisfed.org/series/{series_id}"
+        return _source_url(series_id)
 
     def search_series(
         self,
@@ -75,48 +409,18 @@ class FREDClient:
         filter_variable: str | None = None,
         filter_value: str | None = None,
     ) -> list[SeriesSearchMatch]:
-        params: dict[str, Any] = {"search_text": search_text, "limit": limit}
-        if tag_names:
-            params["tag_names"] = tag_names
-        if filter_variable and filter_value:
-            params["filter_variable"] = filter_variable
-            params["filter_value"] = filter_value
-
-        payload = self._request("series/search", params=params)
-        matches = []
-        for item in payload.get("seriess", []):
-            series_id = item["id"]
-            matches.append(
-                SeriesSearchMatch(
-                    series_id=series_id,
-                    title=item["title"],
-                    units=item.get("units_short") or item.get("units"),
-                    frequency=item.get("frequency_short") or item.get("frequency"),
-                    seasonal_adjustment=item.get("seasonal_adjustment_short") or item.get("seasonal_adjustment"),
-                    notes=item.get("notes"),
-                    popularity=item.get("popularity"),
-                    source_url=self._source_url(series_id),
-                )
-            )
-
-        return matches
+        params = _search_params(
+            search_text,
+            limit,
+            tag_names=tag_names,
+            filter_variable=filter_variable,
+            filter_value=filter_value,
+        )
+        return _parse_search_matches(self._request("series/search", params=params))
 
     def get_series_metadata(self, series_id: str) -> SeriesMetadata:
         payload = self._request("series", params={"series_id": series_id})
-        items = payload.get("seriess", [])
-        if not items:
-            raise FREDAPIError(f"No metadata found for series {series_id}.")
-
-        item = items[0]
-        return SeriesMetadata(
-            series_id=series_id,
-            title=item["title"],
-            units=item.get("units_short") or item.get("units") or "Unknown",
-            frequency=item.get("frequency_short") or item.get("frequency") or "Unknown",
-            seasonal_adjustment=item.get("seasonal_adjustment_short") or item.get("seasonal_adjustment"),
-            notes=item.get("notes"),
-            source_url=self._source_url(series_id),
-        )
+        return _parse_series_metadata(series_id, payload)
 
     def get_series_observations(
         self,
@@ -128,53 +432,43 @@ class FREDClient:
         aggregation_method: str | None = None,
         limit: int | None = None,
         sort_order: str | None = None,
-    ) -> list[ObservationPoint]:
-        params: dict[str, Any] = {"series_id": series_id}
-        if start_date is not None:
-            params["observation_start"] = start_date.isoformat()
-        if end_date is not None:
-            params["observation_end"] = end_date.isoformat()
-        if frequency:
-            params["frequency"] = frequency
-        if aggregation_method:
-            params["aggregation_method"] = aggregation_method
-        if limit is not None:
-            params["limit"] = limit
-        if sort_order:
-            params["sort_order"] = sort_order
-
-        payload = self._request("series/observations", params=params)
-        observations: list[ObservationPoint] = []
-        for item in payload.get("observations", []):
-            raw_value = item.get("value", ".")
-            if raw_value == ".":
-                continue
-
-            observations.append(
-                ObservationPoint(
-                    date=date.fromisoformat(item["date"]),
-                    value=float(raw_value),
-                )
-            )
-
-        return observations
+    ) -> ObservationSeries:
+        params = _observation_params(
+            series_id,
+            start_date=start_date,
+            end_date=end_date,
+            frequency=frequency,
+            aggregation_method=aggregation_method,
+            limit=limit,
+            sort_order=sort_order,
+        )
+        return _parse_observations(self._request("series/observations", params=params))
 
-    def get_series_vintage_dates(self, series_id: str, limit: int = 1000) -> list[date]:
+    def get_series_vintage_dates(
+        self,
+        series_id: str,
+        limit: int = 1000,
+        *,
+        realtime_start: date | None = None,
+        sort_order: str | None = None,
+    ) -> list[date]:
         """
         Get the dates in history when a series' data values were revised or new data released.
 
         Args:
             series_id: The ID of the series to retrieve vintage dates for
             limit: Maximum number of vintage dates to return
+            realtime_start: Only return vintage dates on or after this date
+            sort_order: 'asc' (FRED's default, oldest first) or 'desc' for the most recent `limit`
 
         Returns:
             List of dates when the series was updated with new data
         """
         payload = self._request(
             "series/vintagedates",
-            params={"series_id": series_id, "limit": limit},
+            params=_vintage_date_params(series_id, limit, realtime_start, sort_order),
         )
-        return [date.fromisoformat(value) for value in payload.get("vintage_dates", [])]
+        return _parse_vintage_dates(payload)
 
     def get_series_observations_for_vintage_date(
         self,
@@ -187,7 +481,7 @@ class FREDClient:
         aggregation_method: str | None = None,
         limit: int | None = None,
         sort_order: str | None = None,
-    ) -> list[ObservationPoint]:
+    ) -> ObservationSeries:
         """
         Get series observations as they existed on a specific vintage date.
         This allows you to see what data was available on a specific date in history.
@@ -205,35 +499,51 @@ class FREDClient:
         Returns:
             List of observation points as they existed on the vintage date
         """
-        params: dict[str, Any] = {
-            "series_id": series_id,
-            "vintage_dates": vintage_date.isoformat()  # Parameter name for vintage date
-        }
-        if start_date is not None:
-            params["observation_start"] = start_date.isoformat()
-        if end_date is not None:
-            params["observation_end"] = end_date.isoformat()
-        if frequency:
-            params["frequency"] = frequency
-        if aggregation_method:
-            params["aggregation_method"] = aggregation_method
-        if limit is not None:
-            params["limit"] = limit
-        if sort_order:
-            params["sort_order"] = sort_order
-
-        payload = self._request("series/observations", params=params)
-        observations: list[ObservationPoint] = []
-        for item in payload.get("observations", []):
-            raw_value = item.get("value", ".")
-            if raw_value == ".":
-                continue
-
-            observations.append(
-                ObservationPoint(
-                    date=date.fromisoformat(item["date"]),
-                    value=float(raw_value),
-                )
-            )
+        params = _observation_params(
+            series_id,
+            start_date=start_date,
+            end_date=end_date,
+            frequency=frequency,
+            aggregation_method=aggregation_method,
+            limit=limit,
+            sort_order=sort_order,
+        )
+        params["vintage_dates"] = vintage_date.isoformat()
+        return _parse_observations(self._request("series/observations", params=params))
 
+    def get_series_realtime_observations(
+        self,
+        series_id: str,
+        realtime_start: date | None = None,
+        realtime_end: date | None = None,
+        *,
+        output_type: int = OUTPUT_REALTIME_PERIODS,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> list[VintageObservation]:
+        """
+        Get every value a series has had during a real-time window from ALFRED.
+
+        With `OUTPUT_REALTIME_PERIODS` each row is one value of one observation, valid from
+        its `vintage_date` through `realtime_end`; rows ending on `REALTIME_END` are current.
+        `OUTPUT_INITIAL_RELEASE` returns only each observation's first published value.
+        The window defaults to all of ALFRED's history. Histories longer than
+        `realtime_page_size` rows take one request per page.
+        """
+        params = _realtime_params(
+            series_id,
+            realtime_start=realtime_start,
+            realtime_end=realtime_end,
+            output_type=output_type,
+            start_date=start_date,
+            end_date=end_date,
+            page_size=self.realtime_page_size,
+        )
+        observations: list[VintageObservation] = []
+        offset: int | None = 0
+        while offset is not None:
+            payload = self._request("series/observations", params={**params, "offset": offset} if offset else params)
+            observations.extend(_parse_realtime_observations(payload))
+            offset = _next_realtime_offset(payload, offset, self.realtime_page_size)
         return observations
+
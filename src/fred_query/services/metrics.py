@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from threading import Lock
+
+_DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._labelset = frozenset(self.labelnames)
+        self._lock = Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if labels.keys() != self._labelset:
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]:
+        """Yield the exposition lines for every labelled value."""
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels: str) -> None:
+        """Mirror a monotonically increasing count that is owned by another object."""
+
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        self.set_total(value, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = _DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: per-bucket (non-cumulative) counts with a trailing +Inf slot, then the sum.
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            state[0][index] += 1
+            state[1][0] += value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return sum(state[0]) if state is not None else 0
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """In-process metric registry rendered in the Prometheus text exposition format.
+
+    Updates take one short lock per metric, so instrumenting the request path costs
+    well under a microsecond next to a FRED round-trip.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} is already registered with a different shape.")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = _DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets=buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+FRED_REQUESTS = REGISTRY.counter(
+    "fred_query_fred_requests_total",
+    "FRED HTTP requests by endpoint and response status ('error' for transport failures).",
+    ("endpoint", "status"),
+)
+FRED_REQUEST_RETRIES = REGISTRY.counter(
+    "fred_query_fred_request_retries_total",
+    "FRED HTTP requests that were retries of a failed attempt.",
+    ("endpoint",),
+)
+FRED_REQUEST_SECONDS = REGISTRY.histogram(
+    "fred_query_fred_request_duration_seconds",
+    "FRED HTTP request latency.",
+    ("endpoint",),
+)
+OPENAI_PARSE_SECONDS = REGISTRY.histogram(
+    "fred_query_openai_parse_duration_seconds",
+    "OpenAI intent parse latency by outcome.",
+    ("outcome",),
+    buckets=(0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0),
+)
+ROUTED_QUERIES = REGISTRY.counter(
+    "fred_query_routed_queries_total",
+    "Natural-language queries by routed status and reason; failures use status 'error'.",
+    ("status", "reason"),
+)
+QUERY_SESSION_TURNS = REGISTRY.counter(
+    "fred_query_session_turns_total",
+    "Query turns stored in follow-up sessions.",
+)
+QUERY_SESSIONS = REGISTRY.gauge(
+    "fred_query_sessions",
+    "Follow-up sessions currently held by the session store.",
+)
+QUERY_SESSION_BYTES = REGISTRY.gauge(
+    "fred_query_session_estimated_bytes",
+    "Estimated memory held by stored session revisions.",
+)
+OBSERVATION_CACHE_LOOKUPS = REGISTRY.counter(
+    "fred_query_observation_cache_lookups_total",
+    "Observation cache lookups by outcome (hit, revalidated, extended, miss, bypass).",
+    ("outcome",),
+)
+METADATA_CACHE_LOOKUPS = REGISTRY.counter(
+    "fred_query_metadata_cache_lookups_total",
+    "Series metadata cache lookups by outcome (hit, miss).",
+    ("outcome",),
+)
+SERIES_CATALOG_LOOKUPS = REGISTRY.counter(
+    "fred_query_series_catalog_lookups_total",
+    "Series searches answered by the local catalog (hit), sent to FRED after a weak match (fallback), or bypassing it.",
+    ("outcome",),
+)
+VINTAGE_ARCHIVE_SYNCS = REGISTRY.counter(
+    "fred_query_vintage_archive_syncs_total",
+    "Vintage archive reads by outcome (fresh, unchanged, appended, created).",
+    ("outcome",),
+)
+INTENT_CACHE_LOOKUPS = REGISTRY.counter(
+    "fred_query_intent_cache_lookups_total",
+    "Intent parse cache lookups by outcome (hit, miss).",
+    ("outcome",),
+)
+INTENT_CACHE_HIT_RATIO = REGISTRY.gauge(
+    "fred_query_intent_cache_hit_ratio",
+    "Share of intent parse cache lookups answered from the cache.",
+)
+FAST_PATH_PARSES = REGISTRY.counter(
+    "fred_query_fast_path_parses_total",
+    "Queries parsed by a local fast-path pattern, or by the LLM fallback (pattern 'fallback').",
+    ("pattern",),
+)
+SINGLE_FLIGHT_CALLS = REGISTRY.counter(
+    "fred_query_single_flight_calls_total",
+    "FRED calls that ran upstream (executed) or joined an identical in-flight call (coalesced).",
+    ("outcome",),
+)
+SINGLE_FLIGHT_IN_FLIGHT = REGISTRY.gauge(
+    "fred_query_single_flight_in_flight",
+    "Distinct FRED calls currently in flight through the shared single-flight group.",
+)
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+from fred_query.errors import UpstreamServiceError
 from fred_query.schemas.analysis import RoutedQueryResponse
 from fred_query.services.clarification_resolver import ClarificationResolver
 from fred_query.services.comparison_service import StateGDPComparisonService
 from fred_query.services.cross_section_service import CrossSectionService
-from fred_query.services.fred_client import FREDClient
+from fred_query.services.fast_path_parser_service import FastPathIntentParser
+from fred_query.services.fred_client import FREDClientProtocol
 from fred_query.services.follow_up_intent_merger import FollowUpIntentMerger
+from fred_query.services.metrics import ROUTED_QUERIES
 from fred_query.services.openai_parser_service import OpenAIIntentParser
+from fred_query.services.progress import emit_progress
 from fred_query.services.query_router import QueryRouter
 from fred_query.services.query_session_service import QuerySession
+from fred_query.services.recession_index import RecessionIndex
 from fred_query.services.relationship_service import RelationshipAnalysisService
+from fred_query.services.resolver_service import ResolverService
 from fred_query.services.single_series_service import SingleSeriesLookupService
+from fred_query.services.stage_timing import stage
 from fred_query.services.vintage_analysis_service import VintageAnalysisService
 
 
@@ -20,21 +27,39 @@ class NaturalLanguageQueryService:
     def __init__(
         self,
         *,
-        parser: OpenAIIntentParser,
-        fred_client: FREDClient,
+        parser: OpenAIIntentParser | FastPathIntentParser,
+        fred_client: FREDClientProtocol,
         state_gdp_service: StateGDPComparisonService | None = None,
         cross_section_service: CrossSectionService | None = None,
         single_series_service: SingleSeriesLookupService | None = None,
         relationship_service: RelationshipAnalysisService | None = None,
         vintage_analysis_service: VintageAnalysisService | None = None,
+        recession_index: RecessionIndex | None = None,
+        resolver_service: ResolverService | None = None,
     ) -> None:
         self.parser = parser
         self.fred_client = fred_client
-        self.state_gdp_service = state_gdp_service or StateGDPComparisonService(fred_client)
-        self.cross_section_service = cross_section_service or CrossSectionService(fred_client)
-        self.single_series_service = single_series_service or SingleSeriesLookupService(fred_client)
-        self.relationship_service = relationship_service or RelationshipAnalysisService(fred_client)
+        self.resolver_service = resolver_service or ResolverService(fred_client)
+        self.state_gdp_service = state_gdp_service or StateGDPComparisonService(
+            fred_client,
+            resolver_service=self.resolver_service,
+            recession_index=recession_index,
+        )
+        self.cross_section_service = cross_section_service or CrossSectionService(
+            fred_client,
+            resolver_service=self.resolver_service,
+        )
         self.vintage_analysis_service = vintage_analysis_service or VintageAnalysisService(fred_client)
+        self.single_series_service = single_series_service or SingleSeriesLookupService(
+            fred_client,
+            resolver_service=self.resolver_service,
+            vintage_analysis_service=self.vintage_analysis_service,
+            recession_index=recession_index,
+        )
+        self.relationship_service = relationship_service or RelationshipAnalysisService(
+            fred_client,
+            resolver_service=self.resolver_service,
+        )
 
         self.clarification_resolver = ClarificationResolver(fred_client)
         self.follow_up_intent_merger = FollowUpIntentMerger(parser)
@@ -58,6 +83,25 @@ class NaturalLanguageQueryService:
         if effective_selected_series_ids is None and selected_series_id is not None:
             effective_selected_series_ids = [selected_series_id]
 
-        intent = self.follow_up_intent_merger.parse_intent(query, session_context)
-        intent = self.follow_up_intent_merger.merge(query, intent, session_context)
-        return self.query_router.route(intent, selected_series_ids=effective_selected_series_ids)
+        try:
+            with stage("ask"):
+                with stage("parse"):
+                    intent = self.follow_up_intent_merger.parse_intent(query, session_context)
+                with stage("follow_up"):
+                    intent = self.follow_up_intent_merger.merge(query, intent, session_context)
+                emit_progress("intent", {"intent": intent})
+                response = self.query_router.route(intent, selected_series_ids=effective_selected_series_ids)
+        except Exception as exc:
+            ROUTED_QUERIES.inc(status="error", reason=self._error_reason(exc))
+            raise
+        ROUTED_QUERIES.inc(status=response.status.value, reason=response.reason.value if response.reason else "")
+        return response
+
+    @staticmethod
+    def _error_reason(exc: Exception) -> str:
+        # Mirrors the API's error codes so dashboards can line the two up.
+        if isinstance(exc, UpstreamServiceError):
+            return f"{exc.service}_error"
+        if isinstance(exc, ValueError):
+            return "invalid_request"
+        return "internal_error"
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
+from time import perf_counter
 
 from openai import OpenAI
 
+from fred_query.cache.intent_cache import IntentParseCache
 from fred_query.errors import ConfigurationError, IntentParsingError
 from fred_query.schemas.intent import CrossSectionScope, QueryIntent, TaskType, TransformType
 from fred_query.services.cross_section_intent_service import CrossSectionIntentService
+from fred_query.services.metrics import OPENAI_PARSE_SECONDS
 
 
 PARSER_INSTRUCTIONS = """You convert natural-language economic questions into a strict QueryIntent.
@@ -60,6 +63,7 @@ class OpenAIIntentParser:
         model: str = "gpt-5.4-mini",
         reasoning_effort: str | None = "low",
         client: OpenAI | None = None,
+        cache: IntentParseCache | None = None,
     ) -> None:
         if not api_key and client is None:
             raise ConfigurationError("An OpenAI API key is required for intent parsing.")
@@ -67,9 +71,10 @@ class OpenAIIntentParser:
         self.model = model
         self.reasoning_effort = reasoning_effort
         self.client = client or OpenAI(api_key=api_key)
+        self.cache = cache
 
     def parse(self, query: str) -> QueryIntent:
-        return self._parse_input(query, original_query=query)
+        return self._parse_cached(query, query, context=None)
 
     def parse_with_context(self, query: str, context: dict[str, object]) -> QueryIntent:
         contextual_input = "\n\n".join(
@@ -79,9 +84,30 @@ class OpenAIIntentParser:
                 f"Current user query:\n{query}",
             ]
         )
-        return self._parse_input(contextual_input, original_query=query)
+        return self._parse_cached(contextual_input, query, context=context)
+
+    def _parse_cached(self, parser_input: str, query: str, *, context: dict[str, object] | None) -> QueryIntent:
+        if self.cache is None:
+            return self._parse_input(parser_input, original_query=query)
+
+        key = self.cache.key_for(
+            query,
+            model=self.model,
+            reasoning_effort=self.reasoning_effort,
+            instructions=PARSER_INSTRUCTIONS,
+            context=context,
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            cached.original_query = query
+            return cached
+
+        intent = self._parse_input(parser_input, original_query=query)
+        self.cache.put(key, intent)
+        return intent
 
     def _parse_input(self, parser_input: str, *, original_query: str) -> QueryIntent:
+        started = perf_counter()
         try:
             request_kwargs = {
                 "model": self.model,
@@ -97,7 +123,9 @@ class OpenAIIntentParser:
                 **request_kwargs,
             )
         except Exception as exc:
+            OPENAI_PARSE_SECONDS.observe(perf_counter() - started, outcome="error")
             raise IntentParsingError(f"Natural-language parsing failed: {exc}") from exc
+        OPENAI_PARSE_SECONDS.observe(perf_counter() - started, outcome="ok")
 
         intent = response.output_parsed
         if intent is None:
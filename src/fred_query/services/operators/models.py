@@ -3,8 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date
 
-from fred_query.schemas.analysis import DerivedMetric, HistoricalSeriesContext, ObservationPoint
+from fred_query.schemas.analysis import DerivedMetric, HistoricalSeriesContext
 from fred_query.schemas.intent import TransformType
+from fred_query.schemas.observation_series import ObservationSeries
 from fred_query.schemas.resolved_series import ResolvedSeries, SeriesMetadata, SeriesSearchMatch
 
 
@@ -30,9 +31,9 @@ class SingleSeriesTransformPlan:
 
 @dataclass(frozen=True)
 class SingleSeriesTransformOutput:
-    visible_observations: list[ObservationPoint]
-    transformed_observations: list[ObservationPoint] | None
-    normalized_observations: list[ObservationPoint] | None
+    visible_observations: ObservationSeries
+    transformed_observations: ObservationSeries | None
+    normalized_observations: ObservationSeries | None
     analysis_basis: str | None
     analysis_units: str | None
     latest_value: float | None
@@ -62,8 +63,8 @@ class RelationshipTransformPlan:
 
 @dataclass(frozen=True)
 class RelationshipSeriesTransformOutput:
-    visible_observations: list[ObservationPoint]
-    transformed_observations: list[ObservationPoint]
+    visible_observations: ObservationSeries
+    transformed_observations: ObservationSeries
     basis: str
     units: str
     applied_transform_window: int | None
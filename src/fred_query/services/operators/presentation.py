@@ -6,12 +6,14 @@ from fred_query.schemas.analysis import AnalysisResult, SeriesAnalysis
 from fred_query.schemas.chart import ChartSpec, DateSpanAnnotation
 from fred_query.services.answer_service import AnswerService
 from fred_query.services.chart_service import ChartService
+from fred_query.services.stage_timing import timed_stage
 
 
 class BuildChartOp:
     def __init__(self, chart_service: ChartService) -> None:
         self.chart_service = chart_service
 
+    @timed_stage("chart")
     def build_single_series_chart(
         self,
         *,
@@ -29,6 +31,7 @@ class BuildChartOp:
             recession_periods=recession_periods,
         )
 
+    @timed_stage("chart")
     def build_relationship_chart(
         self,
         *,
@@ -53,8 +56,10 @@ class RenderAnswerOp:
     def __init__(self, answer_service: AnswerService) -> None:
         self.answer_service = answer_service
 
+    @timed_stage("answer")
     def render_single_series_answer(self, analysis: AnalysisResult, *, normalize: bool) -> str:
         return self.answer_service.write_single_series_lookup(analysis, normalize=normalize)
 
+    @timed_stage("answer")
     def render_relationship_answer(self, analysis: AnalysisResult) -> str:
         return self.answer_service.write_relationship_analysis(analysis)
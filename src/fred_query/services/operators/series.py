@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from datetime import date
 
-from fred_query.schemas.analysis import DerivedMetric, HistoricalSeriesContext, ObservationPoint, SeriesAnalysis
+from fred_query.schemas.analysis import DerivedMetric, HistoricalSeriesContext, SeriesAnalysis
 from fred_query.schemas.chart import DateSpanAnnotation
 from fred_query.schemas.intent import QueryIntent, TransformType
+from fred_query.schemas.observation_series import ObservationInput, ObservationSeries
 from fred_query.schemas.resolved_series import SeriesMetadata
-from fred_query.services.fred_client import FREDClient
+from fred_query.services.fred_client import FREDClientProtocol
 from fred_query.services.operators.models import (
     HistoricalSummaryResult,
     ResolvedSeriesResult,
@@ -16,7 +17,9 @@ from fred_query.services.operators.models import (
     SingleSeriesTransformPlan,
     SingleSeriesTransformOutput,
 )
+from fred_query.services.recession_index import RecessionIndex
 from fred_query.services.resolver_service import ResolverService
+from fred_query.services.stage_timing import timed_stage
 from fred_query.services.transform_service import TransformService
 
 
@@ -24,6 +27,7 @@ class ResolveSeriesOp:
     def __init__(self, resolver_service: ResolverService) -> None:
         self.resolver_service = resolver_service
 
+    @timed_stage("resolve")
     def for_single_series(self, intent: QueryIntent) -> ResolvedSeriesResult:
         search_text = intent.search_text or " ".join(intent.indicators)
         resolved_series, metadata, search_match = self.resolver_service.resolve_series(
@@ -60,6 +64,7 @@ class ResolveSeriesOp:
             return intent.series_ids[index]
         return None
 
+    @timed_stage("resolve")
     def for_relationship_target(self, intent: QueryIntent, index: int) -> ResolvedSeriesResult:
         search_text = self.relationship_search_text_for_index(intent, index)
         resolved_series, metadata, search_match = self.resolver_service.resolve_series(
@@ -84,6 +89,7 @@ class FetchSeriesObservationsOp:
     def __init__(self, resolver_service: ResolverService) -> None:
         self.resolver_service = resolver_service
 
+    @timed_stage("fetch")
     def fetch(
         self,
         series_id: str,
@@ -95,7 +101,7 @@ class FetchSeriesObservationsOp:
         limit: int | None = None,
         sort_order: str | None = None,
         empty_result_message: str | None = None,
-    ) -> list[ObservationPoint]:
+    ) -> ObservationSeries:
         return self.resolver_service.get_required_observations(
             series_id,
             start_date=start_date,
@@ -112,6 +118,7 @@ class ApplyTransformOp:
     def __init__(self, transform_service: TransformService) -> None:
         self.transform_service = transform_service
 
+    @timed_stage("transform")
     def plan_single_series(
         self,
         intent: QueryIntent,
@@ -152,9 +159,10 @@ class ApplyTransformOp:
             warnings=transform_warnings,
         )
 
+    @timed_stage("transform")
     def apply_single_series(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         metadata: SeriesMetadata,
         plan: SingleSeriesTransformPlan,
@@ -220,6 +228,7 @@ class ApplyTransformOp:
             compound_annual_growth_rate_pct=compound_annual_growth_rate,
         )
 
+    @timed_stage("transform")
     def plan_relationship(
         self,
         intent: QueryIntent,
@@ -267,9 +276,10 @@ class ApplyTransformOp:
             warnings=transform_warnings,
         )
 
+    @timed_stage("transform")
     def apply_relationship_basis(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         metadata: SeriesMetadata,
         plan: RelationshipTransformPlan,
@@ -322,14 +332,16 @@ class AlignSeriesOp:
     def __init__(self, transform_service: TransformService) -> None:
         self.transform_service = transform_service
 
+    @timed_stage("align")
     def align(
         self,
-        first: list[ObservationPoint],
-        second: list[ObservationPoint],
-    ) -> tuple[list[ObservationPoint], list[ObservationPoint]]:
+        first: ObservationInput,
+        second: ObservationInput,
+    ) -> tuple[ObservationSeries, ObservationSeries]:
         return self.transform_service.align_on_dates(first, second)
 
-    def standardize(self, observations: list[ObservationPoint]) -> list[ObservationPoint]:
+    @timed_stage("align")
+    def standardize(self, observations: ObservationInput) -> ObservationSeries:
         return self.transform_service.standardize(observations)
 
 
@@ -337,10 +349,11 @@ class ComputeRelationshipMetricsOp:
     def __init__(self, transform_service: TransformService) -> None:
         self.transform_service = transform_service
 
+    @timed_stage("metrics")
     def compute(
         self,
-        first: list[ObservationPoint],
-        second: list[ObservationPoint],
+        first: ObservationInput,
+        second: ObservationInput,
         *,
         periods_per_year: int,
     ) -> RelationshipMetricsResult:
@@ -448,12 +461,13 @@ class ComputeSeriesMetricsOp:
             )
         return metrics
 
+    @timed_stage("history")
     def summarize_historical_context(
         self,
         *,
         series_id: str,
         metadata: SeriesMetadata,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         transform_plan: SingleSeriesTransformPlan,
         transform_result: SingleSeriesTransformOutput,
     ) -> HistoricalSummaryResult:
@@ -534,6 +548,7 @@ class ComputeSeriesMetricsOp:
 
 class RankSeriesOp:
     @staticmethod
+    @timed_stage("rank")
     def rank(
         series_results: list[SeriesAnalysis],
         *,
@@ -547,11 +562,23 @@ class RankSeriesOp:
 
 
 class FetchRecessionPeriodsOp:
-    def __init__(self, *, fred_client: FREDClient, transform_service: TransformService) -> None:
+    def __init__(
+        self,
+        *,
+        fred_client: FREDClientProtocol,
+        transform_service: TransformService,
+        recession_index: RecessionIndex | None = None,
+    ) -> None:
         self.fred_client = fred_client
         self.transform_service = transform_service
+        self.recession_index = recession_index
 
+    @timed_stage("recession")
     def fetch(self, *, start_date: date, end_date: date) -> list[DateSpanAnnotation]:
+        if self.recession_index is not None:
+            periods = self.recession_index.overlapping(start_date, end_date)
+            if periods is not None:
+                return periods
         try:
             recession_observations = self.fred_client.get_series_observations(
                 "USREC",
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+ProgressListener = Callable[[str, dict[str, Any]], None]
+
+_LISTENER: ContextVar[ProgressListener | None] = ContextVar("fred_query_progress_listener", default=None)
+
+
+@contextmanager
+def progress_listener(listener: ProgressListener) -> Iterator[None]:
+    """Send every `emit_progress` call made in this context (and its worker threads) to `listener`."""
+
+    token = _LISTENER.set(listener)
+    try:
+        yield
+    finally:
+        _LISTENER.reset(token)
+
+
+def progress_requested() -> bool:
+    """Whether anyone is listening; lets callers skip building payloads nobody will read."""
+
+    return _LISTENER.get() is not None
+
+
+def emit_progress(event: str, payload: dict[str, Any]) -> None:
+    """Report an intermediate result to the active listener; a no-op outside of one."""
+
+    listener = _LISTENER.get()
+    if listener is not None:
+        listener(event, payload)
@@ -9,6 +9,7 @@ from fred_query.services.execution_executor import ExecutionExecutor
 from fred_query.services.execution_planner import ExecutionPlanner
 from fred_query.services.relationship_service import RelationshipAnalysisService
 from fred_query.services.single_series_service import SingleSeriesLookupService
+from fred_query.services.stage_timing import stage, timed_stage
 
 
 class QueryRouter:
@@ -101,6 +102,7 @@ class QueryRouter:
             )
         return intent.refresh_query_plan()
 
+    @timed_stage("route")
     def route(
         self,
         intent: QueryIntent,
@@ -111,7 +113,8 @@ class QueryRouter:
         task_type = intent.planned_task_type
 
         if intent.clarification_needed:
-            candidate_series = self.clarification_resolver.build_candidates(intent)
+            with stage("clarify"):
+                candidate_series = self.clarification_resolver.build_candidates(intent)
             return RoutedQueryResponse(
                 status=RoutedQueryStatus.NEEDS_CLARIFICATION,
                 reason=self._clarification_reason(intent),
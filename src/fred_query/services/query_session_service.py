@@ -1,11 +1,70 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from threading import Lock
+from typing import Protocol
 from uuid import uuid4
 
 from fred_query.schemas.analysis import RoutedQueryResponse
+from fred_query.services.metrics import QUERY_SESSION_TURNS
+
+# Rough in-memory footprint, measured with tracemalloc: an ObservationPoint with its
+# date is ~540 bytes; a chart value is a list slot plus (usually shared) date/float.
+_BASE_RESPONSE_BYTES = 4096
+_BYTES_PER_OBSERVATION = 544
+_BYTES_PER_CHART_VALUE = 64
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def estimate_response_bytes(response: RoutedQueryResponse) -> int:
+    """Approximate the memory held by a routed response; observations and chart traces dominate."""
+
+    query_response = response.query_response
+    if query_response is None:
+        return _BASE_RESPONSE_BYTES
+    observations = sum(
+        len(result.observations) + len(result.transformed_observations or [])
+        for result in query_response.analysis.series_results
+    )
+    chart_values = sum(len(trace.x) + len(trace.x_categories) + len(trace.y) for trace in query_response.chart.series)
+    return _BASE_RESPONSE_BYTES + observations * _BYTES_PER_OBSERVATION + chart_values * _BYTES_PER_CHART_VALUE
+
+
+def normalize_session_id(session_id: str | None) -> str:
+    """Strip a client-supplied session id, minting a fresh one when it is blank."""
+
+    normalized = (session_id or "").strip()
+    return normalized or str(uuid4())
+
+
+def compact_response(response: RoutedQueryResponse) -> RoutedQueryResponse:
+    """Drop observations and chart traces, keeping what follow-up merging reads.
+
+    The intent, status, candidates, answer text, resolved series and derived metrics
+    survive, so a compacted revision still works as a `base_revision_id`.
+    """
+
+    query_response = response.query_response
+    if query_response is None:
+        return response
+    analysis = query_response.analysis.model_copy(
+        update={
+            "series_results": [
+                result.model_copy(update={"observations": [], "transformed_observations": None})
+                for result in query_response.analysis.series_results
+            ]
+        }
+    )
+    chart = query_response.chart.model_copy(update={"series": []})
+    return response.model_copy(
+        update={"query_response": query_response.model_copy(update={"analysis": analysis, "chart": chart})}
+    )
 
 
 @dataclass(slots=True)
@@ -14,6 +73,8 @@ class QuerySessionRevision:
     query: str
     response: RoutedQueryResponse
     created_at: datetime
+    estimated_bytes: int = 0
+    compacted: bool = False
 
 
 @dataclass(slots=True)
@@ -24,37 +85,129 @@ class QuerySession:
     last_query: str | None = None
     last_response: RoutedQueryResponse | None = None
     revisions: list[QuerySessionRevision] = field(default_factory=list)
+    accessed_at: datetime | None = None
+    estimated_bytes: int = 0
+    revision_index: dict[str, QuerySessionRevision] = field(default_factory=dict, repr=False, compare=False)
+    lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+
+class QuerySessionStore(Protocol):
+    """Storage for follow-up sessions.
+
+    `QuerySessionService` keeps sessions in process memory; `SQLiteQuerySessionStore`
+    persists compact revisions so several workers or replicas can share them.
+    """
+
+    def session_count(self) -> int: ...
+
+    def estimated_bytes(self) -> int: ...
+
+    def get_or_create(self, session_id: str | None = None) -> QuerySession: ...
+
+    def get_context(self, *, session_id: str | None = None, revision_id: str | None = None) -> QuerySession: ...
+
+    def store_turn(
+        self,
+        *,
+        session_id: str,
+        query: str,
+        response: RoutedQueryResponse,
+    ) -> tuple[QuerySession, QuerySessionRevision]: ...
+
+    def close(self) -> None: ...
 
 
 class QuerySessionService:
-    """In-memory request session storage for multi-turn follow-up queries."""
+    """Bounded in-memory session storage for multi-turn follow-up queries.
+
+    Sessions are kept in LRU order and evicted when idle past `idle_ttl`, when there
+    are more than `max_sessions`, or when the estimated footprint of all stored
+    responses exceeds `memory_budget_bytes`. Each session keeps at most
+    `max_revisions` revisions; only the newest `full_revisions` keep observations and
+    chart data, older ones are compacted with `compact_response`.
+
+    The service lock only guards the LRU order and the byte total. Revision lists are
+    guarded by each session's own lock and indexed by id, so requests for different
+    sessions never wait on each other's revision work.
+    """
 
-    def __init__(self) -> None:
-        self._sessions: dict[str, QuerySession] = {}
+    DEFAULT_MAX_SESSIONS = 1000
+    DEFAULT_IDLE_TTL = timedelta(hours=12)
+    DEFAULT_MAX_REVISIONS = 50
+    DEFAULT_FULL_REVISIONS = 5
+    DEFAULT_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_ttl: timedelta = DEFAULT_IDLE_TTL,
+        max_revisions: int = DEFAULT_MAX_REVISIONS,
+        full_revisions: int = DEFAULT_FULL_REVISIONS,
+        memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.max_sessions = max(1, max_sessions)
+        self.idle_ttl = idle_ttl
+        self.max_revisions = max(1, max_revisions)
+        self.full_revisions = max(1, min(full_revisions, self.max_revisions))
+        self.memory_budget_bytes = memory_budget_bytes
+        self._clock = clock
+        self._sessions: OrderedDict[str, QuerySession] = OrderedDict()
+        self._estimated_bytes = 0
         self._lock = Lock()
 
-    @staticmethod
-    def _now() -> datetime:
-        return datetime.now(timezone.utc)
+    def _now(self) -> datetime:
+        return self._clock()
 
-    @staticmethod
-    def _normalize_session_id(session_id: str | None) -> str:
-        normalized = (session_id or "").strip()
-        return normalized or str(uuid4())
+    def _drop_unlocked(self, session_id: str) -> None:
+        session = self._sessions.pop(session_id)
+        self._estimated_bytes -= session.estimated_bytes
+
+    def _evict_idle_unlocked(self, now: datetime) -> None:
+        # LRU order is also last-access order, so idle sessions are all at the front.
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - (session.accessed_at or session.updated_at) < self.idle_ttl:
+                return
+            self._drop_unlocked(session.session_id)
+
+    def _evict_over_capacity_unlocked(self) -> None:
+        # The session being served was just moved to the end, so it is evicted last.
+        while len(self._sessions) > 1 and (
+            len(self._sessions) > self.max_sessions or self._estimated_bytes > self.memory_budget_bytes
+        ):
+            self._drop_unlocked(next(iter(self._sessions)))
 
     def _get_or_create_unlocked(self, session_id: str | None = None) -> QuerySession:
-        normalized_session_id = self._normalize_session_id(session_id)
+        now = self._now()
+        self._evict_idle_unlocked(now)
+        normalized_session_id = normalize_session_id(session_id)
         session = self._sessions.get(normalized_session_id)
         if session is None:
-            now = self._now()
             session = QuerySession(
                 session_id=normalized_session_id,
                 created_at=now,
                 updated_at=now,
             )
             self._sessions[normalized_session_id] = session
+            self._evict_over_capacity_unlocked()
+        else:
+            self._sessions.move_to_end(normalized_session_id)
+        session.accessed_at = now
         return session
 
+    def session_count(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def estimated_bytes(self) -> int:
+        with self._lock:
+            return self._estimated_bytes
+
+    def close(self) -> None:
+        pass
+
     def get_or_create(self, session_id: str | None = None) -> QuerySession:
         with self._lock:
             return self._get_or_create_unlocked(session_id)
@@ -67,24 +220,48 @@ class QuerySessionService:
     ) -> QuerySession:
         with self._lock:
             session = self._get_or_create_unlocked(session_id)
-            if not revision_id:
-                return session
+        if not revision_id:
+            return session
 
-            revision = next(
-                (item for item in session.revisions if item.revision_id == revision_id),
-                None,
-            )
-            if revision is None:
-                raise ValueError("Unknown revision_id for the requested session.")
-
-            return QuerySession(
-                session_id=session.session_id,
-                created_at=session.created_at,
-                updated_at=session.updated_at,
-                last_query=revision.query,
-                last_response=revision.response,
-                revisions=session.revisions,
-            )
+        with session.lock:
+            revision = session.revision_index.get(revision_id)
+        if revision is None:
+            raise ValueError("Unknown revision_id for the requested session.")
+
+        return QuerySession(
+            session_id=session.session_id,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+            last_query=revision.query,
+            last_response=revision.response,
+            revisions=[revision],
+            accessed_at=session.accessed_at,
+        )
+
+    @staticmethod
+    def _resize_revision(revision: QuerySessionRevision, estimated_bytes: int) -> int:
+        delta = estimated_bytes - revision.estimated_bytes
+        revision.estimated_bytes = estimated_bytes
+        return delta
+
+    def _trim_revisions(self, session: QuerySession) -> int:
+        """Drop and compact revisions past the limits; returns the byte delta. Needs `session.lock`."""
+
+        delta = 0
+        overflow = len(session.revisions) - self.max_revisions
+        if overflow > 0:
+            for revision in session.revisions[:overflow]:
+                delta += self._resize_revision(revision, 0)
+                del session.revision_index[revision.revision_id]
+            del session.revisions[:overflow]
+        # Appending one revision pushes at most one past the full-revision window.
+        compact_index = len(session.revisions) - self.full_revisions - 1
+        if compact_index >= 0 and not session.revisions[compact_index].compacted:
+            revision = session.revisions[compact_index]
+            revision.response = compact_response(revision.response)
+            revision.compacted = True
+            delta += self._resize_revision(revision, estimate_response_bytes(revision.response))
+        return delta
 
     def store_turn(
         self,
@@ -95,14 +272,25 @@ class QuerySessionService:
     ) -> tuple[QuerySession, QuerySessionRevision]:
         with self._lock:
             session = self._get_or_create_unlocked(session_id)
-            revision = QuerySessionRevision(
-                revision_id=str(uuid4()),
-                query=query,
-                response=response,
-                created_at=self._now(),
-            )
+        revision = QuerySessionRevision(
+            revision_id=str(uuid4()),
+            query=query,
+            response=response,
+            created_at=self._now(),
+        )
+        with session.lock:
             session.revisions.append(revision)
+            session.revision_index[revision.revision_id] = revision
+            delta = self._resize_revision(revision, estimate_response_bytes(response))
+            delta += self._trim_revisions(session)
             session.last_query = query
             session.last_response = response
-            session.updated_at = self._now()
-            return session, revision
+            session.updated_at = revision.created_at
+        with self._lock:
+            # A session evicted in the meantime has already been subtracted in full.
+            if self._sessions.get(session.session_id) is session:
+                session.estimated_bytes += delta
+                self._estimated_bytes += delta
+                self._evict_over_capacity_unlocked()
+        QUERY_SESSION_TURNS.inc()
+        return session, revision
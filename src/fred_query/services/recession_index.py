@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+import logging
+from threading import Event, Lock, Thread
+
+from fred_query.schemas.chart import DateSpanAnnotation
+from fred_query.services.fred_client import FREDClientProtocol
+from fred_query.services.transform.series_stats import SeriesStatisticsService
+
+LOGGER = logging.getLogger(__name__)
+RECESSION_SERIES_ID = "USREC"
+_RETRY_INTERVAL = timedelta(minutes=5)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True)
+class _RecessionSpans:
+    starts: tuple[date, ...]
+    ends: tuple[date, ...]
+    spans: tuple[DateSpanAnnotation, ...]
+    loaded_at: datetime
+
+
+class RecessionIndex:
+    """Sorted, process-wide index of recession spans derived from FRED's USREC series.
+
+    Recession spans never overlap, so both their starts and ends are sorted and an
+    overlap query is two bisections. Refreshes build a new snapshot and swap it in,
+    so lookups never lock and never touch the network.
+    """
+
+    def __init__(
+        self,
+        *,
+        refresh_interval: timedelta = timedelta(hours=12),
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._snapshot: _RecessionSpans | None = None
+        self._refresh_lock = Lock()
+        self._stopped = Event()
+        self._thread: Thread | None = None
+
+    @property
+    def loaded_at(self) -> datetime | None:
+        snapshot = self._snapshot
+        return snapshot.loaded_at if snapshot is not None else None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._snapshot is not None
+
+    def is_stale(self) -> bool:
+        loaded_at = self.loaded_at
+        return loaded_at is None or self._clock() - loaded_at >= self.refresh_interval
+
+    def load(self, spans: Iterable[DateSpanAnnotation]) -> None:
+        ordered = tuple(sorted(spans, key=lambda span: span.start_date))
+        self._snapshot = _RecessionSpans(
+            starts=tuple(span.start_date for span in ordered),
+            ends=tuple(span.end_date for span in ordered),
+            spans=ordered,
+            loaded_at=self._clock(),
+        )
+
+    def refresh(self, fred_client: FREDClientProtocol) -> None:
+        with self._refresh_lock:
+            observations = fred_client.get_series_observations(RECESSION_SERIES_ID)
+            self.load(SeriesStatisticsService.derive_recession_periods(observations))
+
+    def overlapping(self, start_date: date | None, end_date: date | None) -> list[DateSpanAnnotation] | None:
+        """Return spans overlapping [start_date, end_date], clipped to it, or None before the first load."""
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+
+        lower = 0 if start_date is None else bisect_left(snapshot.ends, start_date)
+        upper = len(snapshot.spans) if end_date is None else bisect_right(snapshot.starts, end_date)
+        return [
+            span.model_copy(
+                update={
+                    "start_date": span.start_date if start_date is None else max(span.start_date, start_date),
+                    "end_date": span.end_date if end_date is None else min(span.end_date, end_date),
+                }
+            )
+            for span in snapshot.spans[lower:upper]
+        ]
+
+    def start(self, fred_client: FREDClientProtocol) -> None:
+        """Load the index in a daemon thread and keep refreshing it every `refresh_interval`."""
+
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = Thread(
+            target=self._refresh_forever,
+            args=(fred_client,),
+            name="recession-index",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _refresh_forever(self, fred_client: FREDClientProtocol) -> None:
+        while not self._stopped.is_set():
+            wait = self.refresh_interval
+            try:
+                self.refresh(fred_client)
+            except Exception as exc:
+                LOGGER.warning("Unable to refresh the recession index: %s", exc)
+                wait = min(wait, _RETRY_INTERVAL)
+            self._stopped.wait(wait.total_seconds())
@@ -11,7 +11,7 @@ from fred_query.schemas.analysis import (
 )
 from fred_query.services.answer_service import AnswerService
 from fred_query.services.chart_service import ChartService
-from fred_query.services.fred_client import FREDClient
+from fred_query.services.fred_client import FREDClientProtocol
 from fred_query.services.operators import (
     AlignSeriesOp,
     ApplyTransformOp,
@@ -31,7 +31,7 @@ class RelationshipAnalysisService:
 
     def __init__(
         self,
-        fred_client: FREDClient,
+        fred_client: FREDClientProtocol,
         *,
         resolver_service: ResolverService | None = None,
         transform_service: TransformService | None = None,
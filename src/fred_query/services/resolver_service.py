@@ -1,21 +1,21 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 import re
 from typing import Callable
 
-from fred_query.schemas.analysis import ObservationPoint
+from fred_query.schemas.observation_series import ObservationSeries
 from fred_query.schemas.resolved_series import ResolvedSeries, SeriesMetadata, SeriesSearchMatch
-from fred_query.services.fred_client import FREDClient
+from fred_query.services.fred_client import FREDClientProtocol
 from fred_query.services.series_match_scorer import (
     build_match_score_context_from_parts,
-    candidate_text,
-    extract_candidate_features,
-    is_base_price_index,
+    candidate_profile,
     is_plain_inflation_request,
-    has_specialized_inflation_variant,
+    profile_has_term,
     score_candidate,
 )
+from fred_query.services.state_series_metadata import StateSeriesMetadataTable, bundled_state_series_metadata
 
 
 STATE_NAME_TO_CODE = {
@@ -82,6 +82,8 @@ STATE_SERIES_PATTERNS = {
     "unemployment": ("UR", "unemployment_rate"),
     "jobless rate": ("UR", "unemployment_rate"),
 }
+# Shared by every ResolverService; the API keeps it refreshed from FRED in the background.
+STATE_SERIES_METADATA = StateSeriesMetadataTable(bundled_state_series_metadata(STATE_CODE_TO_NAME))
 
 
 class ResolverService:
@@ -132,8 +134,20 @@ class ResolverService:
         "yearly": ("a", "annual"),
     }
 
-    def __init__(self, fred_client: FREDClient) -> None:
+    def __init__(
+        self,
+        fred_client: FREDClientProtocol,
+        *,
+        state_series_metadata: StateSeriesMetadataTable | None = None,
+    ) -> None:
         self.fred_client = fred_client
+        self.state_series_metadata = state_series_metadata if state_series_metadata is not None else STATE_SERIES_METADATA
+
+    def _state_series_metadata(self, series_id: str) -> SeriesMetadata:
+        metadata = self.state_series_metadata.get(series_id)
+        if metadata is not None:
+            return metadata
+        return self.fred_client.get_series_metadata(series_id)
 
     @staticmethod
     def resolve_state_code(state_name: str) -> str:
@@ -176,12 +190,13 @@ class ResolverService:
         return re.findall(r"[A-Za-z0-9]+", value.lower())
 
     @classmethod
-    def _significant_terms(cls, value: str | None) -> list[str]:
-        return [
+    @lru_cache(maxsize=256)
+    def _significant_terms(cls, value: str | None) -> tuple[str, ...]:
+        return tuple(
             token
             for token in cls._tokenize(value)
             if len(token) >= 3 and token not in cls._STOP_WORDS
-        ]
+        )
 
     @classmethod
     def _frequency_score(cls, candidate: SeriesSearchMatch, *, query_text: str) -> float:
@@ -213,12 +228,12 @@ class ResolverService:
         if normalized_geography in {"united states", "u.s.", "us", "national"}:
             return 0.0
 
-        candidate_text_value = candidate_text(candidate)
         geography_terms = cls._significant_terms(geography)
         if not geography_terms:
             return 0.0
 
-        matched_terms = sum(1 for term in geography_terms if term in candidate_text_value)
+        profile = candidate_profile(candidate)
+        matched_terms = sum(1 for term in geography_terms if profile_has_term(profile, term))
         if matched_terms == len(geography_terms):
             return cls._RANKING_WEIGHTS["geography_exact_match"]
         if matched_terms > 0:
@@ -233,37 +248,22 @@ class ResolverService:
         if not phrase or phrase == "unknown_indicator":
             return 0.0
 
-        candidate_text_value = candidate_text(candidate)
-        if phrase in candidate_text_value:
+        profile = candidate_profile(candidate)
+        if phrase in profile.text:
             return cls._RANKING_WEIGHTS["indicator_exact_phrase_match"]
 
         terms = cls._significant_terms(indicator)
         if not terms:
             return 0.0
 
-        title_text = f"{candidate.series_id} {candidate.title}".lower()
-        title_matches = sum(1 for term in terms if term in title_text)
-        full_matches = sum(1 for term in terms if term in candidate_text_value)
+        title_matches = sum(1 for term in terms if profile_has_term(profile, term, title_only=True))
+        full_matches = sum(1 for term in terms if profile_has_term(profile, term))
         if title_matches >= max(1, min(2, len(terms))):
             return cls._RANKING_WEIGHTS["indicator_title_term_match"]
         if full_matches >= max(1, min(2, len(terms))):
             return cls._RANKING_WEIGHTS["indicator_full_text_term_match"]
         return 0.0
 
-    @classmethod
-    def _semantic_profile_score(
-        cls,
-        candidate: SeriesSearchMatch,
-        *,
-        search_text: str,
-        indicator: str,
-    ) -> float:
-        score = 0.0
-        search_variants = [value for value in [search_text, indicator] if value]
-        for scorer in cls._semantic_profile_scorers(search_variants):
-            score += scorer(candidate)
-        return score
-
     @classmethod
     def _semantic_profile_scorers(
         cls,
@@ -276,20 +276,19 @@ class ResolverService:
 
     @classmethod
     def _score_plain_inflation_profile(cls, candidate: SeriesSearchMatch) -> float:
+        profile = candidate_profile(candidate)
         score = 0.0
-        if is_base_price_index(candidate):
+        if profile.is_base_price_index:
             score += cls._RANKING_WEIGHTS["profile_plain_inflation_base_index_bonus"]
-        if has_specialized_inflation_variant(candidate):
+        if profile.has_specialized_inflation_variant:
             score -= cls._RANKING_WEIGHTS["profile_plain_inflation_specialized_penalty"]
 
-        candidate_features = extract_candidate_features(candidate)
-        if candidate_features.has_cpi:
+        if profile.features.has_cpi:
             score += cls._RANKING_WEIGHTS["profile_plain_inflation_cpi_bonus"]
-        elif candidate_features.has_pce:
+        elif profile.features.has_pce:
             score += cls._RANKING_WEIGHTS["profile_plain_inflation_pce_bonus"]
 
-        candidate_text_value = candidate_text(candidate)
-        if "breakeven" in candidate_text_value:
+        if "breakeven" in profile.text:
             score -= cls._RANKING_WEIGHTS["profile_plain_inflation_breakeven_penalty"]
         return score
 
@@ -319,6 +318,7 @@ class ResolverService:
             if value and value not in {"unknown_indicator", "Unspecified"}
         )
 
+        profile_scorers = self._semantic_profile_scorers([value for value in [search_text, indicator] if value])
         ranked: list[tuple[float, SeriesSearchMatch]] = []
         for rank, candidate in enumerate(matches):
             score = max(
@@ -331,7 +331,7 @@ class ResolverService:
             score += self._frequency_score(candidate, query_text=query_text)
             score += self._geography_score(candidate, geography=geography, query_text=query_text)
             score += self._indicator_phrase_score(candidate, indicator=indicator)
-            score += self._semantic_profile_score(candidate, search_text=search_text, indicator=indicator)
+            score += sum(scorer(candidate) for scorer in profile_scorers)
             ranked.append((score, candidate))
 
         ranked.sort(
@@ -431,7 +431,7 @@ class ResolverService:
         limit: int | None = None,
         sort_order: str | None = None,
         empty_result_message: str | None = None,
-    ) -> list[ObservationPoint]:
+    ) -> ObservationSeries:
         request_kwargs: dict[str, object] = {}
         if start_date is not None:
             request_kwargs["start_date"] = start_date
@@ -446,7 +446,7 @@ class ResolverService:
         if sort_order is not None:
             request_kwargs["sort_order"] = sort_order
 
-        observations = self.fred_client.get_series_observations(series_id, **request_kwargs)
+        observations = ObservationSeries.coerce(self.fred_client.get_series_observations(series_id, **request_kwargs))
         if observations:
             return observations
         raise ValueError(empty_result_message or f"No observations returned for {series_id}.")
@@ -455,7 +455,7 @@ class ResolverService:
         state_code = self.resolve_state_code(state_name)
         canonical_state_name = STATE_CODE_TO_NAME[state_code]
         series_id = f"{state_code}RGSP"
-        metadata = self.fred_client.get_series_metadata(series_id)
+        metadata = self._state_series_metadata(series_id)
 
         return self.build_resolved_series(
             metadata,
@@ -489,7 +489,7 @@ class ResolverService:
         if pattern is not None:
             suffix, indicator = pattern
             series_id = f"{state_code}{suffix}"
-            metadata = self.fred_client.get_series_metadata(series_id)
+            metadata = self._state_series_metadata(series_id)
             return self.build_resolved_series(
                 metadata,
                 geography=canonical_state_name,
@@ -153,6 +153,22 @@ class CandidateFeatures:
     has_deflator: bool
 
 
+@dataclass(frozen=True)
+class CandidateProfile:
+    """Everything the scorers read from one candidate, derived once per distinct series text."""
+
+    text: str
+    title_text: str
+    full_text: str
+    normalized_title: str
+    title_tokens: frozenset[str]
+    text_tokens: frozenset[str]
+    features: CandidateFeatures
+    seasonally_adjusted: bool | None
+    has_specialized_inflation_variant: bool
+    is_base_price_index: bool
+
+
 @dataclass(frozen=True)
 class MatchScoreContext:
     search_text: str | None
@@ -160,6 +176,10 @@ class MatchScoreContext:
     search_variants: tuple[str, ...]
     anchor_terms: tuple[str, ...]
     query_features: QueryFeatures
+    # Lowercased variants with their significant terms, and the plain-inflation flag, so
+    # per-candidate scoring does no query-side text work.
+    variant_terms: tuple[tuple[str, tuple[str, ...]], ...] = ()
+    plain_inflation_request: bool = False
 
 
 def tokenize(text: str | None) -> list[str]:
@@ -315,27 +335,24 @@ def extract_candidate_features_from_text(text: str) -> CandidateFeatures:
     )
 
 
-def candidate_text(candidate: SeriesSearchMatch) -> str:
-    return " ".join(
-        value
-        for value in [
-            candidate.series_id,
-            candidate.title,
-            candidate.units or "",
-            candidate.frequency or "",
-            candidate.seasonal_adjustment or "",
-            candidate.notes or "",
-        ]
-        if value
-    ).lower()
-
-
-def extract_candidate_features(candidate: SeriesSearchMatch) -> CandidateFeatures:
-    return extract_candidate_features_from_text(candidate_text(candidate))
+_SPECIALIZED_INFLATION_TERMS = (
+    "trimmed mean",
+    "core",
+    "excluding food and energy",
+    "less food and energy",
+    "annual rate",
+    "annualized",
+    "% chg",
+    "percent change",
+    "breakeven",
+    "inflation-indexed",
+    "producer price",
+    "deflator",
+)
 
 
-def candidate_is_seasonally_adjusted(candidate: SeriesSearchMatch) -> bool | None:
-    adjustment = (candidate.seasonal_adjustment or "").strip().lower()
+def _seasonal_adjustment_flag(seasonal_adjustment: str | None) -> bool | None:
+    adjustment = (seasonal_adjustment or "").strip().lower()
     if not adjustment:
         return None
     if "not seasonally adjusted" in adjustment or adjustment == "nsa":
@@ -345,6 +362,67 @@ def candidate_is_seasonally_adjusted(candidate: SeriesSearchMatch) -> bool | Non
     return None
 
 
+@lru_cache(maxsize=4096)
+def _candidate_profile(
+    series_id: str,
+    title: str,
+    units: str | None,
+    frequency: str | None,
+    seasonal_adjustment: str | None,
+    notes: str | None,
+) -> CandidateProfile:
+    text = " ".join(
+        value for value in [series_id, title, units or "", frequency or "", seasonal_adjustment or "", notes or ""] if value
+    ).lower()
+    title_text = f"{series_id} {title}".lower()
+    full_text = " ".join([series_id, title, notes or "", units or "", frequency or ""]).lower()
+    features = extract_candidate_features_from_text(text)
+    has_specialized = text_has_any(text, _SPECIALIZED_INFLATION_TERMS)
+    return CandidateProfile(
+        text=text,
+        title_text=title_text,
+        full_text=full_text,
+        normalized_title=re.sub(r"\s+", " ", title.strip().lower()),
+        title_tokens=frozenset(tokenize(title_text)),
+        text_tokens=frozenset(tokenize(text)),
+        features=features,
+        seasonally_adjusted=_seasonal_adjustment_flag(seasonal_adjustment),
+        has_specialized_inflation_variant=has_specialized,
+        is_base_price_index=(features.has_cpi or features.has_pce) and "index" in text and not has_specialized,
+    )
+
+
+def candidate_profile(candidate: SeriesSearchMatch) -> CandidateProfile:
+    return _candidate_profile(
+        candidate.series_id,
+        candidate.title,
+        candidate.units,
+        candidate.frequency,
+        candidate.seasonal_adjustment,
+        candidate.notes,
+    )
+
+
+def candidate_text(candidate: SeriesSearchMatch) -> str:
+    return candidate_profile(candidate).text
+
+
+def extract_candidate_features(candidate: SeriesSearchMatch) -> CandidateFeatures:
+    return candidate_profile(candidate).features
+
+
+def candidate_is_seasonally_adjusted(candidate: SeriesSearchMatch) -> bool | None:
+    return candidate_profile(candidate).seasonally_adjusted
+
+
+def profile_has_term(profile: CandidateProfile, term: str, *, title_only: bool = False) -> bool:
+    """Substring match like `term in text`, answered from the token set when `term` is a whole word."""
+
+    if term in (profile.title_tokens if title_only else profile.text_tokens):
+        return True
+    return term in (profile.title_text if title_only else profile.text)
+
+
 def generic_score_adjustment(
     candidate: SeriesSearchMatch,
     candidate_features: CandidateFeatures,
@@ -418,40 +496,15 @@ def is_plain_inflation_request(search_variants: list[str]) -> bool:
 
 
 def candidate_has_any(candidate: SeriesSearchMatch, terms: tuple[str, ...]) -> bool:
-    text = candidate_text(candidate)
-    return any(term in text for term in terms)
+    return text_has_any(candidate_profile(candidate).text, terms)
 
 
 def has_specialized_inflation_variant(candidate: SeriesSearchMatch) -> bool:
-    return candidate_has_any(
-        candidate,
-        (
-            "trimmed mean",
-            "core",
-            "excluding food and energy",
-            "less food and energy",
-            "annual rate",
-            "annualized",
-            "% chg",
-            "percent change",
-            "breakeven",
-            "inflation-indexed",
-            "producer price",
-            "deflator",
-        ),
-    )
+    return candidate_profile(candidate).has_specialized_inflation_variant
 
 
 def is_base_price_index(candidate: SeriesSearchMatch) -> bool:
-    text = candidate_text(candidate)
-    if not (
-        "consumer price index" in text
-        or "personal consumption expenditures" in text
-        or re.search(r"\bcpi\b", text)
-        or re.search(r"\bpce\b", text)
-    ):
-        return False
-    return "index" in text and not has_specialized_inflation_variant(candidate)
+    return candidate_profile(candidate).is_base_price_index
 
 
 def inflation_profile_score_adjustment(
@@ -460,13 +513,14 @@ def inflation_profile_score_adjustment(
     context: MatchScoreContext,
     candidate_features: CandidateFeatures,
 ) -> float:
-    if not is_plain_inflation_request(list(context.search_variants)):
+    if not context.plain_inflation_request:
         return 0.0
 
+    profile = candidate_profile(candidate)
     score = 0.0
-    if is_base_price_index(candidate):
+    if profile.is_base_price_index:
         score += SCORE_WEIGHTS["inflation_base_index_bonus"]
-    if has_specialized_inflation_variant(candidate):
+    if profile.has_specialized_inflation_variant:
         score -= SCORE_WEIGHTS["inflation_specialized_penalty"]
     if candidate_features.has_instrument_terms and not context.query_features.wants_market_based:
         score -= SCORE_WEIGHTS["inflation_unwanted_instrument_penalty"]
@@ -478,38 +532,27 @@ def score_candidate(
     *,
     context: MatchScoreContext,
 ) -> float:
-    title_text = f"{candidate.series_id} {candidate.title}".lower()
-    full_text = " ".join(
-        [
-            candidate.series_id,
-            candidate.title,
-            candidate.notes or "",
-            candidate.units or "",
-            candidate.frequency or "",
-        ]
-    ).lower()
+    profile = candidate_profile(candidate)
+    title_text = profile.title_text
+    full_text = profile.full_text
+    title_tokens = profile.title_tokens
 
-    candidate_features = extract_candidate_features(candidate)
     score = 0.0
     title_matches = 0
     for term in context.anchor_terms:
-        if term in title_text:
+        if term in title_tokens or term in title_text:
             score += SCORE_WEIGHTS["anchor_term_title_match"]
             title_matches += 1
         elif term in full_text:
             score += SCORE_WEIGHTS["anchor_term_full_text_match"]
 
-    for phrase in context.search_variants:
-        lowered_phrase = phrase.lower().strip()
-        if not lowered_phrase:
-            continue
+    for lowered_phrase, phrase_terms in context.variant_terms:
         if lowered_phrase in full_text:
             score += SCORE_WEIGHTS["exact_phrase_match"]
             continue
 
-        phrase_terms = significant_terms([phrase])
         if phrase_terms:
-            matched_terms = sum(1 for term in phrase_terms if term in title_text)
+            matched_terms = sum(1 for term in phrase_terms if term in title_tokens or term in title_text)
             if matched_terms >= max(1, min(2, len(phrase_terms))):
                 score += SCORE_WEIGHTS["partial_phrase_match"]
 
@@ -522,11 +565,11 @@ def score_candidate(
     if title_matches == 0:
         score -= SCORE_WEIGHTS["no_title_match_penalty"]
 
-    score += generic_score_adjustment(candidate, candidate_features, context=context)
+    score += generic_score_adjustment(candidate, profile.features, context=context)
     score += inflation_profile_score_adjustment(
         candidate,
         context=context,
-        candidate_features=candidate_features,
+        candidate_features=profile.features,
     )
     return score
 
@@ -570,10 +613,16 @@ def build_match_score_context_from_parts(
         context_texts.insert(0, original_query)
     anchor_terms = significant_terms(context_texts)
     query_text = " ".join(part for part in context_texts if part)
+    variant_terms = tuple(
+        (variant.lower(), tuple(significant_terms([variant])))
+        for variant in search_variants
+    )
     return MatchScoreContext(
         search_text=search_text,
         example_searches=tuple(example_searches),
         search_variants=tuple(search_variants),
         anchor_terms=tuple(anchor_terms),
         query_features=extract_query_features(query_text),
+        variant_terms=variant_terms,
+        plain_inflation_request=is_plain_inflation_request(search_variants),
     )
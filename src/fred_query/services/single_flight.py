@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    executed: int
+    coalesced: int
+    in_flight: int
+
+    def to_dict(self) -> dict[str, int]:
+        return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": self.in_flight}
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is in
+    flight block and receive the same result or exception. Nothing is cached: once
+    the call finishes, the next caller for that key starts a fresh one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(executed=self._executed, coalesced=self._coalesced, in_flight=len(self._calls))
+
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import date, timedelta
+from time import perf_counter
 
 from fred_query.schemas.analysis import (
     AnalysisResult,
@@ -9,9 +11,11 @@ from fred_query.schemas.analysis import (
     QueryResponse,
     SeriesAnalysis,
 )
+from fred_query.schemas.resolved_series import ResolvedSeries
+from fred_query.schemas.vintage_analysis import VintageAnalysisResult
 from fred_query.services.answer_service import AnswerService
 from fred_query.services.chart_service import ChartService
-from fred_query.services.fred_client import FREDClient
+from fred_query.services.fred_client import FREDClientProtocol
 from fred_query.services.operators import (
     ApplyTransformOp,
     BuildChartOp,
@@ -21,18 +25,28 @@ from fred_query.services.operators import (
     RenderAnswerOp,
     ResolveSeriesOp,
 )
+from fred_query.services.progress import emit_progress, progress_requested
+from fred_query.services.recession_index import RecessionIndex
 from fred_query.services.resolver_service import ResolverService
+from fred_query.services.stage_timing import bind_stage_context, stage
 from fred_query.schemas.intent import TransformType
 from fred_query.services.transform_service import TransformService
 from fred_query.services.vintage_analysis_service import VintageAnalysisService
 
+DEFAULT_VINTAGE_DEADLINE_SECONDS = 5.0
+
 
 class SingleSeriesLookupService:
-    """Deterministic single-series lookup based on a FRED series ID or search phrase."""
+    """Deterministic single-series lookup based on a FRED series ID or search phrase.
+
+    Revision analysis starts as soon as the series is resolved and runs alongside the
+    fetch and transform work; it is dropped with a warning if it has not finished
+    `vintage_deadline_seconds` after it started.
+    """
 
     def __init__(
         self,
-        fred_client: FREDClient,
+        fred_client: FREDClientProtocol,
         *,
         resolver_service: ResolverService | None = None,
         transform_service: TransformService | None = None,
@@ -44,10 +58,13 @@ class SingleSeriesLookupService:
         apply_transform_op: ApplyTransformOp | None = None,
         compute_metrics_op: ComputeSeriesMetricsOp | None = None,
         fetch_recession_periods_op: FetchRecessionPeriodsOp | None = None,
+        recession_index: RecessionIndex | None = None,
         build_chart_op: BuildChartOp | None = None,
         render_answer_op: RenderAnswerOp | None = None,
+        vintage_deadline_seconds: float = DEFAULT_VINTAGE_DEADLINE_SECONDS,
     ) -> None:
         self.fred_client = fred_client
+        self.vintage_deadline_seconds = max(0.0, vintage_deadline_seconds)
         self.resolver_service = resolver_service or ResolverService(fred_client)
         self.transform_service = transform_service or TransformService()
         self.transform_planning_service = self.transform_service.planning_service
@@ -66,6 +83,7 @@ class SingleSeriesLookupService:
         self.fetch_recession_periods_op = fetch_recession_periods_op or FetchRecessionPeriodsOp(
             fred_client=fred_client,
             transform_service=self.transform_service,
+            recession_index=recession_index,
         )
         self.build_chart_op = build_chart_op or BuildChartOp(self.chart_service)
         self.render_answer_op = render_answer_op or RenderAnswerOp(self.answer_service)
@@ -74,6 +92,53 @@ class SingleSeriesLookupService:
     def _default_start_date() -> date:
         return date.today() - timedelta(days=365 * 10)
 
+    def _analyze_vintage(self, resolved_series: ResolvedSeries) -> VintageAnalysisResult:
+        with stage("vintage"):
+            return self.vintage_analysis_service.analyze_vintage_data(resolved_series)
+
+    def _start_vintage_analysis(self, resolved_series: ResolvedSeries) -> Future[VintageAnalysisResult]:
+        # One short-lived worker per lookup; shutting down without waiting lets the lookup return
+        # at the deadline while an unfinished analysis runs out in the background.
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vintage")
+        try:
+            return executor.submit(bind_stage_context(self._analyze_vintage), resolved_series)
+        finally:
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _vintage_metrics(vintage_analysis: VintageAnalysisResult) -> list[DerivedMetric]:
+        metrics = []
+        for comparison in vintage_analysis.comparisons[:3]:  # Limit to first 3 comparisons
+            if comparison.first_release_value is not None and comparison.current_value is not None:
+                percent_change = comparison.percent_change_from_first
+                if percent_change is not None:
+                    metrics.append(
+                        DerivedMetric(
+                            name=f"vintage_revision_{comparison.observation_date.isoformat()}",
+                            value=round(percent_change, 4),
+                            unit="%",
+                            description=(
+                                f"Revision impact for {comparison.observation_date.isoformat()}: "
+                                f"first release {comparison.first_release_value:.4f} vs "
+                                f"current {comparison.current_value:.4f} ({percent_change:+.2f}%)"
+                            ),
+                        )
+                    )
+
+        # Add summary vintage metric if available
+        if vintage_analysis.summary_stats:
+            avg_change = vintage_analysis.summary_stats.get("average_revision_impact_pct")
+            if avg_change is not None:
+                metrics.append(
+                    DerivedMetric(
+                        name="average_vintage_revision_impact",
+                        value=round(avg_change, 4),
+                        unit="%",
+                        description="Average percentage change from first release across all vintage revisions",
+                    )
+                )
+        return metrics
+
     def lookup(self, intent: QueryIntent) -> QueryResponse:
         response_intent = intent.model_copy(deep=True)
         start_date = intent.start_date or self._default_start_date()
@@ -88,6 +153,13 @@ class SingleSeriesLookupService:
             response_intent.search_text = search_match.title if search_match is not None else metadata.title
         if not response_intent.indicators:
             response_intent.indicators = [resolved_series.indicator]
+        emit_progress("resolved_series", {"series": [resolved_series]})
+
+        # Revision analysis only needs the resolved series, so overlap it with everything below.
+        vintage_future = None
+        if intent.needs_revision_analysis:
+            vintage_deadline = perf_counter() + self.vintage_deadline_seconds
+            vintage_future = self._start_vintage_analysis(resolved_series)
 
         transform_plan = self.apply_transform_op.plan_single_series(
             intent,
@@ -107,6 +179,38 @@ class SingleSeriesLookupService:
             metadata=metadata,
             plan=transform_plan,
         )
+        series_analysis = SeriesAnalysis(
+            series=resolved_series,
+            observations=transform_result.visible_observations,
+            transformed_observations=(
+                transform_result.transformed_observations or transform_result.normalized_observations
+            ),
+            analysis_basis=transform_result.analysis_basis,
+            analysis_units=transform_result.analysis_units,
+            total_growth_pct=transform_result.total_growth_pct,
+            compound_annual_growth_rate_pct=transform_result.compound_annual_growth_rate_pct,
+            latest_value=transform_result.latest_value,
+            latest_observation_date=transform_result.latest_date,
+        )
+        display_observations = (
+            transform_result.transformed_observations
+            or transform_result.visible_observations
+            or transform_result.normalized_observations
+        )
+        start_year = display_observations[0].date.year
+        end_year = display_observations[-1].date.year
+        if progress_requested():
+            # The plotted data is final here; historical context, recession shading and
+            # revision analysis only add annotations, so a streaming caller can draw now.
+            preview_chart = self.build_chart_op.build_single_series_chart(
+                series_result=series_analysis,
+                start_year=start_year,
+                end_year=end_year,
+                normalize=transform_plan.normalize_chart,
+                recession_periods=[],
+            )
+            emit_progress("chart", {"chart": preview_chart})
+
         historical_summary = self.compute_metrics_op.summarize_historical_context(
             series_id=metadata.series_id,
             metadata=metadata,
@@ -115,26 +219,13 @@ class SingleSeriesLookupService:
             transform_result=transform_result,
         )
         warnings.extend(historical_summary.warnings)
+        series_analysis.historical_context = historical_summary.context
 
         recession_periods = self.fetch_recession_periods_op.fetch(
             start_date=transform_result.visible_observations[0].date,
             end_date=transform_result.visible_observations[-1].date,
         )
 
-        series_analysis = SeriesAnalysis(
-            series=resolved_series,
-            observations=transform_result.visible_observations,
-            transformed_observations=(
-                transform_result.transformed_observations or transform_result.normalized_observations
-            ),
-            historical_context=historical_summary.context,
-            analysis_basis=transform_result.analysis_basis,
-            analysis_units=transform_result.analysis_units,
-            total_growth_pct=transform_result.total_growth_pct,
-            compound_annual_growth_rate_pct=transform_result.compound_annual_growth_rate_pct,
-            latest_value=transform_result.latest_value,
-            latest_observation_date=transform_result.latest_date,
-        )
         derived_metrics = [
             DerivedMetric(
                 name="top_search_match",
@@ -163,11 +254,6 @@ class SingleSeriesLookupService:
                     description="Rolling window length used for the displayed transform.",
                 )
             )
-        display_observations = (
-            transform_result.transformed_observations
-            or transform_result.visible_observations
-            or transform_result.normalized_observations
-        )
         analysis = AnalysisResult(
             series_results=[series_analysis],
             derived_metrics=derived_metrics + historical_summary.metrics,
@@ -178,56 +264,23 @@ class SingleSeriesLookupService:
         )
 
         # Add vintage analysis if requested
-        if intent.needs_revision_analysis:
-            try:
-                vintage_analysis = self.vintage_analysis_service.analyze_vintage_data(resolved_series)
-
-                # Add vintage-specific derived metrics
-                for comparison in vintage_analysis.comparisons[:3]:  # Limit to first 3 comparisons
-                    if comparison.first_release_value is not None and comparison.current_value is not None:
-                        percent_change = comparison.percent_change_from_first
-                        if percent_change is not None:
-                            analysis.derived_metrics.append(
-                                DerivedMetric(
-                                    name=f"vintage_revision_{comparison.observation_date.isoformat()}",
-                                    value=round(percent_change, 4),
-                                    unit="%",
-                                    description=(
-                                        f"Revision impact for {comparison.observation_date.isoformat()}: "
-                                        f"first release {comparison.first_release_value:.4f} vs "
-                                        f"current {comparison.current_value:.4f} ({percent_change:+.2f}%)"
-                                    ),
-                                )
-                            )
-
-                # Add summary vintage metric if available
-                if vintage_analysis.summary_stats:
-                    avg_change = vintage_analysis.summary_stats.get("average_revision_impact_pct")
-                    if avg_change is not None:
-                        analysis.derived_metrics.append(
-                            DerivedMetric(
-                                name="average_vintage_revision_impact",
-                                value=round(avg_change, 4),
-                                unit="%",
-                                description="Average percentage change from first release across all vintage revisions",
-                            )
-                        )
-            except Exception as e:
-                # If vintage analysis fails, add a warning but continue
-                analysis.warnings.append(f"Vintage analysis unavailable: {str(e)}")
+        if vintage_future is not None:
+            done, _ = wait((vintage_future,), timeout=max(0.0, vintage_deadline - perf_counter()))
+            if not done:
+                analysis.warnings.append(
+                    f"Vintage analysis did not finish within {self.vintage_deadline_seconds:g}s and was skipped."
+                )
+            else:
+                try:
+                    analysis.derived_metrics.extend(self._vintage_metrics(vintage_future.result()))
+                except Exception as e:
+                    # If vintage analysis fails, add a warning but continue
+                    analysis.warnings.append(f"Vintage analysis unavailable: {str(e)}")
 
         chart = self.build_chart_op.build_single_series_chart(
             series_result=series_analysis,
-            start_year=(
-                analysis.coverage_start.year
-                if analysis.coverage_start
-                else transform_result.visible_observations[0].date.year
-            ),
-            end_year=(
-                analysis.coverage_end.year
-                if analysis.coverage_end
-                else transform_result.visible_observations[-1].date.year
-            ),
+            start_year=start_year,
+            end_year=end_year,
             normalize=transform_plan.normalize_chart,
             recession_periods=recession_periods,
         )
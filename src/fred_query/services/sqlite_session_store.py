@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sqlite3
+from threading import Lock, local
+from uuid import uuid4
+
+from fred_query.schemas.analysis import RoutedQueryResponse
+from fred_query.services.metrics import QUERY_SESSION_TURNS
+from fred_query.services.query_session_service import (
+    QuerySession,
+    QuerySessionRevision,
+    QuerySessionService,
+    compact_response,
+    normalize_session_id,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_updated_at ON sessions (updated_at);
+CREATE TABLE IF NOT EXISTS revisions (
+    session_id TEXT NOT NULL,
+    revision_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    query TEXT NOT NULL,
+    response_json TEXT NOT NULL,
+    PRIMARY KEY (session_id, revision_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS revisions_by_created_at ON revisions (session_id, created_at);
+"""
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class _PendingTurn:
+    session_id: str
+    revision: QuerySessionRevision
+    response_json: str
+    done: bool = False
+    error: BaseException | None = None
+
+
+class SQLiteQuerySessionStore:
+    """Durable session store in one SQLite (WAL) file shared by every worker.
+
+    Revisions are stored compacted (see `compact_response`): the intent, resolved
+    series and answer, never observation payloads. Lookups hit the
+    (session_id, revision_id) primary key or the per-session `created_at` index.
+    Writes are group-committed: turns stored while another commit is running are
+    flushed together in the next transaction, and `store_turn` returns only once
+    its turn is durable, so any worker can serve the follow-up.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        idle_ttl: timedelta = QuerySessionService.DEFAULT_IDLE_TTL,
+        max_revisions: int = QuerySessionService.DEFAULT_MAX_REVISIONS,
+        prune_interval: timedelta = timedelta(minutes=5),
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.idle_ttl = idle_ttl
+        self.max_revisions = max(1, max_revisions)
+        self.prune_interval = prune_interval
+        self._clock = clock
+        self._local = local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = Lock()
+        self._pending: list[_PendingTurn] = []
+        self._pending_lock = Lock()
+        self._write_lock = Lock()
+        self._next_prune_at: datetime | None = None
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = local()
+
+    @contextmanager
+    def _transaction(self, connection: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _idle_cutoff(self, now: datetime) -> str:
+        return (now - self.idle_ttl).isoformat()
+
+    def session_count(self) -> int:
+        row = self._connection().execute(
+            "SELECT COUNT(*) FROM sessions WHERE updated_at >= ?",
+            (self._idle_cutoff(self._clock()),),
+        ).fetchone()
+        return int(row[0])
+
+    def estimated_bytes(self) -> int:
+        # The compacted JSON of live sessions' revisions, matching `QuerySessionRevision.estimated_bytes`.
+        row = self._connection().execute(
+            "SELECT COALESCE(SUM(LENGTH(response_json)), 0) FROM revisions "
+            "WHERE session_id IN (SELECT session_id FROM sessions WHERE updated_at >= ?)",
+            (self._idle_cutoff(self._clock()),),
+        ).fetchone()
+        return int(row[0])
+
+    def get_or_create(self, session_id: str | None = None) -> QuerySession:
+        now = self._clock()
+        normalized_session_id = normalize_session_id(session_id)
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT created_at, updated_at FROM sessions WHERE session_id = ? AND updated_at >= ?",
+            (normalized_session_id, self._idle_cutoff(now)),
+        ).fetchone()
+        if row is None:
+            # Nothing is written until the first turn is stored.
+            return QuerySession(session_id=normalized_session_id, created_at=now, updated_at=now, accessed_at=now)
+
+        session = QuerySession(
+            session_id=normalized_session_id,
+            created_at=datetime.fromisoformat(row[0]),
+            updated_at=datetime.fromisoformat(row[1]),
+            accessed_at=now,
+        )
+        latest = connection.execute(
+            "SELECT revision_id, created_at, query, response_json FROM revisions "
+            "WHERE session_id = ? ORDER BY created_at DESC, revision_id DESC LIMIT 1",
+            (normalized_session_id,),
+        ).fetchone()
+        if latest is not None:
+            revision = self._revision_from_row(*latest)
+            session.last_query = revision.query
+            session.last_response = revision.response
+            session.revisions = [revision]
+        return session
+
+    def get_context(
+        self,
+        *,
+        session_id: str | None = None,
+        revision_id: str | None = None,
+    ) -> QuerySession:
+        session = self.get_or_create(session_id)
+        if not revision_id:
+            return session
+
+        # Revisions of an idle-expired session stay on disk until the next prune; never serve them.
+        row = self._connection().execute(
+            "SELECT revision_id, created_at, query, response_json FROM revisions "
+            "WHERE session_id = ? AND revision_id = ? "
+            "AND session_id IN (SELECT session_id FROM sessions WHERE updated_at >= ?)",
+            (session.session_id, revision_id, self._idle_cutoff(session.accessed_at or self._clock())),
+        ).fetchone()
+        if row is None:
+            raise ValueError("Unknown revision_id for the requested session.")
+
+        revision = self._revision_from_row(*row)
+        return QuerySession(
+            session_id=session.session_id,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+            last_query=revision.query,
+            last_response=revision.response,
+            revisions=[revision],
+            accessed_at=session.accessed_at,
+        )
+
+    @staticmethod
+    def _revision_from_row(revision_id: str, created_at: str, query: str, response_json: str) -> QuerySessionRevision:
+        return QuerySessionRevision(
+            revision_id=revision_id,
+            query=query,
+            response=RoutedQueryResponse.model_validate_json(response_json),
+            created_at=datetime.fromisoformat(created_at),
+            estimated_bytes=len(response_json),
+            compacted=True,
+        )
+
+    def store_turn(
+        self,
+        *,
+        session_id: str,
+        query: str,
+        response: RoutedQueryResponse,
+    ) -> tuple[QuerySession, QuerySessionRevision]:
+        now = self._clock()
+        compacted = compact_response(response)
+        response_json = compacted.model_dump_json()
+        revision = QuerySessionRevision(
+            revision_id=str(uuid4()),
+            query=query,
+            response=compacted,
+            created_at=now,
+            estimated_bytes=len(response_json),
+            compacted=True,
+        )
+        self._write(_PendingTurn(session_id=session_id, revision=revision, response_json=response_json))
+        QUERY_SESSION_TURNS.inc()
+
+        row = self._connection().execute(
+            "SELECT created_at FROM sessions WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        session = QuerySession(
+            session_id=session_id,
+            created_at=datetime.fromisoformat(row[0]) if row is not None else now,
+            updated_at=now,
+            last_query=query,
+            last_response=response,
+            revisions=[revision],
+            accessed_at=now,
+        )
+        return session, revision
+
+    def _write(self, turn: _PendingTurn) -> None:
+        with self._pending_lock:
+            self._pending.append(turn)
+        with self._write_lock:
+            if not turn.done:
+                with self._pending_lock:
+                    batch, self._pending = self._pending, []
+                try:
+                    self._commit(batch)
+                except BaseException as exc:
+                    for item in batch:
+                        item.error = exc
+                    raise
+                finally:
+                    for item in batch:
+                        item.done = True
+        if turn.error is not None:
+            raise turn.error
+
+    def _commit(self, batch: list[_PendingTurn]) -> None:
+        now = self._clock()
+        with self._transaction(self._connection()) as connection:
+            # A turn for a session that went idle starts it afresh, even if no prune has run since.
+            self._expire_idle(connection, {turn.session_id for turn in batch}, now)
+            connection.executemany(
+                "INSERT INTO sessions (session_id, created_at, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (session_id) DO UPDATE SET updated_at = excluded.updated_at",
+                [
+                    (turn.session_id, turn.revision.created_at.isoformat(), turn.revision.created_at.isoformat())
+                    for turn in batch
+                ],
+            )
+            connection.executemany(
+                "INSERT INTO revisions (session_id, revision_id, created_at, query, response_json) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        turn.session_id,
+                        turn.revision.revision_id,
+                        turn.revision.created_at.isoformat(),
+                        turn.revision.query,
+                        turn.response_json,
+                    )
+                    for turn in batch
+                ],
+            )
+            for session_id in {turn.session_id for turn in batch}:
+                self._trim_revisions(connection, session_id)
+            if self._next_prune_at is None or now >= self._next_prune_at:
+                self._prune_idle(connection, now)
+                self._next_prune_at = now + self.prune_interval
+
+    def _trim_revisions(self, connection: sqlite3.Connection, session_id: str) -> None:
+        connection.execute(
+            "DELETE FROM revisions WHERE session_id = ? AND created_at < ("
+            "SELECT created_at FROM revisions WHERE session_id = ? "
+            "ORDER BY created_at DESC, revision_id DESC LIMIT 1 OFFSET ?)",
+            (session_id, session_id, self.max_revisions - 1),
+        )
+
+    def _expire_idle(self, connection: sqlite3.Connection, session_ids: set[str], now: datetime) -> None:
+        cutoff = self._idle_cutoff(now)
+        connection.executemany(
+            "DELETE FROM revisions WHERE session_id IN "
+            "(SELECT session_id FROM sessions WHERE session_id = ? AND updated_at < ?)",
+            [(session_id, cutoff) for session_id in session_ids],
+        )
+        connection.executemany(
+            "DELETE FROM sessions WHERE session_id = ? AND updated_at < ?",
+            [(session_id, cutoff) for session_id in session_ids],
+        )
+
+    def _prune_idle(self, connection: sqlite3.Connection, now: datetime) -> None:
+        cutoff = self._idle_cutoff(now)
+        connection.execute(
+            "DELETE FROM revisions WHERE session_id IN (SELECT session_id FROM sessions WHERE updated_at < ?)",
+            (cutoff,),
+        )
+        connection.execute("DELETE FROM sessions WHERE updated_at < ?", (cutoff,))
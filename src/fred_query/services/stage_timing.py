@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextvars import ContextVar, copy_context
+from dataclasses import asdict, dataclass
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class StageTiming:
+    name: str
+    count: int = 0
+    duration_ms: float = 0.0
+    upstream_calls: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "duration_ms": round(self.duration_ms, 3)}
+
+
+class StageTimings:
+    """Per-request collector of stage durations and upstream call counts.
+
+    Stages are aggregated by name in the order they were first entered. Durations
+    and upstream calls are inclusive: a FRED call made inside `fetch` also counts
+    toward every enclosing stage.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._stages: dict[str, StageTiming] = {}
+
+    def _entry(self, name: str) -> StageTiming:
+        with self._lock:
+            entry = self._stages.get(name)
+            if entry is None:
+                entry = self._stages[name] = StageTiming(name=name)
+            return entry
+
+    def _finish(self, entry: StageTiming, *, elapsed_seconds: float, upstream_calls: int) -> None:
+        with self._lock:
+            entry.count += 1
+            entry.duration_ms += elapsed_seconds * 1000.0
+            entry.upstream_calls += upstream_calls
+
+    def stages(self) -> list[StageTiming]:
+        with self._lock:
+            return [StageTiming(**asdict(entry)) for entry in self._stages.values()]
+
+    def to_dict(self) -> list[dict[str, Any]]:
+        return [entry.to_dict() for entry in self.stages()]
+
+    def server_timing_header(self) -> str:
+        metrics = []
+        for entry in self.stages():
+            metric = f"{entry.name};dur={entry.duration_ms:.1f}"
+            if entry.upstream_calls:
+                metric += f';desc="{entry.upstream_calls} upstream"'
+            metrics.append(metric)
+        return ", ".join(metrics)
+
+
+class _ActiveStage:
+    __slots__ = ("entry", "parent", "timings", "upstream_calls")
+
+    def __init__(self, entry: StageTiming, timings: StageTimings, parent: _ActiveStage | None) -> None:
+        self.entry = entry
+        self.timings = timings
+        self.parent = parent
+        self.upstream_calls = 0
+
+
+_ACTIVE_STAGE: ContextVar[_ActiveStage | None] = ContextVar("fred_query_active_stage", default=None)
+
+
+class stage:
+    """Time a block as a named stage of the active `StageTimings`.
+
+    Outside of a collector this is a no-op, so library code can mark stages
+    unconditionally. Pass `timings` to start collecting at this stage.
+    """
+
+    __slots__ = ("_frame", "_name", "_started", "_timings", "_token")
+
+    def __init__(self, name: str, *, timings: StageTimings | None = None) -> None:
+        self._name = name
+        self._timings = timings
+        self._token = None
+
+    def __enter__(self) -> stage:
+        parent = _ACTIVE_STAGE.get()
+        timings = self._timings
+        if timings is None and parent is not None:
+            timings = parent.timings
+        if timings is None:
+            return self
+        if parent is not None and parent.timings is not timings:
+            parent = None
+        self._frame = _ActiveStage(timings._entry(self._name), timings, parent)
+        self._token = _ACTIVE_STAGE.set(self._frame)
+        self._started = perf_counter()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        if self._token is None:
+            return
+        elapsed = perf_counter() - self._started
+        _ACTIVE_STAGE.reset(self._token)
+        self._token = None
+        frame = self._frame
+        frame.timings._finish(frame.entry, elapsed_seconds=elapsed, upstream_calls=frame.upstream_calls)
+
+
+def timed_stage(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function so each call is recorded as stage `name`."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _ACTIVE_STAGE.get() is None:
+                return func(*args, **kwargs)
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_upstream_call() -> None:
+    """Count one upstream HTTP request against the active stage and its parents."""
+
+    frame = _ACTIVE_STAGE.get()
+    if frame is None:
+        return
+    with frame.timings._lock:
+        while frame is not None:
+            frame.upstream_calls += 1
+            frame = frame.parent
+
+
+def bind_stage_context(func: Callable[P, R]) -> Callable[P, R]:
+    """Carry the caller's active stage into worker threads (e.g. `ThreadPoolExecutor.map`)."""
+
+    if _ACTIVE_STAGE.get() is None:
+        return func
+    context = copy_context()
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import logging
+from threading import Event, Lock, Thread
+
+from fred_query.schemas.resolved_series import SeriesMetadata
+from fred_query.services.fred_client import FREDClientProtocol
+from fred_query.services.stage_timing import bind_stage_context
+
+LOGGER = logging.getLogger(__name__)
+_RETRY_INTERVAL = timedelta(minutes=5)
+
+# Metadata for the FRED series behind `STATE_SERIES_PATTERNS`, in the short forms FREDClient returns.
+_STATE_SERIES_TEMPLATES: dict[str, tuple[str, str, str, str]] = {
+    "RGSP": ("Real Gross Domestic Product: All Industry Total in {state}", "Mil. of Chn. 2017 $", "A", "NSA"),
+    "UR": ("Unemployment Rate in {state}", "%", "M", "SA"),
+}
+# Pattern-derived IDs that FRED does not publish; these still go through a metadata call.
+_UNPUBLISHED_SERIES = frozenset({"PRRGSP"})
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def bundled_state_series_metadata(state_names: Mapping[str, str]) -> list[SeriesMetadata]:
+    """Metadata for every state x pattern series, built from `_STATE_SERIES_TEMPLATES`."""
+
+    entries: list[SeriesMetadata] = []
+    for state_code, state_name in sorted(state_names.items()):
+        for suffix, (title, units, frequency, seasonal_adjustment) in _STATE_SERIES_TEMPLATES.items():
+            series_id = f"{state_code}{suffix}"
+            if series_id in _UNPUBLISHED_SERIES:
+                continue
+            entries.append(
+                SeriesMetadata(
+                    series_id=series_id,
+                    title=title.format(state=state_name),
+                    units=units,
+                    frequency=frequency,
+                    seasonal_adjustment=seasonal_adjustment,
+                    source_url=f"https://fred.stlouisfed.org/series/{series_id}",
+                )
+            )
+    return entries
+
+
+class StateSeriesMetadataTable:
+    """Process-wide metadata for pattern-resolved state series (`CAUR`, `TXRGSP`, ...).
+
+    Starts from the bundled entries so lookups never touch the network. `prefetch`
+    fetches every entry concurrently and swaps in a new snapshot; `start` repeats that
+    every `refresh_interval` in a daemon thread. Entries that fail to refresh keep their
+    previous value.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[SeriesMetadata] = (),
+        *,
+        refresh_interval: timedelta = timedelta(hours=24),
+        max_concurrency: int = 8,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.refresh_interval = refresh_interval
+        self.max_concurrency = max(1, max_concurrency)
+        self._clock = clock
+        self._entries: dict[str, SeriesMetadata] = {entry.series_id: entry for entry in entries}
+        self._refreshed_at: datetime | None = None
+        self._refresh_lock = Lock()
+        self._stopped = Event()
+        self._thread: Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def refreshed_at(self) -> datetime | None:
+        return self._refreshed_at
+
+    def get(self, series_id: str) -> SeriesMetadata | None:
+        return self._entries.get(series_id)
+
+    def prefetch(self, fred_client: FREDClientProtocol, series_ids: Iterable[str] | None = None) -> int:
+        """Refresh the given series (default: all known) from FRED; returns how many were updated."""
+
+        with self._refresh_lock:
+            entries = self._entries
+            targets = list(dict.fromkeys(series_ids)) if series_ids is not None else list(entries)
+
+            def fetch(series_id: str) -> SeriesMetadata | None:
+                try:
+                    return fred_client.get_series_metadata(series_id)
+                except Exception as exc:
+                    LOGGER.warning("Unable to refresh metadata for %s: %s", series_id, exc)
+                    return None
+
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, max(1, len(targets)))) as executor:
+                fetched = [item for item in executor.map(bind_stage_context(fetch), targets) if item is not None]
+            if fetched:
+                self._entries = {**entries, **{item.series_id: item for item in fetched}}
+            self._refreshed_at = self._clock()
+            return len(fetched)
+
+    def start(self, fred_client: FREDClientProtocol) -> None:
+        """Keep the table refreshed from FRED every `refresh_interval` in a daemon thread."""
+
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = Thread(
+            target=self._refresh_forever,
+            args=(fred_client,),
+            name="state-series-metadata",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _refresh_forever(self, fred_client: FREDClientProtocol) -> None:
+        while not self._stopped.is_set():
+            wait = self.refresh_interval
+            try:
+                if not self.prefetch(fred_client):
+                    wait = min(wait, _RETRY_INTERVAL)
+            except Exception as exc:
+                LOGGER.warning("Unable to refresh state series metadata: %s", exc)
+                wait = min(wait, _RETRY_INTERVAL)
+            self._stopped.wait(wait.total_seconds())
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from fred_query.schemas.analysis import ObservationPoint
+from fred_query.schemas.observation_series import ObservationSeries
 
 
 @dataclass
 class SingleSeriesTransformResult:
-    observations: list[ObservationPoint] | None
+    observations: ObservationSeries | None
     basis: str | None
     units: str
     applied_window: int | None = None
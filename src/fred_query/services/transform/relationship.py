@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from math import sqrt
+import numpy as np
 
-from fred_query.schemas.analysis import ObservationPoint
 from fred_query.schemas.intent import TransformType
+from fred_query.schemas.observation_series import ObservationInput, ObservationSeries
 from fred_query.services.transform.series_transforms import SeriesTransformService
 
 
@@ -42,7 +42,7 @@ class RelationshipTransformService:
 
     def build_relationship_basis(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         title: str,
         units: str,
@@ -51,7 +51,8 @@ class RelationshipTransformService:
         transform: TransformType = TransformType.LEVEL,
         normalization: bool = False,
         requested_window: int | None = None,
-    ) -> tuple[list[ObservationPoint], str, str, int | None, list[str]]:
+    ) -> tuple[ObservationSeries, str, str, int | None, list[str]]:
+        observations = ObservationSeries.coerce(observations)
         effective_transform = TransformType.LEVEL if transform == TransformType.NORMALIZED_INDEX else transform
         normalize_chart = normalization or transform == TransformType.NORMALIZED_INDEX
 
@@ -64,7 +65,7 @@ class RelationshipTransformService:
                 window=requested_window,
             )
             return (
-                transform_result.observations or [],
+                transform_result.observations if transform_result.observations is not None else ObservationSeries(),
                 transform_result.basis or effective_transform.value.replace("_", " "),
                 transform_result.units,
                 transform_result.applied_window,
@@ -99,72 +100,76 @@ class RelationshipTransformService:
 
     @staticmethod
     def align_on_dates(
-        first: list[ObservationPoint],
-        second: list[ObservationPoint],
-    ) -> tuple[list[ObservationPoint], list[ObservationPoint]]:
-        first_by_date = {point.date: point for point in first}
-        second_by_date = {point.date: point for point in second}
-        common_dates = sorted(set(first_by_date).intersection(second_by_date))
+        first: ObservationInput,
+        second: ObservationInput,
+    ) -> tuple[ObservationSeries, ObservationSeries]:
+        first_series = ObservationSeries.coerce(first)
+        second_series = ObservationSeries.coerce(second)
+        common_dates, first_indices, second_indices = np.intersect1d(
+            first_series.dates,
+            second_series.dates,
+            assume_unique=True,
+            return_indices=True,
+        )
         return (
-            [first_by_date[current_date] for current_date in common_dates],
-            [second_by_date[current_date] for current_date in common_dates],
+            ObservationSeries(common_dates, first_series.values[first_indices]),
+            ObservationSeries(common_dates, second_series.values[second_indices]),
         )
 
     @staticmethod
-    def _pearson_from_values(first_values: list[float], second_values: list[float]) -> float | None:
+    def _pearson_from_values(first_values: np.ndarray, second_values: np.ndarray) -> float | None:
         if len(first_values) != len(second_values) or len(first_values) < 2:
             return None
 
-        first_mean = sum(first_values) / len(first_values)
-        second_mean = sum(second_values) / len(second_values)
-        covariance = sum(
-            (first_value - first_mean) * (second_value - second_mean)
-            for first_value, second_value in zip(first_values, second_values, strict=True)
-        )
-        first_variance = sum((value - first_mean) ** 2 for value in first_values)
-        second_variance = sum((value - second_mean) ** 2 for value in second_values)
-        denominator = sqrt(first_variance * second_variance)
+        first_deviation = first_values - first_values.mean()
+        second_deviation = second_values - second_values.mean()
+        denominator = np.sqrt(np.dot(first_deviation, first_deviation) * np.dot(second_deviation, second_deviation))
         if denominator == 0:
             return None
-        return covariance / denominator
+        return float(np.dot(first_deviation, second_deviation) / denominator)
 
     def calculate_correlation(
         self,
-        first: list[ObservationPoint],
-        second: list[ObservationPoint],
+        first: ObservationInput,
+        second: ObservationInput,
     ) -> float | None:
         if len(first) != len(second):
             raise ValueError("Correlation requires aligned observation lists.")
         return self._pearson_from_values(
-            [point.value for point in first],
-            [point.value for point in second],
+            ObservationSeries.coerce(first).values,
+            ObservationSeries.coerce(second).values,
         )
 
     def calculate_regression_slope(
         self,
-        first: list[ObservationPoint],
-        second: list[ObservationPoint],
+        first: ObservationInput,
+        second: ObservationInput,
     ) -> float | None:
         if len(first) != len(second) or len(first) < 2:
             return None
 
-        x_values = [point.value for point in first]
-        y_values = [point.value for point in second]
-        x_mean = sum(x_values) / len(x_values)
-        y_mean = sum(y_values) / len(y_values)
-        denominator = sum((value - x_mean) ** 2 for value in x_values)
+        x_values = ObservationSeries.coerce(first).values
+        y_values = ObservationSeries.coerce(second).values
+        x_deviation = x_values - x_values.mean()
+        denominator = float(np.dot(x_deviation, x_deviation))
         if denominator == 0:
             return None
-        numerator = sum(
-            (x_value - x_mean) * (y_value - y_mean)
-            for x_value, y_value in zip(x_values, y_values, strict=True)
-        )
-        return numerator / denominator
+        return float(np.dot(x_deviation, y_values - y_values.mean())) / denominator
+
+    @staticmethod
+    def _lagged_cross_products(first_values: np.ndarray, second_values: np.ndarray, max_lag: int) -> np.ndarray:
+        """Return sum(first[i] * second[i + lag]) for every lag in [-max_lag, max_lag] via one FFT."""
+
+        size = len(first_values)
+        fft_size = 1 << (size + max_lag - 1).bit_length()
+        spectrum = np.conj(np.fft.rfft(first_values, fft_size)) * np.fft.rfft(second_values, fft_size)
+        circular = np.fft.irfft(spectrum, fft_size)
+        return np.concatenate((circular[fft_size - max_lag :], circular[: max_lag + 1]))
 
     def calculate_best_lag_correlation(
         self,
-        first: list[ObservationPoint],
-        second: list[ObservationPoint],
+        first: ObservationInput,
+        second: ObservationInput,
         *,
         max_lag: int,
         min_samples: int = 8,
@@ -172,54 +177,70 @@ class RelationshipTransformService:
         if len(first) != len(second):
             raise ValueError("Lagged correlation requires aligned observation lists.")
 
-        first_values = [point.value for point in first]
-        second_values = [point.value for point in second]
-        best_lag: int | None = None
-        best_correlation: float | None = None
-        best_samples = 0
-
-        for lag in range(-max_lag, max_lag + 1):
-            if lag > 0:
-                left = first_values[:-lag]
-                right = second_values[lag:]
-            elif lag < 0:
-                offset = abs(lag)
-                left = first_values[offset:]
-                right = second_values[:-offset]
-            else:
-                left = first_values
-                right = second_values
-
-            if len(left) < min_samples or len(right) < min_samples:
-                continue
-
-            correlation = self._pearson_from_values(left, right)
-            if correlation is None:
-                continue
-
-            if best_correlation is None or abs(correlation) > abs(best_correlation):
-                best_lag = lag
-                best_correlation = correlation
-                best_samples = len(left)
-
-        return best_lag, best_correlation, best_samples
+        size = len(first)
+        max_lag = min(max_lag, size - max(min_samples, 2))
+        if max_lag < 0:
+            return None, None, 0
+
+        # Pearson correlation is shift invariant; centering first keeps the
+        # moment sums small so the sum-of-products identities stay accurate.
+        first_values = ObservationSeries.coerce(first).values
+        second_values = ObservationSeries.coerce(second).values
+        first_values = first_values - first_values.mean()
+        second_values = second_values - second_values.mean()
+
+        # Overlap for lag L: first[max(0, -L) : size - max(0, L)] against
+        # second[max(0, L) : size - max(0, -L)].
+        lags = np.arange(-max_lag, max_lag + 1)
+        samples = size - np.abs(lags)
+        first_start = np.maximum(0, -lags)
+        first_end = size - np.maximum(0, lags)
+        second_start = np.maximum(0, lags)
+        second_end = size - np.maximum(0, -lags)
+
+        def overlap_sums(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            prefix = np.concatenate(([0.0], np.cumsum(values)))
+            squared_prefix = np.concatenate(([0.0], np.cumsum(values * values)))
+            return prefix[ends] - prefix[starts], squared_prefix[ends] - squared_prefix[starts]
+
+        first_sums, first_squares = overlap_sums(first_values, first_start, first_end)
+        second_sums, second_squares = overlap_sums(second_values, second_start, second_end)
+        cross_products = self._lagged_cross_products(first_values, second_values, max_lag)
+
+        covariance = cross_products - first_sums * second_sums / samples
+        first_variance = first_squares - first_sums**2 / samples
+        second_variance = second_squares - second_sums**2 / samples
+        tolerance = 1e-12 * max(float(np.dot(first_values, first_values)), float(np.dot(second_values, second_values)))
+        valid = (samples >= min_samples) & (first_variance > tolerance) & (second_variance > tolerance)
+        if not valid.any():
+            return None, None, 0
+
+        correlations = np.zeros(lags.size)
+        correlations[valid] = np.clip(
+            covariance[valid] / np.sqrt(first_variance[valid] * second_variance[valid]),
+            -1.0,
+            1.0,
+        )
+        strengths = np.where(valid, np.abs(correlations), -1.0)
+        # Ties within rounding go to the most negative lag, as a lag-by-lag scan would.
+        best_index = int(np.flatnonzero(strengths >= strengths.max() - 1e-12)[0])
+        best_lag = int(lags[best_index])
+        correlation = self._pearson_from_values(
+            first_values[first_start[best_index] : first_end[best_index]],
+            second_values[second_start[best_index] : second_end[best_index]],
+        )
+        if correlation is None:
+            correlation = float(correlations[best_index])
+        return best_lag, correlation, int(samples[best_index])
 
     @staticmethod
-    def standardize(observations: list[ObservationPoint]) -> list[ObservationPoint]:
-        if len(observations) < 2:
-            return observations
-
-        values = [point.value for point in observations]
-        mean = sum(values) / len(values)
-        variance = sum((value - mean) ** 2 for value in values) / len(values)
-        standard_deviation = sqrt(variance)
+    def standardize(observations: ObservationInput) -> ObservationSeries:
+        series = ObservationSeries.coerce(observations)
+        if len(series) < 2:
+            return series
+
+        standard_deviation = float(series.values.std())
         if standard_deviation == 0:
-            return observations
+            return series
 
-        return [
-            ObservationPoint(
-                date=point.date,
-                value=(point.value - mean) / standard_deviation,
-            )
-            for point in observations
-        ]
+        return series.with_values((series.values - series.values.mean()) / standard_deviation)
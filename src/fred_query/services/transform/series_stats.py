@@ -2,30 +2,35 @@ from __future__ import annotations
 
 from datetime import date
 
+import numpy as np
+
 from fred_query.schemas.analysis import HistoricalSeriesContext, ObservationPoint
 from fred_query.schemas.chart import DateSpanAnnotation
+from fred_query.schemas.observation_series import ObservationInput, ObservationSeries
 
 
 class SeriesStatisticsService:
     @staticmethod
-    def calculate_total_growth_pct(observations: list[ObservationPoint]) -> float | None:
-        if len(observations) < 2:
+    def calculate_total_growth_pct(observations: ObservationInput) -> float | None:
+        series = ObservationSeries.coerce(observations)
+        if len(series) < 2:
             return None
 
-        first_value = observations[0].value
-        last_value = observations[-1].value
+        first_value = float(series.values[0])
+        last_value = float(series.values[-1])
         if first_value == 0:
             return None
 
         return ((last_value / first_value) - 1.0) * 100.0
 
     @staticmethod
-    def calculate_cagr_pct(observations: list[ObservationPoint]) -> float | None:
-        if len(observations) < 2:
+    def calculate_cagr_pct(observations: ObservationInput) -> float | None:
+        series = ObservationSeries.coerce(observations)
+        if len(series) < 2:
             return None
 
-        first_point = observations[0]
-        last_point = observations[-1]
+        first_point = series[0]
+        last_point = series[-1]
         years = (last_point.date - first_point.date).days / 365.25
         if years <= 0 or first_point.value == 0:
             return None
@@ -33,51 +38,58 @@ class SeriesStatisticsService:
         return ((last_point.value / first_point.value) ** (1.0 / years) - 1.0) * 100.0
 
     @staticmethod
-    def calculate_average_value(observations: list[ObservationPoint]) -> float | None:
-        if not observations:
+    def calculate_average_value(observations: ObservationInput) -> float | None:
+        series = ObservationSeries.coerce(observations)
+        if not series:
             return None
-        return sum(point.value for point in observations) / len(observations)
+        return float(series.values.mean())
 
     @staticmethod
     def calculate_percentile_rank(
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         value: float | None = None,
     ) -> float | None:
-        if len(observations) < 2:
+        series = ObservationSeries.coerce(observations)
+        if len(series) < 2:
             return None
 
-        reference_value = observations[-1].value if value is None else value
-        at_or_below_count = sum(1 for point in observations if point.value <= reference_value)
-        return (at_or_below_count / len(observations)) * 100.0
+        reference_value = series.values[-1] if value is None else value
+        at_or_below_count = int(np.count_nonzero(series.values <= reference_value))
+        return (at_or_below_count / len(series)) * 100.0
 
     @staticmethod
-    def minimum_point(observations: list[ObservationPoint]) -> ObservationPoint | None:
-        if not observations:
+    def minimum_point(observations: ObservationInput) -> ObservationPoint | None:
+        series = ObservationSeries.coerce(observations)
+        if not series:
             return None
-        return min(observations, key=lambda point: (point.value, point.date))
+        # Ties on value resolve to the earliest date.
+        return series[int(np.lexsort((series.dates, series.values))[0])]
 
     @staticmethod
-    def maximum_point(observations: list[ObservationPoint]) -> ObservationPoint | None:
-        if not observations:
+    def maximum_point(observations: ObservationInput) -> ObservationPoint | None:
+        series = ObservationSeries.coerce(observations)
+        if not series:
             return None
-        return max(observations, key=lambda point: (point.value, point.date))
+        # Ties on value resolve to the latest date.
+        return series[int(np.lexsort((series.dates, series.values))[-1])]
 
     def summarize_historical_context(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
     ) -> HistoricalSeriesContext | None:
-        if not observations:
+        series = ObservationSeries.coerce(observations)
+        if not series:
             return None
 
-        minimum = self.minimum_point(observations)
-        maximum = self.maximum_point(observations)
+        minimum = self.minimum_point(series)
+        maximum = self.maximum_point(series)
         return HistoricalSeriesContext(
-            start_date=observations[0].date,
-            end_date=observations[-1].date,
-            observation_count=len(observations),
-            average_value=self.calculate_average_value(observations),
-            percentile_rank=self.calculate_percentile_rank(observations),
+            start_date=series[0].date,
+            end_date=series[-1].date,
+            observation_count=len(series),
+            average_value=self.calculate_average_value(series),
+            percentile_rank=self.calculate_percentile_rank(series),
             min_value=minimum.value if minimum is not None else None,
             min_date=minimum.date if minimum is not None else None,
             max_value=maximum.value if maximum is not None else None,
@@ -85,30 +97,29 @@ class SeriesStatisticsService:
         )
 
     @staticmethod
-    def latest_value(observations: list[ObservationPoint]) -> tuple[float | None, date | None]:
-        if not observations:
+    def latest_value(observations: ObservationInput) -> tuple[float | None, date | None]:
+        series = ObservationSeries.coerce(observations)
+        if not series:
             return None, None
-        last_point = observations[-1]
+        last_point = series[-1]
         return last_point.value, last_point.date
 
     @staticmethod
-    def derive_recession_periods(observations: list[ObservationPoint]) -> list[DateSpanAnnotation]:
-        if not observations:
-            return []
-
-        recession_dates = [point.date for point in observations if point.value >= 1.0]
-        if not recession_dates:
+    def derive_recession_periods(observations: ObservationInput) -> list[DateSpanAnnotation]:
+        series = ObservationSeries.coerce(observations)
+        recession_dates = series.dates[series.values >= 1.0]
+        if recession_dates.size == 0:
             return []
 
-        periods: list[DateSpanAnnotation] = []
-        start = recession_dates[0]
-        previous = recession_dates[0]
-
-        for current in recession_dates[1:]:
-            if (current - previous).days > 40:
-                periods.append(DateSpanAnnotation(label="Recession", start_date=start, end_date=previous))
-                start = current
-            previous = current
-
-        periods.append(DateSpanAnnotation(label="Recession", start_date=start, end_date=previous))
-        return periods
+        # A gap of more than 40 days between recession months starts a new period.
+        breaks = np.flatnonzero(np.diff(recession_dates).astype(np.int64) > 40)
+        starts = np.concatenate(([0], breaks + 1))
+        ends = np.concatenate((breaks, [len(recession_dates) - 1]))
+        return [
+            DateSpanAnnotation(
+                label="Recession",
+                start_date=recession_dates[start].item(),
+                end_date=recession_dates[end].item(),
+            )
+            for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+        ]
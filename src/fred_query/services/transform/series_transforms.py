@@ -3,12 +3,34 @@ from __future__ import annotations
 from datetime import date
 from math import sqrt
 
-from fred_query.schemas.analysis import ObservationPoint
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 from fred_query.schemas.intent import TransformType
+from fred_query.schemas.observation_series import ObservationInput, ObservationSeries
 from fred_query.services.transform.models import SingleSeriesTransformResult
 from fred_query.services.transform.planning import TransformPlanningService
 
 
+def _reanchored_running_sum(anchors: np.ndarray, increments: np.ndarray, stride: int) -> np.ndarray:
+    """Accumulate `increments` onto exact values known at every `stride`-th position.
+
+    Position k is `anchors[k // stride]` plus the increments applied since that
+    anchor, so rounding error never carries across more than `stride` steps.
+    """
+
+    running = np.concatenate(([0.0], np.cumsum(increments)))
+    block_starts = (np.arange(running.size) // stride) * stride
+    return anchors[block_starts // stride] + running - running[block_starts]
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Return the sum of every length-`window` slice of `values` in O(n)."""
+
+    anchors = sliding_window_view(values, window)[::window].sum(axis=1)
+    return _reanchored_running_sum(anchors, values[window:] - values[:-window], window)
+
+
 class SeriesTransformService:
     def __init__(
         self,
@@ -18,139 +40,116 @@ class SeriesTransformService:
 
     @staticmethod
     def calculate_pct_change(
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         periods: int,
-    ) -> list[ObservationPoint]:
-        if periods <= 0 or len(observations) <= periods:
-            return []
-
-        transformed: list[ObservationPoint] = []
-        for index in range(periods, len(observations)):
-            previous = observations[index - periods]
-            current = observations[index]
-            if previous.value == 0:
-                continue
-            transformed.append(
-                ObservationPoint(
-                    date=current.date,
-                    value=((current.value / previous.value) - 1.0) * 100.0,
-                )
-            )
-        return transformed
+    ) -> ObservationSeries:
+        series = ObservationSeries.coerce(observations)
+        if periods <= 0 or len(series) <= periods:
+            return ObservationSeries()
+
+        previous = series.values[:-periods]
+        current = series.values[periods:]
+        nonzero = previous != 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            changes = ((current / previous) - 1.0) * 100.0
+        return ObservationSeries(series.dates[periods:][nonzero], changes[nonzero])
 
     @staticmethod
-    def cumulative_growth_series(observations: list[ObservationPoint]) -> list[ObservationPoint]:
-        if not observations:
-            return []
+    def cumulative_growth_series(observations: ObservationInput) -> ObservationSeries:
+        series = ObservationSeries.coerce(observations)
+        if not series:
+            return ObservationSeries()
 
-        first_value = observations[0].value
+        first_value = series.values[0]
         if first_value == 0:
-            return []
+            return ObservationSeries()
 
-        return [
-            ObservationPoint(
-                date=point.date,
-                value=((point.value / first_value) - 1.0) * 100.0,
-            )
-            for point in observations
-        ]
+        return series.with_values(((series.values / first_value) - 1.0) * 100.0)
 
     @staticmethod
-    def rolling_average(observations: list[ObservationPoint], *, window: int) -> list[ObservationPoint]:
-        if window <= 0 or len(observations) < window:
-            return []
-
-        transformed: list[ObservationPoint] = []
-        for index in range(window - 1, len(observations)):
-            current_window = observations[index - window + 1 : index + 1]
-            transformed.append(
-                ObservationPoint(
-                    date=observations[index].date,
-                    value=sum(point.value for point in current_window) / window,
-                )
-            )
-        return transformed
+    def rolling_average(observations: ObservationInput, *, window: int) -> ObservationSeries:
+        series = ObservationSeries.coerce(observations)
+        if window <= 0 or len(series) < window:
+            return ObservationSeries()
 
-    @staticmethod
+        return ObservationSeries(series.dates[window - 1 :], _window_sums(series.values, window) / window)
+
+    @classmethod
     def rolling_stddev(
-        observations: list[ObservationPoint],
+        cls,
+        observations: ObservationInput,
         *,
         window: int,
-    ) -> list[ObservationPoint]:
-        if window < 2 or len(observations) < window:
-            return []
-
-        transformed: list[ObservationPoint] = []
-        for index in range(window - 1, len(observations)):
-            current_window = observations[index - window + 1 : index + 1]
-            values = [point.value for point in current_window]
-            mean = sum(values) / window
-            variance = sum((value - mean) ** 2 for value in values) / (window - 1)
-            transformed.append(
-                ObservationPoint(
-                    date=observations[index].date,
-                    value=sqrt(variance),
-                )
-            )
-        return transformed
+    ) -> ObservationSeries:
+        series = ObservationSeries.coerce(observations)
+        if window < 2 or len(series) < window:
+            return ObservationSeries()
+
+        # Sliding Welford update: moving the window one step changes the sum of
+        # squared deviations by (x_new - x_old) * (x_new - mean_new + x_old - mean_old).
+        values = series.values
+        means = cls.rolling_average(series, window=window).values
+        entering = values[window:]
+        leaving = values[:-window]
+        anchor_windows = sliding_window_view(values, window)[::window]
+        anchor_squares = np.sum((anchor_windows - means[::window, None]) ** 2, axis=1)
+        squared_deviations = _reanchored_running_sum(
+            anchor_squares,
+            (entering - leaving) * (entering - means[1:] + leaving - means[:-1]),
+            window,
+        )
+        variances = np.maximum(squared_deviations / (window - 1), 0.0)
+
+        # Windows without any change in value are exactly flat; report 0.0 rather
+        # than the rounding residue left in the running sum.
+        changes = _window_sums((np.diff(values) != 0).astype(np.float64), window - 1)
+        variances[changes == 0] = 0.0
+        return ObservationSeries(series.dates[window - 1 :], np.sqrt(variances))
 
     def rolling_volatility(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         window: int,
         periods_per_year: int,
-    ) -> list[ObservationPoint]:
+    ) -> ObservationSeries:
         period_returns = self.calculate_pct_change(observations, periods=1)
         if not period_returns:
-            return []
+            return ObservationSeries()
 
         rolling_stddev = self.rolling_stddev(period_returns, window=window)
         annualization_factor = sqrt(max(1, periods_per_year))
-        return [
-            ObservationPoint(
-                date=point.date,
-                value=point.value * annualization_factor,
-            )
-            for point in rolling_stddev
-        ]
+        return rolling_stddev.with_values(rolling_stddev.values * annualization_factor)
 
     @staticmethod
     def filter_observations_by_date(
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         start_date: date | None = None,
         end_date: date | None = None,
-    ) -> list[ObservationPoint]:
-        return [
-            point
-            for point in observations
-            if (start_date is None or point.date >= start_date)
-            and (end_date is None or point.date <= end_date)
-        ]
+    ) -> ObservationSeries:
+        return ObservationSeries.coerce(observations).between(start_date, end_date)
 
     @staticmethod
     def normalize_to_index(
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         base_value: float = 100.0,
-    ) -> list[ObservationPoint]:
-        if not observations:
-            return []
+    ) -> ObservationSeries:
+        series = ObservationSeries.coerce(observations)
+        if not series:
+            return ObservationSeries()
 
-        first_value = observations[0].value
+        first_value = series.values[0]
         if first_value == 0:
             raise ValueError("Cannot normalize a series with a zero starting value.")
 
-        return [
-            ObservationPoint(date=point.date, value=(point.value / first_value) * base_value)
-            for point in observations
-        ]
+        return series.with_values((series.values / first_value) * base_value)
 
     def apply_single_series_transform(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         transform: TransformType,
         units: str,
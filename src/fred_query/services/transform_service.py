@@ -5,6 +5,7 @@ from datetime import date
 from fred_query.schemas.analysis import HistoricalSeriesContext, ObservationPoint
 from fred_query.schemas.chart import DateSpanAnnotation
 from fred_query.schemas.intent import TransformType
+from fred_query.schemas.observation_series import ObservationInput, ObservationSeries
 from fred_query.services.transform import (
     RelationshipTransformService,
     SeriesStatisticsService,
@@ -89,38 +90,38 @@ class TransformService:
 
     def calculate_pct_change(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         periods: int,
-    ) -> list[ObservationPoint]:
+    ) -> ObservationSeries:
         return self.series_transform_service.calculate_pct_change(observations, periods=periods)
 
-    def cumulative_growth_series(self, observations: list[ObservationPoint]) -> list[ObservationPoint]:
+    def cumulative_growth_series(self, observations: ObservationInput) -> ObservationSeries:
         return self.series_transform_service.cumulative_growth_series(observations)
 
     def rolling_average(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         window: int,
-    ) -> list[ObservationPoint]:
+    ) -> ObservationSeries:
         return self.series_transform_service.rolling_average(observations, window=window)
 
     def rolling_stddev(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         window: int,
-    ) -> list[ObservationPoint]:
+    ) -> ObservationSeries:
         return self.series_transform_service.rolling_stddev(observations, window=window)
 
     def rolling_volatility(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         window: int,
         periods_per_year: int,
-    ) -> list[ObservationPoint]:
+    ) -> ObservationSeries:
         return self.series_transform_service.rolling_volatility(
             observations,
             window=window,
@@ -129,11 +130,11 @@ class TransformService:
 
     def filter_observations_by_date(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         start_date: date | None = None,
         end_date: date | None = None,
-    ) -> list[ObservationPoint]:
+    ) -> ObservationSeries:
         return self.series_transform_service.filter_observations_by_date(
             observations,
             start_date=start_date,
@@ -142,7 +143,7 @@ class TransformService:
 
     def apply_single_series_transform(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         transform: TransformType,
         units: str,
@@ -162,7 +163,7 @@ class TransformService:
 
     def build_relationship_basis(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         title: str,
         units: str,
@@ -171,7 +172,7 @@ class TransformService:
         transform: TransformType = TransformType.LEVEL,
         normalization: bool = False,
         requested_window: int | None = None,
-    ) -> tuple[list[ObservationPoint], str, str, int | None, list[str]]:
+    ) -> tuple[ObservationSeries, str, str, int | None, list[str]]:
         return self.relationship_transform_service.build_relationship_basis(
             observations,
             title=title,
@@ -185,29 +186,29 @@ class TransformService:
 
     def align_on_dates(
         self,
-        first: list[ObservationPoint],
-        second: list[ObservationPoint],
-    ) -> tuple[list[ObservationPoint], list[ObservationPoint]]:
+        first: ObservationInput,
+        second: ObservationInput,
+    ) -> tuple[ObservationSeries, ObservationSeries]:
         return self.relationship_transform_service.align_on_dates(first, second)
 
     def calculate_correlation(
         self,
-        first: list[ObservationPoint],
-        second: list[ObservationPoint],
+        first: ObservationInput,
+        second: ObservationInput,
     ) -> float | None:
         return self.relationship_transform_service.calculate_correlation(first, second)
 
     def calculate_regression_slope(
         self,
-        first: list[ObservationPoint],
-        second: list[ObservationPoint],
+        first: ObservationInput,
+        second: ObservationInput,
     ) -> float | None:
         return self.relationship_transform_service.calculate_regression_slope(first, second)
 
     def calculate_best_lag_correlation(
         self,
-        first: list[ObservationPoint],
-        second: list[ObservationPoint],
+        first: ObservationInput,
+        second: ObservationInput,
         *,
         max_lag: int,
         min_samples: int = 8,
@@ -219,48 +220,48 @@ class TransformService:
             min_samples=min_samples,
         )
 
-    def standardize(self, observations: list[ObservationPoint]) -> list[ObservationPoint]:
+    def standardize(self, observations: ObservationInput) -> ObservationSeries:
         return self.relationship_transform_service.standardize(observations)
 
     def normalize_to_index(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         base_value: float = 100.0,
-    ) -> list[ObservationPoint]:
+    ) -> ObservationSeries:
         return self.series_transform_service.normalize_to_index(observations, base_value=base_value)
 
-    def calculate_total_growth_pct(self, observations: list[ObservationPoint]) -> float | None:
+    def calculate_total_growth_pct(self, observations: ObservationInput) -> float | None:
         return self.series_statistics_service.calculate_total_growth_pct(observations)
 
-    def calculate_cagr_pct(self, observations: list[ObservationPoint]) -> float | None:
+    def calculate_cagr_pct(self, observations: ObservationInput) -> float | None:
         return self.series_statistics_service.calculate_cagr_pct(observations)
 
-    def calculate_average_value(self, observations: list[ObservationPoint]) -> float | None:
+    def calculate_average_value(self, observations: ObservationInput) -> float | None:
         return self.series_statistics_service.calculate_average_value(observations)
 
     def calculate_percentile_rank(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
         *,
         value: float | None = None,
     ) -> float | None:
         return self.series_statistics_service.calculate_percentile_rank(observations, value=value)
 
-    def minimum_point(self, observations: list[ObservationPoint]) -> ObservationPoint | None:
+    def minimum_point(self, observations: ObservationInput) -> ObservationPoint | None:
         return self.series_statistics_service.minimum_point(observations)
 
-    def maximum_point(self, observations: list[ObservationPoint]) -> ObservationPoint | None:
+    def maximum_point(self, observations: ObservationInput) -> ObservationPoint | None:
         return self.series_statistics_service.maximum_point(observations)
 
     def summarize_historical_context(
         self,
-        observations: list[ObservationPoint],
+        observations: ObservationInput,
     ) -> HistoricalSeriesContext | None:
         return self.series_statistics_service.summarize_historical_context(observations)
 
-    def latest_value(self, observations: list[ObservationPoint]) -> tuple[float | None, date | None]:
+    def latest_value(self, observations: ObservationInput) -> tuple[float | None, date | None]:
         return self.series_statistics_service.latest_value(observations)
 
-    def derive_recession_periods(self, observations: list[ObservationPoint]) -> list[DateSpanAnnotation]:
+    def derive_recession_periods(self, observations: ObservationInput) -> list[DateSpanAnnotation]:
         return self.series_statistics_service.derive_recession_periods(observations)
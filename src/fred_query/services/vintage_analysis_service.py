@@ -3,22 +3,22 @@ from __future__ import annotations
 from datetime import date
 from typing import Dict, List, Optional
 
-from fred_query.schemas.analysis import ObservationPoint
+from fred_query.cache.vintage_archive import VintageArchive
 from fred_query.schemas.resolved_series import ResolvedSeries
 from fred_query.schemas.vintage_analysis import (
     VintageAnalysisResult,
     VintageComparison,
-    VintageObservation,
     VintageSeriesData,
 )
-from fred_query.services.fred_client import FREDClient
+from fred_query.services.fred_client import OUTPUT_INITIAL_RELEASE, REALTIME_END, FREDClientProtocol
 
 
 class VintageAnalysisService:
     """Service to perform vintage/revision analysis on FRED series data"""
 
-    def __init__(self, fred_client: FREDClient):
+    def __init__(self, fred_client: FREDClientProtocol, *, vintage_archive: VintageArchive | None = None):
         self.fred_client = fred_client
+        self.vintage_archive = vintage_archive
 
     def analyze_vintage_data(
         self,
@@ -31,53 +31,36 @@ class VintageAnalysisService:
 
         Args:
             series: The series to analyze
-            vintage_limit: Maximum number of vintage dates to retrieve
+            vintage_limit: How many of the most recent vintages to cover (live fetches only; the archive keeps all)
             max_comparisons: Maximum number of observation dates to compare across vintages
 
         Returns:
             VintageAnalysisResult containing comparison data
         """
-        # Get all vintage dates for the series
-        vintage_dates = self.fred_client.get_series_vintage_dates(series.series_id, limit=vintage_limit)
-
-        if not vintage_dates:
-            return VintageAnalysisResult()
-
-        # Get observations for each vintage date
-        all_vintage_observations: List[VintageObservation] = []
+        if self.vintage_archive is not None:
+            # Stored history, extended with only the vintages published since the last sync
+            history = self.vintage_archive.history(self.fred_client, series.series_id)
+            if not history.vintage_dates:
+                return VintageAnalysisResult()
+            revisions = history.observations
+            vintage_series_data = history.data.model_copy(update={"title": series.title})
+        else:
+            # The `vintage_limit` most recent vintages; the oldest of them opens the real-time window
+            vintage_dates = self.fred_client.get_series_vintage_dates(
+                series.series_id, limit=vintage_limit, sort_order="desc"
+            )
 
-        # Limit vintage dates to avoid too many API calls - keep the latest ones for accuracy
-        vintage_dates_limited = vintage_dates[-min(10, len(vintage_dates)):]
+            if not vintage_dates:
+                return VintageAnalysisResult()
 
-        for vintage_date in vintage_dates_limited:
-            try:
-                observations = self.fred_client.get_series_observations_for_vintage_date(
-                    series.series_id, vintage_date
-                )
-
-                for obs in observations:
-                    all_vintage_observations.append(
-                        VintageObservation(
-                            date=obs.date,
-                            value=obs.value,
-                            vintage_date=vintage_date
-                        )
-                    )
-            except Exception:
-                # Skip vintage dates that fail to load
-                continue
-
-        # Create vintage series data
-        vintage_series_data = VintageSeriesData(
-            series_id=series.series_id,
-            title=series.title,
-            vintage_observations=all_vintage_observations,
-            vintage_dates=vintage_dates_limited
-        )
+            # ALFRED returns every value each observation has had since that vintage
+            revisions = self.fred_client.get_series_realtime_observations(
+                series.series_id, realtime_start=min(vintage_dates)
+            )
+            vintage_series_data = VintageSeriesData.from_realtime_periods(series.series_id, series.title, revisions)
 
-        # Get current observations for comparison
-        current_observations = self.fred_client.get_series_observations(series.series_id)
-        current_values_map = {obs.date: obs.value for obs in current_observations}
+        # Values whose real-time period is still open are the current ones
+        current_values_map = {obs.date: obs.value for obs in revisions if obs.realtime_end == REALTIME_END}
 
         # Create comparisons for recent observation dates
         comparison_dates = sorted(current_values_map.keys(), reverse=True)[:max_comparisons]
@@ -106,7 +89,7 @@ class VintageAnalysisService:
                 first_release_value=first_value,
                 latest_revision_value=latest_value,
                 current_value=current_value,
-                revision_count=len(revision_history),
+                revision_count=vintage_series_data.get_revision_count(obs_date),
                 revision_history=revision_history,
                 percent_change_from_first=percent_change_from_first,
                 percent_change_from_latest=percent_change_from_latest
@@ -143,59 +126,35 @@ class VintageAnalysisService:
 
     def get_first_release_value(self, series_id: str, obs_date: date) -> Optional[float]:
         """Get the first-release value for a specific series and observation date"""
-        vintage_dates = self.fred_client.get_series_vintage_dates(series_id, limit=100)
-        if not vintage_dates:
-            return None
-
-        # Find the first vintage that contains the observation date
-        for vintage_date in sorted(vintage_dates):
-            try:
-                observations = self.fred_client.get_series_observations_for_vintage_date(
-                    series_id, vintage_date
+        if self.vintage_archive is not None:
+            # A first release never changes, so a stored one is served without contacting FRED
+            stored = self.vintage_archive.get(series_id)
+            first_value = stored.data.get_first_release_value(obs_date) if stored is not None else None
+            if first_value is None:
+                first_value = self.vintage_archive.history(self.fred_client, series_id).data.get_first_release_value(
+                    obs_date
                 )
-                for obs in observations:
-                    if obs.date == obs_date:
-                        return obs.value
-            except Exception:
-                continue  # Skip this vintage if it fails
+            return first_value
 
+        releases = self.fred_client.get_series_realtime_observations(
+            series_id, output_type=OUTPUT_INITIAL_RELEASE, start_date=obs_date, end_date=obs_date
+        )
+        for obs in releases:
+            if obs.date == obs_date:
+                return obs.value
         return None
 
     def compare_latest_vs_original(self, series_id: str, obs_date: date) -> Optional[Dict[str, float]]:
         """Compare latest revision vs original release for a specific observation date"""
-        vintage_dates = self.fred_client.get_series_vintage_dates(series_id, limit=100)
-        if not vintage_dates:
-            return None
-
-        first_vintage = min(vintage_dates)
-        latest_vintage = max(vintage_dates)
-
-        first_value = None
-        latest_value = None
-
-        # Get first release value
-        try:
-            first_observations = self.fred_client.get_series_observations_for_vintage_date(
-                series_id, first_vintage
-            )
-            for obs in first_observations:
-                if obs.date == obs_date:
-                    first_value = obs.value
-                    break
-        except Exception:
-            pass
-
-        # Get latest revision value
-        try:
-            latest_observations = self.fred_client.get_series_observations_for_vintage_date(
-                series_id, latest_vintage
+        if self.vintage_archive is not None:
+            history = self.vintage_archive.history(self.fred_client, series_id).data
+        else:
+            revisions = self.fred_client.get_series_realtime_observations(
+                series_id, start_date=obs_date, end_date=obs_date
             )
-            for obs in latest_observations:
-                if obs.date == obs_date:
-                    latest_value = obs.value
-                    break
-        except Exception:
-            pass
+            history = VintageSeriesData.from_realtime_periods(series_id, series_id, revisions)
+        first_value = history.get_first_release_value(obs_date)
+        latest_value = history.get_latest_revision_value(obs_date)
 
         if first_value is not None and latest_value is not None:
             percent_change = ((latest_value - first_value) / abs(first_value)) * 100 if first_value != 0 else 0
@@ -205,4 +164,4 @@ class VintageAnalysisService:
                 "percent_change": percent_change
             }
 
-        return None
\ No newline at end of file
+        return None
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import time
 import unittest
 
+from fastapi import Depends
 from fastapi.testclient import TestClient
+import httpx
 
 from fred_query.api.app import (
     app,
     get_app_settings,
+    get_fred_client,
     get_natural_language_query_service,
+    get_query_session_service,
+    get_recession_index,
     get_state_gdp_comparison_service,
+    get_state_series_metadata,
 )
 from fred_query.config import Settings
 from fred_query.errors import ConfigurationError
@@ -25,7 +36,10 @@ from fred_query.schemas.analysis import (
 from fred_query.schemas.chart import AxisSpec, ChartSpec, ChartTrace
 from fred_query.schemas.intent import ComparisonMode, Geography, GeographyType, QueryIntent, TaskType, TransformType
 from fred_query.schemas.resolved_series import ClarificationBadge, ClarificationOption, ResolvedSeries, SeriesSearchMatch
-from fred_query.services import FREDAPIError, QuerySession
+from fred_query.services import FREDAPIError, FREDClient, QuerySession, SQLiteQuerySessionStore
+from fred_query.services.progress import emit_progress
+from fred_query.services.resolver_service import STATE_SERIES_METADATA
+from fred_query.services.stage_timing import record_upstream_call, stage
 
 
 def _build_query_response() -> QueryResponse:
@@ -114,6 +128,31 @@ class _FakeNaturalLanguageQueryService:
         return self.response
 
 
+class _StagedNaturalLanguageQueryService(_FakeNaturalLanguageQueryService):
+    def ask(self, query: str, **kwargs: object) -> RoutedQueryResponse:
+        with stage("ask"), stage("fetch"):
+            record_upstream_call()
+            record_upstream_call()
+        return self.response
+
+
+class _ProgressNaturalLanguageQueryService(_FakeNaturalLanguageQueryService):
+    def ask(self, query: str, **kwargs: object) -> RoutedQueryResponse:
+        query_response = self.response.query_response
+        emit_progress("intent", {"intent": self.response.intent})
+        emit_progress("resolved_series", {"series": [item.series for item in query_response.analysis.series_results]})
+        emit_progress("chart", {"chart": query_response.chart})
+        return self.response
+
+
+def _sse_events(body: str) -> list[tuple[str, dict[str, object]]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
 class _FakeStateGDPComparisonService:
     def compare(self, **_: object) -> QueryResponse:
         return _build_query_response()
@@ -162,9 +201,12 @@ class _TrackingStateGDPComparisonService(_FakeStateGDPComparisonService):
 class APITest(unittest.TestCase):
     def setUp(self) -> None:
         app.dependency_overrides.clear()
+        # Background loaders would call the real FRED API from `_lifespan`; tests opt in explicitly.
         app.dependency_overrides[get_app_settings] = lambda: Settings(
             fred_api_key="test-fred-key",
             openai_api_key="test-openai-key",
+            recession_index_refresh_hours=0,
+            state_metadata_refresh_hours=0,
         )
         self.client = TestClient(app)
 
@@ -177,6 +219,13 @@ class APITest(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"status": "ok"})
 
+    def test_intent_cache_stats_are_exposed(self) -> None:
+        response = self.client.get("/api/cache/intent")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["enabled"], True)
+        self.assertEqual(response.json()["hits"], 0)
+
     def test_index(self) -> None:
         response = self.client.get("/")
 
@@ -219,6 +268,119 @@ class APITest(unittest.TestCase):
         )
         self.assertEqual(payload["follow_up_suggestions"][0]["kind"], "toggle_normalization")
 
+    def test_ask_reports_stage_timings(self) -> None:
+        routed = RoutedQueryResponse(
+            status=RoutedQueryStatus.COMPLETED,
+            intent=_build_query_response().intent,
+            answer_text="Completed comparison.",
+            query_response=_build_query_response(),
+        )
+        app.dependency_overrides[get_natural_language_query_service] = (
+            lambda: _StagedNaturalLanguageQueryService(routed)
+        )
+
+        plain = self.client.post("/api/ask", json={"query": "Compare California and Texas GDP"})
+        timed = self.client.post(
+            "/api/ask",
+            json={"query": "Compare California and Texas GDP", "include_timings": True},
+        )
+
+        self.assertIsNone(plain.json()["timings"])
+        self.assertIn('fetch;dur=', plain.headers["server-timing"])
+        self.assertIn('service;dur=', plain.headers["server-timing"])
+        stages = {entry["name"]: entry for entry in timed.json()["timings"]}
+        self.assertEqual(set(stages), {"session", "service", "ask", "fetch", "response"})
+        self.assertEqual(stages["service"]["upstream_calls"], 2)
+        self.assertEqual(stages["session"]["count"], 2)
+
+    def test_ask_stream_emits_progress_before_the_answer(self) -> None:
+        routed = RoutedQueryResponse(
+            status=RoutedQueryStatus.COMPLETED,
+            intent=_build_query_response().intent,
+            answer_text="Completed comparison.",
+            query_response=_build_query_response(),
+        )
+        app.dependency_overrides[get_natural_language_query_service] = (
+            lambda: _ProgressNaturalLanguageQueryService(routed)
+        )
+
+        response = self.client.post("/api/ask/stream", json={"query": "Compare California and Texas GDP"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("text/event-stream", response.headers["content-type"])
+        events = _sse_events(response.text)
+        self.assertEqual(
+            [name for name, _ in events],
+            ["intent", "resolved_series", "chart", "answer", "follow_ups", "done"],
+        )
+        data = dict(events)
+        self.assertEqual(data["intent"]["intent"]["task_type"], "state_gdp_comparison")
+        self.assertEqual([item["series_id"] for item in data["resolved_series"]["series"]], ["CARGSP", "TXRGSP"])
+        self.assertEqual(data["chart"]["plotly_figure"], data["answer"]["plotly_figure"])
+        self.assertEqual(data["answer"]["status"], "completed")
+        self.assertEqual(data["follow_ups"]["follow_up_suggestions"], data["answer"]["follow_up_suggestions"])
+        self.assertEqual(data["done"]["revision_id"], data["answer"]["revision_id"])
+
+        follow_up = self.client.post(
+            "/api/ask",
+            json={"query": "Now show levels", "session_id": data["done"]["session_id"]},
+        )
+        self.assertEqual(follow_up.json()["session_id"], data["done"]["session_id"])
+
+    def test_ask_stream_reports_errors_as_an_event(self) -> None:
+        app.dependency_overrides[get_natural_language_query_service] = (
+            lambda: _FailingNaturalLanguageQueryService(FREDAPIError("FRED request timed out."))
+        )
+
+        response = self.client.post("/api/ask/stream", json={"query": "Show me unemployment"})
+
+        self.assertEqual(response.status_code, 200)
+        events = _sse_events(response.text)
+        self.assertEqual([name for name, _ in events], ["error"])
+        self.assertEqual(events[0][1]["error"], {"code": "fred_error", "message": "FRED request timed out."})
+
+    def test_concurrent_asks_share_one_session_store_commit(self) -> None:
+        routed = RoutedQueryResponse(
+            status=RoutedQueryStatus.COMPLETED,
+            intent=_build_query_response().intent,
+            answer_text="Completed comparison.",
+            query_response=_build_query_response(),
+        )
+        app.dependency_overrides[get_natural_language_query_service] = lambda: _FakeNaturalLanguageQueryService(routed)
+
+        with TemporaryDirectory() as directory:
+            store = SQLiteQuerySessionStore(Path(directory) / "sessions.sqlite3")
+            app.dependency_overrides[get_query_session_service] = lambda: store
+            batch_sizes: list[int] = []
+            commit = store._commit
+
+            def held_commit(batch: list[object]) -> None:
+                batch_sizes.append(len(batch))
+                if len(batch_sizes) == 1:
+                    # Hold the first transaction until the other turns queue behind it; on the
+                    # event loop this would stall every request instead.
+                    deadline = time.monotonic() + 5
+                    while len(store._pending) < 3 and time.monotonic() < deadline:
+                        time.sleep(0.01)
+                commit(batch)
+
+            store._commit = held_commit  # type: ignore[method-assign]
+            try:
+                with TestClient(app) as client, ThreadPoolExecutor(max_workers=4) as executor:
+                    responses = list(
+                        executor.map(lambda index: client.post("/api/ask", json={"query": f"q{index}"}), range(4))
+                    )
+                stored = [
+                    store.get_context(session_id=item.json()["session_id"], revision_id=item.json()["revision_id"])
+                    for item in responses
+                ]
+            finally:
+                store.close()
+
+        self.assertEqual([item.status_code for item in responses], [200] * 4)
+        self.assertEqual(batch_sizes, [1, 3])
+        self.assertEqual(sorted(context.last_query for context in stored), ["q0", "q1", "q2", "q3"])
+
     def test_ask_forwards_selected_series_id(self) -> None:
         routed = RoutedQueryResponse(
             status=RoutedQueryStatus.COMPLETED,
@@ -303,6 +465,102 @@ class APITest(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTrue(service.closed)
 
+    def test_fred_clients_share_one_http_pool(self) -> None:
+        app.state.fred_http_client = None
+        seen_pools: list[object] = []
+
+        def capture(fred_client: FREDClient = Depends(get_fred_client)) -> _FakeStateGDPComparisonService:
+            seen_pools.append(fred_client._client)
+            return _FakeStateGDPComparisonService()
+
+        app.dependency_overrides[get_state_gdp_comparison_service] = capture
+        payload = {"state1": "California", "state2": "Texas", "start_date": "2019-01-01", "normalize": True}
+
+        with TestClient(app) as client:
+            self.assertEqual(client.post("/api/compare/state-gdp", json=payload).status_code, 200)
+            self.assertEqual(client.post("/api/compare/state-gdp", json=payload).status_code, 200)
+            shared_pool = app.state.fred_http_client
+
+        self.assertEqual(len(seen_pools), 2)
+        self.assertIs(seen_pools[0], shared_pool)
+        self.assertIs(seen_pools[1], shared_pool)
+        self.assertTrue(shared_pool.is_closed)
+        self.assertIsNone(app.state.fred_http_client)
+
+    def test_recession_index_is_started_at_startup_and_only_read_by_requests(self) -> None:
+        fred_calls: list[str] = []
+
+        def fred(request: httpx.Request) -> httpx.Response:
+            fred_calls.append(request.url.params["series_id"])
+            observations = [{"date": "2020-03-01", "value": "1"}, {"date": "2020-05-01", "value": "0"}]
+            return httpx.Response(status_code=200, json={"observations": observations})
+
+        app.dependency_overrides[get_app_settings] = lambda: Settings(
+            fred_api_key="test-fred-key",
+            openai_api_key="test-openai-key",
+            state_metadata_refresh_hours=0,
+        )
+        app.state.fred_http_client = httpx.Client(base_url="https://example.test/fred", transport=httpx.MockTransport(fred))
+        seen_indexes: list[object] = []
+
+        def capture(recession_index: object = Depends(get_recession_index)) -> _FakeStateGDPComparisonService:
+            seen_indexes.append(recession_index)
+            return _FakeStateGDPComparisonService()
+
+        app.dependency_overrides[get_state_gdp_comparison_service] = capture
+        payload = {"state1": "California", "state2": "Texas", "start_date": "2019-01-01", "normalize": True}
+
+        with TestClient(app) as client:
+            index = app.state.recession_index
+            deadline = time.monotonic() + 5
+            while not index.is_loaded and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(client.post("/api/compare/state-gdp", json=payload).status_code, 200)
+
+        self.assertEqual(fred_calls, ["USREC"])
+        self.assertEqual(seen_indexes, [index])
+        self.assertEqual(len(index.overlapping(None, None)), 1)
+        self.assertIsNone(app.state.recession_index)
+
+    def test_state_series_metadata_is_per_app_and_started_at_startup(self) -> None:
+        def fred(request: httpx.Request) -> httpx.Response:
+            series_id = request.url.params["series_id"]
+            item = {"id": series_id, "title": f"Refreshed {series_id}", "units_short": "%", "frequency_short": "M"}
+            return httpx.Response(status_code=200, json={"seriess": [item]})
+
+        app.dependency_overrides[get_app_settings] = lambda: Settings(
+            fred_api_key="test-fred-key",
+            openai_api_key="test-openai-key",
+            recession_index_refresh_hours=0,
+            state_metadata_refresh_hours=6,
+            fred_max_concurrency=3,
+        )
+        app.state.fred_http_client = httpx.Client(base_url="https://example.test/fred", transport=httpx.MockTransport(fred))
+        global_settings = (STATE_SERIES_METADATA.refresh_interval, STATE_SERIES_METADATA.max_concurrency)
+        seen_tables: list[object] = []
+
+        def capture(table: object = Depends(get_state_series_metadata)) -> _FakeStateGDPComparisonService:
+            seen_tables.append(table)
+            return _FakeStateGDPComparisonService()
+
+        app.dependency_overrides[get_state_gdp_comparison_service] = capture
+        payload = {"state1": "California", "state2": "Texas", "start_date": "2019-01-01", "normalize": True}
+
+        with TestClient(app) as client:
+            table = app.state.state_series_metadata
+            deadline = time.monotonic() + 5
+            while table.refreshed_at is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(client.post("/api/compare/state-gdp", json=payload).status_code, 200)
+
+        self.assertIsNot(table, STATE_SERIES_METADATA)
+        self.assertEqual(seen_tables, [table])
+        self.assertEqual((table.refresh_interval.total_seconds(), table.max_concurrency), (6 * 3600, 3))
+        self.assertEqual(table.get("CAUR").title, "Refreshed CAUR")
+        self.assertEqual((STATE_SERIES_METADATA.refresh_interval, STATE_SERIES_METADATA.max_concurrency), global_settings)
+        self.assertNotEqual(STATE_SERIES_METADATA.get("CAUR").title, "Refreshed CAUR")
+        self.assertIsNone(app.state.state_series_metadata)
+
     def test_ask_clarification(self) -> None:
         routed = RoutedQueryResponse(
             status=RoutedQueryStatus.NEEDS_CLARIFICATION,
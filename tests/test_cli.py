@@ -8,13 +8,15 @@ from pathlib import Path
 import sys
 from tempfile import TemporaryDirectory
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+from fred_query.cache import SeriesCatalog
 from fred_query.cli import main
 from fred_query.schemas.analysis import AnalysisResult, QueryResponse, RoutedQueryResponse, RoutedQueryStatus, SeriesAnalysis
 from fred_query.schemas.chart import AxisSpec, ChartSpec, ChartTrace
 from fred_query.schemas.intent import ComparisonMode, Geography, GeographyType, QueryIntent, TaskType, TransformType
-from fred_query.schemas.resolved_series import ResolvedSeries
+from fred_query.schemas.resolved_series import ResolvedSeries, SeriesSearchMatch
+from fred_query.services.stage_timing import record_upstream_call, stage
 
 
 def _build_response() -> QueryResponse:
@@ -150,6 +152,30 @@ class CLITest(unittest.TestCase):
         self.assertEqual(exit_code, 0)
         self.assertIn("CPI or PCE", stdout.getvalue())
 
+    @patch("fred_query.cli.run_natural_language_query")
+    def test_ask_command_profile_prints_stage_table(self, mock_run_natural_language_query) -> None:
+        def run(_: object) -> RoutedQueryResponse:
+            with stage("ask"):
+                record_upstream_call()
+            return RoutedQueryResponse(
+                status=RoutedQueryStatus.NEEDS_CLARIFICATION,
+                intent=_build_response().intent,
+                answer_text="Do you mean CPI or PCE inflation?",
+            )
+
+        mock_run_natural_language_query.side_effect = run
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+
+        with redirect_stdout(stdout), patch.object(sys, "stderr", stderr):
+            exit_code = main(["ask", "Show me inflation.", "--profile"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("CPI or PCE", stdout.getvalue())
+        rows = {line.split()[0]: line.split() for line in stderr.getvalue().splitlines()[1:]}
+        self.assertEqual(set(rows), {"total", "ask"})
+        self.assertEqual(rows["ask"][-1], "1")
+
     @patch("fred_query.cli.run_natural_language_query")
     def test_ask_command_returns_hard_error(self, mock_run_natural_language_query) -> None:
         mock_run_natural_language_query.side_effect = RuntimeError("insufficient_quota")
@@ -162,6 +188,26 @@ class CLITest(unittest.TestCase):
         self.assertEqual(exit_code, 1)
         self.assertIn("natural-language parsing failed", stderr.getvalue())
 
+    def test_refresh_catalog_writes_snapshot(self) -> None:
+        match = SeriesSearchMatch(
+            series_id="UNRATE",
+            title="Unemployment Rate",
+            source_url="https://fred.stlouisfed.org/series/UNRATE",
+        )
+        upstream = MagicMock()
+        upstream.search_series.return_value = [match]
+        stdout = io.StringIO()
+
+        with TemporaryDirectory() as tmpdir:
+            catalog_path = Path(tmpdir) / "catalog.jsonl"
+            with redirect_stdout(stdout), patch("fred_query.cli._build_upstream_fred_client", return_value=upstream):
+                exit_code = main(["refresh-catalog", "unemployment rate", "--catalog", str(catalog_path), "--limit", "50"])
+
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(SeriesCatalog.load(catalog_path).get("UNRATE"), match)
+        upstream.search_series.assert_called_once_with("unemployment rate", limit=50)
+        self.assertIn("1 series total", stdout.getvalue())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import date
 import json
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
@@ -17,8 +19,10 @@ class CrossSectionServiceTest(unittest.TestCase):
         self,
         state_values: dict[str, tuple[str, float]] | None = None,
         observation_payloads_by_series: dict[str, list[dict[str, str]]] | None = None,
+        concurrency_probe: dict[str, int] | None = None,
     ) -> tuple[FREDClient, list[dict[str, str]]]:
         requests: list[dict[str, str]] = []
+        probe_lock = threading.Lock()
         state_values = state_values or {
             "CA": ("California", 5.0),
             "TX": ("Texas", 4.0),
@@ -49,6 +53,19 @@ class CrossSectionServiceTest(unittest.TestCase):
             }
 
         def handler(request: httpx.Request) -> httpx.Response:
+            if concurrency_probe is None:
+                return respond(request)
+            with probe_lock:
+                concurrency_probe["in_flight"] = concurrency_probe.get("in_flight", 0) + 1
+                concurrency_probe["peak"] = max(concurrency_probe.get("peak", 0), concurrency_probe["in_flight"])
+            try:
+                time.sleep(0.02)
+                return respond(request)
+            finally:
+                with probe_lock:
+                    concurrency_probe["in_flight"] -= 1
+
+        def respond(request: httpx.Request) -> httpx.Response:
             requests.append(dict(request.url.params))
             if request.url.path.endswith("/series"):
                 series_id = request.url.params["series_id"]
@@ -147,7 +164,8 @@ class CrossSectionServiceTest(unittest.TestCase):
         self.assertEqual(response.analysis.cross_section_summary.leader_label, "Nevada")
         self.assertIn("Nevada ranks highest", response.answer_text)
         observation_requests = [item for item in requests if item.get("series_id") in {"CAUR", "TXUR", "NVUR"} and item.get("sort_order") == "desc"]
-        self.assertEqual(len(observation_requests), 6)
+        # Every latest point already sits on the aligned snapshot date, so no second wave is needed.
+        self.assertEqual(len(observation_requests), 3)
         self.assertTrue(all(item.get("limit") == "1" for item in observation_requests))
         self.assertEqual(response.chart.to_plotly_dict()["data"][0]["type"], "bar")
 
@@ -255,6 +273,42 @@ class CrossSectionServiceTest(unittest.TestCase):
         )
         self.assertIn("Latest cross-section aligned on or before 2023-01-01", response.answer_text)
 
+    def test_state_fan_out_runs_concurrently_and_keeps_per_state_warnings(self) -> None:
+        observation_payloads = {
+            "CAUR": [{"date": "2024-01-01", "value": "5.0"}],
+            "TXUR": [{"date": "2024-01-01", "value": "4.0"}],
+            "NVUR": [{"date": "2030-01-01", "value": "6.5"}],
+        }
+        concurrency_probe: dict[str, int] = {}
+        client, _ = self._build_state_ranking_client(
+            observation_payloads_by_series=observation_payloads,
+            concurrency_probe=concurrency_probe,
+        )
+        service = CrossSectionService(client, max_concurrency=3)
+        intent = QueryIntent(
+            task_type=TaskType.CROSS_SECTION,
+            indicators=["unemployment rate"],
+            search_text="unemployment rate",
+            comparison_mode=ComparisonMode.CROSS_SECTION,
+            cross_section_scope=CrossSectionScope.STATES,
+        )
+
+        with patch.dict(
+            "fred_query.services.cross_section_service.STATE_CODE_TO_NAME",
+            {"CA": "California", "TX": "Texas", "NV": "Nevada"},
+            clear=True,
+        ):
+            response = service.analyze(intent)
+
+        self.assertGreater(concurrency_probe["peak"], 1)
+        self.assertLessEqual(concurrency_probe["peak"], 3)
+        self.assertEqual(response.intent.observation_date, date(2024, 1, 1))
+        self.assertEqual(
+            [result.series.geography for result in response.analysis.series_results],
+            ["California", "Texas"],
+        )
+        self.assertEqual(response.analysis.warnings, ["No observations returned for NVUR at 2024-01-01."])
+
 
 if __name__ == "__main__":
     unittest.main()
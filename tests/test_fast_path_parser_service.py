@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import date
+import unittest
+
+from fred_query.schemas.intent import CrossSectionScope, QueryIntent, TaskType, TransformType
+from fred_query.services.fast_path_parser_service import FastPathIntentParser
+
+
+class _RecordingParser:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, object] | None]] = []
+
+    def parse(self, query: str) -> QueryIntent:
+        self.calls.append((query, None))
+        return QueryIntent(task_type=TaskType.SINGLE_SERIES_LOOKUP, search_text=query, original_query=query)
+
+    def parse_with_context(self, query: str, context: dict[str, object]) -> QueryIntent:
+        self.calls.append((query, context))
+        return QueryIntent(task_type=TaskType.SINGLE_SERIES_LOOKUP, search_text=query, original_query=query)
+
+
+class FastPathIntentParserTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fallback = _RecordingParser()
+        self.parser = FastPathIntentParser(self.fallback)
+
+    def test_explicit_series_id_with_dates_and_transform(self) -> None:
+        intent = self.parser.parse("Plot the 12-month moving average of PAYEMS from 2010 to 2020")
+
+        self.assertEqual(self.fallback.calls, [])
+        self.assertEqual(intent.task_type, TaskType.SINGLE_SERIES_LOOKUP)
+        self.assertEqual(intent.series_id, "PAYEMS")
+        self.assertEqual(intent.transform, TransformType.ROLLING_AVERAGE)
+        self.assertEqual(intent.transform_window, 12)
+        self.assertEqual((intent.start_date, intent.end_date), (date(2010, 1, 1), date(2020, 12, 31)))
+        self.assertEqual(intent.original_query, "Plot the 12-month moving average of PAYEMS from 2010 to 2020")
+
+    def test_only_id_like_capitalized_words_are_taken_as_series_ids(self) -> None:
+        shouted = self.parser.parse("SHOW ME UNEMPLOYMENT")
+        index_name = self.parser.parse("show me NASDAQ since 2020")
+        with_digit = self.parser.parse("show GDPC1 since 2020")
+        state_series = self.parser.parse("CAUR yoy")
+
+        self.assertEqual([query for query, _ in self.fallback.calls], ["SHOW ME UNEMPLOYMENT", "show me NASDAQ since 2020"])
+        self.assertIsNone(shouted.series_id)
+        self.assertIsNone(index_name.series_id)
+        self.assertEqual(with_digit.series_id, "GDPC1")
+        self.assertEqual(state_series.series_id, "CAUR")
+
+    def test_state_ranking_uses_cross_section_defaults(self) -> None:
+        top = self.parser.parse("rank the top 5 states by unemployment rate")
+        bottom = self.parser.parse("Which states have the lowest unemployment rate?")
+
+        self.assertEqual(top.task_type, TaskType.CROSS_SECTION)
+        self.assertEqual(top.cross_section_scope, CrossSectionScope.STATES)
+        self.assertEqual(top.rank_limit, 5)
+        self.assertTrue(top.sort_descending)
+        self.assertEqual(top.search_text, "unemployment rate")
+        self.assertFalse(bottom.sort_descending)
+        self.assertIsNone(bottom.rank_limit)
+
+    def test_state_gdp_comparison_accepts_codes_and_names(self) -> None:
+        intent = self.parser.parse("compare CA and Texas GDP since 2019")
+
+        self.assertEqual(intent.task_type, TaskType.STATE_GDP_COMPARISON)
+        self.assertEqual([geography.name for geography in intent.geographies], ["California", "Texas"])
+        self.assertEqual(intent.start_date, date(2019, 1, 1))
+
+    def test_unrecognized_or_ambiguous_queries_fall_back(self) -> None:
+        for query in (
+            "show me unemployment since 2020",
+            "show GDP since 2015",
+            "UNRATE yoy and rolling volatility",
+            "compare california and california gdp",
+        ):
+            self.parser.parse(query)
+
+        self.parser.parse_with_context("show UNRATE instead", {"previous_query": "payrolls"})
+
+        self.assertEqual(len(self.fallback.calls), 5)
+        self.assertEqual(self.fallback.calls[-1][1], {"previous_query": "payrolls"})
+
+    def test_stats_report_hit_rate_and_latency_per_pattern(self) -> None:
+        self.parser.parse("show UNRATE since 2015")
+        self.parser.parse("UNRATE yoy")
+        self.parser.parse("top ten states by real gdp")
+        self.parser.parse("how is the labor market doing")
+
+        stats = self.parser.stats.to_dict()
+
+        self.assertEqual(stats["total"], 4)
+        self.assertEqual(stats["fast_path_hit_rate"], 0.75)
+        self.assertEqual(stats["patterns"]["series_id"]["hits"], 2)
+        self.assertEqual(stats["patterns"]["series_id"]["hit_rate"], 0.5)
+        self.assertEqual(stats["patterns"]["state_ranking"]["hits"], 1)
+        self.assertGreaterEqual(stats["patterns"]["state_ranking"]["avg_latency_ms"], 0.0)
+        self.assertEqual(stats["fallback"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
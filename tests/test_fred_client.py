@@ -1,71 +1,77 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 import json
+from threading import Event
+import time
 import unittest
 
 import httpx
 
-from fred_query.services.fred_client import FREDClient
+from fred_query.services.fred_client import FREDAPIError, FREDClient
+from fred_query.services.single_flight import SingleFlight
 
 
-class FREDClientTest(unittest.TestCase):
-    def _build_client(self) -> FREDClient:
-        def handler(request: httpx.Request) -> httpx.Response:
-            if request.url.path.endswith("/series/search"):
-                payload = {
-                    "seriess": [
-                        {
-                            "id": "CARGSP",
-                            "title": "Real GDP: California",
-                            "units_short": "Bil. of Chn. 2017 Dollars",
-                            "frequency_short": "A",
-                            "seasonal_adjustment_short": "NSA",
-                            "popularity": 88,
-                        }
-                    ]
+def _fixture_response(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/series/search"):
+        payload = {
+            "seriess": [
+                {
+                    "id": "CARGSP",
+                    "title": "Real GDP: California",
+                    "units_short": "Bil. of Chn. 2017 Dollars",
+                    "frequency_short": "A",
+                    "seasonal_adjustment_short": "NSA",
+                    "popularity": 88,
                 }
-            elif request.url.path.endswith("/series"):
-                payload = {
-                    "seriess": [
-                        {
-                            "id": "CARGSP",
-                            "title": "Real GDP: California",
-                            "units_short": "Bil. of Chn. 2017 Dollars",
-                            "frequency_short": "A",
-                            "seasonal_adjustment_short": "NSA",
-                            "notes": "Sample notes",
-                        }
-                    ]
+            ]
+        }
+    elif request.url.path.endswith("/series"):
+        payload = {
+            "seriess": [
+                {
+                    "id": "CARGSP",
+                    "title": "Real GDP: California",
+                    "units_short": "Bil. of Chn. 2017 Dollars",
+                    "frequency_short": "A",
+                    "seasonal_adjustment_short": "NSA",
+                    "notes": "Sample notes",
+                    "last_updated": "2024-03-29 07:51:02-05",
                 }
-            elif request.url.path.endswith("/series/observations"):
-                # Check if the request includes vintage dates parameter
-                if "vintage_dates" in request.url.params:
-                    # Handle the case where vintage dates are specified
-                    payload = {
-                        "observations": [
-                            {"date": "2010-01-01", "value": "100.0"},
-                            {"date": "2011-01-01", "value": "110.5"},
-                            {"date": "2012-01-01", "value": "125.0"},
-                        ]
-                    }
-                else:
-                    # Regular observations request (without vintage dates)
-                    payload = {
-                        "observations": [
-                            {"date": "2010-01-01", "value": "100.0"},
-                            {"date": "2011-01-01", "value": "."},
-                            {"date": "2012-01-01", "value": "125.0"},
-                        ]
-                    }
-            elif request.url.path.endswith("/series/vintagedates"):
-                payload = {"vintage_dates": ["2020-01-01", "2021-01-01"]}
-            else:
-                return httpx.Response(status_code=404, json={"error_message": "not found"})
-
-            return httpx.Response(status_code=200, text=json.dumps(payload))
-
-        transport = httpx.MockTransport(handler)
+            ]
+        }
+    elif request.url.path.endswith("/series/observations"):
+        # Check if the request includes vintage dates parameter
+        if "vintage_dates" in request.url.params:
+            # Handle the case where vintage dates are specified
+            payload = {
+                "observations": [
+                    {"date": "2010-01-01", "value": "100.0"},
+                    {"date": "2011-01-01", "value": "110.5"},
+                    {"date": "2012-01-01", "value": "125.0"},
+                ]
+            }
+        else:
+            # Regular observations request (without vintage dates)
+            payload = {
+                "observations": [
+                    {"date": "2010-01-01", "value": "100.0"},
+                    {"date": "2011-01-01", "value": "."},
+                    {"date": "2012-01-01", "value": "125.0"},
+                ]
+            }
+    elif request.url.path.endswith("/series/vintagedates"):
+        payload = {"vintage_dates": ["2020-01-01", "2021-01-01"]}
+    else:
+        return httpx.Response(status_code=404, json={"error_message": "not found"})
+
+    return httpx.Response(status_code=200, text=json.dumps(payload))
+
+
+class FREDClientTest(unittest.TestCase):
+    def _build_client(self) -> FREDClient:
+        transport = httpx.MockTransport(_fixture_response)
         http_client = httpx.Client(base_url="https://example.test/fred", transport=transport)
         return FREDClient(api_key="test-key", base_url="https://example.test/fred", http_client=http_client)
 
@@ -86,6 +92,10 @@ class FREDClientTest(unittest.TestCase):
 
         self.assertEqual(matches[0].series_id, "CARGSP")
         self.assertEqual(metadata.title, "Real GDP: California")
+        self.assertEqual(
+            metadata.last_updated,
+            datetime(2024, 3, 29, 7, 51, 2, tzinfo=timezone(timedelta(hours=-5))),
+        )
         self.assertEqual(len(observations), 2)
         self.assertEqual(observations[-1].value, 125.0)
         self.assertEqual(vintage_dates[-1], date(2021, 1, 1))
@@ -93,5 +103,72 @@ class FREDClientTest(unittest.TestCase):
         self.assertEqual(vintage_obs[0].value, 100.0)
 
 
+class SingleFlightFREDClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.release = Event()
+        self.upstream_paths: list[str] = []
+        self.status_code = 200
+
+    def _blocking_response(self, request: httpx.Request) -> httpx.Response:
+        self.upstream_paths.append(request.url.path)
+        self.release.wait(timeout=5)
+        if self.status_code != 200:
+            return httpx.Response(status_code=self.status_code, json={"error_message": "busy"})
+        return _fixture_response(request)
+
+    def _build_client(self, single_flight: SingleFlight) -> FREDClient:
+        http_client = httpx.Client(
+            base_url="https://example.test/fred",
+            transport=httpx.MockTransport(self._blocking_response),
+        )
+        return FREDClient(
+            api_key="test-key",
+            base_url="https://example.test/fred",
+            max_retries=0,
+            http_client=http_client,
+            single_flight=single_flight,
+        )
+
+    def _wait_for_coalesced(self, single_flight: SingleFlight, count: int) -> None:
+        deadline = time.monotonic() + 5
+        while single_flight.stats().coalesced < count and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def test_identical_concurrent_requests_share_one_upstream_call(self) -> None:
+        single_flight = SingleFlight()
+        clients = [self._build_client(single_flight) for _ in range(5)]
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            metadata_futures = [executor.submit(client.get_series_metadata, "CARGSP") for client in clients]
+            observation_future = executor.submit(clients[0].get_series_observations, "CARGSP")
+            self._wait_for_coalesced(single_flight, 4)
+            self.release.set()
+            metadata = [future.result() for future in metadata_futures]
+            observations = observation_future.result()
+
+        self.assertEqual(sorted(self.upstream_paths), ["/fred/series", "/fred/series/observations"])
+        self.assertEqual({item.title for item in metadata}, {"Real GDP: California"})
+        self.assertEqual(len(observations), 2)
+        self.assertEqual(single_flight.stats().to_dict(), {"executed": 2, "coalesced": 4, "in_flight": 0})
+
+        clients[0].get_series_metadata("CARGSP")
+        self.assertEqual(len(self.upstream_paths), 3)
+
+    def test_upstream_failure_is_shared_by_waiting_callers(self) -> None:
+        single_flight = SingleFlight()
+        client = self._build_client(single_flight)
+        self.status_code = 503
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(client.get_series_metadata, "CARGSP") for _ in range(3)]
+            self._wait_for_coalesced(single_flight, 2)
+            self.release.set()
+            for future in futures:
+                with self.assertRaises(FREDAPIError):
+                    future.result()
+
+        self.assertEqual(len(self.upstream_paths), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
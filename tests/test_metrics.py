@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import unittest
+
+from fastapi.testclient import TestClient
+import httpx
+
+from fred_query.api.app import app, get_app_settings, get_natural_language_query_service
+from fred_query.config import Settings
+from fred_query.schemas.analysis import RoutedQueryReason, RoutedQueryStatus
+from fred_query.schemas.intent import QueryIntent, TaskType
+from fred_query.services.fred_client import FREDClient
+from fred_query.services.metrics import FRED_REQUEST_RETRIES, FRED_REQUESTS, MetricsRegistry, _Metric
+from fred_query.services.natural_language_query_service import NaturalLanguageQueryService
+
+
+class _ClarifyingParser:
+    def parse(self, query: str) -> QueryIntent:
+        return QueryIntent(
+            task_type=TaskType.SINGLE_SERIES_LOOKUP,
+            original_query=query,
+            search_text="inflation",
+            clarification_needed=True,
+        )
+
+    def parse_with_context(self, query: str, context: dict[str, object]) -> QueryIntent:
+        return self.parse(query)
+
+
+class _NoMatchFREDClient:
+    def search_series(self, *args: object, **kwargs: object) -> list[object]:
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def test_render_uses_prometheus_text_format(self) -> None:
+        registry = MetricsRegistry()
+        requests = registry.counter("demo_requests_total", "Requests.", ("endpoint",))
+        latency = registry.histogram("demo_seconds", "Latency.", buckets=(0.1, 1.0))
+
+        requests.inc(endpoint="series")
+        requests.inc(2, endpoint='say "hi"')
+        latency.observe(0.05)
+        latency.observe(0.1)
+        latency.observe(3.0)
+
+        self.assertIs(registry.counter("demo_requests_total", "Requests.", ("endpoint",)), requests)
+        self.assertEqual(
+            registry.render(),
+            "\n".join(
+                [
+                    "# HELP demo_requests_total Requests.",
+                    "# TYPE demo_requests_total counter",
+                    'demo_requests_total{endpoint="say \\"hi\\""} 2',
+                    'demo_requests_total{endpoint="series"} 1',
+                    "# HELP demo_seconds Latency.",
+                    "# TYPE demo_seconds histogram",
+                    'demo_seconds_bucket{le="0.1"} 2',
+                    'demo_seconds_bucket{le="1"} 2',
+                    'demo_seconds_bucket{le="+Inf"} 3',
+                    "demo_seconds_sum 3.15",
+                    "demo_seconds_count 3",
+                ]
+            )
+            + "\n",
+        )
+        with self.assertRaises(ValueError):
+            requests.inc(status="200")
+
+    def test_metric_types_must_render_their_samples(self) -> None:
+        class Unrendered(_Metric):
+            kind = "gauge"
+
+        with self.assertRaises(TypeError):
+            Unrendered("demo_unrendered", "Never rendered.")
+
+    def test_fred_client_counts_requests_by_status_and_retries(self) -> None:
+        endpoint = "series/metrics-test"
+        responses = iter([httpx.Response(503), httpx.Response(200, json={"seriess": []})])
+        client = FREDClient(
+            api_key="test",
+            http_client=httpx.Client(
+                base_url="https://fred.example/fred",
+                transport=httpx.MockTransport(lambda request: next(responses)),
+            ),
+        )
+        before_retries = FRED_REQUEST_RETRIES.value(endpoint=endpoint)
+
+        client._request(endpoint, {"series_id": "UNRATE"})
+
+        self.assertEqual(FRED_REQUESTS.value(endpoint=endpoint, status="503"), 1)
+        self.assertEqual(FRED_REQUESTS.value(endpoint=endpoint, status="200"), 1)
+        self.assertEqual(FRED_REQUEST_RETRIES.value(endpoint=endpoint) - before_retries, 1)
+
+
+class MetricsEndpointTest(unittest.TestCase):
+    def setUp(self) -> None:
+        app.dependency_overrides.clear()
+        app.dependency_overrides[get_app_settings] = lambda: Settings(
+            fred_api_key="test-fred-key",
+            openai_api_key="test-openai-key",
+        )
+        self.client = TestClient(app)
+
+    def tearDown(self) -> None:
+        app.dependency_overrides.clear()
+
+    def test_metrics_exposes_routes_sessions_and_component_stats(self) -> None:
+        app.dependency_overrides[get_natural_language_query_service] = lambda: NaturalLanguageQueryService(
+            parser=_ClarifyingParser(),
+            fred_client=_NoMatchFREDClient(),
+        )
+
+        self.client.post("/api/ask", json={"query": "Show me inflation"})
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        body = response.text
+        status = RoutedQueryStatus.NEEDS_CLARIFICATION.value
+        reason = RoutedQueryReason.AMBIGUOUS_SERIES.value
+        self.assertRegex(body, rf'fred_query_routed_queries_total{{status="{status}",reason="{reason}"}} \d+')
+        self.assertRegex(body, r"\nfred_query_sessions [1-9]\d*\n")
+        self.assertRegex(body, r"\nfred_query_session_turns_total [1-9]\d*\n")
+        self.assertIn('fred_query_single_flight_calls_total{outcome="coalesced"}', body)
+        self.assertIn('fred_query_fast_path_parses_total{pattern="fallback"}', body)
+        self.assertIn("# TYPE fred_query_fred_request_duration_seconds histogram", body)
+
+
+if __name__ == "__main__":
+    unittest.main()
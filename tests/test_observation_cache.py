@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+from fred_query.cache import (
+    CachingFREDClient,
+    FreshnessPolicy,
+    ObservationCacheKey,
+    ObservationSpan,
+    ObservationStore,
+    ReleaseCalendar,
+)
+from fred_query.schemas.analysis import ObservationPoint
+from fred_query.schemas.resolved_series import SeriesMetadata
+
+
+class _MonthlyFREDClient:
+    """Serves a monthly series from 1990-01 through 2024-06 and records each request."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, date | None, date | None, str | None, int | None]] = []
+        self.metadata_requests: list[str] = []
+        self.last_updated = datetime(2024, 7, 5, 12, 0, tzinfo=timezone.utc)
+        self.observations = [
+            ObservationPoint(date=date(year, month, 1), value=float(year * 100 + month))
+            for year in range(1990, 2025)
+            for month in range(1, 13)
+            if date(year, month, 1) <= date(2024, 6, 1)
+        ]
+
+    def close(self) -> None:
+        return None
+
+    def get_series_metadata(self, series_id: str) -> SeriesMetadata:
+        self.metadata_requests.append(series_id)
+        return SeriesMetadata(
+            series_id=series_id,
+            title="Unemployment Rate",
+            units="Percent",
+            frequency="Monthly",
+            last_updated=self.last_updated,
+            source_url=f"https://fred.stlouisfed.org/series/{series_id}",
+        )
+
+    def get_series_observations(
+        self,
+        series_id: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        *,
+        frequency: str | None = None,
+        aggregation_method: str | None = None,
+        limit: int | None = None,
+        sort_order: str | None = None,
+    ) -> list[ObservationPoint]:
+        self.requests.append((series_id, start_date, end_date, frequency, limit))
+        observations = [
+            point
+            for point in self.observations
+            if (start_date is None or point.date >= start_date) and (end_date is None or point.date <= end_date)
+        ]
+        if sort_order == "desc":
+            observations = list(reversed(observations))
+        if limit is not None:
+            observations = observations[:limit]
+        return observations
+
+
+class ObservationCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2024, 7, 15, 9, 0, tzinfo=timezone.utc)
+
+    def _build_client(self, store: ObservationStore | None = None) -> tuple[CachingFREDClient, _MonthlyFREDClient]:
+        upstream = _MonthlyFREDClient()
+        client = CachingFREDClient(upstream, store or ObservationStore(), clock=lambda: self.now)
+        return client, upstream
+
+    def test_repeat_settled_range_is_served_locally(self) -> None:
+        client, upstream = self._build_client()
+
+        first = client.get_series_observations("UNRATE", start_date=date(2015, 1, 1), end_date=date(2019, 12, 31))
+        second = client.get_series_observations("UNRATE", start_date=date(2016, 1, 1), end_date=date(2018, 12, 31))
+
+        self.assertEqual(len(first), 60)
+        self.assertEqual([point.date for point in second], [point.date for point in first[12:48]])
+        self.assertEqual(len(upstream.requests), 1)
+
+    def test_extending_back_fetches_only_the_missing_head(self) -> None:
+        client, upstream = self._build_client()
+
+        client.get_series_observations("UNRATE", start_date=date(2020, 1, 1))
+        extended = client.get_series_observations("UNRATE", start_date=date(2000, 1, 1))
+
+        self.assertEqual(extended[0].date, date(2000, 1, 1))
+        self.assertEqual(extended[-1].date, date(2024, 6, 1))
+        self.assertEqual(
+            upstream.requests,
+            [
+                ("UNRATE", date(2020, 1, 1), None, None, None),
+                ("UNRATE", date(2000, 1, 1), date(2019, 12, 31), None, None),
+            ],
+        )
+
+    def test_recent_bounded_range_fetches_the_tail_for_an_open_request(self) -> None:
+        client, upstream = self._build_client()
+
+        bounded = client.get_series_observations("UNRATE", start_date=date(2024, 1, 1), end_date=date(2024, 3, 31))
+        unbounded = client.get_series_observations("UNRATE", start_date=date(2024, 1, 1))
+        repeated = client.get_series_observations("UNRATE", start_date=date(2024, 1, 1))
+
+        self.assertEqual(bounded[-1].date, date(2024, 3, 1))
+        self.assertEqual(unbounded[-1].date, date(2024, 6, 1))
+        self.assertEqual(repeated, unbounded)
+        self.assertEqual(
+            upstream.requests,
+            [
+                ("UNRATE", date(2024, 1, 1), date(2024, 3, 31), None, None),
+                ("UNRATE", date(2024, 4, 1), None, None, None),
+            ],
+        )
+
+    def test_fresh_open_tail_is_served_without_upstream_calls(self) -> None:
+        client, upstream = self._build_client()
+        client.get_series_metadata("UNRATE")
+        client.get_series_observations("UNRATE", start_date=date(2024, 1, 1))
+
+        self.now += timedelta(days=2)
+        repeated = client.get_series_observations("UNRATE", start_date=date(2024, 1, 1))
+        client.get_series_metadata("UNRATE")
+
+        self.assertEqual(repeated[-1].date, date(2024, 6, 1))
+        self.assertEqual(len(upstream.requests), 1)
+        self.assertEqual(upstream.metadata_requests, ["UNRATE"])
+
+    def test_stale_span_with_unchanged_last_updated_is_revalidated_not_refetched(self) -> None:
+        client, upstream = self._build_client()
+        client.get_series_observations("UNRATE", start_date=date(2024, 1, 1))
+
+        self.now += timedelta(days=5)
+        client.get_series_observations("UNRATE", start_date=date(2024, 1, 1))
+
+        self.assertEqual(len(upstream.requests), 1)
+        self.assertEqual(upstream.metadata_requests, ["UNRATE", "UNRATE"])
+
+    def test_stale_span_refetches_when_series_was_updated(self) -> None:
+        client, upstream = self._build_client()
+        client.get_series_observations("UNRATE", start_date=date(2024, 1, 1))
+
+        self.now += timedelta(days=5)
+        upstream.last_updated = datetime(2024, 7, 19, 12, 0, tzinfo=timezone.utc)
+        upstream.observations[-1] = ObservationPoint(date=date(2024, 6, 1), value=4.0)
+        upstream.observations.append(ObservationPoint(date=date(2024, 7, 1), value=4.1))
+        refreshed = client.get_series_observations("UNRATE", start_date=date(2024, 1, 1))
+
+        self.assertEqual(len(upstream.requests), 2)
+        self.assertEqual([point.value for point in refreshed[-2:]], [4.0, 4.1])
+
+    def test_spans_persist_across_store_instances(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            client, _ = self._build_client(ObservationStore(Path(tmpdir)))
+            client.get_series_observations("UNRATE", start_date=date(2010, 1, 1), end_date=date(2012, 12, 31))
+
+            reloaded_client, upstream = self._build_client(ObservationStore(Path(tmpdir)))
+            observations = reloaded_client.get_series_observations(
+                "UNRATE",
+                start_date=date(2011, 1, 1),
+                end_date=date(2011, 12, 31),
+                sort_order="desc",
+            )
+
+            self.assertEqual(upstream.requests, [])
+            self.assertEqual(observations[0].date, date(2011, 12, 1))
+            self.assertTrue((Path(tmpdir) / f"{ObservationCacheKey('UNRATE').file_stem()}.json").exists())
+
+    def test_memory_holds_only_the_most_recent_spans_in_front_of_disk(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            store = ObservationStore(Path(tmpdir), max_entries=1)
+            span = ObservationSpan(covered_start=date(2024, 1, 1), covered_end=date(2024, 1, 31))
+            unrate, payems = ObservationCacheKey("UNRATE"), ObservationCacheKey("PAYEMS")
+            store.put(unrate, span)
+            store.put(payems, span)
+
+            # UNRATE was evicted from memory, so losing its file loses it; PAYEMS is still held in memory.
+            (Path(tmpdir) / f"{unrate.file_stem()}.json").unlink()
+            (Path(tmpdir) / f"{payems.file_stem()}.json").unlink()
+
+            self.assertEqual(store.get(payems), span)
+            self.assertIsNone(store.get(unrate))
+
+    def test_limit_requests_bypass_the_cache(self) -> None:
+        client, upstream = self._build_client()
+
+        latest = client.get_series_observations("UNRATE", limit=1, sort_order="desc")
+        client.get_series_observations("UNRATE", limit=1, sort_order="desc")
+
+        self.assertEqual(latest[0].date, date(2024, 6, 1))
+        self.assertEqual(len(upstream.requests), 2)
+
+    def test_aggregated_requests_refetch_the_union_range(self) -> None:
+        client, upstream = self._build_client()
+
+        client.get_series_observations("UNRATE", start_date=date(2018, 1, 1), end_date=date(2019, 12, 31), frequency="q")
+        client.get_series_observations("UNRATE", start_date=date(2015, 1, 1), end_date=date(2019, 12, 31), frequency="q")
+
+        self.assertEqual(upstream.requests[-1], ("UNRATE", date(2015, 1, 1), date(2019, 12, 31), "q", None))
+
+
+class FreshnessPolicyTest(unittest.TestCase):
+    @staticmethod
+    def _metadata(series_id: str, frequency: str, last_updated: datetime | None) -> SeriesMetadata:
+        return SeriesMetadata(
+            series_id=series_id,
+            title=series_id,
+            units="Percent",
+            frequency=frequency,
+            last_updated=last_updated,
+            source_url=f"https://fred.stlouisfed.org/series/{series_id}",
+        )
+
+    def test_daily_series_expire_on_the_next_business_day(self) -> None:
+        friday_update = datetime(2024, 7, 12, 21, 0, tzinfo=timezone.utc)
+        expires_at = FreshnessPolicy().expires_at(
+            self._metadata("DGS10", "Daily", friday_update),
+            fetched_at=datetime(2024, 7, 13, 8, 0, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(expires_at, datetime(2024, 7, 14, 8, 0, tzinfo=timezone.utc))
+        self.assertEqual(
+            FreshnessPolicy.next_expected_update("Daily", friday_update),
+            datetime(2024, 7, 15, 21, 0, tzinfo=timezone.utc),
+        )
+
+    def test_annual_series_are_capped_and_overdue_series_retry_soon(self) -> None:
+        fetched_at = datetime(2024, 7, 15, tzinfo=timezone.utc)
+        policy = FreshnessPolicy()
+
+        recent = policy.expires_at(
+            self._metadata("CARGSP", "Annual", datetime(2024, 6, 28, tzinfo=timezone.utc)),
+            fetched_at=fetched_at,
+        )
+        overdue = policy.expires_at(
+            self._metadata("CARGSP", "Annual", datetime(2023, 6, 28, tzinfo=timezone.utc)),
+            fetched_at=fetched_at,
+        )
+
+        self.assertEqual(recent, fetched_at + timedelta(days=7))
+        self.assertEqual(overdue, fetched_at + timedelta(hours=1))
+
+    def test_release_calendar_sets_expiry_for_matching_patterns(self) -> None:
+        calendar = ReleaseCalendar({"*RGSP": [date(2024, 7, 17), date(2024, 9, 27)]})
+        expires_at = FreshnessPolicy(release_calendar=calendar).expires_at(
+            self._metadata("TXRGSP", "Annual", None),
+            fetched_at=datetime(2024, 7, 15, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(expires_at, datetime(2024, 7, 17, tzinfo=timezone.utc))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import date
+import unittest
+
+from fred_query.schemas.analysis import ObservationPoint, SeriesAnalysis
+from fred_query.schemas.observation_series import ObservationSeries
+from fred_query.schemas.resolved_series import ResolvedSeries
+
+
+class ObservationSeriesTest(unittest.TestCase):
+    def test_from_fred_observations_drops_missing_values(self) -> None:
+        series = ObservationSeries.from_fred_observations(
+            [
+                {"date": "2024-01-01", "value": "3.7"},
+                {"date": "2024-02-01", "value": "."},
+                {"date": "2024-03-01", "value": "3.9"},
+            ]
+        )
+
+        self.assertEqual(len(series), 2)
+        self.assertEqual(series[0], ObservationPoint(date=date(2024, 1, 1), value=3.7))
+        self.assertEqual(series[-1].date, date(2024, 3, 1))
+
+    def test_between_and_slices_return_series(self) -> None:
+        series = ObservationSeries(
+            [f"2024-{month:02d}-01" for month in range(1, 7)],
+            [float(month) for month in range(1, 7)],
+        )
+
+        window = series.between(date(2024, 2, 15), date(2024, 5, 1))
+
+        self.assertIsInstance(window, ObservationSeries)
+        self.assertEqual(window.values.tolist(), [3.0, 4.0, 5.0])
+        self.assertEqual(series[::-1].values.tolist(), [6.0, 5.0, 4.0, 3.0, 2.0, 1.0])
+        self.assertEqual(len(series.between(date(2025, 1, 1))), 0)
+
+    def test_round_trips_and_compares_with_point_lists(self) -> None:
+        points = [ObservationPoint(date=date(2024, month, 1), value=month * 1.5) for month in range(1, 4)]
+
+        series = ObservationSeries.coerce(points)
+
+        self.assertEqual(series, points)
+        self.assertIs(ObservationSeries.coerce(series), series)
+        self.assertEqual(series.to_points(), points)
+        with self.assertRaises(ValueError):
+            ObservationSeries(["2024-01-01"], [1.0, 2.0])
+
+    def test_series_analysis_materializes_points(self) -> None:
+        series = ObservationSeries(["2024-01-01", "2024-02-01"], [1.0, 2.0])
+
+        analysis = SeriesAnalysis(
+            series=ResolvedSeries(
+                series_id="UNRATE",
+                title="Unemployment Rate",
+                geography="United States",
+                indicator="unemployment_rate",
+                units="Percent",
+                frequency="Monthly",
+                resolution_reason="test",
+                source_url="https://fred.stlouisfed.org/series/UNRATE",
+            ),
+            observations=series,
+            transformed_observations=series[1:],
+        )
+
+        self.assertEqual(analysis.observations, series.to_points())
+        self.assertIsInstance(analysis.observations, list)
+        self.assertEqual(analysis.model_dump(mode="json")["transformed_observations"], [{"date": "2024-02-01", "value": 2.0}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from types import SimpleNamespace
 import unittest
 
+from fred_query.cache import IntentParseCache
 from fred_query.schemas.intent import (
     ComparisonMode,
     CrossSectionScope,
@@ -23,9 +26,11 @@ class _FakeResponsesAPI:
     def __init__(self, intent: QueryIntent) -> None:
         self.intent = intent
         self.last_kwargs: dict[str, object] | None = None
+        self.calls = 0
 
     def parse(self, **_: object) -> object:
         self.last_kwargs = _
+        self.calls += 1
         return SimpleNamespace(output_parsed=self.intent)
 
 
@@ -181,5 +186,91 @@ class OpenAIIntentParserTest(unittest.TestCase):
         self.assertNotIn("reasoning", client.responses.last_kwargs or {})
 
 
+class IntentParseCacheTest(unittest.TestCase):
+    @staticmethod
+    def _unemployment_intent() -> QueryIntent:
+        return QueryIntent(
+            task_type=TaskType.SINGLE_SERIES_LOOKUP,
+            search_text="unemployment rate",
+            start_date=date(2020, 1, 1),
+        )
+
+    def test_repeated_queries_are_served_from_cache(self) -> None:
+        client = _FakeOpenAIClient(self._unemployment_intent())
+        parser = OpenAIIntentParser(api_key="test-key", client=client, cache=IntentParseCache())
+
+        first = parser.parse("Show me the unemployment rate since 2020")
+        first.search_text = "mutated downstream"
+        second = parser.parse("  show me the Unemployment Rate since 2020? ")
+
+        self.assertEqual(client.responses.calls, 1)
+        self.assertEqual(second.search_text, "unemployment rate")
+        self.assertEqual(second.original_query, "  show me the Unemployment Rate since 2020? ")
+        stats = parser.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_cache_key_includes_model_and_follow_up_context(self) -> None:
+        cache = IntentParseCache()
+        client = _FakeOpenAIClient(self._unemployment_intent())
+        parser = OpenAIIntentParser(api_key="test-key", client=client, cache=cache)
+        other_model = OpenAIIntentParser(api_key="test-key", model="gpt-5.4", client=client, cache=cache)
+
+        parser.parse("make that yoy")
+        parser.parse_with_context("make that yoy", {"previous_query": "unemployment rate"})
+        parser.parse_with_context("make that yoy", {"previous_query": "payrolls"})
+        other_model.parse("make that yoy")
+        parser.parse_with_context("make that yoy", {"previous_query": "payrolls"})
+
+        self.assertEqual(client.responses.calls, 4)
+        self.assertEqual(cache.stats().hits, 1)
+
+    def test_disk_cache_survives_new_instances_and_evicts_in_memory(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            client = _FakeOpenAIClient(self._unemployment_intent())
+            parser = OpenAIIntentParser(
+                api_key="test-key",
+                client=client,
+                cache=IntentParseCache(max_entries=1, directory=tmpdir),
+            )
+            parser.parse("unemployment rate")
+            parser.parse("inflation")
+
+            reloaded = OpenAIIntentParser(
+                api_key="test-key",
+                client=client,
+                cache=IntentParseCache(max_entries=1, directory=tmpdir),
+            )
+            reloaded.parse("Unemployment rate")
+
+            self.assertEqual(client.responses.calls, 2)
+            self.assertEqual(parser.cache.stats().size, 1)
+
+    def test_entries_expire_and_keys_roll_over_with_the_date(self) -> None:
+        now = datetime(2024, 6, 1, 9, 0, tzinfo=timezone.utc)
+        with TemporaryDirectory() as tmpdir:
+            client = _FakeOpenAIClient(self._unemployment_intent())
+            cache = IntentParseCache(directory=tmpdir, ttl=timedelta(hours=6), clock=lambda: now)
+            parser = OpenAIIntentParser(api_key="test-key", client=client, cache=cache)
+
+            parser.parse("unemployment over the past 5 years")
+            now += timedelta(hours=5)
+            parser.parse("unemployment over the past 5 years")
+            now += timedelta(hours=1)
+            reloaded = OpenAIIntentParser(
+                api_key="test-key",
+                client=client,
+                cache=IntentParseCache(directory=tmpdir, ttl=timedelta(hours=6), clock=lambda: now),
+            )
+            reloaded.parse("unemployment over the past 5 years")
+            now += timedelta(hours=10)
+            reloaded.parse("unemployment over the past 5 years")
+
+            # Hit, then expired on disk, then a new day's key.
+            self.assertEqual(client.responses.calls, 3)
+            self.assertEqual(reloaded.cache.stats().hits, 0)
+            self.assertEqual(len(list(Path(tmpdir).glob("*.json"))), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+import unittest
+
+from fred_query.schemas.analysis import (
+    AnalysisResult,
+    ObservationPoint,
+    QueryResponse,
+    RoutedQueryResponse,
+    RoutedQueryStatus,
+    SeriesAnalysis,
+)
+from fred_query.schemas.chart import AxisSpec, ChartSpec, ChartTrace
+from fred_query.schemas.intent import QueryIntent, TaskType
+from fred_query.schemas.resolved_series import ResolvedSeries
+from fred_query.services.query_session_service import QuerySessionService, estimate_response_bytes
+
+
+def _routed_response(points: int = 120) -> RoutedQueryResponse:
+    observations = [
+        ObservationPoint(date=date(2000, 1, 1) + timedelta(days=31 * index), value=float(index))
+        for index in range(points)
+    ]
+    intent = QueryIntent(task_type=TaskType.SINGLE_SERIES_LOOKUP, series_id="UNRATE")
+    query_response = QueryResponse(
+        intent=intent,
+        analysis=AnalysisResult(
+            series_results=[
+                SeriesAnalysis(
+                    series=ResolvedSeries(
+                        series_id="UNRATE",
+                        title="Unemployment Rate",
+                        geography="United States",
+                        indicator="unemployment_rate",
+                        units="Percent",
+                        frequency="M",
+                        resolution_reason="fixture",
+                        source_url="https://fred.stlouisfed.org/series/UNRATE",
+                    ),
+                    observations=observations,
+                )
+            ]
+        ),
+        chart=ChartSpec(
+            title="Unemployment Rate",
+            x_axis=AxisSpec(title="Date"),
+            y_axis=AxisSpec(title="Percent"),
+            series=[
+                ChartTrace(
+                    name="UNRATE",
+                    x=[point.date for point in observations],
+                    y=[point.value for point in observations],
+                )
+            ],
+            source_note="Source: FRED",
+        ),
+        answer_text="Unemployment is fixture-high.",
+    )
+    return RoutedQueryResponse(
+        status=RoutedQueryStatus.COMPLETED,
+        intent=intent,
+        answer_text=query_response.answer_text,
+        query_response=query_response,
+    )
+
+
+class QuerySessionServiceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def _service(self, **kwargs: object) -> QuerySessionService:
+        return QuerySessionService(clock=lambda: self.now, **kwargs)
+
+    def test_old_revisions_are_compacted_then_dropped(self) -> None:
+        service = self._service(max_revisions=3, full_revisions=2)
+        revisions = [
+            service.store_turn(session_id="s1", query=f"turn {index}", response=_routed_response())[1]
+            for index in range(4)
+        ]
+
+        session = service.get_or_create("s1")
+        self.assertEqual([item.query for item in session.revisions], ["turn 1", "turn 2", "turn 3"])
+        self.assertEqual([item.compacted for item in session.revisions], [True, False, False])
+        with self.assertRaisesRegex(ValueError, "Unknown revision_id"):
+            service.get_context(session_id="s1", revision_id=revisions[0].revision_id)
+
+        compacted = service.get_context(session_id="s1", revision_id=revisions[1].revision_id).last_response
+        self.assertEqual(compacted.query_response.intent.series_id, "UNRATE")
+        self.assertEqual(compacted.query_response.analysis.series_results[0].series.series_id, "UNRATE")
+        self.assertEqual(compacted.query_response.analysis.series_results[0].observations, [])
+        self.assertEqual(compacted.query_response.chart.series, [])
+        self.assertEqual(compacted.answer_text, "Unemployment is fixture-high.")
+
+        full = service.get_context(session_id="s1", revision_id=revisions[3].revision_id).last_response
+        self.assertEqual(len(full.query_response.analysis.series_results[0].observations), 120)
+        self.assertEqual(
+            service.estimated_bytes(),
+            estimate_response_bytes(compacted) + 2 * estimate_response_bytes(_routed_response()),
+        )
+
+    def test_revision_lookup_only_waits_on_its_own_session(self) -> None:
+        service = self._service()
+        _, revision_a = service.store_turn(session_id="a", query="qa", response=_routed_response(8))
+        _, revision_b = service.store_turn(session_id="b", query="qb", response=_routed_response(8))
+        self.assertIs(service._sessions["a"].revision_index[revision_a.revision_id], revision_a)
+
+        with service._sessions["a"].lock:
+            context = service.get_context(session_id="b", revision_id=revision_b.revision_id)
+            service.store_turn(session_id="b", query="qb2", response=_routed_response(8))
+
+        self.assertEqual(context.last_query, "qb")
+        self.assertEqual(len(service.get_or_create("b").revision_index), 2)
+
+    def test_idle_sessions_expire(self) -> None:
+        service = self._service(idle_ttl=timedelta(minutes=30))
+        service.store_turn(session_id="idle", query="q", response=_routed_response())
+        self.now += timedelta(minutes=20)
+        service.get_or_create("active")
+        self.now += timedelta(minutes=15)
+
+        service.get_or_create("active")
+
+        self.assertEqual(service.session_count(), 1)
+        self.assertEqual(service.estimated_bytes(), 0)
+        self.assertEqual(service.get_or_create("idle").revisions, [])
+
+    def test_least_recently_used_sessions_are_evicted_at_capacity(self) -> None:
+        service = self._service(max_sessions=2)
+        service.get_or_create("a")
+        service.get_or_create("b")
+        service.get_context(session_id="a")
+
+        service.get_or_create("c")
+
+        self.assertEqual(list(service._sessions), ["a", "c"])
+
+    def test_memory_budget_evicts_oldest_sessions_but_keeps_the_current_one(self) -> None:
+        per_response = estimate_response_bytes(_routed_response())
+        service = self._service(memory_budget_bytes=int(per_response * 2.5))
+        for session_id in ("a", "b", "c"):
+            service.store_turn(session_id=session_id, query="q", response=_routed_response())
+
+        self.assertEqual(list(service._sessions), ["b", "c"])
+
+        service.store_turn(session_id="big", query="q", response=_routed_response(points=2000))
+
+        self.assertEqual(list(service._sessions), ["big"])
+        self.assertEqual(len(service.get_or_create("big").revisions), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+import time
+import unittest
+
+from fred_query.schemas.analysis import ObservationPoint
+from fred_query.schemas.chart import DateSpanAnnotation
+from fred_query.services.operators import FetchRecessionPeriodsOp
+from fred_query.services.recession_index import RecessionIndex
+from fred_query.services.transform_service import TransformService
+
+
+def _monthly_usrec(recession_months: set[tuple[int, int]]) -> list[ObservationPoint]:
+    return [
+        ObservationPoint(date=date(year, month, 1), value=1.0 if (year, month) in recession_months else 0.0)
+        for year in range(2000, 2022)
+        for month in range(1, 13)
+    ]
+
+
+class _USRECClient:
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, date | None, date | None]] = []
+
+    def get_series_observations(
+        self,
+        series_id: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        **_: object,
+    ) -> list[ObservationPoint]:
+        self.requests.append((series_id, start_date, end_date))
+        recession_months = {(2001, month) for month in range(4, 12)}
+        recession_months |= {(2008, month) for month in range(1, 13)} | {(2009, month) for month in range(1, 7)}
+        recession_months |= {(2020, 3), (2020, 4)}
+        return _monthly_usrec(recession_months)
+
+
+class RecessionIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.client = _USRECClient()
+        self.index = RecessionIndex(refresh_interval=timedelta(hours=12), clock=lambda: self.now)
+
+    def test_unloaded_index_defers_to_callers(self) -> None:
+        self.assertFalse(self.index.is_loaded)
+        self.assertTrue(self.index.is_stale())
+        self.assertIsNone(self.index.overlapping(date(2000, 1, 1), date(2020, 1, 1)))
+
+    def test_overlapping_returns_sorted_clipped_spans(self) -> None:
+        self.index.refresh(self.client)
+
+        self.assertEqual(self.client.requests, [("USREC", None, None)])
+        everything = self.index.overlapping(None, None)
+        self.assertEqual(
+            [(span.start_date, span.end_date) for span in everything or []],
+            [
+                (date(2001, 4, 1), date(2001, 11, 1)),
+                (date(2008, 1, 1), date(2009, 6, 1)),
+                (date(2020, 3, 1), date(2020, 4, 1)),
+            ],
+        )
+
+        window = self.index.overlapping(date(2009, 1, 15), date(2020, 3, 15))
+        self.assertEqual(
+            [(span.start_date, span.end_date) for span in window or []],
+            [(date(2009, 1, 15), date(2009, 6, 1)), (date(2020, 3, 1), date(2020, 3, 15))],
+        )
+        self.assertEqual(self.index.overlapping(date(2010, 1, 1), date(2019, 12, 31)), [])
+        self.assertEqual(everything[1].end_date, date(2009, 6, 1))
+
+    def test_staleness_follows_refresh_interval(self) -> None:
+        self.index.load([DateSpanAnnotation(label="Recession", start_date=date(2020, 3, 1), end_date=date(2020, 4, 1))])
+
+        self.assertFalse(self.index.is_stale())
+        self.now += timedelta(hours=12)
+        self.assertTrue(self.index.is_stale())
+
+    def test_background_refresh_loads_and_stops(self) -> None:
+        self.index.start(self.client)
+        deadline = time.monotonic() + 5
+        while not self.index.is_loaded and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.index.stop()
+
+        self.assertTrue(self.index.is_loaded)
+        self.assertEqual(len(self.index.overlapping(None, None) or []), 3)
+
+    def test_fetch_op_reads_loaded_index_without_network(self) -> None:
+        self.index.refresh(self.client)
+        op = FetchRecessionPeriodsOp(
+            fred_client=self.client,
+            transform_service=TransformService(),
+            recession_index=self.index,
+        )
+
+        periods = op.fetch(start_date=date(2019, 1, 1), end_date=date(2021, 1, 1))
+
+        self.assertEqual([(span.start_date, span.end_date) for span in periods], [(date(2020, 3, 1), date(2020, 4, 1))])
+        self.assertEqual(len(self.client.requests), 1)
+
+    def test_fetch_op_falls_back_to_windowed_fetch_before_first_load(self) -> None:
+        op = FetchRecessionPeriodsOp(
+            fred_client=self.client,
+            transform_service=TransformService(),
+            recession_index=self.index,
+        )
+
+        periods = op.fetch(start_date=date(2019, 1, 1), end_date=date(2021, 1, 1))
+
+        self.assertEqual(self.client.requests, [("USREC", date(2019, 1, 1), date(2021, 1, 1))])
+        self.assertEqual(len(periods), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import unittest
 
 from fred_query.schemas.resolved_series import SeriesMetadata, SeriesSearchMatch
 from fred_query.services.resolver_service import ResolverService
+from fred_query.services.series_match_scorer import candidate_profile, profile_has_term
 
 
 class _RankingFREDClient:
@@ -328,6 +329,28 @@ class ResolverServiceTest(unittest.TestCase):
 
         self.assertGreater(cpi_score, breakeven_score)
 
+    def test_candidate_profile_is_computed_once_per_series_text(self) -> None:
+        candidate = SeriesSearchMatch(
+            series_id="CPILFESL",
+            title="Consumer Price Index for All Urban Consumers: All Items Less Food and Energy",
+            units="Index 1982-1984=100",
+            frequency="Monthly",
+            seasonal_adjustment="SA",
+            source_url="https://fred.stlouisfed.org/series/CPILFESL",
+        )
+
+        profile = candidate_profile(candidate)
+
+        self.assertIs(candidate_profile(candidate.model_copy(update={"selection_label": "Core CPI"})), profile)
+        self.assertTrue(profile.features.has_core and profile.features.has_cpi)
+        self.assertTrue(profile.seasonally_adjusted)
+        self.assertTrue(profile.has_specialized_inflation_variant)
+        self.assertFalse(profile.is_base_price_index)
+        self.assertTrue(profile_has_term(profile, "consumer", title_only=True))
+        self.assertTrue(profile_has_term(profile, "consum", title_only=True))
+        self.assertFalse(profile_has_term(profile, "monthly", title_only=True))
+        self.assertTrue(profile_has_term(profile, "monthly"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+from fred_query.cache import CatalogFREDClient, SeriesCatalog
+from fred_query.schemas.resolved_series import SeriesSearchMatch
+
+
+def _match(series_id: str, title: str, *, popularity: int = 50, notes: str | None = None) -> SeriesSearchMatch:
+    return SeriesSearchMatch(
+        series_id=series_id,
+        title=title,
+        units="Percent",
+        frequency="Monthly",
+        seasonal_adjustment="Seasonally Adjusted",
+        notes=notes,
+        popularity=popularity,
+        source_url=f"https://fred.stlouisfed.org/series/{series_id}",
+    )
+
+
+_SNAPSHOT = [
+    _match("UNRATE", "Unemployment Rate", popularity=95),
+    _match("CAUR", "Unemployment Rate in California", popularity=60),
+    _match("TXUR", "Unemployment Rate in Texas", popularity=55),
+    _match("CPIAUCSL", "Consumer Price Index for All Urban Consumers: All Items", popularity=94),
+    _match("PAYEMS", "All Employees, Total Nonfarm", popularity=90, notes="Unemployment is covered separately."),
+]
+
+
+class _SearchFREDClient:
+    def __init__(self, matches: list[SeriesSearchMatch] | dict[str, list[SeriesSearchMatch]]) -> None:
+        self.matches = matches
+        self.searches: list[str] = []
+
+    def search_series(self, search_text: str, limit: int = 10, **kwargs: object) -> list[SeriesSearchMatch]:
+        self.searches.append(search_text)
+        matches = self.matches.get(search_text, []) if isinstance(self.matches, dict) else self.matches
+        return matches[:limit]
+
+    def close(self) -> None:
+        pass
+
+
+class SeriesCatalogTest(unittest.TestCase):
+    def test_search_ranks_by_term_coverage_then_bm25(self) -> None:
+        catalog = SeriesCatalog(_SNAPSHOT)
+
+        hits = catalog.search("california unemployment rates", limit=3)
+
+        self.assertEqual([hit.series.series_id for hit in hits], ["CAUR", "UNRATE", "TXUR"])
+        self.assertEqual(hits[0].matched_terms, 3)
+        self.assertEqual(catalog.search("unrate")[0].series.series_id, "UNRATE")
+        self.assertEqual(catalog.search("the of"), [])
+
+    def test_upsert_replaces_postings_and_snapshot_round_trips(self) -> None:
+        catalog = SeriesCatalog(_SNAPSHOT)
+        catalog.upsert([_match("TXUR", "Jobless Rate for Texas")])
+        catalog.record_search("Unemployment rates", _SNAPSHOT[:2], limit=2, bulk=True)
+
+        self.assertEqual(len(catalog), 5)
+        self.assertNotIn("TXUR", [hit.series.series_id for hit in catalog.search("unemployment")])
+        self.assertEqual(catalog.search("jobless")[0].series.series_id, "TXUR")
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "catalog.jsonl"
+            catalog.save(path)
+            restored = SeriesCatalog.load(path)
+
+        self.assertEqual(len(restored), 5)
+        self.assertEqual(restored.get("cpiaucsl"), catalog.get("CPIAUCSL"))
+        self.assertTrue(restored.bulk_filled)
+        self.assertEqual(
+            [item.series_id for item in restored.recorded_search("unemployment rate", limit=2)],
+            ["UNRATE", "CAUR"],
+        )
+        self.assertIsNone(restored.recorded_search("unemployment rate", limit=3))
+
+
+class CatalogFREDClientTest(unittest.TestCase):
+    def test_bulk_catalog_answers_full_matches_and_recorded_searches_locally(self) -> None:
+        catalog = SeriesCatalog()
+        catalog.refresh(_SearchFREDClient(_SNAPSHOT), ["unemployment rate"])
+        upstream = _SearchFREDClient([_match("MORTGAGE30US", "30-Year Fixed Rate Mortgage Average", popularity=92)])
+        client = CatalogFREDClient(upstream, catalog)
+
+        local = client.search_series("unemployment rate in Texas", limit=1)
+        too_few_full_matches = client.search_series("unemployment rate in Texas", limit=2)
+        fallback = client.search_series("30 year mortgage rate", limit=6)
+        repeated = client.search_series("30 year mortgage rate", limit=10)
+
+        self.assertEqual([item.series_id for item in local], ["TXUR"])
+        self.assertEqual([item.series_id for item in too_few_full_matches], ["MORTGAGE30US"])
+        self.assertEqual([item.series_id for item in fallback], ["MORTGAGE30US"])
+        self.assertEqual([item.series_id for item in repeated], ["MORTGAGE30US"])
+        self.assertEqual(upstream.searches, ["unemployment rate in Texas", "30 year mortgage rate"])
+
+    def test_leftovers_from_other_searches_do_not_answer_a_new_query(self) -> None:
+        upstream = _SearchFREDClient(
+            {
+                "inflation expectations": [
+                    _match("MICH", "University of Michigan: Inflation Expectation"),
+                    _match("EXPINF1YR", "1-Year Expected Inflation"),
+                ],
+                "inflation": [_match("CPIAUCSL", "Consumer Price Index for All Urban Consumers: All Items")],
+            }
+        )
+        client = CatalogFREDClient(upstream, SeriesCatalog())
+
+        client.search_series("inflation expectations")
+        inflation = client.search_series("inflation")
+        repeated = client.search_series("Inflation?")
+
+        self.assertEqual([item.series_id for item in inflation], ["CPIAUCSL"])
+        self.assertEqual(repeated, inflation)
+        self.assertEqual(upstream.searches, ["inflation expectations", "inflation"])
+
+    def test_runtime_answers_age_out_and_bulk_state_survives_eviction(self) -> None:
+        now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        catalog = SeriesCatalog(max_searches=2, search_ttl=timedelta(hours=1), clock=lambda: now)
+        catalog.refresh(_SearchFREDClient(_SNAPSHOT), ["unemployment rate"])
+        upstream = _SearchFREDClient({"inflation": [_match("CPIAUCSL", "Consumer Price Index")]})
+        client = CatalogFREDClient(upstream, catalog)
+
+        client.search_series("inflation")
+        client.search_series("inflation")
+        now += timedelta(hours=1)
+        client.search_series("inflation")
+        self.assertTrue(catalog.bulk_filled)
+        catalog.record_search("payrolls", [], limit=10)
+
+        self.assertEqual(upstream.searches, ["inflation", "inflation"])
+        self.assertFalse(catalog.bulk_filled)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
+from threading import Event
+import time
 import unittest
 
 from fred_query.schemas.analysis import ObservationPoint
 from fred_query.schemas.intent import QueryIntent, TaskType, TransformType
-from fred_query.schemas.resolved_series import SeriesMetadata
+from fred_query.schemas.resolved_series import ResolvedSeries, SeriesMetadata
+from fred_query.schemas.vintage_analysis import VintageAnalysisResult, VintageComparison
+from fred_query.services.progress import progress_listener
 from fred_query.services.single_series_service import SingleSeriesLookupService
 
 
@@ -108,6 +112,28 @@ class _DailyVolatilityFREDClient:
         return observations
 
 
+class _BlockingVintageAnalysisService:
+    def __init__(self, release: Event | None = None) -> None:
+        self.started = Event()
+        self.release = release
+
+    def analyze_vintage_data(self, series: ResolvedSeries) -> VintageAnalysisResult:
+        self.started.set()
+        if self.release is not None:
+            self.release.wait(5)
+        return VintageAnalysisResult(
+            comparisons=[
+                VintageComparison(
+                    series_id=series.series_id,
+                    observation_date=date(2024, 1, 1),
+                    first_release_value=4.0,
+                    current_value=4.1,
+                    percent_change_from_first=2.5,
+                )
+            ]
+        )
+
+
 class SingleSeriesLookupServiceTest(unittest.TestCase):
     def test_lookup_adds_historical_context_to_answer(self) -> None:
         client = _HistoricalUnemploymentFREDClient()
@@ -142,6 +168,25 @@ class SingleSeriesLookupServiceTest(unittest.TestCase):
         self.assertIn("17th percentile", response.answer_text)
         self.assertIn("well below the 2020 peak of 14.70%", response.answer_text)
 
+    def test_lookup_streams_the_chart_before_historical_context_and_recessions(self) -> None:
+        client = _HistoricalUnemploymentFREDClient()
+        service = SingleSeriesLookupService(client)
+        intent = QueryIntent(
+            task_type=TaskType.SINGLE_SERIES_LOOKUP,
+            series_id="UNRATE",
+            start_date=date(2022, 1, 1),
+        )
+        events: list[tuple[str, dict[str, object], int]] = []
+
+        with progress_listener(lambda event, data: events.append((event, data, len(client.requests)))):
+            response = service.lookup(intent)
+
+        self.assertEqual([(event, requests) for event, _, requests in events], [("resolved_series", 0), ("chart", 1)])
+        self.assertEqual(events[0][1]["series"][0].series_id, "UNRATE")
+        preview = events[1][1]["chart"]
+        self.assertEqual(preview.series, response.chart.series)
+        self.assertEqual(preview.title, response.chart.title)
+
     def test_lookup_supports_rolling_volatility_with_default_window(self) -> None:
         client = _DailyVolatilityFREDClient()
         service = SingleSeriesLookupService(client)
@@ -169,5 +214,54 @@ class SingleSeriesLookupServiceTest(unittest.TestCase):
         self.assertIn("applied_transform_window", metric_names)
 
 
+    def test_vintage_analysis_overlaps_the_observation_fetch(self) -> None:
+        client = _HistoricalUnemploymentFREDClient()
+        vintage_service = _BlockingVintageAnalysisService()
+        started_before_fetch: list[bool] = []
+        fetch = client.get_series_observations
+
+        def fetch_after_vintage_start(series_id: str, *args: object, **kwargs: object) -> list[ObservationPoint]:
+            started_before_fetch.append(vintage_service.started.wait(1))
+            return fetch(series_id, *args, **kwargs)
+
+        client.get_series_observations = fetch_after_vintage_start  # type: ignore[method-assign]
+        service = SingleSeriesLookupService(client, vintage_analysis_service=vintage_service)
+        intent = QueryIntent(
+            task_type=TaskType.SINGLE_SERIES_LOOKUP,
+            series_id="UNRATE",
+            start_date=date(2022, 1, 1),
+            needs_revision_analysis=True,
+        )
+
+        response = service.lookup(intent)
+
+        self.assertTrue(started_before_fetch[0])
+        self.assertIn("vintage_revision_2024-01-01", [metric.name for metric in response.analysis.derived_metrics])
+
+    def test_vintage_analysis_past_the_deadline_is_skipped_with_a_warning(self) -> None:
+        release = Event()
+        service = SingleSeriesLookupService(
+            _HistoricalUnemploymentFREDClient(),
+            vintage_analysis_service=_BlockingVintageAnalysisService(release),
+            vintage_deadline_seconds=0.05,
+        )
+        intent = QueryIntent(
+            task_type=TaskType.SINGLE_SERIES_LOOKUP,
+            series_id="UNRATE",
+            start_date=date(2022, 1, 1),
+            needs_revision_analysis=True,
+        )
+
+        started = time.perf_counter()
+        try:
+            response = service.lookup(intent)
+        finally:
+            release.set()
+
+        self.assertLess(time.perf_counter() - started, 2.0)
+        self.assertIn("Vintage analysis did not finish within 0.05s and was skipped.", response.analysis.warnings)
+        self.assertFalse(any(metric.name.startswith("vintage_") for metric in response.analysis.derived_metrics))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+from fred_query.services.sqlite_session_store import SQLiteQuerySessionStore
+from tests.test_query_session_service import _routed_response
+
+
+class SQLiteQuerySessionStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self._tmp = TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "sessions.sqlite3"
+        self._stores: list[SQLiteQuerySessionStore] = []
+
+    def tearDown(self) -> None:
+        for store in self._stores:
+            store.close()
+        self._tmp.cleanup()
+
+    def _store(self, **kwargs: object) -> SQLiteQuerySessionStore:
+        store = SQLiteQuerySessionStore(self.path, clock=lambda: self.now, **kwargs)
+        self._stores.append(store)
+        return store
+
+    def test_sessions_are_shared_between_stores_on_the_same_file(self) -> None:
+        writer = self._store()
+        reader = self._store()
+        _, first = writer.store_turn(session_id="s1", query="unemployment", response=_routed_response())
+        self.now += timedelta(seconds=1)
+        _, second = writer.store_turn(session_id="s1", query="now yoy", response=_routed_response())
+
+        session = reader.get_or_create("s1")
+        self.assertEqual(session.last_query, "now yoy")
+        self.assertEqual(session.created_at, datetime(2024, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual([item.revision_id for item in session.revisions], [second.revision_id])
+
+        previous = reader.get_context(session_id="s1", revision_id=first.revision_id).last_response
+        self.assertEqual(previous.query_response.intent.series_id, "UNRATE")
+        self.assertEqual(previous.query_response.analysis.series_results[0].observations, [])
+        self.assertEqual(previous.answer_text, "Unemployment is fixture-high.")
+        with self.assertRaisesRegex(ValueError, "Unknown revision_id"):
+            reader.get_context(session_id="other", revision_id=first.revision_id)
+        self.assertEqual(reader.session_count(), 1)
+
+    def test_revision_cap_and_idle_expiry(self) -> None:
+        store = self._store(max_revisions=2, idle_ttl=timedelta(minutes=30))
+        revisions = []
+        for index in range(3):
+            self.now += timedelta(seconds=1)
+            revisions.append(store.store_turn(session_id="s1", query=f"turn {index}", response=_routed_response())[1])
+
+        with self.assertRaisesRegex(ValueError, "Unknown revision_id"):
+            store.get_context(session_id="s1", revision_id=revisions[0].revision_id)
+        self.assertEqual(store.get_context(session_id="s1", revision_id=revisions[1].revision_id).last_query, "turn 1")
+
+        self.now += timedelta(minutes=31)
+        self.assertEqual(store.session_count(), 0)
+        self.assertEqual(store.get_or_create("s1").revisions, [])
+
+    def test_turn_after_idle_expiry_starts_a_fresh_session_without_a_prune(self) -> None:
+        store = self._store(idle_ttl=timedelta(minutes=30), prune_interval=timedelta(days=1))
+        _, expired = store.store_turn(session_id="s1", query="unemployment", response=_routed_response())
+
+        self.now += timedelta(minutes=31)
+        self.assertEqual(store.get_or_create("s1").revisions, [])
+        with self.assertRaisesRegex(ValueError, "Unknown revision_id"):
+            store.get_context(session_id="s1", revision_id=expired.revision_id)
+        session, fresh = store.store_turn(session_id="s1", query="inflation", response=_routed_response())
+
+        self.assertEqual(session.created_at, self.now)
+        self.assertEqual(store.get_or_create("s1").created_at, self.now)
+        with self.assertRaisesRegex(ValueError, "Unknown revision_id"):
+            store.get_context(session_id="s1", revision_id=expired.revision_id)
+        self.assertEqual(store.get_context(session_id="s1", revision_id=fresh.revision_id).last_query, "inflation")
+        self.assertEqual(store.estimated_bytes(), fresh.estimated_bytes)
+
+    def test_concurrent_turns_are_all_committed(self) -> None:
+        store = self._store()
+
+        def store_turn(index: int) -> str:
+            return store.store_turn(session_id=f"s{index % 4}", query=f"q{index}", response=_routed_response(8))[1].revision_id
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            revision_ids = list(executor.map(store_turn, range(40)))
+
+        reader = self._store()
+        self.assertEqual(reader.session_count(), 4)
+        for index, revision_id in enumerate(revision_ids):
+            context = reader.get_context(session_id=f"s{index % 4}", revision_id=revision_id)
+            self.assertEqual(context.last_query, f"q{index}")
+
+
+if __name__ == "__main__":
+    unittest.main()
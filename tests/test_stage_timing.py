@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+
+from fred_query.services.stage_timing import (
+    StageTimings,
+    bind_stage_context,
+    record_upstream_call,
+    stage,
+    timed_stage,
+)
+
+
+@timed_stage("fetch")
+def _fetch(calls: int) -> int:
+    for _ in range(calls):
+        record_upstream_call()
+    return calls
+
+
+class StageTimingTest(unittest.TestCase):
+    def test_stages_are_noops_without_a_collector(self) -> None:
+        with stage("ask"):
+            self.assertEqual(_fetch(2), 2)
+            record_upstream_call()
+
+    def test_nested_stages_aggregate_by_name_with_inclusive_upstream_calls(self) -> None:
+        timings = StageTimings()
+
+        with stage("ask", timings=timings):
+            with stage("parse"):
+                pass
+            _fetch(2)
+            _fetch(1)
+
+        stages = {entry.name: entry for entry in timings.stages()}
+        self.assertEqual([entry.name for entry in timings.stages()], ["ask", "parse", "fetch"])
+        self.assertEqual(stages["fetch"].count, 2)
+        self.assertEqual(stages["fetch"].upstream_calls, 3)
+        self.assertEqual(stages["ask"].upstream_calls, 3)
+        self.assertEqual(stages["parse"].upstream_calls, 0)
+        self.assertGreaterEqual(stages["ask"].duration_ms, stages["fetch"].duration_ms)
+
+        header = timings.server_timing_header()
+        self.assertRegex(header, r'^ask;dur=\d+\.\d;desc="3 upstream", parse;dur=\d+\.\d, fetch;dur=')
+
+    def test_bound_worker_threads_report_into_the_callers_stage(self) -> None:
+        timings = StageTimings()
+
+        with stage("execute", timings=timings):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(bind_stage_context(_fetch), [1, 2, 3, 4]))
+
+        stages = {entry.name: entry for entry in timings.stages()}
+        self.assertEqual(results, [1, 2, 3, 4])
+        self.assertEqual(stages["fetch"].count, 4)
+        self.assertEqual(stages["execute"].upstream_calls, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import unittest
+
+from fred_query.schemas.resolved_series import SeriesMetadata
+from fred_query.services.fred_client import FREDAPIError
+from fred_query.services.resolver_service import STATE_CODE_TO_NAME, ResolverService
+from fred_query.services.state_series_metadata import StateSeriesMetadataTable, bundled_state_series_metadata
+
+
+class _MetadataFREDClient:
+    def __init__(self, *, failing: set[str] | None = None) -> None:
+        self.failing = failing or set()
+        self.metadata_calls: list[str] = []
+
+    def get_series_metadata(self, series_id: str) -> SeriesMetadata:
+        self.metadata_calls.append(series_id)
+        if series_id in self.failing:
+            raise FREDAPIError(f"No metadata found for series {series_id}.")
+        return SeriesMetadata(
+            series_id=series_id,
+            title=f"Live title for {series_id}",
+            units="Percent",
+            frequency="M",
+            source_url=f"https://fred.stlouisfed.org/series/{series_id}",
+        )
+
+
+class StateSeriesMetadataTableTest(unittest.TestCase):
+    def test_state_resolution_uses_the_bundled_table_without_metadata_calls(self) -> None:
+        client = _MetadataFREDClient()
+        resolver = ResolverService(
+            client,
+            state_series_metadata=StateSeriesMetadataTable(bundled_state_series_metadata(STATE_CODE_TO_NAME)),
+        )
+
+        resolved = [
+            resolver.resolve_state_indicator_series(state_name, indicator_hint="unemployment rate")
+            for state_name in STATE_CODE_TO_NAME.values()
+        ]
+        gdp = resolver.resolve_state_gdp_series("Texas")
+        puerto_rico_gdp = resolver.resolve_state_gdp_series("PR")
+
+        self.assertEqual(len(resolved), len(STATE_CODE_TO_NAME))
+        self.assertEqual(resolved[0].series_id, "ALUR")
+        self.assertEqual(resolved[0].title, "Unemployment Rate in Alabama")
+        self.assertEqual((gdp.series_id, gdp.frequency), ("TXRGSP", "A"))
+        self.assertEqual(puerto_rico_gdp.title, "Live title for PRRGSP")
+        self.assertEqual(client.metadata_calls, ["PRRGSP"])
+
+    def test_prefetch_refreshes_entries_and_keeps_failed_ones(self) -> None:
+        table = StateSeriesMetadataTable(bundled_state_series_metadata({"CA": "California", "TX": "Texas"}))
+        client = _MetadataFREDClient(failing={"TXUR"})
+
+        updated = table.prefetch(client)
+
+        self.assertEqual(updated, 3)
+        self.assertEqual(sorted(client.metadata_calls), ["CARGSP", "CAUR", "TXRGSP", "TXUR"])
+        self.assertEqual(table.get("CAUR").title, "Live title for CAUR")
+        self.assertEqual(table.get("TXUR").title, "Unemployment Rate in Texas")
+        self.assertIsNotNone(table.refreshed_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
+from statistics import correlation, fmean, stdev
 import unittest
 
 from fred_query.schemas.analysis import ObservationPoint
@@ -98,6 +99,28 @@ class TransformServiceTest(unittest.TestCase):
         self.assertEqual(default_window, 30)
         self.assertIn("30-observation rolling window", warnings[0])
 
+    def test_sliding_rolling_helpers_match_per_window_reference(self) -> None:
+        values = [10_000.0 + ((index * 7919) % 101) * 0.37 + index * 0.05 for index in range(600)]
+        values[200:260] = [4.0] * 60
+        observations = [
+            ObservationPoint(date=date(2000, 1, 1) + timedelta(days=index), value=value)
+            for index, value in enumerate(values)
+        ]
+
+        for window in (2, 3, 30, 252):
+            averages = self.service.rolling_average(observations, window=window)
+            stddevs = self.service.rolling_stddev(observations, window=window)
+            expected_averages = [fmean(values[index - window + 1 : index + 1]) for index in range(window - 1, len(values))]
+            expected_stddevs = [stdev(values[index - window + 1 : index + 1]) for index in range(window - 1, len(values))]
+
+            self.assertEqual(averages[0].date, observations[window - 1].date)
+            for actual, expected in zip(averages, expected_averages, strict=True):
+                self.assertAlmostEqual(actual.value, expected, delta=1e-9 * abs(expected))
+            for actual, expected in zip(stddevs, expected_stddevs, strict=True):
+                self.assertAlmostEqual(actual.value, expected, delta=1e-7 + 1e-9 * expected)
+            if window <= 60:
+                self.assertEqual(stddevs[259 - window + 1].value, 0.0)
+
     def test_relationship_helpers(self) -> None:
         code, label, periods_per_year, lag_unit = self.service.choose_relationship_frequency(["Daily", "Monthly"])
 
@@ -141,6 +164,38 @@ class TransformServiceTest(unittest.TestCase):
         self.assertAlmostEqual(correlation or 0.0, 1.0, places=6)
         self.assertGreaterEqual(sample_size, 8)
 
+    def test_best_lag_correlation_matches_lag_by_lag_scan_on_wide_windows(self) -> None:
+        driver = [((index * 37) % 23) + 0.1 * index for index in range(400)]
+        follower = [0.0] * 17 + [value * 2.0 + ((index * 11) % 5) for index, value in enumerate(driver[:-17])]
+        first = [
+            ObservationPoint(date=date(1990, 1, 1) + timedelta(weeks=index), value=value)
+            for index, value in enumerate(driver)
+        ]
+        second = [
+            ObservationPoint(date=date(1990, 1, 1) + timedelta(weeks=index), value=value)
+            for index, value in enumerate(follower)
+        ]
+
+        def scan(lag: int) -> float:
+            if lag >= 0:
+                return correlation(driver[: len(driver) - lag], follower[lag:])
+            return correlation(driver[-lag:], follower[: len(follower) + lag])
+
+        expected_lag = max(range(-60, 61), key=lambda lag: (abs(scan(lag)), -lag))
+        lag, best_correlation, sample_size = self.service.calculate_best_lag_correlation(first, second, max_lag=60)
+
+        self.assertEqual(lag, 17)
+        self.assertEqual(lag, expected_lag)
+        self.assertAlmostEqual(best_correlation or 0.0, scan(17), places=9)
+        self.assertEqual(sample_size, 383)
+
+    def test_best_lag_correlation_skips_flat_or_short_overlaps(self) -> None:
+        first = [ObservationPoint(date=date(2020, month, 1), value=float(month)) for month in range(1, 13)]
+        flat = [ObservationPoint(date=date(2020, month, 1), value=3.0) for month in range(1, 13)]
+
+        self.assertEqual(self.service.calculate_best_lag_correlation(first, flat, max_lag=3), (None, None, 0))
+        self.assertEqual(self.service.calculate_best_lag_correlation(first[:5], first[:5], max_lag=2), (None, None, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,34 +7,40 @@ from datetime import date
 import httpx
 
 from fred_query.schemas.resolved_series import ResolvedSeries
+from fred_query.schemas.vintage_analysis import VintageObservation, VintageSeriesData
 from fred_query.services.fred_client import FREDClient
 from fred_query.services.vintage_analysis_service import VintageAnalysisService
 
 
 class VintageAnalysisServiceTest(unittest.TestCase):
-    def _build_client(self) -> FREDClient:
+    def _build_client(self, **client_kwargs: int) -> FREDClient:
+        self.requests: list[httpx.Request] = []
+
         def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            params = request.url.params
             if request.url.path.endswith("/series/vintagedates"):
                 # Return mock vintage dates
-                payload = {"vintage_dates": ["2020-01-01", "2021-01-01", "2022-01-01"]}
-            elif "vintage_dates=" in str(request.url):
-                # This is a request for observations with a vintage date
-                payload = {
-                    "observations": [
-                        {"date": "2010-01-01", "value": "100.0"},
-                        {"date": "2011-01-01", "value": "105.0"},
-                        {"date": "2012-01-01", "value": "110.0"},
-                    ]
-                }
-            elif request.url.path.endswith("/series/observations"):
-                # This is a request for current observations
-                payload = {
-                    "observations": [
-                        {"date": "2010-01-01", "value": "102.0"},  # Revised from 100.0
-                        {"date": "2011-01-01", "value": "107.0"},  # Revised from 105.0
-                        {"date": "2012-01-01", "value": "112.0"},  # Revised from 110.0
-                    ]
-                }
+                vintage_dates = ["2020-01-01", "2021-01-01", "2022-01-01"]
+                if params.get("sort_order") == "desc":
+                    vintage_dates.reverse()
+                payload = {"vintage_dates": vintage_dates[: int(params["limit"])]}
+            elif request.url.path.endswith("/series/observations") and "realtime_start" in params:
+                # Real-time periods: each observation was revised once a year, e.g. 2010: 100 -> 101 -> 102
+                rows = [
+                    {"realtime_start": start, "realtime_end": end, "date": f"{year}-01-01", "value": f"{base + step:.1f}"}
+                    for year, base in ((2010, 100.0), (2011, 105.0), (2012, 110.0))
+                    for step, (start, end) in enumerate(
+                        (("2020-01-01", "2020-12-31"), ("2021-01-01", "2021-12-31"), ("2022-01-01", "9999-12-31"))
+                    )
+                ]
+                if params["output_type"] == "4":
+                    rows = [row for row in rows if row["realtime_start"] == "2020-01-01"]
+                if "observation_start" in params:
+                    rows = [row for row in rows if params["observation_start"] <= row["date"] <= params["observation_end"]]
+                rows = [row for row in rows if row["realtime_end"] >= params["realtime_start"]]
+                offset = int(params.get("offset", 0))
+                payload = {"observations": rows[offset : offset + int(params["limit"])]}
             elif request.url.path.endswith("/series"):
                 payload = {
                     "seriess": [
@@ -55,7 +61,23 @@ class VintageAnalysisServiceTest(unittest.TestCase):
 
         transport = httpx.MockTransport(handler)
         http_client = httpx.Client(base_url="https://example.test/fred", transport=transport)
-        return FREDClient(api_key="test-key", base_url="https://example.test/fred", http_client=http_client)
+        return FREDClient(
+            api_key="test-key", base_url="https://example.test/fred", http_client=http_client, **client_kwargs
+        )
+
+    @staticmethod
+    def _series() -> ResolvedSeries:
+        return ResolvedSeries(
+            series_id="TEST",
+            title="Test Series",
+            geography="United States",
+            indicator="test_indicator",
+            units="Index",
+            frequency="Annual",
+            score=1.0,
+            resolution_reason="Test",
+            source_url="https://example.com/test",
+        )
 
     def test_vintage_analysis_service(self) -> None:
         client = self._build_client()
@@ -77,26 +99,89 @@ class VintageAnalysisServiceTest(unittest.TestCase):
         # Perform vintage analysis
         result = service.analyze_vintage_data(series, vintage_limit=10, max_comparisons=5)
 
-        # Verify the result structure
+        # Verify the result structure: one vintage-dates call plus one real-time call
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[-1].url.params["realtime_start"], "2020-01-01")
         self.assertEqual(len(result.series_vintage_data), 1)
         vintage_data = result.series_vintage_data[0]
         self.assertEqual(vintage_data.series_id, "TEST")
         self.assertEqual(len(vintage_data.vintage_dates), 3)  # We mocked 3 vintage dates
-        self.assertGreaterEqual(len(vintage_data.vintage_observations), 0)  # May have some observations
-
-        # Verify comparisons were created
-        self.assertGreaterEqual(len(result.comparisons), 0)
-
-        # Test helper methods
+        self.assertEqual(len(vintage_data.vintage_observations), 9)
+
+        # Comparisons come newest first, with current values from the open real-time periods
+        self.assertEqual([comp.observation_date for comp in result.comparisons][0], date(2012, 1, 1))
+        comparison_2010 = result.comparisons[-1]
+        self.assertEqual(comparison_2010.first_release_value, 100.0)
+        self.assertEqual(comparison_2010.latest_revision_value, 102.0)
+        self.assertEqual(comparison_2010.current_value, 102.0)
+        self.assertEqual(comparison_2010.revision_count, 3)
+        self.assertAlmostEqual(comparison_2010.percent_change_from_first, 2.0)
+
+        # Test helper methods: one request each
+        self.requests.clear()
         first_value = service.get_first_release_value("TEST", date(2010, 1, 1))
-        self.assertIsNotNone(first_value)
+        self.assertEqual(first_value, 100.0)
+        self.assertEqual(self.requests[-1].url.params["output_type"], "4")
 
         comparison = service.compare_latest_vs_original("TEST", date(2010, 1, 1))
+        self.assertEqual(len(self.requests), 2)
         self.assertIsNotNone(comparison)
         if comparison:
-            self.assertIn("first_release_value", comparison)
-            self.assertIn("latest_revision_value", comparison)
-            self.assertIn("percent_change", comparison)
+            self.assertEqual(comparison["first_release_value"], 100.0)
+            self.assertEqual(comparison["latest_revision_value"], 102.0)
+            self.assertAlmostEqual(comparison["percent_change"], 2.0)
+
+    def test_vintage_limit_covers_the_most_recent_vintages(self) -> None:
+        client = self._build_client()
+
+        result = VintageAnalysisService(client).analyze_vintage_data(self._series(), vintage_limit=2)
+
+        vintage_request, realtime_request = self.requests
+        self.assertEqual(vintage_request.url.params["sort_order"], "desc")
+        self.assertEqual(vintage_request.url.params["limit"], "2")
+        self.assertEqual(realtime_request.url.params["realtime_start"], "2021-01-01")
+        self.assertEqual(len(result.series_vintage_data[0].vintage_observations), 6)
+
+    def test_realtime_observations_are_paged_past_the_row_limit(self) -> None:
+        client = self._build_client(realtime_page_size=4)
+
+        revisions = client.get_series_realtime_observations("TEST")
+
+        self.assertEqual([request.url.params.get("offset") for request in self.requests], [None, "4", "8"])
+        self.assertEqual({request.url.params["limit"] for request in self.requests}, {"4"})
+        self.assertEqual(len(revisions), 9)
+        self.assertEqual(len({(obs.date, obs.vintage_date) for obs in revisions}), 9)
+
+    def test_revision_matrix_indexes_unordered_observations(self) -> None:
+        # Snapshot-style rows in arbitrary order: 2010 appears in three vintages, 2011 only in the last two.
+        rows = [
+            (date(2011, 1, 1), 105.0, date(2022, 1, 1)),
+            (date(2010, 1, 1), 102.0, date(2022, 1, 1)),
+            (date(2010, 1, 1), 100.0, date(2020, 1, 1)),
+            (date(2011, 1, 1), 104.0, date(2021, 1, 1)),
+            (date(2010, 1, 1), 101.0, date(2021, 1, 1)),
+        ]
+        data = VintageSeriesData(
+            series_id="TEST",
+            title="Test Series",
+            vintage_observations=[
+                VintageObservation(date=obs_date, value=value, vintage_date=vintage_date)
+                for obs_date, value, vintage_date in rows
+            ],
+        )
+
+        matrix = data.revision_matrix
+        self.assertEqual((len(matrix), matrix.vintage_dates.shape[0]), (2, 3))
+        self.assertEqual(matrix.revision_counts.tolist(), [3, 2])
+        self.assertEqual(data.get_first_release_value(date(2011, 1, 1)), 104.0)
+        self.assertEqual(data.get_latest_revision_value(date(2010, 1, 1)), 102.0)
+        self.assertEqual(data.get_revision_count(date(2010, 1, 1)), 3)
+        self.assertEqual(
+            [(obs.vintage_date.year, obs.value) for obs in data.get_revision_history(date(2010, 1, 1))],
+            [(2020, 100.0), (2021, 101.0), (2022, 102.0)],
+        )
+        self.assertIsNone(data.get_first_release_value(date(2012, 1, 1)))
+        self.assertEqual(data.get_revision_history(date(2012, 1, 1)), [])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+import unittest
+
+from fred_query.cache import VintageArchive
+from fred_query.schemas.resolved_series import ResolvedSeries
+from fred_query.schemas.vintage_analysis import VintageObservation
+from fred_query.services.fred_client import REALTIME_END
+from fred_query.services.vintage_analysis_service import VintageAnalysisService
+
+
+class _ALFREDClient:
+    """Serves ALFRED real-time periods derived from full snapshots keyed by vintage date."""
+
+    def __init__(self, snapshots: dict[date, dict[date, float]]) -> None:
+        self.snapshots = snapshots
+        self.calls: list[tuple[str, date | None]] = []
+
+    def get_series_vintage_dates(
+        self, series_id: str, limit: int = 1000, *, realtime_start: date | None = None
+    ) -> list[date]:
+        self.calls.append(("vintagedates", realtime_start))
+        vintages = [vintage for vintage in sorted(self.snapshots) if realtime_start is None or vintage >= realtime_start]
+        return vintages[:limit]
+
+    def get_series_realtime_observations(
+        self, series_id: str, realtime_start: date | None = None, realtime_end: date | None = None, **kwargs: object
+    ) -> list[VintageObservation]:
+        self.calls.append(("observations", realtime_start))
+        vintages = sorted(self.snapshots)
+        rows: list[VintageObservation] = []
+        for obs_date in sorted({obs_date for snapshot in self.snapshots.values() for obs_date in snapshot}):
+            previous = None
+            for index, vintage in enumerate(vintages):
+                value = self.snapshots[vintage].get(obs_date)
+                end = vintages[index + 1] - timedelta(days=1) if index + 1 < len(vintages) else REALTIME_END
+                if previous is not None and previous.value == value:
+                    previous.realtime_end = end
+                    continue
+                previous = None
+                if value is not None:
+                    previous = VintageObservation(date=obs_date, value=value, vintage_date=vintage, realtime_end=end)
+                    rows.append(previous)
+        start = realtime_start or date.min
+        return [
+            row.model_copy(update={"vintage_date": max(row.vintage_date, start)})
+            for row in rows
+            if row.realtime_end >= start
+        ]
+
+
+class _BlockingALFREDClient(_ALFREDClient):
+    """Holds real-time requests until `release` is set."""
+
+    def __init__(self, snapshots: dict[date, dict[date, float]]) -> None:
+        super().__init__(snapshots)
+        self.fetching = Event()
+        self.release = Event()
+
+    def get_series_realtime_observations(self, *args: object, **kwargs: object) -> list[VintageObservation]:
+        self.fetching.set()
+        self.release.wait(5)
+        return super().get_series_realtime_observations(*args, **kwargs)
+
+
+def _periods(rows: list[VintageObservation]) -> list[tuple[date, float, date, date | None]]:
+    return [(row.date, row.value, row.vintage_date, row.realtime_end) for row in rows]
+
+
+class VintageArchiveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        self.snapshots = {
+            date(2024, 1, 5): {date(2023, 11, 1): 3.7, date(2023, 12, 1): 3.8},
+            date(2024, 2, 5): {date(2023, 11, 1): 3.7, date(2023, 12, 1): 3.7, date(2024, 1, 1): 3.9},
+        }
+        self.client = _ALFREDClient(self.snapshots)
+
+    def _archive(self, directory: str | None, **kwargs: int) -> VintageArchive:
+        return VintageArchive(directory, check_interval=timedelta(hours=1), clock=lambda: self.now, **kwargs)
+
+    def test_sync_appends_only_new_vintages_and_persists(self) -> None:
+        with TemporaryDirectory() as directory:
+            archive = self._archive(directory)
+            archive.history(self.client, "UNRATE")
+            self.now += timedelta(minutes=30)
+            archive.history(self.client, "UNRATE")
+
+            # A new vintage revises Jan, drops Nov and adds Feb.
+            self.snapshots[date(2024, 3, 5)] = {date(2023, 12, 1): 3.7, date(2024, 1, 1): 3.7, date(2024, 2, 1): 3.9}
+            self.now += timedelta(hours=1)
+            appended = archive.history(self.client, "UNRATE")
+            self.now += timedelta(hours=1)
+            unchanged = archive.history(self.client, "UNRATE")
+            restored = self._archive(directory).get("UNRATE")
+
+        self.assertEqual(
+            self.client.calls,
+            [
+                ("vintagedates", None),
+                ("observations", None),
+                ("vintagedates", date(2024, 2, 6)),
+                ("observations", date(2024, 2, 6)),
+                ("vintagedates", date(2024, 3, 6)),
+            ],
+        )
+        full_history = _periods(_ALFREDClient(self.snapshots).get_series_realtime_observations("UNRATE"))
+        self.assertEqual(_periods(appended.observations), full_history)
+        self.assertEqual(appended.synced_through, date(2024, 3, 5))
+        self.assertEqual(unchanged.observations, appended.observations)
+        self.assertIsNotNone(restored)
+        self.assertEqual(_periods(restored.observations), full_history)
+        self.assertEqual(restored.data.get_first_release_value(date(2024, 1, 1)), 3.9)
+        self.assertEqual(restored.data.get_latest_revision_value(date(2024, 1, 1)), 3.7)
+
+    def test_sync_pages_through_vintage_dates_past_the_limit(self) -> None:
+        self.snapshots[date(2024, 3, 5)] = {date(2023, 12, 1): 3.7, date(2024, 1, 1): 3.8}
+        archive = self._archive(None, page_size=2)
+
+        history = archive.history(self.client, "UNRATE")
+        self.snapshots[date(2024, 4, 5)] = {date(2024, 1, 1): 3.8, date(2024, 2, 1): 3.9}
+        self.now += timedelta(hours=2)
+        appended = archive.history(self.client, "UNRATE")
+
+        self.assertEqual(history.synced_through, date(2024, 3, 5))
+        self.assertEqual(len(history.vintage_dates), 3)
+        self.assertEqual(appended.synced_through, date(2024, 4, 5))
+        self.assertEqual(
+            self.client.calls,
+            [
+                ("vintagedates", None),
+                ("vintagedates", date(2024, 2, 6)),
+                ("observations", None),
+                ("vintagedates", date(2024, 3, 6)),
+                ("observations", date(2024, 3, 6)),
+            ],
+        )
+        full_history = _periods(_ALFREDClient(self.snapshots).get_series_realtime_observations("UNRATE"))
+        self.assertEqual(_periods(appended.observations), full_history)
+
+    def test_memory_keeps_only_recent_histories_in_front_of_the_files(self) -> None:
+        with TemporaryDirectory() as directory:
+            archive = self._archive(directory, max_histories=1)
+            archive.history(self.client, "UNRATE")
+            payems = archive.history(self.client, "PAYEMS")
+
+            # UNRATE was evicted from memory, so only its file held it; PAYEMS is still in memory.
+            for path in Path(directory).glob("*.json"):
+                path.unlink()
+
+            self.assertEqual(archive.get("PAYEMS"), payems)
+            self.assertIsNone(archive.get("UNRATE"))
+
+    def test_clear_waits_for_an_in_flight_sync(self) -> None:
+        client = _BlockingALFREDClient(self.snapshots)
+        with TemporaryDirectory() as directory:
+            archive = self._archive(directory)
+            sync = Thread(target=archive.history, args=(client, "UNRATE"))
+            sync.start()
+            self.assertTrue(client.fetching.wait(5))
+            clear = Thread(target=archive.clear)
+            clear.start()
+            clear.join(0.1)
+            self.assertTrue(clear.is_alive())
+
+            client.release.set()
+            sync.join(5)
+            clear.join(5)
+
+            self.assertEqual(list(Path(directory).glob("*.json")), [])
+            self.assertIsNone(archive.get("UNRATE"))
+
+    def test_service_serves_revision_questions_from_the_archive(self) -> None:
+        with TemporaryDirectory() as directory:
+            service = VintageAnalysisService(self.client, vintage_archive=self._archive(directory))
+            series = ResolvedSeries(
+                series_id="UNRATE",
+                title="Unemployment Rate",
+                geography="United States",
+                indicator="unemployment_rate",
+                units="Percent",
+                frequency="Monthly",
+                score=1.0,
+                resolution_reason="Test",
+                source_url="https://fred.stlouisfed.org/series/UNRATE",
+            )
+
+            result = service.analyze_vintage_data(series)
+            calls_after_analysis = len(self.client.calls)
+            first_release = service.get_first_release_value("UNRATE", date(2023, 12, 1))
+            comparison = service.compare_latest_vs_original("UNRATE", date(2023, 12, 1))
+            self.assertTrue(any(Path(directory).glob("*.json")))
+
+        self.assertEqual(calls_after_analysis, 2)
+        self.assertEqual(len(self.client.calls), 2)
+        self.assertEqual(result.series_vintage_data[0].title, "Unemployment Rate")
+        self.assertEqual(result.comparisons[0].observation_date, date(2024, 1, 1))
+        self.assertEqual(first_release, 3.8)
+        self.assertEqual(comparison["latest_revision_value"], 3.7)
+
+
+if __name__ == "__main__":
+    unittest.main()